@@ -180,6 +180,8 @@ class WebSocketService {
       }, 'connection open');
       // Backend sends welcome message immediately, no handshake needed
       // Heartbeat will start after receiving welcome message
+      // No handshake also means no "encodings" offer: the server keeps this client
+      // on JSON text frames (MessagePack is negotiated only for clients that offer it)
     };
 
     this.socket.onclose = (event) => {
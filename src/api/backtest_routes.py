@@ -7,9 +7,11 @@ Story: 1b-1-backtest-session-setup
 Endpoints:
 - GET /api/backtest/data-availability - Check data availability for date range (AC4)
 - POST /api/backtest/start - Start a backtest session (AC6)
+- POST /api/backtest/sweep - Start a parallel parameter sweep
 """
 
 import asyncio
+import os
 from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, HTTPException, Query, Depends, BackgroundTasks
 from pydantic import BaseModel, Field
@@ -21,6 +23,12 @@ from src.core.event_bus import EventBus
 from src.data_feed.questdb_provider import QuestDBProvider
 from src.api.auth_handler import UserSession
 from src.trading.backtest_engine import BacktestEngine, run_backtest
+from src.trading.backtest_sweep import (
+    BacktestParameterSweep,
+    RANKABLE_METRICS,
+    expand_grid,
+    sample_parameters,
+)
 
 # =============================================================================
 # Router Setup
@@ -123,6 +131,34 @@ async def _run_backtest_task(session_id: str) -> None:
             del _running_backtests[session_id]
 
 
+async def _run_sweep_task(sweep: BacktestParameterSweep) -> None:
+    """
+    Background task to run a parameter sweep.
+
+    Args:
+        sweep: Configured parameter sweep
+    """
+    try:
+        result = await sweep.run()
+
+        logger.info("backtest_routes.sweep_completed", {
+            "sweep_id": sweep.sweep_id,
+            "status": result.status.value,
+            "completed": result.completed,
+            "best": result.ranking[0] if result.ranking else None
+        })
+
+    except Exception as e:
+        logger.error("backtest_routes.sweep_failed", {
+            "sweep_id": sweep.sweep_id,
+            "error": str(e),
+            "error_type": type(e).__name__
+        })
+    finally:
+        if sweep.sweep_id in _running_backtests:
+            del _running_backtests[sweep.sweep_id]
+
+
 def get_current_user():
     """Get current user dependency wrapper."""
     if _get_current_user_dependency is None:
@@ -203,6 +239,28 @@ class BacktestStartResponse(BaseModel):
     estimated_duration_seconds: Optional[int] = None
 
 
+MAX_SWEEP_COMBINATIONS = 10000
+MAX_SWEEP_WORKERS = 32
+
+
+class BacktestSweepRequest(BaseModel):
+    """Request model for a parameter sweep (grid or random search)."""
+    symbols: List[str] = Field(..., min_length=1, description="Symbols every combination trades")
+    start_date: str = Field(..., description="Start date (YYYY-MM-DD)")
+    end_date: str = Field(..., description="End date (YYYY-MM-DD)")
+    timeframe: str = Field(default="1m", description="Candle timeframe")
+    initial_balance: float = Field(default=10000, ge=100)
+    grid: Optional[Dict[str, List[float]]] = Field(None, description="Parameter -> candidate values")
+    random_space: Optional[Dict[str, List[float]]] = Field(None, description="Parameter -> [low, high]")
+    samples: int = Field(default=100, ge=1, le=MAX_SWEEP_COMBINATIONS, description="Random search draws")
+    seed: Optional[int] = None
+    rank_by: str = Field(default="final_pnl", description="final_pnl | win_rate | max_drawdown_pct | total_trades")
+    top_n: int = Field(default=10, ge=1, le=100)
+    max_workers: Optional[int] = Field(
+        None, ge=1, le=MAX_SWEEP_WORKERS, description="Worker processes (default: all cores, capped at core count)"
+    )
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -531,6 +589,121 @@ async def start_backtest(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/sweep", response_model=Dict[str, Any])
+async def start_parameter_sweep(
+    request: BacktestSweepRequest,
+    current_user: UserSession = Depends(get_current_user),
+    csrf_token: str = Depends(verify_csrf_token)
+) -> Dict[str, Any]:
+    """
+    Start a parameter sweep that runs backtests in parallel over a process pool.
+
+    Ranked results stream over the backtest progress broadcast with the
+    returned sweep_id as session_id.
+
+    Args:
+        request: Symbols, date range and a parameter grid or random search space
+
+    Returns:
+        Sweep information including sweep_id for tracking
+    """
+    try:
+        try:
+            start_dt = datetime.strptime(request.start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            end_dt = datetime.strptime(request.end_date, "%Y-%m-%d").replace(
+                hour=23, minute=59, second=59, tzinfo=timezone.utc
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid date format. Use YYYY-MM-DD. Error: {str(e)}"
+            )
+
+        if start_dt >= end_dt:
+            raise HTTPException(status_code=400, detail="End date must be after start date")
+
+        if (request.grid is None) == (request.random_space is None):
+            raise HTTPException(status_code=400, detail="Provide exactly one of grid or random_space")
+
+        if request.rank_by not in RANKABLE_METRICS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"rank_by must be one of {sorted(RANKABLE_METRICS)}"
+            )
+
+        try:
+            if request.grid is not None:
+                grid_size = 1
+                for values in request.grid.values():
+                    grid_size *= len(values)
+                if grid_size > MAX_SWEEP_COMBINATIONS:
+                    raise ValueError(f"Grid has {grid_size} combinations (max {MAX_SWEEP_COMBINATIONS})")
+                combinations = expand_grid(request.grid)
+            else:
+                space = {}
+                for name, bounds in request.random_space.items():
+                    if len(bounds) != 2 or bounds[0] > bounds[1]:
+                        raise ValueError(f"random_space[{name}] must be [low, high]")
+                    space[name] = (bounds[0], bounds[1])
+                combinations = sample_parameters(space, request.samples, request.seed)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        if not combinations:
+            raise HTTPException(status_code=400, detail="Sweep has no parameter combinations")
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        sweep_id = f"sweep_{timestamp}_{str(uuid.uuid4())[:8]}"
+
+        sweep = BacktestParameterSweep(
+            sweep_id=sweep_id,
+            db_provider=get_questdb_provider(),
+            event_bus=_event_bus,
+            symbols=request.symbols,
+            start_date=start_dt,
+            end_date=end_dt,
+            combinations=combinations,
+            timeframe=request.timeframe,
+            initial_balance=request.initial_balance,
+            rank_by=request.rank_by,
+            top_n=request.top_n,
+            # Never start more worker processes than the host has cores
+            max_workers=min(request.max_workers or os.cpu_count() or 1, os.cpu_count() or 1)
+        )
+
+        task = asyncio.create_task(_run_sweep_task(sweep))
+        _running_backtests[sweep_id] = task
+
+        logger.info("backtest_routes.sweep_started", {
+            "sweep_id": sweep_id,
+            "symbols": request.symbols,
+            "combinations": len(combinations),
+            "max_workers": sweep.max_workers,
+            "user": current_user.username if current_user else "anonymous"
+        })
+
+        return {
+            "status": "success",
+            "data": {
+                "sweep_id": sweep_id,
+                "status": "started",
+                "symbols": request.symbols,
+                "combinations": len(combinations),
+                "max_workers": sweep.max_workers,
+                "rank_by": request.rank_by
+            }
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("backtest_routes.start_sweep_error", {
+            "symbols": request.symbols,
+            "error": str(e)
+        })
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/sessions", response_model=Dict[str, Any])
 async def list_backtest_sessions(
     limit: int = Query(50, ge=1, le=200, description="Maximum sessions to return"),
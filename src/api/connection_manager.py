@@ -6,12 +6,11 @@ Production-ready with memory leak prevention and performance monitoring.
 """
 
 import asyncio
-import json
 import uuid
 from typing import Dict, Set, Any, Optional, List
 from datetime import datetime
 from dataclasses import dataclass, field
-from collections import deque
+from collections import Counter, OrderedDict, deque
 import time
 import psutil
 import weakref
@@ -20,9 +19,11 @@ from websockets.exceptions import ConnectionClosed
 try:
     # When imported as part of 'src' package
     from ..core.logger import StructuredLogger
+    from .message_serializer import EncodedFrame, FrameSet, MessageSerializer, get_serializer, SERIALIZERS
 except Exception:
     # Compatibility for tests importing as top-level 'api.connection_manager'
     from src.core.logger import StructuredLogger
+    from src.api.message_serializer import EncodedFrame, FrameSet, MessageSerializer, get_serializer, SERIALIZERS
 
 
 @dataclass
@@ -51,7 +52,7 @@ class ClientConnection:
     subscription_timestamps: deque = field(default_factory=lambda: deque(maxlen=100))
 
     # Preferences
-    preferred_format: str = "json"  # "json" | "binary"
+    preferred_format: str = "json"  # Wire format negotiated at handshake: "json" | "msgpack"
     compression_enabled: bool = False
     batch_updates: bool = True
 
@@ -61,6 +62,9 @@ class ClientConnection:
     is_healthy: bool = True
     is_fastapi_websocket: bool = False  # Flag to distinguish WebSocket types
 
+    # Outbound broadcast queue, created on first enqueue
+    send_queue: Optional["ClientSendQueue"] = None
+
     def update_heartbeat(self):
         """Update last heartbeat timestamp"""
         self.last_heartbeat = time.time()
@@ -128,6 +132,114 @@ class ClientConnection:
         self.is_healthy = True
 
 
+# Streams where a lagging client only needs the latest value per symbol
+CONFLATED_STREAMS = frozenset({"market_data", "indicators"})
+
+
+def conflation_key(subscription_type: str, message: Dict[str, Any]) -> Optional[tuple]:
+    """
+    Conflation key of a broadcast message, or None if it must not be conflated.
+
+    market_data is keyed by symbol, indicators by symbol and indicator; messages
+    without a symbol (e.g. multi-symbol batches) are never conflated.
+    """
+    if subscription_type not in CONFLATED_STREAMS or not isinstance(message, dict):
+        return None
+    payload = message.get("data")
+    if not isinstance(payload, dict):
+        payload = message
+    symbol = message.get("symbol") or payload.get("symbol")
+    if not symbol:
+        return None
+    if subscription_type == "indicators":
+        indicator = payload.get("indicator") or payload.get("indicator_id") or payload.get("name")
+        return (subscription_type, symbol, indicator)
+    return (subscription_type, symbol)
+
+
+class ClientSendQueue:
+    """
+    Bounded outbound frame queue + writer task for one client connection.
+
+    Frames are kept in an OrderedDict: conflated streams use their conflation
+    key, so a lagging client keeps only the latest frame per key (in the
+    original position); other frames get a unique sequence key. When the queue
+    is full the oldest frame is dropped. `backpressure_since` is the time of the
+    first drop since the queue was last fully drained.
+    """
+
+    def __init__(self, manager: "ConnectionManager", client_id: str, maxsize: int):
+        self.manager = manager
+        self.client_id = client_id
+        self.maxsize = maxsize
+        self._pending: "OrderedDict[Any, EncodedFrame]" = OrderedDict()
+        self._sequence = 0
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+        self.backpressure_since: Optional[float] = None
+
+        self.enqueued = 0
+        self.sent = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.max_depth = 0
+
+    def start(self) -> None:
+        """Start the writer task (requires a running event loop)."""
+        self._task = asyncio.create_task(self._run(), name=f"ws_writer_{self.client_id}")
+
+    def stop(self) -> None:
+        """Discard pending frames and cancel the writer (safe to call from the writer itself)."""
+        self._closed = True
+        self._pending.clear()
+        if self._task and not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def put(self, frame: EncodedFrame, key: Optional[tuple] = None) -> bool:
+        """Enqueue a frame without waiting; returns False if the queue is closed."""
+        if self._closed:
+            return False
+
+        if key is not None:
+            key = ("stream", key)
+            if key in self._pending:
+                self._pending[key] = frame
+                self.conflated += 1
+                return True
+        else:
+            self._sequence += 1
+            key = ("seq", self._sequence)
+
+        if len(self._pending) >= self.maxsize:
+            self._pending.popitem(last=False)
+            self.dropped += 1
+            if self.backpressure_since is None:
+                self.backpressure_since = time.time()
+
+        self._pending[key] = frame
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, len(self._pending))
+        self._ready.set()
+        return True
+
+    async def _run(self) -> None:
+        while not self._closed:
+            if not self._pending:
+                self.backpressure_since = None
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            _, frame = self._pending.popitem(last=False)
+            if await self.manager.send_frame(self.client_id, frame):
+                self.sent += 1
+
+
 class ConnectionManager:
     """
     Manages all WebSocket client connections with production safeguards.
@@ -138,6 +250,9 @@ class ConnectionManager:
     - Rate limiting and abuse prevention
     - Performance monitoring and metrics
     - Graceful degradation under load
+    - Broadcasts enqueue onto per-client bounded send queues drained by one
+      writer task per client, so a stalled client never delays the others;
+      clients that stay backlogged are disconnected
     """
 
     def __init__(self,
@@ -145,7 +260,10 @@ class ConnectionManager:
                  heartbeat_timeout_seconds: int = 60,
                  cleanup_interval_seconds: int = 30,
                  max_messages_per_minute: int = 100,
-                 max_subscriptions_per_hour: int = 50):
+                 max_subscriptions_per_hour: int = 50,
+                 serializer: Optional[MessageSerializer] = None,
+                 send_queue_size: int = 256,
+                 slow_consumer_timeout_seconds: float = 10.0):
         """
         Initialize ConnectionManager with production settings.
 
@@ -155,12 +273,23 @@ class ConnectionManager:
             cleanup_interval_seconds: Interval for cleanup operations
             max_messages_per_minute: Rate limit for messages per client
             max_subscriptions_per_hour: Rate limit for subscriptions per client
+            serializer: Outbound message serializer (default: orjson when installed, else json)
+            send_queue_size: Capacity of each client's outbound broadcast queue
+            slow_consumer_timeout_seconds: Disconnect a client whose send queue has been
+                overflowing for this long
         """
         self.max_connections = max_connections
         self.heartbeat_timeout_seconds = heartbeat_timeout_seconds
         self.cleanup_interval_seconds = cleanup_interval_seconds
         self.max_messages_per_minute = max_messages_per_minute
         self.max_subscriptions_per_hour = max_subscriptions_per_hour
+        self.serializer = serializer or get_serializer()
+        # Per-client wire formats; "json" is the fallback for every client
+        self._format_serializers: Dict[str, MessageSerializer] = {"json": self.serializer}
+        if "msgpack" in SERIALIZERS:
+            self._format_serializers["msgpack"] = get_serializer("msgpack")
+        self.send_queue_size = send_queue_size
+        self.slow_consumer_timeout_seconds = slow_consumer_timeout_seconds
 
         # ✅ CRITICAL FIX: Memory-safe connection storage with atomic operations
         self._connections: Dict[str, ClientConnection] = {}
@@ -180,6 +309,7 @@ class ConnectionManager:
         self.total_connections_rejected = 0
         self.total_connections_dropped = 0
         self.peak_concurrent_connections = 0
+        self.total_slow_consumer_disconnects = 0
 
         # Logger will be injected
         self.logger: Optional[StructuredLogger] = None
@@ -348,6 +478,8 @@ class ConnectionManager:
 
             # Remove from main storage
             del self._connections[client_id]
+            if connection.send_queue is not None:
+                connection.send_queue.stop()
 
             # Update metrics
             self.total_connections_dropped += 1
@@ -368,11 +500,14 @@ class ConnectionManager:
         if client_id not in self._client_subscriptions:
             return
 
-        subscriptions = self._client_subscriptions[client_id].copy()
-        for subscription_type in subscriptions:
-            await self.unsubscribe_client(client_id, subscription_type)
-
-        del self._client_subscriptions[client_id]
+        # Called with _connection_lock held, so unsubscribe inline (unsubscribe_client
+        # would try to take the lock again)
+        for subscription_type in self._client_subscriptions.pop(client_id):
+            clients = self._subscription_clients.get(subscription_type)
+            if clients is not None:
+                clients.discard(client_id)
+                if not clients:
+                    del self._subscription_clients[subscription_type]
 
     async def get_connection(self, client_id: str) -> Optional[ClientConnection]:
         """Get client connection by ID"""
@@ -511,7 +646,7 @@ class ConnectionManager:
             sender_client_id: Client ID to exclude from broadcast (optional)
 
         Returns:
-            Number of clients message was sent to
+            Number of clients message was queued for
         """
         subscribers = await self.get_subscribers(subscription_type)
         if sender_client_id:
@@ -520,9 +655,15 @@ class ConnectionManager:
         if not subscribers:
             return 0
 
+        # ✅ PERFORMANCE: Serialize once per wire format, every subscriber using that
+        # format gets the same frame, and each send is an O(1) enqueue onto the
+        # client's own writer queue
+        frames = self.frame_set(message)
+        key = conflation_key(subscription_type, message)
+
         sent_count = 0
         for client_id in subscribers:
-            if await self.send_to_client(client_id, message):
+            if self.enqueue_frame(client_id, self.frame_for(client_id, frames), key):
                 sent_count += 1
 
         if self.logger:
@@ -543,6 +684,111 @@ class ConnectionManager:
             client_id: Target client ID
             message: Message to send
 
+        Returns:
+            True if message sent successfully, False otherwise
+        """
+        connection = self._connections.get(client_id)
+        if connection is None:
+            return False
+        return await self.send_frame(client_id, self.serializer_for(connection).encode(message))
+
+    @property
+    def supported_formats(self) -> List[str]:
+        """Wire formats clients can negotiate (in order of preference, json last)."""
+        return sorted(self._format_serializers, key=lambda name: name == "json")
+
+    def serializer_for(self, connection: ClientConnection) -> MessageSerializer:
+        """Serializer for a client's negotiated wire format."""
+        return self._format_serializers.get(connection.preferred_format, self.serializer)
+
+    def frame_set(self, message: Dict[str, Any]) -> FrameSet:
+        """Wrap a broadcast message so it is encoded at most once per wire format."""
+        return FrameSet(message, self._format_serializers, self.serializer)
+
+    def frame_for(self, client_id: str, frames: FrameSet) -> EncodedFrame:
+        """Pick (encoding on first use) the frame matching a client's wire format."""
+        connection = self._connections.get(client_id)
+        return frames.frame(connection.preferred_format if connection else "json")
+
+    def negotiate_format(self, connection: ClientConnection, requested: Any) -> str:
+        """
+        Select a client's wire format from the encodings it offered at handshake.
+
+        Args:
+            connection: Client connection (its preferred_format is updated)
+            requested: Encoding name or list of names in the client's order of
+                preference; None or nothing supported falls back to "json"
+
+        Returns:
+            The selected format; every later frame to the client uses it
+        """
+        if isinstance(requested, str):
+            requested = [requested]
+        selected = next(
+            (name for name in (requested or []) if isinstance(name, str) and name in self._format_serializers),
+            "json"
+        )
+        connection.preferred_format = selected
+        return selected
+
+    def enqueue_frame(self, client_id: str, frame: EncodedFrame, key: Optional[tuple] = None) -> bool:
+        """
+        Queue a pre-encoded frame on the client's outbound queue (does not wait).
+
+        Args:
+            client_id: Target client ID
+            frame: Encoded message
+            key: Conflation key (see conflation_key); None queues the frame unconditionally
+
+        Returns:
+            True if the frame was queued, False if the client is unknown or being disconnected
+        """
+        connection = self._connections.get(client_id)
+        if connection is None:
+            return False
+
+        queue = connection.send_queue
+        if queue is None:
+            queue = connection.send_queue = ClientSendQueue(self, client_id, self.send_queue_size)
+            queue.start()
+
+        if (queue.backpressure_since is not None and
+                time.time() - queue.backpressure_since >= self.slow_consumer_timeout_seconds):
+            queue.stop()
+            asyncio.create_task(self._disconnect_slow_consumer(connection))
+            return False
+
+        return queue.put(frame, key)
+
+    async def _disconnect_slow_consumer(self, connection: ClientConnection) -> None:
+        """Close and remove a client whose send queue stayed backlogged."""
+        queue = connection.send_queue
+        self.total_slow_consumer_disconnects += 1
+        if self.logger:
+            self.logger.warning("connection_manager.slow_consumer_disconnected", {
+                "client_id": connection.client_id,
+                "dropped_frames": queue.dropped if queue else 0,
+                "backlog_seconds": self.slow_consumer_timeout_seconds
+            })
+
+        try:
+            await asyncio.wait_for(connection.websocket.close(code=1008), timeout=1.0)
+        except Exception:
+            pass  # Client is unresponsive anyway; removal below is what matters
+
+        await self.remove_connection(connection.client_id, "slow_consumer")
+
+    async def send_frame(self, client_id: str, frame: EncodedFrame) -> bool:
+        """
+        Send a pre-encoded frame to specific client.
+
+        The frame is not modified, so one frame can be shared by all recipients
+        of a broadcast.
+
+        Args:
+            client_id: Target client ID
+            frame: Encoded message (see MessageSerializer.encode)
+
         Returns:
             True if message sent successfully, False otherwise
         """
@@ -551,26 +797,24 @@ class ConnectionManager:
             return False
 
         try:
-            # Serialize message
-            if connection.preferred_format == "json":
-                message_data = json.dumps(message)
-            else:
-                # Binary format support (future enhancement)
-                message_data = json.dumps(message).encode('utf-8')
-
             # Send message - detect WebSocket type and use appropriate API
             websocket = connection.websocket
 
-            # Use the flag stored in the connection object
-            if connection.is_fastapi_websocket:
+            if frame.is_binary:
+                # Binary frame (client negotiated a binary wire format)
+                if connection.is_fastapi_websocket:
+                    await websocket.send_bytes(frame.binary)
+                else:
+                    await websocket.send(frame.binary)
+            elif connection.is_fastapi_websocket:
                 # FastAPI WebSocket
-                await websocket.send_text(message_data)
+                await websocket.send_text(frame.payload)
             else:
                 # websockets library WebSocket
-                await websocket.send(message_data)
+                await websocket.send(frame.payload)
 
             # Record activity
-            await self.record_message_activity(client_id, "sent", len(message_data))
+            await self.record_message_activity(client_id, "sent", frame.size)
 
             return True
 
@@ -674,6 +918,8 @@ class ConnectionManager:
         total_messages_sent = sum(conn.messages_sent for conn in connections_snapshot)
         total_messages_received = sum(conn.messages_received for conn in connections_snapshot)
 
+        send_queues = [conn.send_queue for conn in connections_snapshot if conn.send_queue is not None]
+
         # Calculate average connection age
         if connections_snapshot:
             avg_age = sum(conn.get_connection_age_seconds() for conn in connections_snapshot) / len(connections_snapshot)
@@ -694,7 +940,15 @@ class ConnectionManager:
             "subscription_types": len(self._subscription_clients),
             "total_active_subscriptions": sum(len(subs) for subs in self._client_subscriptions.values()),
             "memory_usage_mb": psutil.Process().memory_info().rss / 1024 / 1024,
-            "cleanup_last_run": self._last_cleanup_time
+            "cleanup_last_run": self._last_cleanup_time,
+            "send_queue_capacity": self.send_queue_size,
+            "send_queue_depth": sum(queue.depth for queue in send_queues),
+            "max_send_queue_depth": max((queue.max_depth for queue in send_queues), default=0),
+            "send_queue_dropped": sum(queue.dropped for queue in send_queues),
+            "send_queue_conflated": sum(queue.conflated for queue in send_queues),
+            "backpressured_clients": sum(1 for queue in send_queues if queue.backpressure_since is not None),
+            "slow_consumer_disconnects": self.total_slow_consumer_disconnects,
+            "wire_formats": dict(Counter(conn.preferred_format for conn in connections_snapshot))
         }
 
     async def shutdown(self):
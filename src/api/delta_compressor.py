@@ -218,10 +218,13 @@ class DeltaCompressor:
             "data": data
         }
 
+        # ✅ PERFORMANCE: Encode once; the same bytes give the size and feed zlib
+        encoded = self._encode_payload(full_update)
+        original_size = len(encoded)
+
         # Compress if enabled
         if client_state.compression_enabled:
-            compressed_data = self._compress_payload(full_update)
-            original_size = len(json.dumps(full_update).encode('utf-8'))
+            compressed_data = zlib.compress(encoded, level=self.default_compression_level)
             compressed_size = len(compressed_data)
 
             with self._stats_lock:
@@ -230,7 +233,6 @@ class DeltaCompressor:
 
             return {"compressed": compressed_data.decode('latin-1')}, False
         else:
-            original_size = len(json.dumps(full_update).encode('utf-8'))
             with self._stats_lock:
                 self.stats.update(original_size, original_size, is_delta=False)
             client_state.update_state(data, is_delta=False)
@@ -246,10 +248,13 @@ class DeltaCompressor:
             "base_timestamp": datetime.fromtimestamp(client_state.last_update_time).isoformat()
         }
 
+        # ✅ PERFORMANCE: Encode once; the same bytes give the size and feed zlib
+        encoded = self._encode_payload(delta_update)
+        original_size = len(encoded)
+
         # Compress if enabled
         if client_state.compression_enabled:
-            compressed_data = self._compress_payload(delta_update)
-            original_size = len(json.dumps(delta_update).encode('utf-8'))
+            compressed_data = zlib.compress(encoded, level=self.default_compression_level)
             compressed_size = len(compressed_data)
 
             with self._stats_lock:
@@ -258,7 +263,6 @@ class DeltaCompressor:
 
             return {"compressed": compressed_data.decode('latin-1')}, True
         else:
-            original_size = len(json.dumps(delta_update).encode('utf-8'))
             with self._stats_lock:
                 self.stats.update(original_size, original_size, is_delta=True)
             client_state.update_state(full_data, is_delta=True)
@@ -339,10 +343,13 @@ class DeltaCompressor:
 
         return result
 
+    def _encode_payload(self, data: Dict[str, Any]) -> bytes:
+        """Encode data payload as compact JSON bytes"""
+        return json.dumps(data, separators=(',', ':'), default=self._json_serializer).encode('utf-8')
+
     def _compress_payload(self, data: Dict[str, Any]) -> bytes:
         """Compress data payload using zlib"""
-        json_str = json.dumps(data, separators=(',', ':'), default=self._json_serializer)
-        return zlib.compress(json_str.encode('utf-8'), level=self.default_compression_level)
+        return zlib.compress(self._encode_payload(data), level=self.default_compression_level)
 
     def _json_serializer(self, obj):
         """JSON serializer for custom types"""
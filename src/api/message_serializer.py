@@ -0,0 +1,252 @@
+"""
+Message Serializer
+==================
+Pluggable encoding of outbound WebSocket messages into pre-encoded frames.
+
+A broadcast envelope is encoded once into an EncodedFrame (payload + byte
+length) and the same frame object is handed to every recipient, so
+serialization cost scales with messages rather than messages x clients.
+
+Serializers:
+- "json": standard library json (always available)
+- "orjson": orjson text frames (used by default when installed)
+- "msgpack": MessagePack binary frames (when msgpack is installed), negotiated
+  per client during the WebSocket handshake. Only clients that offer it in the
+  handshake "encodings" list get it; the web frontend sends no handshake and
+  stays on JSON text frames
+
+Broadcasts to clients using different wire formats go through a FrameSet,
+which encodes the message at most once per format actually in use.
+"""
+
+import json
+import struct
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # json.dumps compatibility: int dict keys become strings; NumPy values encode natively
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    # pyright: reportMissingImports=false
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    # pyright: reportMissingImports=false
+    MSGPACK_AVAILABLE = False
+
+
+class EncodedFrame:
+    """
+    Pre-encoded WebSocket frame shared by all recipients of a message.
+
+    Text frames carry a str payload, binary frames carry bytes. `size` is the
+    encoded length in bytes (used for bandwidth accounting).
+    """
+
+    __slots__ = ("payload", "size", "is_binary", "_binary")
+
+    def __init__(self, payload: Union[str, bytes], size: Optional[int] = None):
+        self.payload = payload
+        self.is_binary = isinstance(payload, (bytes, bytearray))
+        if size is None:
+            size = len(payload) if self.is_binary else len(payload.encode("utf-8"))
+        self.size = size
+        self._binary: Optional[bytes] = payload if self.is_binary else None
+
+    @property
+    def binary(self) -> bytes:
+        """Payload as bytes (text frames are UTF-8 encoded once and cached)."""
+        if self._binary is None:
+            self._binary = self.payload.encode("utf-8")
+        return self._binary
+
+    def __repr__(self) -> str:
+        kind = "binary" if self.is_binary else "text"
+        return f"EncodedFrame({kind}, size={self.size})"
+
+
+class MessageSerializer:
+    """Encodes message dicts into EncodedFrames."""
+
+    name = "json"
+    is_binary = False
+
+    def dumps(self, message: Dict[str, Any]) -> Union[str, bytes]:
+        return json.dumps(message)
+
+    def encode(self, message: Dict[str, Any]) -> EncodedFrame:
+        """Encode a message into a frame that can be sent to any number of clients."""
+        return EncodedFrame(self.dumps(message))
+
+
+class OrjsonSerializer(MessageSerializer):
+    """orjson-backed JSON text frames (same wire format as json, faster encoding)."""
+
+    name = "orjson"
+
+    def dumps(self, message: Dict[str, Any]) -> str:
+        return orjson.dumps(message, default=str, option=ORJSON_OPTIONS).decode("utf-8")
+
+    def encode(self, message: Dict[str, Any]) -> EncodedFrame:
+        encoded = orjson.dumps(message, default=str, option=ORJSON_OPTIONS)
+        return EncodedFrame(encoded.decode("utf-8"), size=len(encoded))
+
+
+# MessagePack extension type codes for packed float32 series (little-endian)
+FLOAT32_VECTOR_EXT = 1  # float32[n]
+FLOAT32_MATRIX_EXT = 2  # uint32 column count, then float32[rows * cols] row-major
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Fallback for types msgpack cannot pack natively (mirrors json default=str)."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+class MsgpackSerializer(MessageSerializer):
+    """
+    MessagePack binary frames.
+
+    Numeric series stored under one of `float32_keys` (indicator values and
+    history, orderbook levels) are packed as float32 extension types instead
+    of per-element msgpack floats:
+    - FLOAT32_VECTOR_EXT for flat lists / 1-D arrays
+    - FLOAT32_MATRIX_EXT for lists of equal-length rows (e.g. [[price, qty], ...])
+
+    float32 keeps ~7 significant digits, so only those value series are
+    packed; timestamps and every other field keep full precision. Series that
+    are empty, ragged or contain non-numbers are packed as plain msgpack.
+    """
+
+    name = "msgpack"
+    is_binary = True
+
+    FLOAT32_SERIES_KEYS = frozenset({"values", "series", "history", "bids", "asks"})
+
+    def __init__(self, float32_keys: Optional[Iterable[str]] = None):
+        self.float32_keys = frozenset(float32_keys) if float32_keys is not None else self.FLOAT32_SERIES_KEYS
+
+    def dumps(self, message: Dict[str, Any]) -> bytes:
+        return msgpack.packb(self._pack_series(message), use_bin_type=True, default=_msgpack_default)
+
+    def _pack_series(self, value: Any) -> Any:
+        """Replace series under float32 keys with ext types (copies only containers it walks)."""
+        if isinstance(value, dict):
+            return {
+                key: self._pack_float32(item) if key in self.float32_keys else self._pack_series(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, (list, tuple)) and value and isinstance(value[0], (dict, list, tuple)):
+            # Batched envelopes, e.g. {"indicators": [{..., "values": [...]}, ...]}
+            return [self._pack_series(item) for item in value]
+        return value
+
+    def _pack_float32(self, value: Any) -> Any:
+        if isinstance(value, np.ndarray) and value.dtype.kind in "iuf" and value.ndim in (1, 2) and value.size:
+            return self._float32_ext(np.asarray(value, dtype="<f4"))
+
+        if not isinstance(value, (list, tuple)) or not value:
+            return self._pack_series(value)
+
+        first = value[0]
+        if _is_number(first):
+            if all(_is_number(item) for item in value):
+                return self._float32_ext(np.asarray(value, dtype="<f4"))
+        elif isinstance(first, (list, tuple)) and first:
+            width = len(first)
+            if all(
+                isinstance(row, (list, tuple)) and len(row) == width and all(_is_number(item) for item in row)
+                for row in value
+            ):
+                return self._float32_ext(np.asarray(value, dtype="<f4"))
+        return self._pack_series(value)
+
+    @staticmethod
+    def _float32_ext(array: np.ndarray) -> "msgpack.ExtType":
+        if array.ndim == 1:
+            return msgpack.ExtType(FLOAT32_VECTOR_EXT, array.tobytes())
+        return msgpack.ExtType(FLOAT32_MATRIX_EXT, struct.pack("<I", array.shape[1]) + array.tobytes())
+
+
+def decode_msgpack_ext(code: int, data: bytes) -> Any:
+    """
+    msgpack `ext_hook` turning packed float32 series back into lists.
+
+    Usage: msgpack.unpackb(payload, raw=False, ext_hook=decode_msgpack_ext)
+    """
+    if code == FLOAT32_VECTOR_EXT:
+        return np.frombuffer(data, dtype="<f4").tolist()
+    if code == FLOAT32_MATRIX_EXT:
+        (columns,) = struct.unpack_from("<I", data)
+        return np.frombuffer(data, dtype="<f4", offset=4).reshape(-1, columns).tolist()
+    return msgpack.ExtType(code, data)
+
+
+SERIALIZERS: Dict[str, Callable[[], MessageSerializer]] = {"json": MessageSerializer}
+if ORJSON_AVAILABLE:
+    SERIALIZERS["orjson"] = OrjsonSerializer
+if MSGPACK_AVAILABLE:
+    SERIALIZERS["msgpack"] = MsgpackSerializer
+
+
+class FrameSet:
+    """
+    One message, encoded lazily once per wire format its recipients use.
+
+    Broadcasts where every client speaks the same format still encode exactly
+    once; each additional negotiated format adds one more encode, never one
+    per client.
+    """
+
+    __slots__ = ("message", "_serializers", "_default", "_frames")
+
+    def __init__(self, message: Dict[str, Any], serializers: Dict[str, MessageSerializer],
+                 default: MessageSerializer):
+        self.message = message
+        self._serializers = serializers
+        self._default = default
+        self._frames: Dict[str, EncodedFrame] = {}
+
+    def frame(self, wire_format: str) -> EncodedFrame:
+        """Return the frame for a wire format (unknown formats use the default serializer)."""
+        frame = self._frames.get(wire_format)
+        if frame is None:
+            serializer = self._serializers.get(wire_format, self._default)
+            frame = self._frames[wire_format] = serializer.encode(self.message)
+        return frame
+
+    @property
+    def encoded_formats(self) -> tuple:
+        return tuple(self._frames)
+
+
+def get_serializer(name: Optional[str] = None) -> MessageSerializer:
+    """
+    Return a serializer by name, or the fastest available JSON serializer.
+
+    Args:
+        name: "json", "orjson" or "msgpack" (None picks orjson when installed)
+
+    Raises:
+        ValueError: If the named serializer is unknown or its library is not installed
+    """
+    if name is None:
+        name = "orjson" if ORJSON_AVAILABLE else "json"
+    factory = SERIALIZERS.get(name)
+    if factory is None:
+        raise ValueError(f"Serializer '{name}' is not available (installed: {sorted(SERIALIZERS)})")
+    return factory()
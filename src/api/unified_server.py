@@ -356,15 +356,17 @@ def create_unified_app():
         )
         logger.info("state_machine_routes initialized")
 
-        # Start DashboardCacheService (background updates every 1 second)
+        # Start DashboardCacheService (event-driven, changed rows flushed every 1 second)
         dashboard_cache_service = DashboardCacheService(
             questdb_provider=questdb_provider,
-            update_interval=1.0  # Update cache every 1 second
+            update_interval=1.0,  # Flush changed cache rows every 1 second
+            event_bus=event_bus
         )
         await dashboard_cache_service.start()
         app.state.dashboard_cache_service = dashboard_cache_service
         logger.info("dashboard_cache_service.started", {
             "update_interval": 1.0,
+            "event_driven": True,
             "status": "background_task_running"
         })
 
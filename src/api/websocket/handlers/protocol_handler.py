@@ -191,7 +191,8 @@ class ProtocolMessageHandler:
             "type": "handshake",
             "version": "1.0",
             "client_id": "web_client_123",
-            "capabilities": ["market_data", "signals"]
+            "capabilities": ["market_data", "signals"],
+            "encodings": ["msgpack", "json"]  # Optional, in order of preference
         }
 
         Success response:
@@ -201,9 +202,14 @@ class ProtocolMessageHandler:
             "server_version": "1.0",
             "server_capabilities": ["market_data", "signals", "commands", "indicators"],
             "session_id": "session_client_123_1234567890",
+            "encoding": "msgpack",
+            "supported_encodings": ["msgpack", "json"],
             "timestamp": "2025-11-03T11:00:00"
         }
 
+        With "msgpack" selected, the ack and all later frames are binary
+        MessagePack (value series packed as float32, see MsgpackSerializer).
+
         Rejection response:
         {
             "type": "handshake_ack",
@@ -277,6 +283,12 @@ class ProtocolMessageHandler:
                     'client_id': client_id_from_msg,
                     'handshake_timestamp': datetime.now().isoformat()
                 })
+                # ✅ PERFORMANCE: Negotiate the wire format (MessagePack with float32 series
+                # when offered and installed, JSON otherwise); the ack is the first frame
+                # sent in the selected encoding
+                encoding = self.connection_manager.negotiate_format(connection, message.get('encodings'))
+            else:
+                encoding = "json"
 
             # Log successful handshake
             if self.logger:
@@ -284,6 +296,7 @@ class ProtocolMessageHandler:
                     "client_id": client_id,
                     "client_version": client_version,
                     "capabilities": client_capabilities,
+                    "encoding": encoding,
                     "handshake_timestamp": datetime.now().isoformat()
                 })
 
@@ -294,6 +307,8 @@ class ProtocolMessageHandler:
                 "server_version": self.PROTOCOL_VERSION,
                 "server_capabilities": self.SUPPORTED_CAPABILITIES,
                 "session_id": f"session_{client_id}_{int(datetime.now().timestamp())}",
+                "encoding": encoding,
+                "supported_encodings": self.connection_manager.supported_formats,
                 "timestamp": datetime.now().isoformat()
             }
 
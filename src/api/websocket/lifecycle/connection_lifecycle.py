@@ -434,15 +434,8 @@ class ConnectionLifecycle:
             from src.api.protocol import ensure_envelope
             enriched = ensure_envelope(message, request_id=request_id)
 
-            # Send via connection manager
-            success = await self.connection_manager.send_to_client(client_id, enriched)
-
-            if success:
-                # Record message size for bandwidth tracking
-                message_size = len(json.dumps(enriched).encode('utf-8'))
-                await self.connection_manager.record_message_activity(client_id, "sent", message_size)
-
-            return success
+            # Send via connection manager (records the sent size for bandwidth tracking)
+            return await self.connection_manager.send_to_client(client_id, enriched)
 
         except Exception as e:
             if self.logger:
@@ -21,7 +21,8 @@ from websockets.exceptions import ConnectionClosed
 
 from ..core.event_bus import EventBus
 from ..core.logger import StructuredLogger
-from .connection_manager import ConnectionManager
+from .connection_manager import ConnectionManager, conflation_key
+from .message_serializer import FrameSet
 from .message_router import MessageRouter, MessageType
 from .auth_handler import AuthHandler, AuthResult, UserSession, Permission
 from .subscription_manager import SubscriptionManager
@@ -1223,14 +1224,8 @@ class WebSocketAPIServer:
             # Enrich message with version/timestamp/id if missing
             enriched = ensure_envelope(message, request_id=request_id)
 
-            success = await self.connection_manager.send_to_client(client_id, enriched)
-
-            if success:
-                # Record message size for bandwidth tracking
-                message_size = len(json.dumps(enriched).encode('utf-8'))
-                await self.connection_manager.record_message_activity(client_id, "sent", message_size)
-
-            return success
+            # ConnectionManager records the sent message size for bandwidth tracking
+            return await self.connection_manager.send_to_client(client_id, enriched)
         except Exception as e:
             self.logger.error("websocket_server.send_error", {
                 "client_id": client_id,
@@ -1240,11 +1235,22 @@ class WebSocketAPIServer:
             return False
 
     async def _send_to_single_subscriber(self, client_id: str, subscription_type: str,
-                                         data: Dict[str, Any]) -> bool:
+                                         data: Dict[str, Any],
+                                         frames: Optional[FrameSet] = None,
+                                         stream_key: Optional[tuple] = None) -> bool:
         """
         Send message to a single subscriber with all checks and error handling.
-        Returns True if message was successfully sent, False otherwise.
+        Returns True if message was successfully queued, False otherwise.
+
+        `frames` holds the broadcast's envelope of `data`, encoded once per wire
+        format; the frame for this client's format is queued on its send queue
+        (conflated by `stream_key`) instead of serializing `data` for this
+        client, and its size is used for delivery stats.
         """
+        if frames is None:
+            frames = self.connection_manager.frame_set(ensure_envelope(data))
+        frame = self.connection_manager.frame_for(client_id, frames)
+
         # Derive payload for filtering (strip envelope)
         filter_payload = data
         try:
@@ -1277,9 +1283,8 @@ class WebSocketAPIServer:
             connection = await self.connection_manager.get_connection(client_id)
             if connection and getattr(connection, 'in_flight_response', False):
                 # Record filtered message
-                message_size = len(json.dumps(data).encode('utf-8'))
                 await self.subscription_manager.record_message_delivery(
-                    client_id, subscription_type, message_size, filtered=True
+                    client_id, subscription_type, frame.size, filtered=True
                 )
                 return False
         except (AttributeError, TypeError) as e:
@@ -1311,11 +1316,10 @@ class WebSocketAPIServer:
                     await self.connection_manager.remove_connection(client_id, "connection_check_failed")
                     return False
 
-                if await self._send_to_client(client_id, data):
+                if self.connection_manager.enqueue_frame(client_id, frame, stream_key):
                     # Record message delivery
-                    message_size = len(json.dumps(data).encode('utf-8'))
                     await self.subscription_manager.record_message_delivery(
-                        client_id, subscription_type, message_size, filtered=False
+                        client_id, subscription_type, frame.size, filtered=False
                     )
                     return True
             else:
@@ -1323,9 +1327,8 @@ class WebSocketAPIServer:
                 await self.connection_manager.remove_connection(client_id, "connection_not_found")
         else:
             # Record filtered message
-            message_size = len(json.dumps(data).encode('utf-8'))
             await self.subscription_manager.record_message_delivery(
-                client_id, subscription_type, message_size, filtered=True
+                client_id, subscription_type, frame.size, filtered=True
             )
 
         return False
@@ -1336,7 +1339,8 @@ class WebSocketAPIServer:
                                       exclude_client: Optional[str] = None) -> int:
         """
         Broadcast message to all subscribers of a specific type.
-        Sends to all clients concurrently for minimal latency.
+        Each send is an enqueue onto the client's own send queue, so a slow
+        client never delays the others.
 
         Args:
             subscription_type: Type of subscription to broadcast to
@@ -1344,7 +1348,7 @@ class WebSocketAPIServer:
             exclude_client: Client ID to exclude from broadcast
 
         Returns:
-            Number of clients message was sent to
+            Number of clients message was queued for
         """
         subscribers = self.subscription_manager.get_subscribers(subscription_type)
 
@@ -1361,11 +1365,17 @@ class WebSocketAPIServer:
         if not subscribers:
             return 0
 
+        # ✅ PERFORMANCE: Serialize the envelope once per wire format; subscribers using
+        # the same format share the frame (stream broadcasts are not responses, so no
+        # per-client request id is echoed)
+        frames = self.connection_manager.frame_set(ensure_envelope(data))
+        stream_key = conflation_key(subscription_type, data)
+
         # ✅ PERF FIX: Parallel broadcast to all clients
         # Sequential await was blocking EventBus workers when broadcasting to many clients
         # Now sends to all clients concurrently - critical for real-time trading
         tasks = [
-            self._send_to_single_subscriber(client_id, subscription_type, data)
+            self._send_to_single_subscriber(client_id, subscription_type, data, frames, stream_key)
             for client_id in list(subscribers)
         ]
 
@@ -2064,6 +2074,9 @@ class WebSocketAPIServer:
         Purpose:
         - Validates protocol version compatibility
         - Enables capability negotiation between client and server
+        - Negotiates the wire format: optional "encodings" list in the client's
+          order of preference; "msgpack" (binary frames, float32 value series)
+          is selected when offered and installed, JSON otherwise
         - Tracks handshake status in connection manager
 
         Security Note:
@@ -2125,12 +2138,19 @@ class WebSocketAPIServer:
                     'client_id': client_id_from_msg,
                     'handshake_timestamp': datetime.now().isoformat()
                 })
+                # ✅ PERFORMANCE: Negotiate the wire format (MessagePack with float32 series
+                # when offered and installed, JSON otherwise); the ack is the first frame
+                # sent in the selected encoding
+                encoding = self.connection_manager.negotiate_format(connection, message.get('encodings'))
+            else:
+                encoding = "json"
 
             # Log successful handshake
             self.logger.info("websocket_server.handshake_successful", {
                 "client_id": client_id,
                 "client_version": client_version,
                 "capabilities": client_capabilities,
+                "encoding": encoding,
                 "handshake_timestamp": datetime.now().isoformat()
             })
 
@@ -2141,6 +2161,8 @@ class WebSocketAPIServer:
                 "server_version": "1.0",
                 "server_capabilities": supported_capabilities,
                 "session_id": f"session_{client_id}_{int(datetime.now().timestamp())}",
+                "encoding": encoding,
+                "supported_encodings": self.connection_manager.supported_formats,
                 "timestamp": datetime.now().isoformat()
             }
 
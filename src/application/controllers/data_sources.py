@@ -8,13 +8,16 @@ Implementations of IExecutionDataSource for different execution modes.
 """
 
 import asyncio
+import heapq
 import os
 import time
+from collections import deque
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Deque
 
 from .execution_controller import IExecutionDataSource
 from ...core.logger import StructuredLogger
+from ...core.time_manager import VirtualClock, to_epoch_seconds
 from ...domain.interfaces.market_data import IMarketDataProvider
 from ...data.questdb_data_provider import QuestDBDataProvider
 
@@ -270,15 +273,47 @@ class LiveDataSource(IExecutionDataSource):
                 })
 
 
+# Replay modes for QuestDBHistoricalDataSource
+# - paced: wall-clock sleeps scaled by acceleration_factor (max 100 ticks/sec)
+# - virtual_clock: no sleeps; time advances with tick timestamps and the replay
+#   runs as fast as subscribers consume (awaited publish = backpressure)
+REPLAY_MODE_PACED = "paced"
+REPLAY_MODE_VIRTUAL_CLOCK = "virtual_clock"
+REPLAY_MODES = (REPLAY_MODE_PACED, REPLAY_MODE_VIRTUAL_CLOCK)
+
+# Ticks per publish_many() call in virtual-clock replay
+REPLAY_PUBLISH_CHUNK = 64
+
+
+class _SymbolCursor:
+    """
+    Per-symbol read cursor for the replay k-way merge.
+
+    Holds the current QuestDB page of raw tick rows plus the in-flight
+    prefetch of the following page.
+    """
+
+    __slots__ = ("symbol", "order", "rows", "next_page")
+
+    def __init__(self, symbol: str, order: int):
+        self.symbol = symbol
+        self.order = order  # Tie-breaker for equal timestamps (symbol list order)
+        self.rows: Deque[Dict[str, Any]] = deque()
+        self.next_page: Optional[asyncio.Task] = None
+
+
 class QuestDBHistoricalDataSource(IExecutionDataSource):
     """
     Historical data source for backtesting using QuestDB.
     
     Replays tick_prices from specific data collection session with:
     - Time acceleration support
+    - Unthrottled virtual-clock replay (replay_mode="virtual_clock")
     - Batch reading for performance
-    - Progress tracking
-    - Multi-symbol support
+    - Progress and throughput tracking
+    - Multi-symbol support: ticks of all symbols are emitted in timestamp
+      order (k-way heap merge over per-symbol cursors that prefetch their
+      next QuestDB page concurrently)
     
     ✅ STEP 4: New implementation for QuestDB-based backtest
     """
@@ -292,7 +327,8 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
         execution_controller,
         acceleration_factor: float = 1.0,
         batch_size: int = 100,
-        logger: Optional[StructuredLogger] = None
+        logger: Optional[StructuredLogger] = None,
+        replay_mode: str = REPLAY_MODE_PACED
     ):
         """
         Initialize QuestDB historical data source.
@@ -306,7 +342,15 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
             acceleration_factor: Time acceleration (1.0 = realtime, 10.0 = 10x speed)
             batch_size: Number of records to fetch per batch
             logger: Optional structured logger
+            replay_mode: "paced" (wall-clock sleeps, honours acceleration_factor) or
+                         "virtual_clock" (no sleeps, runs at subscriber speed)
+
+        Raises:
+            ValueError: If replay_mode is not one of REPLAY_MODES
         """
+        if replay_mode not in REPLAY_MODES:
+            raise ValueError(f"Invalid replay_mode '{replay_mode}'. Must be one of: {', '.join(REPLAY_MODES)}")
+
         self.session_id = session_id
         self.symbols = list(symbols)  # Make a copy
         self.db_provider = db_provider
@@ -315,10 +359,17 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
         self.acceleration_factor = acceleration_factor
         self.batch_size = batch_size
         self.logger = logger
+        self.replay_mode = replay_mode
 
         # ✅ MEMORY LEAK FIX: Background task tracking with strong references
         self._background_tasks: set = set()
 
+        # Virtual clock + throughput stats (see get_replay_stats)
+        self._clock = VirtualClock()
+        self._ticks_replayed = 0
+        self._replay_started_at: Optional[float] = None  # perf_counter()
+        self._replay_finished_at: Optional[float] = None  # perf_counter()
+
         # State tracking
         # ✅ FIX (2025-11-30): Changed from numeric offset to timestamp-based cursor
         # QuestDB doesn't support OFFSET clause, so we track last timestamp instead
@@ -337,12 +388,17 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
         self._retry_counts: Dict[str, int] = {}  # Track retries per symbol
         self._max_retries = 3  # Retry up to 3 times before marking as failed
 
+        # K-way merge state (built lazily on first _fetch_next_batch call)
+        # Heap entries: (timestamp_seconds, cursor.order, cursor) for the head row of each cursor
+        self._merge_heap: Optional[List[tuple]] = None
+
     async def start_stream(self) -> None:
         """Initialize streaming from QuestDB and start replay task"""
         if not self._stop_event.is_set() and self._replay_task and not self._replay_task.done():
             return  # Already streaming
 
         self._stop_event.clear()  # Clear stop signal = streaming active
+        self._merge_heap = None  # Rebuild cursors from the reset timestamps below
 
         # Count total rows for each symbol (for progress tracking)
         for symbol in self.symbols:
@@ -388,14 +444,26 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
         Reads batches from QuestDB and publishes to EventBus,
         simulating live market data for backtesting.
 
+        Paced mode (default):
         ✅ CRITICAL FIX: Rate limiting to prevent infinite loop and resource exhaustion
         - Enforces minimum 10ms delay between ticks (max 100 ticks/second)
         - Adds batch-level delay to prevent event loop starvation
         - Prevents memory exhaustion from buffer overflow
+
+        Virtual-clock mode:
+        - No wall-clock sleeps; the virtual clock advances to each tick timestamp
+        - Ticks are published in chunks of REPLAY_PUBLISH_CHUNK via publish_many()
+        - Backpressure comes from awaiting publish_many() (every subscriber handled
+          the chunk) plus one event loop yield per chunk so spawned consumer tasks
+          and stop_session() still get scheduled
         """
+        unthrottled = self.replay_mode == REPLAY_MODE_VIRTUAL_CLOCK
+
         try:
             tick_count = 0
             batch_count = 0
+            self._replay_started_at = time.perf_counter()
+            self._replay_finished_at = None
 
             while not self._stop_event.is_set():
                 # Fetch next batch using existing logic
@@ -403,12 +471,14 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
 
                 if not batch:
                     # End of historical data
+                    self._replay_finished_at = time.perf_counter()
                     if self.logger:
                         self.logger.info("questdb_historical.replay_complete", {
                             "session_id": self.session_id,
                             "total_processed": sum(self._rows_processed.values()),
                             "total_batches": batch_count,
-                            "total_ticks": tick_count
+                            "total_ticks": tick_count,
+                            **self.get_replay_stats()
                         })
                     break
 
@@ -417,40 +487,34 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
                 # ✅ CRITICAL FIX: Add batch-level delay to prevent event loop starvation
                 # Even at high acceleration, we need to yield control periodically
                 # This prevents the infinite loop from blocking stop_session() calls
-                if batch_count % 10 == 0:
+                # (virtual-clock mode already yields after every tick)
+                if not unthrottled and batch_count % 10 == 0:
                     await asyncio.sleep(0.1)  # Yield every 10 batches
 
+                if unthrottled:
+                    for start in range(0, len(batch), REPLAY_PUBLISH_CHUNK):
+                        if self._stop_event.is_set():
+                            break
+                        chunk = batch[start:start + REPLAY_PUBLISH_CHUNK]
+                        tick_count += len(chunk)
+                        self._ticks_replayed += len(chunk)
+                        for tick in chunk:
+                            self._clock.advance(tick["timestamp"])
+
+                        await self._emit_ticks(chunk)
+                        await asyncio.sleep(0)
+                    continue
+
                 # Publish each tick to EventBus (same as live data)
                 for tick in batch:
                     if self._stop_event.is_set():
                         break
 
                     tick_count += 1
+                    self._ticks_replayed += 1
+                    self._clock.advance(tick["timestamp"])
 
-                    # Publish to EventBus for indicators/strategies
-                    if self.event_bus:
-                        await self.event_bus.publish("market.price_update", {
-                            "symbol": tick["symbol"],
-                            "price": tick["price"],
-                            "volume": tick["volume"],
-                            "quote_volume": tick.get("quote_volume", 0.0),
-                            "timestamp": tick["timestamp"],
-                            "exchange": "questdb_backtest",
-                            "source": "backtest",
-                            "metadata": tick.get("metadata", {})
-                        })
-
-                    # Write to execution_controller buffer (for CSV/persistence)
-                    if self.execution_controller:
-                        await self.execution_controller._save_data_to_files({
-                            "event_type": "price",
-                            "symbol": tick["symbol"],
-                            "price": tick["price"],
-                            "volume": tick["volume"],
-                            "quote_volume": tick.get("quote_volume", 0.0),
-                            "timestamp": tick["timestamp"],
-                            "source": "backtest"
-                        })
+                    await self._emit_tick(tick)
 
                     # ✅ CRITICAL FIX: Enforce minimum delay to prevent resource exhaustion
                     # OLD: delay = (10.0 / max(1.0, acceleration_factor)) / 1000.0
@@ -489,32 +553,169 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
                     "error_type": type(e).__name__
                 })
 
+    @staticmethod
+    def _price_update_event(tick: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the market.price_update payload for one replayed tick."""
+        return {
+            "symbol": tick["symbol"],
+            "price": tick["price"],
+            "volume": tick["volume"],
+            "quote_volume": tick.get("quote_volume", 0.0),
+            "timestamp": tick["timestamp"],
+            "exchange": "questdb_backtest",
+            "source": "backtest",
+            "metadata": tick.get("metadata", {})
+        }
+
+    async def _save_tick(self, tick: Dict[str, Any]) -> None:
+        """Write one replayed tick to the execution controller buffer (for CSV/persistence)."""
+        await self.execution_controller._save_data_to_files({
+            "event_type": "price",
+            "symbol": tick["symbol"],
+            "price": tick["price"],
+            "volume": tick["volume"],
+            "quote_volume": tick.get("quote_volume", 0.0),
+            "timestamp": tick["timestamp"],
+            "source": "backtest"
+        })
+
+    async def _emit_tick(self, tick: Dict[str, Any]) -> None:
+        """Publish one replayed tick to EventBus and the execution controller buffer."""
+        # Publish to EventBus for indicators/strategies
+        if self.event_bus:
+            await self.event_bus.publish("market.price_update", self._price_update_event(tick))
+
+        if self.execution_controller:
+            await self._save_tick(tick)
+
+    async def _emit_ticks(self, ticks: List[Dict[str, Any]]) -> None:
+        """Publish a chunk of replayed ticks with one EventBus publish_many() call."""
+        if self.event_bus:
+            await self.event_bus.publish_many(
+                "market.price_update", [self._price_update_event(tick) for tick in ticks]
+            )
+
+        if self.execution_controller:
+            for tick in ticks:
+                await self._save_tick(tick)
+
     async def _fetch_next_batch(self) -> Optional[List[Dict[str, Any]]]:
         """
         Fetch next batch of data from QuestDB.
 
+        Ticks from all symbols are merged in timestamp order: each symbol has a
+        cursor over its own QuestDB pages and a heap keyed on the head row
+        timestamp picks the next tick. While a page is being consumed the next
+        page of the same symbol is already being fetched in the background.
+
         Returns:
             List of market data dictionaries or None if stream ended
         """
         if self._stop_event.is_set():
             return None
 
-        # ✅ FIX (2026-01-21) BUG-APP-022: Check both exhausted AND failed symbols
-        # RISK MINIMIZED: Distinguish between "data complete" and "data unavailable"
-        completed_symbols = self._exhausted_symbols | self._failed_symbols
-        if len(completed_symbols) >= len(self.symbols):
-            return None
+        if self._merge_heap is None:
+            await self._init_merge()
 
+        heap = self._merge_heap
         batch = []
 
-        # Read from all active symbols in round-robin fashion
-        for symbol in list(self.symbols):
-            if symbol in self._exhausted_symbols or symbol in self._failed_symbols:
-                continue
-            
-            if len(batch) >= self.batch_size:
-                break
-            
+        while heap and len(batch) < self.batch_size:
+            _, _, cursor = heapq.heappop(heap)
+            symbol = cursor.symbol
+            row = cursor.rows.popleft()
+
+            batch.append(self._to_market_data(symbol, row))
+            self._rows_processed[symbol] = self._rows_processed.get(symbol, 0) + 1
+
+            if not cursor.rows and not await self._refill_cursor(cursor):
+                continue  # Symbol exhausted or failed - drops out of the merge
+
+            heapq.heappush(heap, (self._row_sort_key(cursor.rows[0]), cursor.order, cursor))
+
+        # No data available
+        if not batch:
+            return None
+
+        return batch
+
+    async def _init_merge(self) -> None:
+        """Create per-symbol cursors, fetch their first pages concurrently and seed the merge heap."""
+        cursors = [
+            _SymbolCursor(symbol, order)
+            for order, symbol in enumerate(self.symbols)
+            if symbol not in self._exhausted_symbols and symbol not in self._failed_symbols
+        ]
+
+        for cursor in cursors:
+            self._prefetch_page(cursor)
+
+        self._merge_heap = []
+        for cursor in cursors:
+            if await self._refill_cursor(cursor):
+                heapq.heappush(self._merge_heap, (self._row_sort_key(cursor.rows[0]), cursor.order, cursor))
+
+    def _prefetch_page(self, cursor: _SymbolCursor) -> None:
+        """Start fetching the next QuestDB page for a cursor in the background."""
+        task = asyncio.create_task(self._fetch_symbol_page(cursor.symbol))
+        # ✅ MEMORY LEAK FIX: Track task so stop_stream() cancels in-flight prefetches
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        cursor.next_page = task
+
+    async def _refill_cursor(self, cursor: _SymbolCursor) -> bool:
+        """
+        Load the prefetched page into an empty cursor and prefetch the following one.
+
+        Returns:
+            True if the cursor has rows again, False if the symbol is done
+        """
+        if cursor.next_page is None:
+            return False
+
+        rows = await cursor.next_page
+        cursor.next_page = None
+
+        if not rows:
+            return False
+
+        cursor.rows.extend(rows)
+        self._prefetch_page(cursor)
+        return True
+
+    @staticmethod
+    def _row_sort_key(row: Dict[str, Any]) -> float:
+        """Merge key for a raw tick row (epoch seconds)."""
+        ts = to_epoch_seconds(row.get('timestamp'))
+        return ts if ts is not None else 0.0
+
+    def _to_market_data(self, symbol: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a raw tick_prices row to market data format."""
+        return {
+            "symbol": symbol,
+            "timestamp": row.get('timestamp'),
+            "price": float(row.get('price', 0)),
+            "volume": float(row.get('volume', 0)),
+            "quote_volume": float(row.get('quote_volume', 0)),
+            "source": "questdb_historical",
+            "metadata": {
+                "session_id": self.session_id,
+                "acceleration_factor": self.acceleration_factor,
+                "rows_processed": self._rows_processed.get(symbol, 0)
+            }
+        }
+
+    async def _fetch_symbol_page(self, symbol: str) -> List[Dict[str, Any]]:
+        """
+        Fetch the next page of raw tick rows for one symbol.
+
+        Advances the timestamp cursor for the symbol. Retries transient
+        failures with backoff before marking the symbol as failed.
+
+        Returns:
+            Raw rows, or an empty list if the symbol is exhausted or failed
+        """
+        while not self._stop_event.is_set():
             # ✅ FIX (2025-11-30): Use timestamp-based cursor instead of offset
             # QuestDB doesn't support OFFSET, so we use after_timestamp
             last_timestamp = self._cursors.get(symbol)  # None for first batch
@@ -524,7 +725,7 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
                 rows = await self.db_provider.get_tick_prices(
                     session_id=self.session_id,
                     symbol=symbol,
-                    limit=self.batch_size - len(batch),
+                    limit=self.batch_size,
                     after_timestamp=last_timestamp
                 )
 
@@ -538,41 +739,23 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
                             "symbol": symbol,
                             "rows_processed": self._rows_processed.get(symbol, 0)
                         })
-                    continue
-
-                # Convert to market data format
-                for row in rows:
-                    market_data = {
-                        "symbol": symbol,
-                        "timestamp": row.get('timestamp'),
-                        "price": float(row.get('price', 0)),
-                        "volume": float(row.get('volume', 0)),
-                        "quote_volume": float(row.get('quote_volume', 0)),
-                        "source": "questdb_historical",
-                        "metadata": {
-                            "session_id": self.session_id,
-                            "acceleration_factor": self.acceleration_factor,
-                            "rows_processed": self._rows_processed.get(symbol, 0)
-                        }
-                    }
-                    batch.append(market_data)
+                    return []
 
                 # ✅ FIX (2025-11-30): Update cursor to last timestamp in batch
                 # Store as microseconds (QuestDB timestamp format)
-                if rows:
-                    last_row_ts = rows[-1].get('timestamp')
-                    if last_row_ts is not None:
-                        # Handle both datetime and int timestamp formats
-                        if hasattr(last_row_ts, 'timestamp'):
-                            self._cursors[symbol] = int(last_row_ts.timestamp() * 1_000_000)
-                        else:
-                            self._cursors[symbol] = int(last_row_ts)
-                    self._rows_processed[symbol] = self._rows_processed.get(symbol, 0) + len(rows)
-                
+                last_row_ts = rows[-1].get('timestamp')
+                if last_row_ts is not None:
+                    # Handle both datetime and int timestamp formats
+                    if hasattr(last_row_ts, 'timestamp'):
+                        self._cursors[symbol] = int(last_row_ts.timestamp() * 1_000_000)
+                    else:
+                        self._cursors[symbol] = int(last_row_ts)
+
+                return rows
+
             except Exception as e:
                 # ✅ FIX (2026-01-21) BUG-APP-022: Retry with exponential backoff
                 # RISK MINIMIZED: Transient QuestDB failures no longer mark symbol as exhausted
-                # File: data_sources.py, Lines: 570-620
                 retry_count = self._retry_counts.get(symbol, 0)
 
                 if retry_count < self._max_retries:
@@ -592,7 +775,7 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
                         })
 
                     await asyncio.sleep(backoff_seconds)
-                    # Don't mark as exhausted - will retry on next batch fetch
+                    # Don't mark as exhausted - retry the same page
                     continue
 
                 # Max retries exceeded - mark as FAILED (not exhausted)
@@ -621,13 +804,10 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
                         "source": "questdb_historical",
                         "impact": "Backtest running on incomplete data"
                     })
-        
-        # No data available
-        if not batch:
-            return None
+                return []
+
+        return []
 
-        return batch
-    
     async def stop_stream(self) -> None:
         """Stop streaming and cancel all background tasks"""
         self._stop_event.set()  # Signal stop to replay task
@@ -644,6 +824,8 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
         # Clear the task set
         self._background_tasks.clear()
         self._replay_task = None
+        # Cursors in the heap hold the prefetch tasks cancelled above
+        self._merge_heap = None
 
         # ✅ FIX (2026-01-21) BUG-APP-012: Close QuestDB provider to prevent connection leak
         if self.db_provider and hasattr(self.db_provider, 'db') and self.db_provider.db:
@@ -693,3 +875,27 @@ class QuestDBHistoricalDataSource(IExecutionDataSource):
 
         progress = (total_processed / total_available) * 100.0
         return min(100.0, progress)
+
+    def get_replay_stats(self) -> Dict[str, Any]:
+        """
+        Replay throughput statistics.
+
+        Returns:
+            Dict with replay_mode, ticks_replayed, wall_seconds, ticks_per_second,
+            virtual_seconds (market time covered) and speedup (virtual / wall)
+        """
+        wall_seconds = 0.0
+        if self._replay_started_at is not None:
+            end = self._replay_finished_at if self._replay_finished_at is not None else time.perf_counter()
+            wall_seconds = end - self._replay_started_at
+
+        virtual_seconds = self._clock.elapsed
+
+        return {
+            "replay_mode": self.replay_mode,
+            "ticks_replayed": self._ticks_replayed,
+            "wall_seconds": round(wall_seconds, 6),
+            "ticks_per_second": round(self._ticks_replayed / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+            "virtual_seconds": round(virtual_seconds, 6),
+            "speedup": round(virtual_seconds / wall_seconds, 2) if wall_seconds > 0 else 0.0
+        }
@@ -744,6 +744,7 @@ class ExecutionController:
                 raise ValueError("Backtest mode requires 'session_id' parameter")
 
             acceleration_factor = self._current_session.parameters.get("acceleration_factor", 1.0)
+            replay_mode = self._current_session.parameters.get("replay_mode", "paced")
 
             # Create QuestDB data provider
             from ...data.questdb_data_provider import QuestDBDataProvider
@@ -765,13 +766,15 @@ class ExecutionController:
                 event_bus=self._event_bus,  # ✅ PASS EventBus
                 execution_controller=self,  # ✅ PASS self reference
                 acceleration_factor=acceleration_factor,
-                logger=self.logger
+                logger=self.logger,
+                replay_mode=replay_mode
             )
 
             self.logger.info("execution_controller.backtest_source_created", {
                 "session_id": session_id_param,
                 "symbols": self._current_session.symbols,
-                "acceleration_factor": acceleration_factor
+                "acceleration_factor": acceleration_factor,
+                "replay_mode": replay_mode
             })
 
             await self.start_execution(
@@ -1604,6 +1607,11 @@ class ExecutionController:
 
         self._current_session.progress = progress
 
+        # Backtest replay throughput (ticks/s, virtual-clock speedup)
+        get_replay_stats = getattr(self._data_source, "get_replay_stats", None)
+        if callable(get_replay_stats):
+            self._current_session.metrics["replay"] = get_replay_stats()
+
         # Always update internal state
         self._last_progress_update = progress
 
@@ -15,7 +15,12 @@ from collections import deque
 from ...core.event_bus import EventBus
 from ...core.logger import StructuredLogger
 from ..controllers.execution_controller import ExecutionController, ExecutionMode
-from ..controllers.data_sources import LiveDataSource, QuestDBHistoricalDataSource
+from ..controllers.data_sources import (
+    LiveDataSource,
+    QuestDBHistoricalDataSource,
+    REPLAY_MODE_PACED,
+    REPLAY_MODES,
+)
 from ...domain.interfaces.market_data import IMarketDataProvider
 from ...data.questdb_data_provider import QuestDBDataProvider
 from ...data_feed.questdb_provider import QuestDBProvider
@@ -511,6 +516,7 @@ class AsyncCommandProcessor:
 
         Optional parameters:
         - acceleration_factor: Playback speed multiplier (default: 10.0)
+        - replay_mode: "paced" (default) or "virtual_clock" (unthrottled replay)
         """
         errors = []
         warnings = []
@@ -597,6 +603,10 @@ class AsyncCommandProcessor:
         if not isinstance(acceleration_factor, (int, float)) or acceleration_factor <= 0:
             errors.append("Acceleration factor must be a positive number")
 
+        replay_mode = parameters.get("replay_mode", REPLAY_MODE_PACED)
+        if replay_mode not in REPLAY_MODES:
+            errors.append(f"Replay mode must be one of: {', '.join(REPLAY_MODES)}")
+
         # Check if execution is already running
         current_session = self.execution_controller.get_current_session()
         if current_session and current_session.status.value in ["running", "starting"]:
@@ -765,7 +775,8 @@ class AsyncCommandProcessor:
             execution_controller=self.execution_controller,  # ✅ PASS ExecutionController
             acceleration_factor=parameters.get("acceleration_factor", 10.0),
             batch_size=parameters.get("batch_size", 100),
-            logger=self.logger
+            logger=self.logger,
+            replay_mode=parameters.get("replay_mode", REPLAY_MODE_PACED)
         )
 
         # ✅ FIX (2025-11-30): Extract pre_start_callback from parameters
@@ -788,7 +799,8 @@ class AsyncCommandProcessor:
             "data_session_id": data_session_id,  # Link to source data session
             "mode": "backtest",
             "symbols": symbols,
-            "acceleration_factor": parameters.get("acceleration_factor", 10.0)
+            "acceleration_factor": parameters.get("acceleration_factor", 10.0),
+            "replay_mode": parameters.get("replay_mode", REPLAY_MODE_PACED)
         }
     
     async def _execute_start_trading(self, command_execution: CommandExecution) -> Dict[str, Any]:
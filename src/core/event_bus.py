@@ -6,16 +6,49 @@ Central asynchronous event bus for pub/sub communication.
 Delivery Guarantee: AT_LEAST_ONCE (with retry on failure)
 Memory Safe: NO defaultdict, explicit cleanup
 Error Isolation: Subscriber crashes don't affect others
+
+Delivery Modes (chosen per subscription):
+- Inline (default): publish awaits the subscriber, including its retries
+- Queued: the subscriber gets a bounded queue and its own worker task, so
+  slow handlers and retry backoff never run on the publisher's path
+
+Batch Delivery:
+- publish_many() sends a list of events on one topic in a single call
+- Batch subscribers (subscribe(..., batch=True)) receive a list of events per
+  delivery; single-event subscribers keep receiving one dict per call
+- Queued batch subscribers drain everything pending into one delivery
+- A batch handler that fails on some events raises BatchDeliveryError; the
+  retry redelivers only those events
 """
 
 import asyncio
-from typing import Callable, Any, Dict, List, Optional
+import logging
+from collections import OrderedDict
+from typing import Callable, Any, Dict, List, Optional, Tuple, Union
 
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class BatchDeliveryError(Exception):
+    """
+    Raised by a batch subscriber that handled only part of a delivery.
+
+    The bus counts it as a failed delivery and retries with failed_items only,
+    so events that were already handled are not delivered twice.
+    """
+
+    def __init__(self, failed_items: List[Dict[str, Any]], errors: List[BaseException]):
+        self.failed_items = failed_items
+        self.errors = errors
+        first = errors[0] if errors else None
+        super().__init__(
+            f"{len(failed_items)} event(s) failed in batch"
+            + (f" (first: {type(first).__name__}: {first})" if first is not None else "")
+        )
+
+
 # ============================================================================
 # W2 Enhancement: Metrics and Alerting Data Classes
 # ============================================================================
@@ -53,10 +86,10 @@ class EventBusMetrics:
     last_failure_time: float = 0.0
     started_at: float = field(default_factory=time)
 
-    def record_publish(self, topic: str) -> None:
-        """Record a publish event."""
-        self.total_published += 1
-        self.published_by_topic[topic] = self.published_by_topic.get(topic, 0) + 1
+    def record_publish(self, topic: str, count: int = 1) -> None:
+        """Record published events (count > 1 for publish_many)."""
+        self.total_published += count
+        self.published_by_topic[topic] = self.published_by_topic.get(topic, 0) + count
         self.last_publish_time = time()
 
     def record_delivery(self, latency_ms: float) -> None:
@@ -186,7 +219,7 @@ class AlertThresholds:
     max_consecutive_failures: int = 5
     max_failures_per_minute: int = 10
 
-    # Queue thresholds (for future queue-based implementation)
+    # Queue thresholds (per queued subscriber backlog)
     max_queue_size: int = 1000
 
     # Inactivity threshold (seconds without publish)
@@ -217,6 +250,189 @@ class HealthAlert:
         }
 
 
+# Overflow policies for queued subscriptions
+OVERFLOW_DROP_OLDEST = "drop_oldest"  # Evict the oldest pending event
+OVERFLOW_BLOCK = "block"              # Publisher waits for space (backpressure)
+OVERFLOW_COALESCE = "coalesce"        # Replace the pending event with the same key
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_BLOCK, OVERFLOW_COALESCE)
+
+
+class SubscriberQueue:
+    """
+    Bounded queue + worker task for one queued subscription.
+
+    Events are kept in an OrderedDict so coalescing can replace a pending event
+    in place (keeping its position); without coalescing every event gets a
+    unique sequence key. The worker delivers through EventBus._deliver_with_retry,
+    so retries and backoff only delay this subscriber. Batch subscribers get all
+    pending events as one list per delivery.
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        topic: str,
+        handler: Callable,
+        maxsize: int,
+        overflow: str,
+        coalesce_key: Optional[Union[str, Callable[[Dict[str, Any]], Any]]] = None,
+        batch: bool = False
+    ):
+        self.bus = bus
+        self.topic = topic
+        self.handler = handler
+        self.is_async = asyncio.iscoroutinefunction(handler)
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.batch = batch
+        self._coalesce_key = coalesce_key
+        self._pending: "OrderedDict[Any, tuple]" = OrderedDict()  # key -> (data, enqueued_at)
+        self._sequence = 0
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+
+        # Lag metrics
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.max_lag_ms = 0.0
+        self._total_lag_ms = 0.0
+        self._lag_samples = 0
+
+    def start(self) -> None:
+        """Start the worker task (requires a running event loop)."""
+        self._task = asyncio.create_task(self._run(), name=f"eventbus_worker_{self.topic}")
+
+    async def stop(self) -> None:
+        """Stop the worker; pending events are discarded and blocked publishers released."""
+        self._closed = True
+        self._space.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._pending.clear()
+
+    def _key_for(self, data: Dict[str, Any]) -> Any:
+        if self.overflow == OVERFLOW_COALESCE and self._coalesce_key is not None:
+            if callable(self._coalesce_key):
+                return ("key", self._coalesce_key(data))
+            return ("key", data.get(self._coalesce_key))
+        self._sequence += 1
+        return ("seq", self._sequence)
+
+    async def put(self, data: Dict[str, Any]) -> None:
+        """Enqueue an event according to the overflow policy."""
+        if self._closed:
+            return
+
+        key = self._key_for(data)
+        if key in self._pending:
+            # Coalesce: newest payload, original position and enqueue time
+            self._pending[key] = (data, self._pending[key][1])
+            self.coalesced += 1
+            return
+
+        if len(self._pending) >= self.maxsize:
+            if self.overflow == OVERFLOW_BLOCK:
+                while len(self._pending) >= self.maxsize and not self._closed:
+                    self._space.clear()
+                    await self._space.wait()
+                if self._closed:
+                    return
+            else:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+
+        self._pending[key] = (data, time())
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, len(self._pending))
+        self._ready.set()
+
+    async def _run(self) -> None:
+        while not self._closed:
+            if not self._pending:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            if self.batch:
+                entries = list(self._pending.values())
+                self._pending.clear()
+            else:
+                entries = [self._pending.popitem(last=False)[1]]
+            self._space.set()
+
+            now = time()
+            for _, enqueued_at in entries:
+                lag_ms = (now - enqueued_at) * 1000
+                self._total_lag_ms += lag_ms
+                self._lag_samples += 1
+                self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+            if self.batch:
+                data = [entry[0] for entry in entries]
+            else:
+                data = entries[0][0]
+            await self.bus._deliver_with_retry(self.topic, self.handler, data, self.is_async)
+            self.delivered += len(entries)
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-subscriber queue and lag metrics."""
+        oldest_age_ms = 0.0
+        if self._pending:
+            oldest_age_ms = (time() - next(iter(self._pending.values()))[1]) * 1000
+        return {
+            "topic": self.topic,
+            "subscriber": getattr(self.handler, "__qualname__", repr(self.handler)),
+            "overflow": self.overflow,
+            "batch": self.batch,
+            "capacity": self.maxsize,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "lag_ms": round(oldest_age_ms, 2),
+            "max_lag_ms": round(self.max_lag_ms, 2),
+            "avg_lag_ms": round(self._total_lag_ms / self._lag_samples, 2) if self._lag_samples else 0.0,
+        }
+
+
+class Subscription:
+    """
+    Immutable subscriber record stored in the per-topic dispatch tuples.
+
+    The coroutine check is done once here instead of on every publish.
+    Batch subscriptions receive a list of events per delivery.
+    """
+
+    __slots__ = ("handler", "is_async", "queue", "is_batch")
+
+    def __init__(self, handler: Callable, queue: Optional[SubscriberQueue] = None, is_batch: bool = False):
+        self.handler = handler
+        self.is_async = asyncio.iscoroutinefunction(handler)
+        self.queue = queue
+        self.is_batch = is_batch
+
+    def __repr__(self) -> str:
+        mode = f"queued({self.queue.overflow})" if self.queue is not None else "inline"
+        if self.is_batch:
+            mode += ", batch"
+        return f"Subscription({getattr(self.handler, '__qualname__', self.handler)!r}, {mode})"
+
+
 # Event Topics - DO NOT CHANGE without coordination
 TOPICS = {
     "market_data": {
@@ -312,14 +528,21 @@ class EventBus:
     - Memory safe: NO defaultdict, explicit cleanup
     - All async (asyncio)
     - W2 Enhancement: Comprehensive health monitoring and alerting
+    - Optional queued delivery per subscriber (bounded queue, own worker task,
+      overflow policy, lag metrics)
+    - Lock-free publish: per-topic subscriber tuples are copy-on-write, replaced
+      atomically under the lock by subscribe/unsubscribe/shutdown
+    - publish_many() for bursts; batch subscribers receive one list per call
     """
 
     def __init__(self):
         """Initialize EventBus with memory-safe structures."""
         # CRITICAL: Use explicit Dict, NOT defaultdict (memory leak prevention)
-        self._subscribers: Dict[str, List[Callable]] = {}
+        # ✅ PERFORMANCE: Values are immutable tuples, never mutated in place - writers
+        # build a new tuple and swap it in, so publish() can read without the lock
+        self._subscribers: Dict[str, Tuple[Subscription, ...]] = {}
         self._shutdown_requested = False
-        # Lock to protect concurrent access to _subscribers dict
+        # Lock serializing writers (subscribe/unsubscribe/shutdown) of _subscribers
         self._lock = asyncio.Lock()
 
         # W2 Enhancement: Metrics tracking
@@ -336,32 +559,58 @@ class EventBus:
 
         logger.info("EventBus initialized (simplified, AT_LEAST_ONCE delivery, W2 monitoring)")
 
-    async def subscribe(self, topic: str, handler: Callable[[Any], None]) -> None:
+    async def subscribe(
+        self,
+        topic: str,
+        handler: Callable[[Any], None],
+        queue_size: Optional[int] = None,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        coalesce_key: Optional[Union[str, Callable[[Dict[str, Any]], Any]]] = None,
+        batch: bool = False
+    ) -> None:
         """
         Subscribe to topic with async handler.
 
         Args:
             topic: Event topic to subscribe to
             handler: Async callable that receives event data
+            queue_size: If set, deliver through a bounded queue of this size and a
+                dedicated worker task instead of inline in publish()
+            overflow: Queue overflow policy (drop_oldest, block, coalesce)
+            coalesce_key: Event field name or callable giving the coalescing key
+                (required for the coalesce policy)
+            batch: If True the handler receives a list of events per delivery
+                (one list per publish_many() call, a one-element list per publish())
 
         Raises:
-            ValueError: If topic or handler is invalid
+            ValueError: If topic, handler or queue options are invalid
         """
         if not topic or not isinstance(topic, str):
             raise ValueError("Topic must be a non-empty string")
         if not callable(handler):
             raise ValueError("Handler must be callable")
 
-        # Protect concurrent access to _subscribers dict
+        queue: Optional[SubscriberQueue] = None
+        if queue_size is not None:
+            if queue_size <= 0:
+                raise ValueError("queue_size must be positive")
+            if overflow not in OVERFLOW_POLICIES:
+                raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+            if overflow == OVERFLOW_COALESCE and coalesce_key is None:
+                raise ValueError("coalesce overflow policy requires coalesce_key")
+            queue = SubscriberQueue(self, topic, handler, queue_size, overflow, coalesce_key, batch)
+            queue.start()
+
+        # Copy-on-write: build the new tuple under the writer lock, then swap it in
         async with self._lock:
-            # Explicit dict creation (NO defaultdict)
-            if topic not in self._subscribers:
-                self._subscribers[topic] = []
+            subscribers = self._subscribers.get(topic, ()) + (Subscription(handler, queue, batch),)
+            self._subscribers[topic] = subscribers
+            subscriber_count = len(subscribers)
 
-            self._subscribers[topic].append(handler)
-            subscriber_count = len(self._subscribers[topic])
-
-        logger.info(f"Subscribed to '{topic}' (total subscribers: {subscriber_count})")
+        mode = f"queued, size={queue_size}, overflow={overflow}" if queue_size is not None else "inline"
+        if batch:
+            mode += ", batch"
+        logger.info(f"Subscribed to '{topic}' ({mode}, total subscribers: {subscriber_count})")
 
     async def publish(self, topic: str, data: Dict[str, Any]) -> None:
         """
@@ -386,33 +635,88 @@ class EventBus:
             logger.warning(f"Publish blocked - EventBus shutting down (topic: {topic})")
             return
 
-        # Protect concurrent access to _subscribers dict
-        # Make a copy of subscribers while holding lock, then release before delivery
-        async with self._lock:
-            if topic not in self._subscribers:
+        # ✅ PERFORMANCE: Lock-free read of the immutable subscriber tuple - it is
+        # a consistent snapshot even if a writer swaps in a new tuple meanwhile
+        subscribers = self._subscribers.get(topic)
+        debug_enabled = logger.logger.isEnabledFor(logging.DEBUG)
+        if not subscribers:
+            if debug_enabled:
                 logger.debug(f"No subscribers for topic '{topic}'")
-                return
-
-            # Create snapshot of subscribers to avoid holding lock during delivery
-            subscribers = list(self._subscribers[topic])
+            return
 
-        logger.debug(f"Publishing to '{topic}' ({len(subscribers)} subscribers)")
+        if debug_enabled:
+            logger.debug(f"Publishing to '{topic}' ({len(subscribers)} subscribers)")
 
         # W2: Track publish metrics
         self._metrics.record_publish(topic)
 
         # Deliver to each subscriber with retry and error isolation
-        for subscriber in subscribers:
-            await self._deliver_with_retry(topic, subscriber, data)
+        # (queued subscribers only enqueue; their worker delivers and retries)
+        for subscription in subscribers:
+            if subscription.queue is not None:
+                await subscription.queue.put(data)
+            elif subscription.is_batch:
+                await self._deliver_with_retry(topic, subscription.handler, [data], subscription.is_async)
+            else:
+                await self._deliver_with_retry(topic, subscription.handler, data, subscription.is_async)
+
+        # W2: Check thresholds and trigger alerts if needed (P58: rate limited)
+        if time() - self._last_alert_check_time >= self._alert_check_interval:
+            await self._check_and_alert()
+
+    async def publish_many(self, topic: str, items: List[Dict[str, Any]]) -> None:
+        """
+        Publish a burst of events on one topic in a single call.
+
+        Batch subscribers get the whole list in one delivery; single-event
+        subscribers get each event in order, exactly as if publish() had been
+        called for each item. Queued subscribers enqueue every item.
+
+        Args:
+            topic: Event topic
+            items: Event data dicts, in delivery order
+
+        Raises:
+            ValueError: If topic or any item is invalid
+        """
+        if not topic or not isinstance(topic, str):
+            raise ValueError("Topic must be a non-empty string")
+        if not isinstance(items, (list, tuple)):
+            raise ValueError("Items must be a list of dictionaries")
+        if not all(isinstance(item, dict) for item in items):
+            raise ValueError("Data must be a dictionary")
+
+        if self._shutdown_requested:
+            logger.warning(f"Publish blocked - EventBus shutting down (topic: {topic})")
+            return
+
+        subscribers = self._subscribers.get(topic)
+        if not subscribers or not items:
+            return
+
+        self._metrics.record_publish(topic, len(items))
+
+        batch = items if isinstance(items, list) else list(items)
+        for subscription in subscribers:
+            if subscription.queue is not None:
+                for data in batch:
+                    await subscription.queue.put(data)
+            elif subscription.is_batch:
+                await self._deliver_with_retry(topic, subscription.handler, batch, subscription.is_async)
+            else:
+                # Single-event adapter: one delivery per item
+                for data in batch:
+                    await self._deliver_with_retry(topic, subscription.handler, data, subscription.is_async)
 
-        # W2: Check thresholds and trigger alerts if needed
-        await self._check_and_alert()
+        if time() - self._last_alert_check_time >= self._alert_check_interval:
+            await self._check_and_alert()
 
     async def _deliver_with_retry(
         self,
         topic: str,
         subscriber: Callable,
-        data: Dict[str, Any]
+        data: Union[Dict[str, Any], List[Dict[str, Any]]],
+        is_async: Optional[bool] = None
     ) -> None:
         """
         Deliver event to subscriber with retry logic.
@@ -426,8 +730,12 @@ class EventBus:
         Args:
             topic: Event topic
             subscriber: Subscriber handler
-            data: Event data
+            data: Event data (a list of events for batch subscribers)
+            is_async: Cached iscoroutinefunction(subscriber) (computed if None)
         """
+        if is_async is None:
+            is_async = asyncio.iscoroutinefunction(subscriber)
+
         max_retries = 3
         retries = 0
 
@@ -437,7 +745,7 @@ class EventBus:
 
             try:
                 # Call subscriber handler
-                if asyncio.iscoroutinefunction(subscriber):
+                if is_async:
                     await subscriber(data)
                 else:
                     # Sync handler - run in executor to avoid blocking
@@ -453,6 +761,9 @@ class EventBus:
 
             except Exception as e:
                 retries += 1
+                if isinstance(e, BatchDeliveryError) and isinstance(data, list):
+                    # Partially handled batch: retry only the failed events
+                    data = e.failed_items
 
                 # W2: Record retry attempt
                 if retries <= max_retries:
@@ -485,11 +796,20 @@ class EventBus:
             topic: Event topic
             handler: Handler to remove
         """
-        # Protect concurrent access to _subscribers dict
+        removed = None
+
+        # Copy-on-write: publishers keep iterating the old tuple
         async with self._lock:
-            if topic in self._subscribers and handler in self._subscribers[topic]:
-                self._subscribers[topic].remove(handler)
-                remaining = len(self._subscribers[topic])
+            entries = self._subscribers.get(topic, ())
+            for entry in entries:
+                if entry.handler == handler:
+                    removed = entry
+                    break
+
+            if removed is not None:
+                entries = tuple(entry for entry in entries if entry is not removed)
+                self._subscribers[topic] = entries
+                remaining = len(entries)
 
                 logger.info(f"Unsubscribed from '{topic}' (remaining: {remaining})")
 
@@ -498,6 +818,10 @@ class EventBus:
                     del self._subscribers[topic]
                     logger.debug(f"Topic '{topic}' removed (no subscribers)")
 
+        # Stop the worker outside the lock (it may be mid-delivery)
+        if removed is not None and removed.queue is not None:
+            await removed.queue.stop()
+
     async def list_topics(self) -> List[str]:
         """
         List all active topics with subscriber counts.
@@ -527,6 +851,7 @@ class EventBus:
                 len(subscribers) for subscribers in self._subscribers.values()
             )
             total_topics = len(self._subscribers)
+            queue_stats = self._collect_queue_stats()
 
         # P60 FIX: Detect "warming up" state before first publish
         has_data = self._metrics.total_published > 0
@@ -552,7 +877,8 @@ class EventBus:
             "warming_up": not has_data,  # P60 FIX: Explicit warming up indicator
             "active_subscribers": active_subscribers,
             "total_topics": total_topics,
-            "total_queue_size": 0,  # Simplified EventBus has no queues
+            "total_queue_size": sum(q["depth"] for q in queue_stats),
+            "subscriber_queues": queue_stats,
             "shutdown_requested": self._shutdown_requested,
             "is_inactive": is_inactive,
             "time_since_last_publish": round(time_since_publish, 1),
@@ -584,14 +910,40 @@ class EventBus:
             # Clear all subscribers (explicit cleanup)
             topic_count = len(self._subscribers)
             subscriber_count = sum(len(subs) for subs in self._subscribers.values())
+            queues = [
+                entry.queue for subs in self._subscribers.values()
+                for entry in subs if entry.queue is not None
+            ]
 
             self._subscribers.clear()
 
+        # Stop queued subscriber workers (pending events are discarded)
+        for queue in queues:
+            await queue.stop()
+
         logger.info(
             f"EventBus shutdown completed: "
             f"cleared {subscriber_count} subscribers from {topic_count} topics"
         )
 
+    def _collect_queue_stats(self) -> List[Dict[str, Any]]:
+        """Stats of all queued subscriptions (caller holds the lock or accepts a racy read)."""
+        return [
+            entry.queue.get_stats()
+            for subs in list(self._subscribers.values())
+            for entry in subs
+            if entry.queue is not None
+        ]
+
+    def get_subscriber_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-subscriber queue depth and lag metrics for queued subscriptions.
+
+        Returns:
+            List of stats dicts (topic, subscriber, depth, dropped, coalesced, lag_ms, ...)
+        """
+        return self._collect_queue_stats()
+
     # =========================================================================
     # W2 Enhancement: Alerting and Threshold Configuration
     # =========================================================================
@@ -696,6 +1048,20 @@ class EventBus:
                 threshold_value=self._alert_thresholds.max_single_latency_ms
             ))
 
+        # Check queued subscriber backlog
+        for queue_stats in self._collect_queue_stats():
+            if queue_stats["depth"] > self._alert_thresholds.max_queue_size:
+                alerts.append(HealthAlert(
+                    severity="WARNING",
+                    alert_type="queue_depth",
+                    message=(
+                        f"Subscriber queue backlog on '{queue_stats['topic']}' "
+                        f"({queue_stats['subscriber']}): {queue_stats['depth']} events"
+                    ),
+                    current_value=queue_stats["depth"],
+                    threshold_value=self._alert_thresholds.max_queue_size
+                ))
+
         # Emit alerts to callbacks
         for alert in alerts:
             await self._emit_alert(alert)
@@ -1,11 +1,14 @@
+import atexit
 import json
 import logging
 import os
+import queue
 import sys
 import threading
-from logging.handlers import RotatingFileHandler
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime, timezone
-from typing import Dict, Any, Union, TYPE_CHECKING
+from typing import Dict, Any, Callable, List, Optional, Union, TYPE_CHECKING
 from pathlib import Path
 from decimal import Decimal
 
@@ -59,7 +62,8 @@ class JsonFormatter(logging.Formatter):
             message_dict = {"message": record.getMessage()}
 
         log_object = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # record.created, not now(): records may be formatted later on the writer thread
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "module": record.module,
             "funcName": record.funcName,
@@ -70,6 +74,182 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(log_object, cls=CustomJsonEncoder)
 
 
+# --- Asynchronous pipeline ---
+
+# Payload passed to StructuredLogger methods: a dict, or a zero-argument callable
+# returning one (only invoked when the event is actually emitted)
+LogData = Union[Dict[str, Any], Callable[[], Dict[str, Any]], None]
+
+
+def _snapshot(value: Any) -> Any:
+    """Copy nested dicts, lists, tuples and sets so later mutation cannot reach a queued record."""
+    if isinstance(value, dict):
+        return {k: _snapshot(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_snapshot(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_snapshot(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)  # Elements are hashable, so already immutable
+    return value
+
+
+class _EventThrottle:
+    """Rate limit (events per second) and sampling rate for one event type (guarded by _LogPipeline.counter_lock)."""
+
+    __slots__ = ("per_second", "sample_rate", "window_start", "window_count", "sample_credit", "pending")
+
+    def __init__(self, per_second: Optional[float], sample_rate: Optional[float]):
+        self.per_second = per_second
+        self.sample_rate = sample_rate
+        self.window_start = 0.0
+        self.window_count = 0
+        self.sample_credit = 0.0
+        self.pending = 0  # Suppressed since the last emitted event
+
+    def admit(self) -> bool:
+        if self.sample_rate is not None:
+            # Deterministic sampling: emit one event each time the credit reaches 1
+            self.sample_credit += self.sample_rate
+            if self.sample_credit < 1.0:
+                return False
+            self.sample_credit -= 1.0
+
+        if self.per_second is not None:
+            now = time.monotonic()
+            if now - self.window_start >= 1.0:
+                self.window_start = now
+                self.window_count = 0
+            if self.window_count >= self.per_second:
+                return False
+            self.window_count += 1
+        return True
+
+
+class _LogWriter(QueueListener):
+    """Writer thread dispatching queued records to the handlers registered for their logger name."""
+
+    def __init__(self, record_queue: "queue.Queue"):
+        super().__init__(record_queue)
+        self.sinks: Dict[str, List[logging.Handler]] = {}
+
+    def handle(self, record: logging.LogRecord) -> None:
+        for handler in self.sinks.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Enqueues records unformatted; formatting and I/O run on the writer thread."""
+
+    def __init__(self, pipeline: "_LogPipeline"):
+        super().__init__(pipeline.queue)
+        self.pipeline = pipeline
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if isinstance(record.msg, dict):
+            # Snapshot dict payloads at any depth: callers may keep mutating them
+            # (e.g. live metrics dicts) while the writer thread formats the record
+            record.msg = _snapshot(record.msg)
+        if record.exc_info:
+            # Render the traceback now; frames must not outlive the call on another thread
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.pipeline.counter_lock:
+                self.pipeline.dropped += 1
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.pipeline.running:
+            super().emit(record)
+        else:
+            self.pipeline.writer.handle(record)  # Writer stopped (interpreter exit): write inline
+
+
+class _LogPipeline:
+    """Process-wide record queue, writer thread, event throttles and suppression counters."""
+
+    def __init__(self):
+        self.queue: Optional["queue.Queue"] = None
+        self.writer: Optional[_LogWriter] = None
+        self.handler: Optional[_RecordQueueHandler] = None
+        self.running = False
+        self.dropped = 0  # Records lost to a full queue
+        self.suppressed: Dict[str, int] = {}  # event_type -> events suppressed by throttles
+        self.throttles: Dict[str, _EventThrottle] = {}
+        # Guards dropped, suppressed and throttle state, updated from any logging thread
+        self.counter_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    def start(self, queue_size: int) -> None:
+        with self._lock:
+            if self.writer is not None:
+                return
+            self.queue = queue.Queue(maxsize=queue_size)
+            self.writer = _LogWriter(self.queue)
+            self.handler = _RecordQueueHandler(self)
+            self.writer.start()
+            self.running = True
+            atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Drain queued records and stop the writer thread."""
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            self.writer.stop()
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until records queued so far are written (best effort, bounded by timeout)."""
+        deadline = time.monotonic() + timeout
+        while self.running and self.queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+
+_pipeline = _LogPipeline()
+
+
+def configure_event_throttle(event_type: str, per_second: Optional[float] = None,
+                             sample_rate: Optional[float] = None) -> None:
+    """
+    Rate-limit and/or sample an event type across all StructuredLoggers.
+
+    Applies to DEBUG and INFO only; warnings and errors are always emitted.
+    Passing neither limit removes the throttle.
+
+    Args:
+        event_type: Event type to throttle (e.g. "strategy_manager.indicator_update_received")
+        per_second: Maximum events emitted per one-second window
+        sample_rate: Fraction of events emitted (0.1 = every 10th)
+    """
+    if per_second is None and sample_rate is None:
+        _pipeline.throttles.pop(event_type, None)
+    else:
+        _pipeline.throttles[event_type] = _EventThrottle(per_second, sample_rate)
+
+
+def get_log_pipeline_stats() -> Dict[str, Any]:
+    """Suppressed-event counters and queue state of the asynchronous log pipeline."""
+    with _pipeline.counter_lock:
+        return {
+            "running": _pipeline.running,
+            "queue_size": _pipeline.queue.qsize() if _pipeline.queue is not None else 0,
+            "dropped": _pipeline.dropped,
+            "suppressed": dict(_pipeline.suppressed),
+        }
+
+
+def flush_logs(timeout: float = 5.0) -> None:
+    """Wait for the writer thread to catch up with records logged so far."""
+    _pipeline.flush(timeout)
+
+
 class StructuredLogger:
     def __init__(self, name: str, config: Any, filename: str = None):
         self.logger = logging.getLogger(name)
@@ -99,10 +279,26 @@ class StructuredLogger:
         else:
             log_file = None
 
+        # ✅ PERFORMANCE: With async_enabled (default) the logger only enqueues records;
+        # formatting and I/O run on the shared writer thread
+        if getattr(config, 'async_enabled', True):
+            _pipeline.start(getattr(config, 'queue_size', 10000))
+            self._handlers = _pipeline.writer.sinks.setdefault(name, [])
+            if _pipeline.handler not in self.logger.handlers:
+                self.logger.addHandler(_pipeline.handler)
+        else:
+            self._handlers = self.logger.handlers
+
         # Setup handlers
         self._setup_console_handler(console_enabled, structured_logging)
         self._setup_file_handler(file_enabled, log_file, max_file_size_mb, backup_count, structured_logging)
-    
+
+    def _add_handler(self, handler: logging.Handler) -> None:
+        if self._handlers is self.logger.handlers:
+            self.logger.addHandler(handler)
+        else:
+            self._handlers.append(handler)
+
     def _setup_console_handler(self, enabled: bool, structured: bool):
         """
         Setup console handler with appropriate formatter.
@@ -119,7 +315,7 @@ class StructuredLogger:
         # ✅ DEFENSIVE: Check if console handler already exists
         # Prevents duplicate handlers if get_logger() is called multiple times
         # (though cache should prevent this, this is fail-safe)
-        for existing_handler in self.logger.handlers:
+        for existing_handler in self._handlers:
             if isinstance(existing_handler, logging.StreamHandler):
                 # Check if it's stdout handler (console handler)
                 if hasattr(existing_handler, 'stream') and existing_handler.stream == sys.stdout:
@@ -131,7 +327,7 @@ class StructuredLogger:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        self._add_handler(handler)
     
     def _setup_file_handler(self, enabled: bool, log_file: str, max_size_mb: int, backup_count: int, structured: bool):
         """
@@ -149,7 +345,7 @@ class StructuredLogger:
         # Prevents duplicate file handlers if get_logger() is called multiple times
         # (though cache should prevent this, this is fail-safe)
         log_file_normalized = os.path.abspath(log_file)  # Normalize path for comparison
-        for existing_handler in self.logger.handlers:
+        for existing_handler in self._handlers:
             if isinstance(existing_handler, RotatingFileHandler):
                 # Check if it's the same file
                 if hasattr(existing_handler, 'baseFilename'):
@@ -180,20 +376,38 @@ class StructuredLogger:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        self._add_handler(handler)
 
-    def _log(self, level: int, event_type: str, data: Dict[str, Any]):
-        """Helper to log structured data."""
-        payload = {"event_type": event_type, "data": data}
-        self.logger.log(level, payload)
+    def _log(self, level: int, event_type: str, data: LogData, exc_info=False):
+        """Helper to log structured data (throttled DEBUG/INFO events are dropped before building the payload)."""
+        if not self.logger.isEnabledFor(level):
+            return
+        suppressed = 0
+        throttle = _pipeline.throttles.get(event_type) if level < logging.WARNING else None
+        if throttle is not None:
+            with _pipeline.counter_lock:
+                admitted = throttle.admit()
+                if admitted:
+                    suppressed, throttle.pending = throttle.pending, 0
+                else:
+                    throttle.pending += 1
+                    _pipeline.suppressed[event_type] = _pipeline.suppressed.get(event_type, 0) + 1
+            if not admitted:
+                return
+        if callable(data):
+            data = data()
+        payload = {"event_type": event_type, "data": data or {}}
+        if suppressed:
+            payload["suppressed"] = suppressed  # Events of this type skipped since the previous one
+        self.logger.log(level, payload, exc_info=exc_info)
 
-    def info(self, event_type: str, data: Dict[str, Any] = None):
-        self._log(logging.INFO, event_type, data or {})
+    def info(self, event_type: str, data: LogData = None):
+        self._log(logging.INFO, event_type, data)
 
-    def warning(self, event_type: str, data: Dict[str, Any] = None):
-        self._log(logging.WARNING, event_type, data or {})
+    def warning(self, event_type: str, data: LogData = None):
+        self._log(logging.WARNING, event_type, data)
 
-    def error(self, event_type: str, data: Dict[str, Any] = None, exc_info=False):
+    def error(self, event_type: str, data: LogData = None, exc_info=False):
         """
         Log an error event.
 
@@ -202,11 +416,14 @@ class StructuredLogger:
             data: Optional error context data
             exc_info: Include exception info (default: False)
         """
-        payload = {"event_type": event_type, "data": data or {}}
-        self.logger.error(payload, exc_info=exc_info)
+        self._log(logging.ERROR, event_type, data, exc_info=exc_info)
+
+    def debug(self, event_type: str, data: LogData = None):
+        self._log(logging.DEBUG, event_type, data)
 
-    def debug(self, event_type: str, data: Dict[str, Any] = None):
-        self._log(logging.DEBUG, event_type, data or {})
+    def throttle(self, event_type: str, per_second: Optional[float] = None, sample_rate: Optional[float] = None) -> None:
+        """Rate-limit and/or sample an event type (see configure_event_throttle)."""
+        configure_event_throttle(event_type, per_second=per_second, sample_rate=sample_rate)
 
 
 def configure_module_logger(
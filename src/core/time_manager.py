@@ -3,7 +3,8 @@ TimeManager - lightweight time utilities for consistent timing across modules.
 """
 
 import time
-from typing import Optional, Deque, Tuple
+from datetime import datetime
+from typing import Any, Deque, Optional, Tuple
 
 
 def now() -> float:
@@ -33,3 +34,56 @@ def is_fresh(snapshot_ts: Optional[float], current_time: Optional[float], window
     except Exception:
         return False
 
+
+def to_epoch_seconds(ts: Any) -> Optional[float]:
+    """Convert datetime / seconds / milliseconds / microseconds timestamps to epoch seconds."""
+    if ts is None:
+        return None
+    if isinstance(ts, datetime):
+        return ts.timestamp()
+    try:
+        value = float(ts)
+    except (TypeError, ValueError):
+        return None
+    if value > 1e14:  # microseconds
+        return value / 1_000_000
+    if value > 1e11:  # milliseconds
+        return value / 1_000
+    return value
+
+
+class VirtualClock:
+    """
+    Simulated clock driven by replayed event timestamps (backtests).
+
+    Time only moves when advance() is called with an event timestamp, so a
+    replay runs as fast as its consumers allow instead of waiting on wall time.
+    The clock never moves backwards; out-of-order timestamps are ignored.
+    """
+
+    def __init__(self) -> None:
+        self._start: Optional[float] = None
+        self._now: Optional[float] = None
+
+    def advance(self, ts: Any) -> Optional[float]:
+        """Move the clock to the given event timestamp and return current virtual time."""
+        seconds = to_epoch_seconds(ts)
+        if seconds is None:
+            return self._now
+        if self._start is None:
+            self._start = seconds
+            self._now = seconds
+        elif seconds > self._now:
+            self._now = seconds
+        return self._now
+
+    def now(self) -> Optional[float]:
+        """Current virtual time in epoch seconds (None before the first event)."""
+        return self._now
+
+    @property
+    def elapsed(self) -> float:
+        """Virtual seconds covered since the first event."""
+        if self._start is None:
+            return 0.0
+        return self._now - self._start
@@ -95,7 +95,7 @@ Usage:
 import asyncio
 import time
 from contextlib import asynccontextmanager
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime, timedelta, timezone
 import pandas as pd
 import asyncpg
@@ -1347,6 +1347,64 @@ class QuestDBProvider:
         df = pd.DataFrame([self._convert_datetime_to_timestamp(dict(row)) for row in rows])
         return df
 
+    async def get_ohlcv_resample_multi(
+        self,
+        symbols: List[str],
+        interval: str = '1m',
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Get resampled OHLCV data for several symbols in one keyed SAMPLE BY query.
+
+        Args:
+            symbols: Trading pairs
+            interval: Resample interval ('1s', '1m', '5m', '1h', '1d')
+            start_time: Start timestamp (optional)
+            end_time: End timestamp (optional)
+
+        Returns:
+            Long-format DataFrame with timestamp, symbol and OHLCV columns
+            (timestamps as Unix floats)
+        """
+        if not symbols:
+            return pd.DataFrame()
+
+        await self.initialize()
+
+        params: List[Any] = list(symbols)
+        placeholders = ", ".join(f"${i}" for i in range(1, len(params) + 1))
+        query = f"""
+            SELECT
+                timestamp,
+                symbol,
+                first(price) as open,
+                max(price) as high,
+                min(price) as low,
+                last(price) as close,
+                sum(volume) as volume
+            FROM tick_prices
+            WHERE symbol IN ({placeholders})
+        """
+
+        if start_time:
+            params.append(start_time)
+            query += f" AND timestamp >= ${len(params)}"
+
+        if end_time:
+            params.append(end_time)
+            query += f" AND timestamp <= ${len(params)}"
+
+        query += f" SAMPLE BY {interval} ALIGN TO CALENDAR FILL(PREV)"
+
+        async with self.pg_pool.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+
+        if not rows:
+            return pd.DataFrame()
+
+        return pd.DataFrame([self._convert_datetime_to_timestamp(dict(row)) for row in rows])
+
     # ========================================================================
     # DATA COLLECTION SUPPORT
     # ========================================================================
@@ -1460,6 +1518,56 @@ class QuestDBProvider:
 
         return await self._execute_ilp_with_retry("insert_orderbook_snapshots_batch", write_batch)
 
+    async def insert_columnar_batch(
+        self,
+        table: str,
+        timestamps: Sequence[datetime],
+        symbols: Dict[str, Sequence[Any]],
+        columns: Dict[str, Sequence[Any]]
+    ) -> int:
+        """
+        Insert rows given as parallel column lists with automatic retry logic.
+
+        Row i is built from timestamps[i] and the i-th value of every symbol and
+        column list. None values are omitted from the row (NULL in QuestDB).
+
+        Args:
+            table: Target table (created by ILP on first write if missing)
+            timestamps: Designated timestamp per row
+            symbols: SYMBOL column name -> values
+            columns: Regular column name -> values
+
+        Returns:
+            Number of successfully inserted rows
+
+        Raises:
+            ValueError: If a column list length differs from len(timestamps)
+            Exception: If all retry attempts fail
+        """
+        row_count = len(timestamps)
+        if not row_count:
+            return 0
+
+        for name, values in {**symbols, **columns}.items():
+            if len(values) != row_count:
+                raise ValueError(f"Column '{name}' has {len(values)} values, expected {row_count}")
+
+        symbol_items = list(symbols.items())
+        column_items = list(columns.items())
+
+        def write_batch(sender):
+            """Inner function that performs the actual write."""
+            for index in range(row_count):
+                sender.row(
+                    table,
+                    symbols={name: values[index] for name, values in symbol_items},
+                    columns={name: values[index] for name, values in column_items},
+                    at=TimestampNanos(int(timestamps[index].timestamp() * 1_000_000_000))
+                )
+            return row_count
+
+        return await self._execute_ilp_with_retry(f"insert_columnar_batch[{table}]", write_batch)
+
     # ========================================================================
     # OHLCV AGGREGATION REMOVED
     # ========================================================================
@@ -610,6 +610,18 @@ class BacktestOrderManager:
                 if pos.quantity != 0
             ]
 
+    def get_open_position(self, symbol: str) -> Optional[PositionRecord]:
+        """Get the live position record for symbol, or None when flat.
+
+        Synchronous lookup for backtest loops that step many symbols per tick.
+        Positions only change inside submit_order, so between awaits the
+        returned record is consistent without taking the lock.
+        """
+        position = self._positions.get(symbol.upper())
+        if position is None or position.quantity == 0:
+            return None
+        return position
+
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel order"""
         async with self._lock:
@@ -2,7 +2,7 @@
 Dashboard Cache Service
 ========================
 
-Background service that updates dashboard cache tables every 1 second.
+Background service that keeps dashboard cache tables up to date.
 Runs as asyncio Task during application lifespan.
 
 Purpose:
@@ -12,7 +12,17 @@ Purpose:
 
 Architecture:
 - Runs in background loop (asyncio.Task)
-- Updates every 1 second
+- Event-driven when an EventBus is given: market.price_update, signal and
+  paper_trading.performance_updated events maintain per-symbol rolling 24h
+  aggregates and per-session summaries in memory; only rows changed since
+  the last flush are written (one executemany per table)
+- Open positions are read per session from the positions table: on every
+  session refresh and on the next flush after a position event (those events
+  carry per-order ids and no session, so they only mark positions stale)
+- Active sessions and their symbols are re-read every session_refresh_interval;
+  a new session is seeded from QuestDB once, including per-minute price
+  buckets of the last 24h so change_pct starts from the price 24h ago
+- Without an EventBus, polls QuestDB every update_interval per session
 - Graceful error handling (continues on failure)
 - Clean shutdown on application stop
 - BUG-008-7: Circuit breaker and retry for QuestDB resilience
@@ -23,7 +33,10 @@ Performance Impact:
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import json
+import time
+from collections import deque
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime, timezone
 from src.core.logger import get_logger
 from src.data_feed.questdb_provider import QuestDBProvider
@@ -36,17 +49,141 @@ from src.core.circuit_breaker import (
 
 logger = get_logger(__name__)
 
+ROLLING_WINDOW_SECONDS = 24 * 3600
+ROLLING_BUCKET_SECONDS = 60
+
+WATCHLIST_INSERT_SQL = """
+    INSERT INTO watchlist_cache (
+        session_id, symbol, latest_price, price_change_pct,
+        volume_24h, position_side, position_pnl, position_margin_ratio,
+        last_updated
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+"""
+
+SUMMARY_INSERT_SQL = """
+    INSERT INTO dashboard_summary_cache (
+        session_id, global_pnl, total_positions, total_signals,
+        budget_utilization_pct, avg_margin_ratio, max_drawdown_pct,
+        last_updated
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+"""
+
+
+def _event_seconds(timestamp: Any) -> float:
+    """Event timestamp as epoch seconds (accepts seconds, milliseconds, ISO strings, datetimes)."""
+    if isinstance(timestamp, (int, float)):
+        # Milliseconds if > 10 billion (see BUG-003-11)
+        return timestamp / 1000.0 if timestamp > 10_000_000_000 else float(timestamp)
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    if isinstance(timestamp, str):
+        try:
+            return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+    return time.time()
+
+
+def _position_margin(data: Dict[str, Any]) -> float:
+    """Margin held by a position: explicit margin, else notional / leverage."""
+    for key in ("margin", "margin_used"):
+        if data.get(key) is not None:
+            return float(data[key])
+
+    quantity = data.get("quantity")
+    price = data.get("current_price") or data.get("entry_price")
+    if quantity is None or not price:
+        return 0.0
+
+    leverage = data.get("leverage") or (data.get("metadata") or {}).get("leverage") or 1.0
+    return abs(float(quantity)) * float(price) / float(leverage)
+
+
+class _RollingWindow:
+    """Latest price plus 24h change and volume, kept in one-minute buckets."""
+
+    __slots__ = ("latest_price", "volume", "_buckets")
+
+    def __init__(self):
+        self.latest_price = 0.0
+        self.volume = 0.0
+        # [bucket_start, first_price, volume]; at most 24h / 60s entries
+        self._buckets: deque = deque()
+
+    def add(self, timestamp: float, price: float, volume: float) -> None:
+        bucket = timestamp - timestamp % ROLLING_BUCKET_SECONDS
+        if self._buckets and bucket <= self._buckets[-1][0]:
+            # Same minute (or a late tick): fold into the newest bucket
+            self._buckets[-1][2] += volume
+        else:
+            self._buckets.append([bucket, price, volume])
+        self.volume += volume
+        self.latest_price = price
+
+        cutoff = timestamp - ROLLING_WINDOW_SECONDS
+        while self._buckets and self._buckets[0][0] <= cutoff:
+            self.volume -= self._buckets.popleft()[2]
+
+    def seed(self, buckets: List[Tuple[float, float, float]]) -> None:
+        """Prepend historical (timestamp, first_price, volume) buckets older than the live ones."""
+        first_live = self._buckets[0][0] if self._buckets else float("inf")
+        older = [
+            [timestamp - timestamp % ROLLING_BUCKET_SECONDS, price, volume]
+            for timestamp, price, volume in buckets
+            if timestamp - timestamp % ROLLING_BUCKET_SECONDS < first_live
+        ]
+        self._buckets.extendleft(reversed(older))
+        self.volume += sum(bucket[2] for bucket in older)
+
+    @property
+    def change_pct(self) -> float:
+        if not self._buckets or not self._buckets[0][1]:
+            return 0.0
+        opening = self._buckets[0][1]
+        return (self.latest_price - opening) / opening * 100.0
+
+
+class _SessionSummary:
+    """Incrementally maintained dashboard_summary_cache inputs for one session."""
+
+    __slots__ = ("signal_times", "seeded_signals", "balance", "peak_balance", "max_drawdown_pct")
+
+    def __init__(self):
+        self.signal_times: deque = deque()
+        self.seeded_signals = 0
+        self.balance = 0.0
+        self.peak_balance = 0.0
+        self.max_drawdown_pct = 0.0
+
+    def add_signal(self, timestamp: float) -> None:
+        self.signal_times.append(timestamp)
+        cutoff = timestamp - ROLLING_WINDOW_SECONDS
+        while self.signal_times and self.signal_times[0] <= cutoff:
+            self.signal_times.popleft()
+
+    @property
+    def total_signals(self) -> int:
+        return self.seeded_signals + len(self.signal_times)
+
+    def add_balance(self, balance: float) -> None:
+        self.balance = balance
+        if balance > self.peak_balance:
+            self.peak_balance = balance
+        if self.peak_balance > 0:
+            drawdown = (self.peak_balance - balance) / self.peak_balance * 100.0
+            self.max_drawdown_pct = max(self.max_drawdown_pct, drawdown)
+
 
 class DashboardCacheService:
     """
     Background service for dashboard performance optimization.
 
     Updates cache tables:
-    - watchlist_cache (every 1s per active session)
-    - dashboard_summary_cache (every 1s per active session)
+    - watchlist_cache (changed symbols, flushed every update_interval)
+    - dashboard_summary_cache (changed sessions, flushed every update_interval)
 
     Usage:
-        service = DashboardCacheService(questdb_provider)
+        service = DashboardCacheService(questdb_provider, event_bus=event_bus)
         await service.start()
         ...
         await service.stop()
@@ -55,7 +192,9 @@ class DashboardCacheService:
     def __init__(
         self,
         questdb_provider: QuestDBProvider,
-        update_interval: float = 1.0
+        update_interval: float = 1.0,
+        event_bus: Optional[Any] = None,
+        session_refresh_interval: float = 30.0
     ):
         """
         Initialize cache service.
@@ -63,12 +202,28 @@ class DashboardCacheService:
         Args:
             questdb_provider: QuestDB provider for cache operations
             update_interval: Seconds between cache updates (default: 1.0)
+            event_bus: EventBus to maintain the cache from (None = poll QuestDB)
+            session_refresh_interval: Seconds between active session/symbol reloads
+                in event-driven mode (default: 30.0)
         """
         self.questdb = questdb_provider
         self.update_interval = update_interval
+        self.event_bus = event_bus
+        self.session_refresh_interval = session_refresh_interval
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
+        # Event-driven state
+        self._session_symbols: Dict[str, List[str]] = {}
+        self._symbol_sessions: Dict[str, Set[str]] = {}
+        self._symbol_stats: Dict[str, _RollingWindow] = {}
+        self._positions: Dict[str, Dict[str, Dict[str, Any]]] = {}  # session_id -> symbol -> open position
+        self._positions_stale = False
+        self._summaries: Dict[str, _SessionSummary] = {}
+        self._dirty_watchlist: Set[Tuple[str, str]] = set()
+        self._dirty_summaries: Set[str] = set()
+        self._rows_flushed = 0
+
         # BUG-008-7: Circuit breaker for QuestDB resilience
         self._resilient_service = ResilientService(
             name="questdb_dashboard_cache",
@@ -95,6 +250,7 @@ class DashboardCacheService:
 
         logger.info("dashboard_cache_service.initialized", {
             "update_interval": update_interval,
+            "event_driven": event_bus is not None,
             "circuit_breaker_enabled": True
         })
 
@@ -105,10 +261,15 @@ class DashboardCacheService:
             return
 
         self._running = True
-        self._task = asyncio.create_task(self._update_loop())
+        if self.event_bus:
+            await self._subscribe()
+            self._task = asyncio.create_task(self._event_flush_loop())
+        else:
+            self._task = asyncio.create_task(self._update_loop())
 
         logger.info("dashboard_cache_service.started", {
-            "update_interval": self.update_interval
+            "update_interval": self.update_interval,
+            "event_driven": self.event_bus is not None
         })
 
     async def stop(self):
@@ -122,6 +283,11 @@ class DashboardCacheService:
             except asyncio.CancelledError:
                 pass
 
+        if self.event_bus:
+            await self._unsubscribe()
+            # Write whatever changed since the last flush
+            await self._flush_dirty()
+
         logger.info("dashboard_cache_service.stopped")
 
     async def health_check(self) -> Dict[str, Any]:
@@ -142,6 +308,7 @@ class DashboardCacheService:
                 "database": "connected",
                 "circuit_breaker": circuit_status["circuit_breaker"]["state"],
                 "cache_keys": list(self._cache.keys()),
+                "event_driven": self.event_bus is not None,
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
 
@@ -198,6 +365,340 @@ class DashboardCacheService:
                 # Wait longer on error before retry
                 await asyncio.sleep(5.0)
 
+    # ========================================================================
+    # Event-driven mode
+    # ========================================================================
+
+    async def _subscribe(self) -> None:
+        await self.event_bus.subscribe("market.price_update", self._on_price_updates, batch=True)
+        await self.event_bus.subscribe("position_opened", self._on_position_event)
+        await self.event_bus.subscribe("position_updated", self._on_position_event)
+        await self.event_bus.subscribe("position_closed", self._on_position_event)
+        await self.event_bus.subscribe("signal_generated", self._on_signal_generated)
+        await self.event_bus.subscribe("paper_trading.performance_updated", self._on_performance_updated)
+
+    async def _unsubscribe(self) -> None:
+        await self.event_bus.unsubscribe("market.price_update", self._on_price_updates)
+        await self.event_bus.unsubscribe("position_opened", self._on_position_event)
+        await self.event_bus.unsubscribe("position_updated", self._on_position_event)
+        await self.event_bus.unsubscribe("position_closed", self._on_position_event)
+        await self.event_bus.unsubscribe("signal_generated", self._on_signal_generated)
+        await self.event_bus.unsubscribe("paper_trading.performance_updated", self._on_performance_updated)
+
+    async def _event_flush_loop(self):
+        """
+        Flush changed cache rows every interval; reload active sessions periodically.
+
+        Database reads are limited to the session refresh (and a one-off seed per
+        new session) plus one positions read per session after position events,
+        so query load no longer grows with sessions x symbols.
+        """
+        next_refresh = 0.0
+        while self._running:
+            try:
+                if time.monotonic() >= next_refresh:
+                    await self._refresh_sessions()
+                    next_refresh = time.monotonic() + self.session_refresh_interval
+                elif self._positions_stale:
+                    await self._reload_positions()
+
+                await self._flush_dirty()
+                await asyncio.sleep(self.update_interval)
+
+            except asyncio.CancelledError:
+                logger.info("dashboard_cache_service.cancelled")
+                break
+            except Exception as e:
+                logger.error("dashboard_cache_service.update_loop_failed", {
+                    "error": str(e),
+                    "retry_in_seconds": 5
+                })
+                await asyncio.sleep(5.0)
+
+    async def _on_price_updates(self, events: List[Dict[str, Any]]) -> None:
+        """Fold a batch of market.price_update events into the rolling windows."""
+        for data in events:
+            symbol = str(data.get("symbol", "")).upper()
+            price = data.get("price")
+            if not symbol or price is None:
+                continue
+
+            stats = self._symbol_stats.get(symbol)
+            if stats is None:
+                stats = self._symbol_stats[symbol] = _RollingWindow()
+            stats.add(_event_seconds(data.get("timestamp")), float(price), float(data.get("volume") or 0.0))
+
+            for session_id in self._symbol_sessions.get(symbol, ()):
+                self._dirty_watchlist.add((session_id, symbol))
+
+    async def _on_position_event(self, data: Dict[str, Any]) -> None:
+        """
+        Mark open positions for re-reading on the next flush.
+
+        OrderManager publishes position events with a per-order position_id and
+        no session_id (updates and closes carry no symbol either), so they cannot
+        be matched to a session's position; the positions table can.
+        """
+        self._positions_stale = True
+
+    async def _on_signal_generated(self, data: Dict[str, Any]) -> None:
+        """Count a signal toward the rolling 24h total of its sessions."""
+        session_id = data.get("session_id")
+        if session_id in self._summaries:
+            sessions = (session_id,)
+        else:
+            symbol = str(data.get("symbol", "")).upper()
+            sessions = tuple(self._symbol_sessions.get(symbol, ())) if symbol else tuple(self._summaries)
+
+        timestamp = _event_seconds(data.get("timestamp"))
+        for sid in sessions:
+            self._summaries[sid].add_signal(timestamp)
+            self._dirty_summaries.add(sid)
+
+    async def _on_performance_updated(self, data: Dict[str, Any]) -> None:
+        """Track the equity peak and max drawdown from paper trading balance updates."""
+        summary = self._summaries.get(data.get("session_id"))
+        balance = data.get("current_balance")
+        if summary is None or balance is None:
+            return
+        summary.add_balance(float(balance))
+        self._dirty_summaries.add(data["session_id"])
+
+    async def _refresh_sessions(self) -> None:
+        """Reload active sessions and symbols; seed new sessions, drop ended ones."""
+        active_sessions = await self._get_active_sessions()
+
+        session_symbols: Dict[str, List[str]] = {}
+        for session_id in active_sessions:
+            symbols = await self._get_session_symbols(session_id)
+            session_symbols[session_id] = [symbol.upper() for symbol in symbols]
+
+        ended = set(self._session_symbols) - set(session_symbols)
+        for session_id in ended:
+            self._summaries.pop(session_id, None)
+            self._positions.pop(session_id, None)
+            self._dirty_summaries.discard(session_id)
+        self._dirty_watchlist = {key for key in self._dirty_watchlist if key[0] not in ended}
+
+        previous, self._session_symbols = self._session_symbols, session_symbols
+        self._symbol_sessions = {}
+        for session_id, symbols in session_symbols.items():
+            for symbol in symbols:
+                self._symbol_sessions.setdefault(symbol, set()).add(session_id)
+
+        for session_id in session_symbols:
+            if session_id not in self._summaries:
+                await self._seed_session(session_id)
+            else:
+                # Resync the 24h signal count (events may carry no session_id)
+                summary = self._summaries[session_id]
+                for symbol in set(session_symbols[session_id]) - set(previous.get(session_id, ())):
+                    self._dirty_watchlist.add((session_id, symbol))
+                summary.seeded_signals = await self._count_recent_signals(session_id)
+                summary.signal_times.clear()
+                self._dirty_summaries.add(session_id)
+
+        await self._reload_positions()
+
+        logger.debug("dashboard_cache_service.sessions_refreshed", {
+            "active_sessions_count": len(session_symbols),
+            "ended_sessions_count": len(ended)
+        })
+
+    async def _seed_session(self, session_id: str) -> None:
+        """Load the starting state of a newly active session from QuestDB (once)."""
+        summary = self._summaries[session_id] = _SessionSummary()
+        summary.seeded_signals = await self._count_recent_signals(session_id)
+        summary.max_drawdown_pct = await self._calculate_max_drawdown(session_id)
+        summary.balance = await self._get_latest_balance(session_id)
+
+        for symbol in self._session_symbols[session_id]:
+            stats = self._symbol_stats.get(symbol)
+            if stats is None:
+                price_data = await self._get_latest_price(session_id, symbol)
+                stats = self._symbol_stats[symbol] = _RollingWindow()
+                stats.latest_price = price_data.get('price', 0.0)
+            # change_pct compares against the price 24h ago, not the first tick seen
+            stats.seed(await self._get_price_buckets(session_id, symbol))
+            self._dirty_watchlist.add((session_id, symbol))
+        self._dirty_summaries.add(session_id)
+
+    async def _reload_positions(self) -> None:
+        """Re-read open positions of every active session; mark changed rows dirty."""
+        self._positions_stale = False
+        for session_id, symbols in self._session_symbols.items():
+            positions = await self._get_open_positions(session_id)
+            if positions is None:
+                # Keep the last known positions and retry on the next flush
+                self._positions_stale = True
+                continue
+
+            previous = self._positions.get(session_id, {})
+            self._positions[session_id] = positions
+            changed = {
+                symbol for symbol in previous.keys() | positions.keys()
+                if previous.get(symbol) != positions.get(symbol)
+            }
+            if changed:
+                self._dirty_watchlist.update((session_id, symbol) for symbol in changed & set(symbols))
+                self._dirty_summaries.add(session_id)
+
+    async def _count_recent_signals(self, session_id: str) -> int:
+        """Count strategy signals of the last 24h for session."""
+        try:
+            query = """
+                SELECT COUNT(*) as total_signals
+                FROM strategy_signals
+                WHERE session_id = $1
+                  AND timestamp >= dateadd('d', -1, now())
+            """
+
+            async with self.questdb.pg_pool.acquire() as conn:
+                row = await conn.fetchrow(query, session_id)
+
+            return int(row['total_signals']) if row and row['total_signals'] else 0
+
+        except Exception as e:
+            logger.debug("dashboard_cache_service.count_signals_failed", {
+                "session_id": session_id,
+                "error": str(e) if str(e) else type(e).__name__
+            })
+            return 0
+
+    async def _get_price_buckets(self, session_id: str, symbol: str) -> List[Tuple[float, float, float]]:
+        """Per-minute (timestamp, first price, volume) of the last 24h of ticks for symbol."""
+        try:
+            query = """
+                SELECT timestamp, first(price) as price, sum(volume) as volume
+                FROM tick_prices
+                WHERE session_id = $1 AND symbol = $2
+                  AND timestamp >= dateadd('d', -1, now())
+                SAMPLE BY 1m ALIGN TO CALENDAR
+            """
+
+            async with self.questdb.pg_pool.acquire() as conn:
+                rows = await conn.fetch(query, session_id, symbol)
+
+            return [
+                (_event_seconds(row['timestamp']), float(row['price']), float(row['volume'] or 0.0))
+                for row in rows
+                if row['price'] is not None
+            ]
+
+        except Exception as e:
+            logger.debug("dashboard_cache_service.get_price_buckets_failed", {
+                "session_id": session_id,
+                "symbol": symbol,
+                "error": str(e) if str(e) else type(e).__name__
+            })
+            return []
+
+    async def _get_latest_balance(self, session_id: str) -> float:
+        """Latest paper trading balance of session (0.0 if none recorded)."""
+        try:
+            query = """
+                SELECT current_balance
+                FROM paper_trading_performance
+                WHERE session_id = $1
+                ORDER BY timestamp DESC
+                LIMIT 1
+            """
+
+            async with self.questdb.pg_pool.acquire() as conn:
+                row = await conn.fetchrow(query, session_id)
+
+            return float(row['current_balance']) if row and row['current_balance'] else 0.0
+
+        except Exception as e:
+            logger.debug("dashboard_cache_service.get_latest_balance_failed", {
+                "session_id": session_id,
+                "error": str(e) if str(e) else type(e).__name__
+            })
+            return 0.0
+
+    def _watchlist_row(self, session_id: str, symbol: str, now: datetime) -> Tuple:
+        stats = self._symbol_stats.get(symbol) or _RollingWindow()
+        position = self._positions.get(session_id, {}).get(symbol, {})
+        margin_ratio = position.get("margin_ratio")
+        return (
+            session_id, symbol, stats.latest_price, stats.change_pct, stats.volume,
+            position.get("side"),
+            position.get("unrealized_pnl"),
+            float(margin_ratio) if margin_ratio else None,
+            now
+        )
+
+    def _summary_row(self, session_id: str, now: datetime) -> Tuple:
+        summary = self._summaries[session_id]
+        positions = list(self._positions.get(session_id, {}).values())
+        margin_ratios = [float(p["margin_ratio"]) for p in positions if p.get("margin_ratio")]
+        margin = sum(p.get("margin") or 0.0 for p in positions)
+        return (
+            session_id,
+            sum(p.get("unrealized_pnl") or 0.0 for p in positions),
+            len(positions),
+            summary.total_signals,
+            margin / summary.balance * 100.0 if summary.balance > 0 else 0.0,
+            sum(margin_ratios) / len(margin_ratios) if margin_ratios else 0.0,
+            summary.max_drawdown_pct,
+            now
+        )
+
+    async def _flush_dirty(self) -> None:
+        """Write changed watchlist and summary rows, one executemany per table."""
+        if not self._dirty_watchlist and not self._dirty_summaries:
+            return
+
+        dirty_watchlist, self._dirty_watchlist = self._dirty_watchlist, set()
+        dirty_summaries, self._dirty_summaries = self._dirty_summaries, set()
+
+        now = datetime.now(timezone.utc)
+        watchlist_rows = [
+            self._watchlist_row(session_id, symbol, now)
+            for session_id, symbol in dirty_watchlist
+            if session_id in self._summaries
+        ]
+        summary_rows = [
+            self._summary_row(session_id, now)
+            for session_id in dirty_summaries
+            if session_id in self._summaries
+        ]
+
+        try:
+            async with self.questdb.pg_pool.acquire() as conn:
+                if watchlist_rows:
+                    await conn.executemany(WATCHLIST_INSERT_SQL, watchlist_rows)
+                if summary_rows:
+                    await conn.executemany(SUMMARY_INSERT_SQL, summary_rows)
+
+            self._rows_flushed += len(watchlist_rows) + len(summary_rows)
+            logger.debug("dashboard_cache_service.flushed", {
+                "watchlist_rows": len(watchlist_rows),
+                "summary_rows": len(summary_rows)
+            })
+
+        except Exception as e:
+            # Keep the rows dirty so the next cycle retries them
+            self._dirty_watchlist |= dirty_watchlist
+            self._dirty_summaries |= dirty_summaries
+            logger.error("dashboard_cache_service.flush_failed", {
+                "watchlist_rows": len(watchlist_rows),
+                "summary_rows": len(summary_rows),
+                "error": str(e) if str(e) else type(e).__name__
+            })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get event-driven cache statistics."""
+        return {
+            "event_driven": self.event_bus is not None,
+            "active_sessions": len(self._session_symbols),
+            "tracked_symbols": len(self._symbol_stats),
+            "open_positions": sum(len(positions) for positions in self._positions.values()),
+            "dirty_watchlist_rows": len(self._dirty_watchlist),
+            "dirty_summary_rows": len(self._dirty_summaries),
+            "rows_flushed": self._rows_flushed
+        }
+
     async def _get_active_sessions(self) -> List[str]:
         """
         Get list of active trading sessions.
@@ -481,7 +982,7 @@ class DashboardCacheService:
         """Get position data for symbol (if position exists)."""
         try:
             query = """
-                SELECT side, unrealized_pnl, margin_ratio
+                SELECT side, unrealized_pnl, margin_ratio, quantity, current_price
                 FROM positions
                 WHERE session_id = $1 AND symbol = $2 AND status = 'OPEN'
                 LATEST BY symbol
@@ -496,7 +997,9 @@ class DashboardCacheService:
             return {
                 'side': row['side'],
                 'unrealized_pnl': float(row['unrealized_pnl']) if row['unrealized_pnl'] else None,
-                'margin_ratio': float(row['margin_ratio']) if row['margin_ratio'] else None
+                'margin_ratio': float(row['margin_ratio']) if row['margin_ratio'] else None,
+                # positions has no leverage column: seeded margin is the 1x notional
+                'margin': _position_margin({'quantity': row['quantity'], 'current_price': row['current_price']})
             }
 
         except Exception as e:
@@ -508,6 +1011,49 @@ class DashboardCacheService:
             })
             return {}
 
+    async def _get_open_positions(self, session_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Open positions of session by symbol (None if QuestDB could not be read)."""
+        try:
+            query = """
+                SELECT symbol, side, status, unrealized_pnl, margin_ratio,
+                       quantity, current_price, metadata
+                FROM positions
+                WHERE session_id = $1
+                LATEST BY symbol
+            """
+
+            async with self.questdb.pg_pool.acquire() as conn:
+                rows = await conn.fetch(query, session_id)
+
+            positions = {}
+            for row in rows:
+                if str(row['status']).upper() != 'OPEN':
+                    continue
+                try:
+                    metadata = json.loads(row['metadata']) if row['metadata'] else {}
+                except (TypeError, ValueError):
+                    metadata = {}
+                if not isinstance(metadata, dict):
+                    metadata = {}
+                positions[str(row['symbol']).upper()] = {
+                    'side': str(row['side']).upper() if row['side'] else None,
+                    'unrealized_pnl': float(row['unrealized_pnl'] or 0.0),
+                    'margin_ratio': float(row['margin_ratio']) if row['margin_ratio'] else None,
+                    'margin': _position_margin({
+                        'quantity': row['quantity'],
+                        'current_price': row['current_price'],
+                        'metadata': metadata
+                    })
+                }
+            return positions
+
+        except Exception as e:
+            logger.debug("dashboard_cache_service.get_open_positions_failed", {
+                "session_id": session_id,
+                "error": str(e) if str(e) else type(e).__name__
+            })
+            return None
+
     async def _calculate_summary_metrics(self, session_id: str) -> Dict[str, float]:
         """Calculate aggregated metrics for dashboard summary."""
         try:
@@ -611,22 +1157,15 @@ class DashboardCacheService:
         """Insert batch of rows to watchlist_cache using ILP."""
         # For MVP, use PostgreSQL INSERT (ILP would be faster but more complex)
         try:
-            query = """
-                INSERT INTO watchlist_cache (
-                    session_id, symbol, latest_price, price_change_pct,
-                    volume_24h, position_side, position_pnl, position_margin_ratio,
-                    last_updated
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-            """
-
             async with self.questdb.pg_pool.acquire() as conn:
-                for row in rows:
-                    await conn.execute(
-                        query,
+                await conn.executemany(WATCHLIST_INSERT_SQL, [
+                    (
                         row['session_id'], row['symbol'], row['latest_price'],
                         row['price_change_pct'], row['volume_24h'], row['position_side'],
                         row['position_pnl'], row['position_margin_ratio'], row['last_updated']
                     )
+                    for row in rows
+                ])
         except Exception as e:
             logger.error("dashboard_cache_service.insert_watchlist_failed", {
                 "error": str(e)
@@ -635,19 +1174,11 @@ class DashboardCacheService:
     async def _insert_summary_cache(self, session_id: str, summary: Dict[str, float]):
         """Insert summary metrics to dashboard_summary_cache."""
         try:
-            query = """
-                INSERT INTO dashboard_summary_cache (
-                    session_id, global_pnl, total_positions, total_signals,
-                    budget_utilization_pct, avg_margin_ratio, max_drawdown_pct,
-                    last_updated
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            """
-
             now = datetime.now(timezone.utc)
 
             async with self.questdb.pg_pool.acquire() as conn:
                 await conn.execute(
-                    query,
+                    SUMMARY_INSERT_SQL,
                     session_id, summary['global_pnl'], summary['total_positions'],
                     summary['total_signals'], summary['budget_utilization_pct'],
                     summary['avg_margin_ratio'], summary['max_drawdown_pct'], now
@@ -8,6 +8,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class DataWindow:
@@ -278,6 +280,32 @@ class IndicatorAlgorithm(ABC):
                 f"implemented calculate_from_windows(). Please migrate to new interface."
             )
 
+    def calculate_series(self,
+                         timestamps: np.ndarray,
+                         values: np.ndarray,
+                         target_ts: np.ndarray,
+                         params: IndicatorParameters) -> Optional[np.ndarray]:
+        """
+        Calculate a whole indicator series at once (optional batch interface).
+
+        Batch callers (OfflineIndicatorEngine) try this first and fall back to
+        calling calculate_from_windows() per time-axis point when it returns None.
+        Implementations must match calculate_from_windows() on the windows the
+        offline engine builds: points in [start_ts, end_ts) plus the last point
+        before start_ts.
+
+        Args:
+            timestamps: Ascending data timestamps (epoch seconds)
+            values: Data values aligned with timestamps (price for price algorithms)
+            target_ts: Ascending time axis to evaluate at
+            params: Algorithm parameters
+
+        Returns:
+            Array aligned with target_ts (NaN where no value can be calculated),
+            or None if the algorithm has no batch implementation
+        """
+        return None
+
     def get_registry_metadata(self) -> Dict[str, Any]:
         """Return complete metadata for engine registration."""
         # Convert VariantParameter objects to dicts for JSON serialization
@@ -14,13 +14,16 @@ This measures the RATE of price change (velocity) using TWPA to reduce noise.
 """
 
 from typing import List, Optional
+
+import numpy as np
+
 from .base_algorithm import (
     MultiWindowIndicatorAlgorithm,
     IndicatorParameters,
     DataWindow,
     WindowSpec
 )
-from .window_calculations import compute_time_weighted_average
+from .window_calculations import compute_time_weighted_average, compute_time_weighted_average_series
 
 
 class PriceVelocityAlgorithm(MultiWindowIndicatorAlgorithm):
@@ -247,6 +250,32 @@ class PriceVelocityAlgorithm(MultiWindowIndicatorAlgorithm):
 
         return velocity
 
+    def calculate_series(
+        self,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+        target_ts: np.ndarray,
+        params: IndicatorParameters
+    ) -> Optional[np.ndarray]:
+        """Batch PRICE_VELOCITY from current and baseline prefix-integral TWPA series."""
+        current_spec, baseline_spec = self.get_window_specs(params)
+        current_twpa = compute_time_weighted_average_series(
+            timestamps, values, target_ts, current_spec.t1, current_spec.t2
+        )
+        baseline_twpa = compute_time_weighted_average_series(
+            timestamps, values, target_ts, baseline_spec.t1, baseline_spec.t2
+        )
+
+        # Window centers are a fixed distance apart for every target
+        time_diff = (baseline_spec.t1 + baseline_spec.t2 - current_spec.t1 - current_spec.t2) / 2.0
+        if time_diff <= 0:
+            return np.full(len(target_ts), np.nan)
+
+        # Avoid division by zero
+        baseline_twpa = np.where(baseline_twpa == 0, np.nan, baseline_twpa)
+        price_change_pct = ((current_twpa - baseline_twpa) / baseline_twpa) * 100.0
+        return price_change_pct / time_diff
+
     def calculate_multi_window(
         self,
         windows: List[tuple],
@@ -13,13 +13,16 @@ This uses TWPA instead of raw prices to reduce noise and false signals.
 """
 
 from typing import List, Optional
+
+import numpy as np
+
 from .base_algorithm import (
     MultiWindowIndicatorAlgorithm,
     IndicatorParameters,
     DataWindow,
     WindowSpec
 )
-from .window_calculations import compute_time_weighted_average
+from .window_calculations import compute_time_weighted_average, compute_time_weighted_average_series
 
 
 class PumpMagnitudePctAlgorithm(MultiWindowIndicatorAlgorithm):
@@ -215,6 +218,26 @@ class PumpMagnitudePctAlgorithm(MultiWindowIndicatorAlgorithm):
 
         return magnitude_pct
 
+    def calculate_series(
+        self,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+        target_ts: np.ndarray,
+        params: IndicatorParameters
+    ) -> Optional[np.ndarray]:
+        """Batch PUMP_MAGNITUDE_PCT from current and baseline prefix-integral TWPA series."""
+        current_spec, baseline_spec = self.get_window_specs(params)
+        current_twpa = compute_time_weighted_average_series(
+            timestamps, values, target_ts, current_spec.t1, current_spec.t2
+        )
+        baseline_twpa = compute_time_weighted_average_series(
+            timestamps, values, target_ts, baseline_spec.t1, baseline_spec.t2
+        )
+
+        # Avoid division by zero
+        baseline_twpa = np.where(baseline_twpa == 0, np.nan, baseline_twpa)
+        return ((current_twpa - baseline_twpa) / baseline_twpa) * 100.0
+
     def calculate_multi_window(
         self,
         windows: List[tuple],
@@ -5,7 +5,11 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from typing import Optional, Sequence, Tuple, List, Any, Dict
+
+import numpy as np
+
 from .base_algorithm import IndicatorAlgorithm, IndicatorParameters
+from .window_calculations import compute_time_weighted_average_series
 
 
 @dataclass(frozen=True)
@@ -152,6 +156,15 @@ class TWPAAlgorithm(IndicatorAlgorithm):
                  params: IndicatorParameters) -> Optional[float]:
         """Calculate TWPA value using the unified interface."""
         return self._compute_twpa(data, start_ts, end_ts)
+
+    def calculate_series(self,
+                         timestamps: np.ndarray,
+                         values: np.ndarray,
+                         target_ts: np.ndarray,
+                         params: IndicatorParameters) -> Optional[np.ndarray]:
+        """Batch TWPA: difference of prefix time-integrals over each window."""
+        spec = self.get_window_specs(params)[0]
+        return compute_time_weighted_average_series(timestamps, values, target_ts, spec.t1, spec.t2)
     
     @staticmethod
     def _compute_twpa(window_points: Sequence[Tuple[float, float]], start_ts: float, end_ts: float) -> Optional[float]:
@@ -5,6 +5,9 @@ Calculates ratio between two TWPA values: TWPA(t1,t2) / TWPA(t3,t4)
 """
 
 from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from .base_algorithm import (
     MultiWindowIndicatorAlgorithm,
     IndicatorParameters,
@@ -12,6 +15,7 @@ from .base_algorithm import (
     WindowSpec
 )
 from .twpa import twpa_algorithm
+from .window_calculations import compute_time_weighted_average_series
 
 
 class TWPARatioAlgorithm(MultiWindowIndicatorAlgorithm):
@@ -204,6 +208,25 @@ class TWPARatioAlgorithm(MultiWindowIndicatorAlgorithm):
 
         return twpa1 / twpa2
 
+    def calculate_series(self,
+                         timestamps: np.ndarray,
+                         values: np.ndarray,
+                         target_ts: np.ndarray,
+                         params: IndicatorParameters) -> Optional[np.ndarray]:
+        """Batch TWPA ratio from two prefix-integral TWPA series."""
+        numerator_spec, denominator_spec = self.get_window_specs(params)
+        twpa1 = compute_time_weighted_average_series(
+            timestamps, values, target_ts, numerator_spec.t1, numerator_spec.t2
+        )
+        twpa2 = compute_time_weighted_average_series(
+            timestamps, values, target_ts, denominator_spec.t1, denominator_spec.t2
+        )
+
+        # Avoid division by zero (NaN propagates where either TWPA is undefined)
+        min_denominator = params.get_float("min_denominator", 0.001)
+        denominator = np.where(np.abs(twpa2) < min_denominator, np.nan, twpa2)
+        return twpa1 / denominator
+
     # ========================================
     # OLD INTERFACE (kept for backward compatibility)
     # ========================================
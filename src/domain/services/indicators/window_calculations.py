@@ -8,6 +8,8 @@ All functions are pure (no side effects) and thread-safe.
 import math
 from typing import Optional, Sequence, Tuple
 
+import numpy as np
+
 
 def compute_time_weighted_average(
     window_points: Sequence[Tuple[float, float]],
@@ -389,3 +391,73 @@ def compute_standard_deviation(
 
     # Return standard deviation
     return math.sqrt(variance)
+
+
+# ========================================
+# BATCH (SERIES) CALCULATIONS
+# ========================================
+
+def compute_time_weighted_average_series(
+    timestamps: np.ndarray,
+    values: np.ndarray,
+    target_ts: np.ndarray,
+    t1: float,
+    t2: float
+) -> np.ndarray:
+    """
+    Compute compute_time_weighted_average() for every target timestamp at once.
+
+    Each value is held from its timestamp until the next one (step function).
+    A prefix array of its time-integral is built once, so the integral over any
+    window is a difference of two prefix lookups and the whole series costs
+    O((N + T) log N) instead of O(T x window size).
+
+    Window per target: [target - t1, target - t2] over the points before
+    target - t2 (or up to target if t2 < 0) plus the last point before the window
+    start - the same windows the offline engine hands to compute_time_weighted_average().
+
+    Args:
+        timestamps: Ascending timestamps (epoch seconds)
+        values: Values aligned with timestamps
+        target_ts: Ascending time axis
+        t1: Seconds before target for window start
+        t2: Seconds before target for window end
+
+    Returns:
+        Time-weighted averages aligned with target_ts (NaN where undefined)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    target_ts = np.asarray(target_ts, dtype=np.float64)
+    result = np.full(len(target_ts), np.nan)
+    if len(timestamps) == 0 or len(target_ts) == 0:
+        return result
+
+    # prefix[k] = integral of the step function from timestamps[0] to timestamps[k]
+    prefix = np.zeros(len(timestamps))
+    np.cumsum(values[:-1] * np.diff(timestamps), out=prefix[1:])
+
+    start_ts = target_ts - t1
+    end_ts = target_ts - t2
+
+    # Number of points the window may use (never past target_ts)
+    if t2 >= 0:
+        count = np.searchsorted(timestamps, end_ts, side="left")
+    else:
+        count = np.searchsorted(timestamps, target_ts, side="right")
+
+    # Coverage starts at the window start, or at the first point if data begins later
+    begin_ts = np.maximum(start_ts, timestamps[0])
+    width = end_ts - begin_ts
+    valid = (count > 0) & (width > 1e-12)
+    if not valid.any():
+        return result
+
+    last = count[valid] - 1
+    first = np.searchsorted(timestamps, begin_ts[valid], side="right") - 1
+
+    integral_end = prefix[last] + values[last] * (end_ts[valid] - timestamps[last])
+    integral_begin = prefix[first] + values[first] * (begin_ts[valid] - timestamps[first])
+    result[valid] = (integral_end - integral_begin) / width[valid]
+    return result
+
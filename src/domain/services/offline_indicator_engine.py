@@ -9,8 +9,10 @@ Used for session analysis and backtesting scenarios.
 """
 
 import os
+from bisect import bisect_left, bisect_right
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any
 from threading import Lock
 import json
 from datetime import datetime
@@ -501,6 +503,7 @@ class OfflineIndicatorEngine(IIndicatorEngine):
         sorted_data: List[MarketDataPoint],
         target_ts: float,
         window_specs: List,
+        timestamps: Optional[List[float]] = None,
     ) -> List:
         """
         Extract multiple data windows for a single timestamp.
@@ -509,19 +512,24 @@ class OfflineIndicatorEngine(IIndicatorEngine):
         This is required by TWPA and time-weighted algorithms to calculate
         the duration of the first price in the window.
 
-        EFFICIENT: Single pass through data to extract all windows.
+        EFFICIENT: Window bounds are found by bisection over the sorted
+        timestamps, so each window costs O(log n + window size).
         Returns DataWindow objects ready for pure function calculation.
 
         Args:
             sorted_data: All data points sorted by timestamp
             target_ts: Target timestamp for calculation
             window_specs: List of WindowSpec objects
+            timestamps: Timestamps of sorted_data (pass to avoid rebuilding per call)
 
         Returns:
             List of DataWindow objects, each including pre-window point if available
         """
         from .indicators.base_algorithm import DataWindow
 
+        if timestamps is None:
+            timestamps = [point.timestamp for point in sorted_data]
+
         windows = []
 
         for spec in window_specs:
@@ -529,26 +537,19 @@ class OfflineIndicatorEngine(IIndicatorEngine):
             start_ts = target_ts - spec.t1
             end_ts = target_ts - spec.t2
 
-            # ✅ TWPA FIX: Find last transaction BEFORE window (required by TWPA)
-            # AND extract window data - optimized single pass
-            pre_window_point = None
-            window_data = []
-            for point in sorted_data:
-                if point.timestamp > target_ts:
-                    break  # Early exit - data is sorted
-                if point.timestamp < start_ts:
-                    # Keep updating to get the LAST point before window
-                    pre_window_point = (point.timestamp, point.price)
-                elif start_ts <= point.timestamp < end_ts:
-                    window_data.append((point.timestamp, point.price))
-
-            # ✅ TWPA FIX: ALWAYS include the pre-window point at the beginning
+            # ✅ PERFORMANCE: Bisect for [start_ts, end_ts) instead of scanning all points
+            lo = bisect_left(timestamps, start_ts)
+            hi = max(lo, bisect_left(timestamps, end_ts))
+            if end_ts > target_ts:
+                hi = max(lo, bisect_right(timestamps, target_ts))  # Never look past target_ts
+
+            # ✅ TWPA FIX: ALWAYS include the last transaction BEFORE the window at the beginning
             # This is REQUIRED by TWPA algorithm to calculate duration of first price
             # This handles both cases:
             #   1. Window has points: pre_window_point is inserted at position 0
             #   2. Window is empty: pre_window_point creates a single-element list
-            if pre_window_point:
-                window_data.insert(0, pre_window_point)
+            first = lo - 1 if lo > 0 else lo
+            window_data = [(point.timestamp, point.price) for point in sorted_data[first:hi]]
 
             windows.append(DataWindow(
                 data=tuple(window_data),  # Immutable
@@ -558,6 +559,64 @@ class OfflineIndicatorEngine(IIndicatorEngine):
 
         return windows
 
+    def _sweep_windows(
+        self,
+        sorted_data: List[MarketDataPoint],
+        time_axis: Iterable[float],
+        window_specs: List,
+    ) -> Iterator[List]:
+        """
+        Yield the data windows for every timestamp of an ascending time axis.
+
+        Window bounds only move forward as target_ts advances, so each spec keeps
+        a start and end index that are advanced incrementally (two-pointer sweep):
+        the whole series costs O(N + T) pointer moves per spec instead of a fresh
+        lookup per time-axis point. The (timestamp, price) tuples are built once
+        and every window is a slice of that shared list (references only).
+
+        Semantics match _extract_windows_at_timestamp: [start_ts, end_ts) plus
+        the last point BEFORE start_ts (required by TWPA), never past target_ts.
+
+        Args:
+            sorted_data: All data points sorted by timestamp
+            time_axis: Ascending target timestamps
+            window_specs: List of WindowSpec objects
+
+        Yields:
+            List of DataWindow objects (one per spec) for each target timestamp
+        """
+        from .indicators.base_algorithm import DataWindow
+
+        points = [(point.timestamp, point.price) for point in sorted_data]
+        count = len(points)
+        cursors = [[0, 0] for _ in window_specs]  # [lo, hi] per spec
+
+        for target_ts in time_axis:
+            windows = []
+            for spec, cursor in zip(window_specs, cursors):
+                start_ts = target_ts - spec.t1
+                end_ts = target_ts - spec.t2
+                lo, hi = cursor
+
+                while lo < count and points[lo][0] < start_ts:
+                    lo += 1
+                if end_ts > target_ts:
+                    while hi < count and points[hi][0] <= target_ts:  # Never look past target_ts
+                        hi += 1
+                else:
+                    while hi < count and points[hi][0] < end_ts:
+                        hi += 1
+                cursor[0], cursor[1] = lo, hi
+
+                # ✅ TWPA FIX: ALWAYS include the pre-window point at the beginning
+                first = lo - 1 if lo > 0 else lo
+                windows.append(DataWindow(
+                    data=tuple(points[first:max(lo, hi)]),
+                    start_ts=start_ts,
+                    end_ts=end_ts
+                ))
+            yield windows
+
     def _calculate_indicator_series_new(
         self,
         symbol: str,
@@ -571,7 +630,7 @@ class OfflineIndicatorEngine(IIndicatorEngine):
         NEW IMPLEMENTATION: Calculate indicator series using algorithm registry.
 
         Uses pure function interface with zero coupling.
-        More efficient than old method - single pass window extraction.
+        More efficient than old method - sliding-window sweep, O(N + T) per window spec.
 
         Args:
             symbol: Symbol identifier
@@ -657,11 +716,21 @@ class OfflineIndicatorEngine(IIndicatorEngine):
             "end_ts": end_ts
         })
 
+        # ✅ PERFORMANCE: Vectorized batch path when the algorithm provides calculate_series
+        batch_series = self._calculate_indicator_series_batch(
+            algorithm, symbol, indicator_type, timeframe, period, params,
+            wrapped_params, sorted_points, time_axis
+        )
+        if batch_series is not None:
+            return batch_series
+
         # Calculate indicator values
         series: List[IndicatorValue] = []
         calculation_errors = 0
 
-        for idx, target_ts in enumerate(time_axis):
+        window_sweep = self._sweep_windows(sorted_points, time_axis, window_specs)
+
+        for idx, (target_ts, windows) in enumerate(zip(time_axis, window_sweep)):
             # Log progress every 100 points to avoid log spam
             if idx % 100 == 0:
                 self.logger.debug("offline_indicator_engine.calculation_progress", {
@@ -670,11 +739,6 @@ class OfflineIndicatorEngine(IIndicatorEngine):
                     "errors_so_far": calculation_errors
                 })
 
-            # Extract all windows for this timestamp
-            windows = self._extract_windows_at_timestamp(
-                sorted_points, target_ts, window_specs
-            )
-
             # Calculate using pure function
             try:
                 value = algorithm.calculate_from_windows(windows, wrapped_params)
@@ -725,6 +789,82 @@ class OfflineIndicatorEngine(IIndicatorEngine):
 
         return series
     
+    def _calculate_indicator_series_batch(
+        self,
+        algorithm: Any,
+        symbol: str,
+        indicator_type: IndicatorType,
+        timeframe: str,
+        period: int,
+        params: Dict[str, Any],
+        wrapped_params: Any,
+        sorted_points: List[MarketDataPoint],
+        time_axis: List[float],
+    ) -> Optional[List[IndicatorValue]]:
+        """
+        Calculate the series with the algorithm's calculate_series() batch interface.
+
+        Args:
+            algorithm: Algorithm from the registry
+            symbol: Symbol identifier
+            indicator_type: Type of indicator
+            timeframe: Timeframe
+            period: Period (for compatibility)
+            params: Calculation parameters
+            wrapped_params: IndicatorParameters built from params
+            sorted_points: Data points sorted by timestamp
+            time_axis: Ascending target timestamps
+
+        Returns:
+            List of IndicatorValue objects, or None if the algorithm has no batch
+            implementation (or it failed) and the per-point path must be used
+        """
+        if not hasattr(algorithm, 'calculate_series'):
+            return None
+
+        try:
+            values = algorithm.calculate_series(
+                np.fromiter((p.timestamp for p in sorted_points), dtype=np.float64, count=len(sorted_points)),
+                np.fromiter((p.price for p in sorted_points), dtype=np.float64, count=len(sorted_points)),
+                np.asarray(time_axis, dtype=np.float64),
+                wrapped_params,
+            )
+        except Exception as e:
+            import traceback
+            self.logger.error("offline_indicator_engine.batch_series_failed", {
+                "indicator_type": indicator_type.value,
+                "error": str(e),
+                "traceback": traceback.format_exc(),
+                "action": "Falling back to per-point calculation"
+            })
+            return None
+
+        if values is None:
+            return None
+
+        indicator_id = f"{indicator_type.value}_{period}_{timeframe}"
+        series = [
+            IndicatorValue(
+                timestamp=target_ts,
+                symbol=symbol,
+                indicator_id=indicator_id,
+                value=None if value != value else value,  # NaN -> None
+                metadata={
+                    "timeframe": timeframe,
+                    "params": dict(params),
+                },
+            )
+            for target_ts, value in zip(time_axis, values.tolist())
+        ]
+
+        self.logger.info("offline_indicator_engine.batch_series_complete", {
+            "indicator_type": indicator_type.value,
+            "total_points": len(series),
+            "valid_values": sum(1 for v in series if v.value is not None)
+        })
+
+        return series
+
     def get_indicator_values_for_symbol(self, symbol: str) -> Dict[str, Any]:
         """
         Get all calculated indicator values for a symbol.
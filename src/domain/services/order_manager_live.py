@@ -5,7 +5,8 @@ Manages order lifecycle for live trading with retry logic, status polling, and c
 
 Features:
 - Submit orders to MEXC with retry (3 attempts, exponential backoff)
-- Background status polling (every 2s)
+- Background status polling (adaptive interval, batched/concurrent status queries)
+- Optional push-based fill channel (polling becomes a reconciliation backstop)
 - Cleanup old orders (every 60s, removes orders > 1 hour old)
 - Circuit breaker integration for MEXC calls
 - RiskManager validation before submission
@@ -20,8 +21,9 @@ Critical Requirements:
 """
 
 import asyncio
+import math
 import time
-from typing import Dict, Optional, List
+from typing import Any, AsyncIterable, Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from decimal import Decimal
@@ -72,7 +74,7 @@ class LiveOrderManager:
 
     Responsibilities:
     - Submit orders to MEXC
-    - Poll order status every 2 seconds
+    - Poll order status (adaptive interval, see _next_poll_interval)
     - Handle partial fills
     - Retry on transient failures (3 attempts with exponential backoff: 1s, 2s, 4s)
     - Emit order events to EventBus
@@ -81,15 +83,31 @@ class LiveOrderManager:
     - Max size: 1000 orders (configurable)
     - TTL: Not used (cleanup based on age)
     - Cleanup: Remove completed orders after 1 hour
+
+    Status queries:
+    - Adapters implementing get_order_statuses(symbol, exchange_order_ids) are
+      queried in batches of up to status_batch_size ids per request
+    - Otherwise get_order_status() runs for all orders concurrently, bounded by
+      status_concurrency and the shared status_rate_limiter (if given)
     """
 
+    # Poll at the minimum interval for this long after a fill (fills cluster)
+    RECENT_FILL_WINDOW_SECONDS = 10.0
+
     def __init__(
         self,
         event_bus: EventBus,
         mexc_adapter,  # MexcFuturesAdapter or MexcPaperAdapter (Any to avoid circular import)
         risk_manager,  # RiskManager (avoid circular import)
         max_orders: int = 1000,
-        order_timeout_seconds: int = 60  # FIX (Agent 4 - Task 3): Order timeout
+        order_timeout_seconds: int = 60,  # FIX (Agent 4 - Task 3): Order timeout
+        poll_interval_seconds: float = 2.0,
+        min_poll_interval_seconds: float = 0.25,
+        max_poll_interval_seconds: float = 10.0,
+        status_batch_size: int = 50,
+        status_concurrency: int = 8,
+        status_rate_limiter=None,  # Shared limiter with acquire_wait() (e.g. TokenBucketRateLimiter)
+        fill_channel: Optional[AsyncIterable[Tuple[str, Any]]] = None
     ):
         """
         Initialize LiveOrderManager.
@@ -100,6 +118,13 @@ class LiveOrderManager:
             risk_manager: RiskManager for order validation
             max_orders: Maximum number of orders to track
             order_timeout_seconds: Timeout for pending orders (default: 60s)
+            poll_interval_seconds: Status poll interval with open orders and no recent fills
+            min_poll_interval_seconds: Poll interval right after fills
+            max_poll_interval_seconds: Upper bound (also used while a fill channel is connected)
+            status_batch_size: Max exchange order ids per batched status request
+            status_concurrency: Max concurrent single-order status requests
+            status_rate_limiter: Rate limiter shared by all status requests (one token per request)
+            fill_channel: Async iterable of (exchange_order_id, status_response) pushed by the exchange
         """
         self.event_bus = event_bus
         self.mexc_adapter = mexc_adapter
@@ -107,6 +132,21 @@ class LiveOrderManager:
         self.max_orders = max_orders
         self.order_timeout_seconds = order_timeout_seconds
 
+        # Status polling configuration
+        self.poll_interval_seconds = poll_interval_seconds
+        self.min_poll_interval_seconds = min_poll_interval_seconds
+        self.max_poll_interval_seconds = max_poll_interval_seconds
+        self.status_batch_size = max(1, status_batch_size)
+        self.status_concurrency = max(1, status_concurrency)
+        self.status_rate_limiter = status_rate_limiter
+        self.fill_channel = fill_channel
+        # Batch support is a method of the adapter class (instance attribute lookups on mocks always succeed)
+        self._batch_status_supported = callable(getattr(type(mexc_adapter), "get_order_statuses", None))
+        self._poll_interval = poll_interval_seconds
+        self._poll_wakeup = asyncio.Event()  # Set when new orders need polling sooner
+        self._last_fill_at: Optional[float] = None  # time.monotonic() of the latest fill
+        self._fill_channel_connected = False
+
         # Order tracking (CRITICAL: Not defaultdict to prevent memory leak)
         self.orders: Dict[str, Order] = {}
 
@@ -119,6 +159,7 @@ class LiveOrderManager:
         # Background tasks
         self._status_poll_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._fill_channel_task: Optional[asyncio.Task] = None
         self._running = False
 
         # Note: EventBus subscriptions moved to start() method (async required)
@@ -140,6 +181,8 @@ class LiveOrderManager:
         # Start background tasks
         self._status_poll_task = asyncio.create_task(self._poll_order_status())
         self._cleanup_task = asyncio.create_task(self._cleanup_old_orders())
+        if self.fill_channel is not None:
+            self._fill_channel_task = asyncio.create_task(self._consume_fill_channel())
 
     async def stop(self):
         """Stop background tasks and cleanup."""
@@ -164,6 +207,13 @@ class LiveOrderManager:
             except asyncio.CancelledError:
                 pass
 
+        if self._fill_channel_task:
+            self._fill_channel_task.cancel()
+            try:
+                await self._fill_channel_task
+            except asyncio.CancelledError:
+                pass
+
         # FIX (Agent 4 - Task 3): Cancel all timeout tasks
         timeout_count = len(self._order_timeouts)
         for order_id, timeout_task in list(self._order_timeouts.items()):
@@ -295,6 +345,9 @@ class LiveOrderManager:
                 self._order_timeouts[order.order_id] = timeout_task
                 logger.debug(f"Timeout task created for order {order.order_id} ({self.order_timeout_seconds}s)")
 
+                # Idle poller may be sleeping the max interval - bring the first check forward
+                self._reset_poll_interval()
+
                 await self._emit_order_event("order_created", order, status="submitted")
                 return True
 
@@ -471,13 +524,13 @@ class LiveOrderManager:
 
     async def _poll_order_status(self):
         """
-        Background task: Poll order status every 2 seconds.
+        Background task: Poll order status at an adaptive interval.
 
-        Checks all SUBMITTED orders for fills.
+        Checks all SUBMITTED/PARTIALLY_FILLED orders for fills.
         """
         while self._running:
             try:
-                await asyncio.sleep(2)
+                await self._wait_for_next_poll()
 
                 # Get all submitted/partially filled orders (protect with lock)
                 async with self._order_lock:
@@ -486,33 +539,14 @@ class LiveOrderManager:
                         if order.status in [OrderStatus.SUBMITTED, OrderStatus.PARTIALLY_FILLED]
                     ]
 
-                if not active_orders:
-                    continue
-
-                logger.debug(f"Polling status for {len(active_orders)} orders...")
-
-                # Poll each order
-                for order in active_orders:
-                    try:
-                        # Get order status from MEXC (circuit breaker integrated in adapter)
-                        status_response = await self.mexc_adapter.get_order_status(
-                            order.symbol,
-                            order.exchange_order_id
-                        )
+                if active_orders:
+                    logger.debug(f"Polling status for {len(active_orders)} orders...")
+                    if self._batch_status_supported:
+                        await self._poll_statuses_batched(active_orders)
+                    else:
+                        await self._poll_statuses_concurrently(active_orders)
 
-                        # Skip if status_response is None (order not found on exchange)
-                        # Use debug level to avoid log spam - this can happen frequently during normal operation
-                        if status_response is None:
-                            logger.debug(f"Order status not found on exchange: {order.order_id} (exchange_id: {order.exchange_order_id})")
-                            continue
-
-                        await self._update_order_status(order, status_response)
-
-                    except CircuitBreakerOpenException:
-                        logger.warning("Skipping order status poll: circuit breaker open")
-                        break  # Skip remaining orders
-                    except Exception as e:
-                        logger.error(f"Failed to poll order {order.order_id}: {e}")
+                self._poll_interval = self._next_poll_interval(len(active_orders))
 
             except asyncio.CancelledError:
                 logger.info("Order status polling stopped")
@@ -520,6 +554,156 @@ class LiveOrderManager:
             except Exception as e:
                 logger.error(f"Error in order status polling: {e}")
 
+    async def _wait_for_next_poll(self) -> None:
+        """Sleep for the current poll interval, shortened if _reset_poll_interval() fires meanwhile."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._poll_interval
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            self._poll_wakeup.clear()
+            try:
+                await asyncio.wait_for(self._poll_wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+            deadline = min(deadline, loop.time() + self._poll_interval)
+
+    def _reset_poll_interval(self) -> None:
+        """Cap the poll interval at the base interval and wake the poller to re-arm its sleep."""
+        self._poll_interval = min(self._poll_interval, self.poll_interval_seconds)
+        self._poll_wakeup.set()
+
+    def _next_poll_interval(self, open_orders: int) -> float:
+        """
+        Interval until the next status poll.
+
+        - No open orders, or a fill channel connected: max interval (reconciliation only)
+        - Fill within RECENT_FILL_WINDOW_SECONDS: min interval
+        - Otherwise the base interval, stretched so one poll cycle fits the rate limiter budget
+        """
+        if open_orders == 0 or self._fill_channel_connected:
+            return self.max_poll_interval_seconds
+
+        if self._last_fill_at is not None and time.monotonic() - self._last_fill_at < self.RECENT_FILL_WINDOW_SECONDS:
+            interval = self.min_poll_interval_seconds
+        else:
+            interval = self.poll_interval_seconds
+
+        refill_rate = getattr(self.status_rate_limiter, "refill_rate", None)
+        if refill_rate:
+            requests = math.ceil(open_orders / self.status_batch_size) if self._batch_status_supported else open_orders
+            interval = max(interval, requests / refill_rate)
+
+        return min(interval, self.max_poll_interval_seconds)
+
+    async def _acquire_status_request(self) -> None:
+        if self.status_rate_limiter is not None:
+            await self.status_rate_limiter.acquire_wait()
+
+    async def _poll_statuses_batched(self, orders: List[Order]) -> None:
+        """Query statuses with get_order_statuses(), up to status_batch_size ids per request per symbol."""
+        by_symbol: Dict[str, List[Order]] = {}
+        for order in orders:
+            by_symbol.setdefault(order.symbol, []).append(order)
+
+        for symbol, symbol_orders in by_symbol.items():
+            for start in range(0, len(symbol_orders), self.status_batch_size):
+                chunk = symbol_orders[start:start + self.status_batch_size]
+                try:
+                    await self._acquire_status_request()
+                    responses = await self.mexc_adapter.get_order_statuses(
+                        symbol,
+                        [order.exchange_order_id for order in chunk]
+                    ) or {}
+                except CircuitBreakerOpenException:
+                    logger.warning("Skipping order status poll: circuit breaker open")
+                    return  # Skip remaining batches
+                except Exception as e:
+                    logger.error(f"Failed to poll {len(chunk)} orders for {symbol}: {e}")
+                    continue
+
+                for order in chunk:
+                    status_response = responses.get(order.exchange_order_id)
+                    if status_response is None:
+                        logger.debug(f"Order status not found on exchange: {order.order_id} (exchange_id: {order.exchange_order_id})")
+                        continue
+                    await self._update_order_status(order, status_response)
+
+    async def _poll_statuses_concurrently(self, orders: List[Order]) -> None:
+        """Query get_order_status() for each order, status_concurrency at a time."""
+        semaphore = asyncio.Semaphore(self.status_concurrency)
+        breaker_open = False
+
+        async def poll(order: Order) -> None:
+            nonlocal breaker_open
+            async with semaphore:
+                if breaker_open:
+                    return  # Skip remaining orders
+                try:
+                    await self._acquire_status_request()
+                    # Get order status from MEXC (circuit breaker integrated in adapter)
+                    status_response = await self.mexc_adapter.get_order_status(
+                        order.symbol,
+                        order.exchange_order_id
+                    )
+                except CircuitBreakerOpenException:
+                    if not breaker_open:
+                        breaker_open = True
+                        logger.warning("Skipping order status poll: circuit breaker open")
+                    return
+                except Exception as e:
+                    logger.error(f"Failed to poll order {order.order_id}: {e}")
+                    return
+
+            # Skip if status_response is None (order not found on exchange)
+            # Use debug level to avoid log spam - this can happen frequently during normal operation
+            if status_response is None:
+                logger.debug(f"Order status not found on exchange: {order.order_id} (exchange_id: {order.exchange_order_id})")
+                return
+
+            # Applied as each response arrives, not after the whole cycle
+            await self._update_order_status(order, status_response)
+
+        await asyncio.gather(*(poll(order) for order in orders))
+
+    async def _consume_fill_channel(self):
+        """Background task: Apply status updates pushed through fill_channel."""
+        self._fill_channel_connected = True
+        try:
+            async for exchange_order_id, status_response in self.fill_channel:
+                try:
+                    await self.apply_status_update(exchange_order_id, status_response)
+                except Exception as e:
+                    logger.error(f"Failed to apply pushed status for {exchange_order_id}: {e}")
+        except asyncio.CancelledError:
+            logger.info("Fill channel consumer stopped")
+            raise
+        except Exception as e:
+            logger.error(f"Fill channel failed, falling back to polling: {e}")
+        finally:
+            self._fill_channel_connected = False
+            self._reset_poll_interval()
+
+    async def apply_status_update(self, exchange_order_id: str, status_response) -> bool:
+        """
+        Apply an exchange status update (push channel or external listener).
+
+        Returns:
+            False if no tracked open order has this exchange order id
+        """
+        async with self._order_lock:
+            order = next(
+                (o for o in self.orders.values()
+                 if o.exchange_order_id == exchange_order_id
+                 and o.status in [OrderStatus.SUBMITTED, OrderStatus.PARTIALLY_FILLED]),
+                None
+            )
+        if order is None:
+            return False
+        await self._update_order_status(order, status_response)
+        return True
+
     async def _update_order_status(self, order: Order, status_response):
         """
         Update order from MEXC status response.
@@ -529,6 +713,7 @@ class LiveOrderManager:
             status_response: OrderStatusResponse from MEXC adapter
         """
         old_status = order.status
+        old_filled_quantity = order.filled_quantity
 
         # Update order fields from response
         order.filled_quantity = status_response.filled_quantity
@@ -543,6 +728,9 @@ class LiveOrderManager:
         elif status_response.status.value == "CANCELED":
             order.status = OrderStatus.CANCELLED
 
+        if order.filled_quantity and order.filled_quantity != old_filled_quantity:
+            self._last_fill_at = time.monotonic()  # Poll faster while fills are arriving
+
         # Emit event if status changed
         if order.status != old_status:
             logger.info(
@@ -14,6 +14,8 @@ Connection Management:
 - Uses asyncpg connection pool (configured for 2-10 connections)
 - Automatically releases connections after operations
 - Thread-safe for concurrent access
+- Orders, position snapshots and performance rows are written behind
+  (WriteBehindQueue); reads of those tables flush first
 """
 
 from __future__ import annotations
@@ -23,6 +25,7 @@ import asyncpg
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from ...core.logger import StructuredLogger
+from .write_behind_queue import WriteBehindQueue
 
 
 class PaperTradingPersistenceService:
@@ -46,7 +49,9 @@ class PaperTradingPersistenceService:
                  logger: Optional[StructuredLogger] = None,
                  event_bus: Optional[Any] = None,
                  min_pool_size: int = 2,
-                 max_pool_size: int = 10):
+                 max_pool_size: int = 10,
+                 flush_batch_size: int = 500,
+                 flush_interval: float = 0.5):
         """
         Initialize persistence service.
 
@@ -60,6 +65,8 @@ class PaperTradingPersistenceService:
             event_bus: Event bus for publishing real-time updates (TIER 1.3)
             min_pool_size: Minimum connection pool size
             max_pool_size: Maximum connection pool size
+            flush_batch_size: Queued writes that trigger an immediate flush
+            flush_interval: Maximum seconds a queued write waits before being flushed
         """
         self.host = host
         self.port = port
@@ -72,6 +79,13 @@ class PaperTradingPersistenceService:
         self.max_pool_size = max_pool_size
 
         self._pool: Optional[asyncpg.Pool] = None
+        self._writes = WriteBehindQueue(
+            lambda: self._pool,
+            logger=logger,
+            name="paper_trading_persistence",
+            max_batch=flush_batch_size,
+            flush_interval=flush_interval
+        )
 
         if self.logger:
             self.logger.info("paper_trading_persistence.initialized", {
@@ -107,9 +121,11 @@ class PaperTradingPersistenceService:
                     "min_size": self.min_pool_size,
                     "max_size": self.max_pool_size
                 })
+        await self._writes.start()
 
     async def close(self) -> None:
-        """Close connection pool."""
+        """Flush queued writes and close connection pool."""
+        await self._writes.stop()
         if self._pool:
             await self._pool.close()
             self._pool = None
@@ -127,6 +143,16 @@ class PaperTradingPersistenceService:
         if self._pool:
             await self._pool.release(conn)
 
+    async def flush(self) -> None:
+        """Write all queued orders, snapshots and performance rows now."""
+        if not self._pool:
+            await self.initialize()
+        await self._writes.flush()
+
+    def get_write_stats(self) -> Dict[str, int]:
+        """Get write-behind queue statistics."""
+        return self._writes.get_stats()
+
     # ========================================
     # Session Management
     # ========================================
@@ -239,6 +265,9 @@ class PaperTradingPersistenceService:
             session_id: Session ID
             final_metrics: Final performance metrics
         """
+        # Orders and snapshots recorded so far land before the final results
+        await self.flush()
+
         conn = None
         try:
             conn = await self._get_connection()
@@ -307,77 +336,71 @@ class PaperTradingPersistenceService:
 
     async def record_order(self, session_id: str, order_data: Dict[str, Any]) -> None:
         """
-        Record paper trading order.
+        Record paper trading order (queued; written by the next flush).
 
         Args:
             session_id: Session ID
             order_data: Order details
         """
-        conn = None
-        try:
-            conn = await self._get_connection()
-
-            query = """
-                INSERT INTO paper_trading_orders (
-                    session_id, order_id, symbol, side, position_side, order_type,
-                    quantity, requested_price, execution_price, slippage_pct, leverage,
-                    liquidation_price, status, commission, realized_pnl, strategy_signal,
-                    timestamp
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6,
-                    $7, $8, $9, $10, $11,
-                    $12, $13, $14, $15, $16,
-                    $17
-                )
-            """
+        if not self._pool:
+            await self.initialize()
 
-            await conn.execute(
-                query,
-                session_id,
-                order_data.get("order_id"),
-                order_data.get("symbol"),
-                order_data.get("side"),
-                order_data.get("position_side"),
-                order_data.get("type", "MARKET"),
-                order_data.get("quantity", 0.0),
-                order_data.get("requested_price", order_data.get("price", 0.0)),
-                order_data.get("price", 0.0),
-                order_data.get("slippage_pct", 0.0),
-                order_data.get("leverage", 1.0),
-                order_data.get("liquidation_price", 0.0),
-                order_data.get("status", "FILLED"),
-                order_data.get("commission", 0.0),
-                order_data.get("realized_pnl", 0.0),
-                order_data.get("strategy_signal", ""),
-                datetime.utcnow()
+        query = """
+            INSERT INTO paper_trading_orders (
+                session_id, order_id, symbol, side, position_side, order_type,
+                quantity, requested_price, execution_price, slippage_pct, leverage,
+                liquidation_price, status, commission, realized_pnl, strategy_signal,
+                timestamp
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6,
+                $7, $8, $9, $10, $11,
+                $12, $13, $14, $15, $16,
+                $17
             )
+        """
 
-            if self.logger:
-                self.logger.debug("paper_trading_persistence.order_recorded", {
-                    "session_id": session_id,
-                    "order_id": order_data.get("order_id"),
-                    "symbol": order_data.get("symbol"),
-                    "side": order_data.get("side")
-                })
+        self._writes.enqueue(query, (
+            session_id,
+            order_data.get("order_id"),
+            order_data.get("symbol"),
+            order_data.get("side"),
+            order_data.get("position_side"),
+            order_data.get("type", "MARKET"),
+            order_data.get("quantity", 0.0),
+            order_data.get("requested_price", order_data.get("price", 0.0)),
+            order_data.get("price", 0.0),
+            order_data.get("slippage_pct", 0.0),
+            order_data.get("leverage", 1.0),
+            order_data.get("liquidation_price", 0.0),
+            order_data.get("status", "FILLED"),
+            order_data.get("commission", 0.0),
+            order_data.get("realized_pnl", 0.0),
+            order_data.get("strategy_signal", ""),
+            datetime.utcnow()
+        ), entity=("order", session_id, order_data.get("order_id")))
 
-            # TIER 1.3: Publish real-time event to WebSocket clients
-            if self.event_bus:
-                await self.event_bus.publish("paper_trading.order_filled", {
-                    "session_id": session_id,
-                    "order_id": order_data.get("order_id"),
-                    "symbol": order_data.get("symbol"),
-                    "side": order_data.get("side"),
-                    "position_side": order_data.get("position_side"),
-                    "quantity": order_data.get("quantity", 0.0),
-                    "price": order_data.get("price", 0.0),
-                    "slippage_pct": order_data.get("slippage_pct", 0.0),
-                    "status": order_data.get("status", "FILLED"),
-                    "timestamp": datetime.utcnow().isoformat()
-                })
+        if self.logger:
+            self.logger.debug("paper_trading_persistence.order_recorded", {
+                "session_id": session_id,
+                "order_id": order_data.get("order_id"),
+                "symbol": order_data.get("symbol"),
+                "side": order_data.get("side")
+            })
 
-        finally:
-            if conn:
-                await self._release_connection(conn)
+        # TIER 1.3: Publish real-time event to WebSocket clients
+        if self.event_bus:
+            await self.event_bus.publish("paper_trading.order_filled", {
+                "session_id": session_id,
+                "order_id": order_data.get("order_id"),
+                "symbol": order_data.get("symbol"),
+                "side": order_data.get("side"),
+                "position_side": order_data.get("position_side"),
+                "quantity": order_data.get("quantity", 0.0),
+                "price": order_data.get("price", 0.0),
+                "slippage_pct": order_data.get("slippage_pct", 0.0),
+                "status": order_data.get("status", "FILLED"),
+                "timestamp": datetime.utcnow().isoformat()
+            })
 
     # ========================================
     # Position Snapshots
@@ -385,48 +408,44 @@ class PaperTradingPersistenceService:
 
     async def snapshot_position(self, session_id: str, position_data: Dict[str, Any]) -> None:
         """
-        Record position snapshot.
+        Record position snapshot (queued; written by the next flush).
+
+        Snapshots of the same symbol queued back-to-back collapse into the latest.
 
         Args:
             session_id: Session ID
             position_data: Position details
         """
-        conn = None
-        try:
-            conn = await self._get_connection()
-
-            query = """
-                INSERT INTO paper_trading_positions (
-                    session_id, symbol, position_side, position_amount, entry_price,
-                    current_price, leverage, liquidation_price, unrealized_pnl,
-                    unrealized_pnl_pct, margin_used, funding_cost_accrued, timestamp
-                ) VALUES (
-                    $1, $2, $3, $4, $5,
-                    $6, $7, $8, $9,
-                    $10, $11, $12, $13
-                )
-            """
+        if not self._pool:
+            await self.initialize()
 
-            await conn.execute(
-                query,
-                session_id,
-                position_data.get("symbol"),
-                position_data.get("position_side"),
-                position_data.get("position_amount", 0.0),
-                position_data.get("entry_price", 0.0),
-                position_data.get("current_price", 0.0),
-                position_data.get("leverage", 1.0),
-                position_data.get("liquidation_price", 0.0),
-                position_data.get("unrealized_pnl", 0.0),
-                position_data.get("unrealized_pnl_pct", 0.0),
-                position_data.get("margin_used", 0.0),
-                position_data.get("funding_cost_accrued", 0.0),
-                datetime.utcnow()
+        query = """
+            INSERT INTO paper_trading_positions (
+                session_id, symbol, position_side, position_amount, entry_price,
+                current_price, leverage, liquidation_price, unrealized_pnl,
+                unrealized_pnl_pct, margin_used, funding_cost_accrued, timestamp
+            ) VALUES (
+                $1, $2, $3, $4, $5,
+                $6, $7, $8, $9,
+                $10, $11, $12, $13
             )
+        """
 
-        finally:
-            if conn:
-                await self._release_connection(conn)
+        self._writes.enqueue(query, (
+            session_id,
+            position_data.get("symbol"),
+            position_data.get("position_side"),
+            position_data.get("position_amount", 0.0),
+            position_data.get("entry_price", 0.0),
+            position_data.get("current_price", 0.0),
+            position_data.get("leverage", 1.0),
+            position_data.get("liquidation_price", 0.0),
+            position_data.get("unrealized_pnl", 0.0),
+            position_data.get("unrealized_pnl_pct", 0.0),
+            position_data.get("margin_used", 0.0),
+            position_data.get("funding_cost_accrued", 0.0),
+            datetime.utcnow()
+        ), entity=("paper_position", session_id, position_data.get("symbol")), coalesce=True)
 
     # ========================================
     # Performance Metrics
@@ -434,80 +453,74 @@ class PaperTradingPersistenceService:
 
     async def record_performance(self, session_id: str, metrics: Dict[str, Any]) -> None:
         """
-        Record performance metrics snapshot.
+        Record performance metrics snapshot (queued; written by the next flush).
 
         Args:
             session_id: Session ID
             metrics: Performance metrics
         """
-        conn = None
-        try:
-            conn = await self._get_connection()
-
-            query = """
-                INSERT INTO paper_trading_performance (
-                    session_id, current_balance, total_pnl, total_return_pct, unrealized_pnl,
-                    realized_pnl, total_trades, winning_trades, losing_trades, win_rate,
-                    profit_factor, average_win, average_loss, largest_win, largest_loss,
-                    max_drawdown, current_drawdown, sharpe_ratio, sortino_ratio, calmar_ratio,
-                    open_positions, total_commission, total_funding_cost, timestamp
-                ) VALUES (
-                    $1, $2, $3, $4, $5,
-                    $6, $7, $8, $9, $10,
-                    $11, $12, $13, $14, $15,
-                    $16, $17, $18, $19, $20,
-                    $21, $22, $23, $24
-                )
-            """
+        if not self._pool:
+            await self.initialize()
 
-            await conn.execute(
-                query,
-                session_id,
-                metrics.get("current_balance", 0.0),
-                metrics.get("total_pnl", 0.0),
-                metrics.get("total_return_pct", 0.0),
-                metrics.get("unrealized_pnl", 0.0),
-                metrics.get("realized_pnl", 0.0),
-                metrics.get("total_trades", 0),
-                metrics.get("winning_trades", 0),
-                metrics.get("losing_trades", 0),
-                metrics.get("win_rate", 0.0),
-                metrics.get("profit_factor", 0.0),
-                metrics.get("average_win", 0.0),
-                metrics.get("average_loss", 0.0),
-                metrics.get("largest_win", 0.0),
-                metrics.get("largest_loss", 0.0),
-                metrics.get("max_drawdown", 0.0),
-                metrics.get("current_drawdown", 0.0),
-                metrics.get("sharpe_ratio", 0.0),
-                metrics.get("sortino_ratio", 0.0),
-                metrics.get("calmar_ratio", 0.0),
-                metrics.get("open_positions", 0),
-                metrics.get("total_commission", 0.0),
-                metrics.get("total_funding_cost", 0.0),
-                datetime.utcnow()
+        query = """
+            INSERT INTO paper_trading_performance (
+                session_id, current_balance, total_pnl, total_return_pct, unrealized_pnl,
+                realized_pnl, total_trades, winning_trades, losing_trades, win_rate,
+                profit_factor, average_win, average_loss, largest_win, largest_loss,
+                max_drawdown, current_drawdown, sharpe_ratio, sortino_ratio, calmar_ratio,
+                open_positions, total_commission, total_funding_cost, timestamp
+            ) VALUES (
+                $1, $2, $3, $4, $5,
+                $6, $7, $8, $9, $10,
+                $11, $12, $13, $14, $15,
+                $16, $17, $18, $19, $20,
+                $21, $22, $23, $24
             )
+        """
 
-            # TIER 1.3: Publish real-time performance update to WebSocket clients
-            if self.event_bus:
-                await self.event_bus.publish("paper_trading.performance_updated", {
-                    "session_id": session_id,
-                    "current_balance": metrics.get("current_balance", 0.0),
-                    "total_pnl": metrics.get("total_pnl", 0.0),
-                    "total_return_pct": metrics.get("total_return_pct", 0.0),
-                    "win_rate": metrics.get("win_rate", 0.0),
-                    "total_trades": metrics.get("total_trades", 0),
-                    "winning_trades": metrics.get("winning_trades", 0),
-                    "losing_trades": metrics.get("losing_trades", 0),
-                    "max_drawdown": metrics.get("max_drawdown", 0.0),
-                    "current_drawdown": metrics.get("current_drawdown", 0.0),
-                    "sharpe_ratio": metrics.get("sharpe_ratio", 0.0),
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-
-        finally:
-            if conn:
-                await self._release_connection(conn)
+        self._writes.enqueue(query, (
+            session_id,
+            metrics.get("current_balance", 0.0),
+            metrics.get("total_pnl", 0.0),
+            metrics.get("total_return_pct", 0.0),
+            metrics.get("unrealized_pnl", 0.0),
+            metrics.get("realized_pnl", 0.0),
+            metrics.get("total_trades", 0),
+            metrics.get("winning_trades", 0),
+            metrics.get("losing_trades", 0),
+            metrics.get("win_rate", 0.0),
+            metrics.get("profit_factor", 0.0),
+            metrics.get("average_win", 0.0),
+            metrics.get("average_loss", 0.0),
+            metrics.get("largest_win", 0.0),
+            metrics.get("largest_loss", 0.0),
+            metrics.get("max_drawdown", 0.0),
+            metrics.get("current_drawdown", 0.0),
+            metrics.get("sharpe_ratio", 0.0),
+            metrics.get("sortino_ratio", 0.0),
+            metrics.get("calmar_ratio", 0.0),
+            metrics.get("open_positions", 0),
+            metrics.get("total_commission", 0.0),
+            metrics.get("total_funding_cost", 0.0),
+            datetime.utcnow()
+        ))
+
+        # TIER 1.3: Publish real-time performance update to WebSocket clients
+        if self.event_bus:
+            await self.event_bus.publish("paper_trading.performance_updated", {
+                "session_id": session_id,
+                "current_balance": metrics.get("current_balance", 0.0),
+                "total_pnl": metrics.get("total_pnl", 0.0),
+                "total_return_pct": metrics.get("total_return_pct", 0.0),
+                "win_rate": metrics.get("win_rate", 0.0),
+                "total_trades": metrics.get("total_trades", 0),
+                "winning_trades": metrics.get("winning_trades", 0),
+                "losing_trades": metrics.get("losing_trades", 0),
+                "max_drawdown": metrics.get("max_drawdown", 0.0),
+                "current_drawdown": metrics.get("current_drawdown", 0.0),
+                "sharpe_ratio": metrics.get("sharpe_ratio", 0.0),
+                "timestamp": datetime.utcnow().isoformat()
+            })
 
     # ========================================
     # Query Methods
@@ -549,6 +562,8 @@ class PaperTradingPersistenceService:
         Returns:
             List of orders
         """
+        await self.flush()
+
         conn = None
         try:
             conn = await self._get_connection()
@@ -577,6 +592,8 @@ class PaperTradingPersistenceService:
         Returns:
             List of performance snapshots
         """
+        await self.flush()
+
         conn = None
         try:
             conn = await self._get_connection()
@@ -11,14 +11,14 @@ Implements the complete strategy system with 5 groups of conditions:
 
 import asyncio
 import json
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Iterable, List, Optional, Callable, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 from ...core.event_bus import EventBus
-from ...core.logger import StructuredLogger
+from ...core.logger import StructuredLogger, configure_event_throttle
 from .order_manager import OrderManager, OrderType
 from .risk_manager import RiskManager
 
@@ -27,6 +27,10 @@ try:
 except ImportError:
     asyncpg = None  # QuestDB persistence optional
 
+# Per-update diagnostics stay at INFO but are rate-limited (see StructuredLogger)
+configure_event_throttle("strategy_manager.indicator_update_received", per_second=5)
+configure_event_throttle("strategy_manager.signal_detection_result", per_second=10)
+
 
 class StrategyState(Enum):
     """Strategy execution states - 5-section workflow per user_feedback.md"""
@@ -147,6 +151,279 @@ class ConditionGroup:
             return ConditionResult.TRUE if any(r == ConditionResult.TRUE for r in results) else ConditionResult.FALSE
 
 
+# ============================================================================
+# COMPILED CONDITION EVALUATION
+# ============================================================================
+# ✅ PERFORMANCE: Strategies are compiled once into per-section plans that hold
+# pre-resolved indicator slot indices and comparison functions. Indicator values
+# for a symbol are mirrored into a slot-indexed list (IndicatorValues), so an
+# evaluation is list indexing + one comparison per condition - no key
+# lowercasing, dict scans, operator parsing or per-call allocations.
+# Plain dicts still go through the interpreted Condition.evaluate() path.
+
+_MISSING = object()  # Slot value of an indicator the symbol has not received yet
+
+
+class IndicatorSlotTable:
+    """Assigns slot indices to indicator keys (case-insensitive), shared by all symbols."""
+
+    __slots__ = ("_by_name", "_by_key")
+
+    def __init__(self):
+        self._by_name: Dict[str, int] = {}  # lowercased key -> slot
+        self._by_key: Dict[str, int] = {}   # key as written -> slot (skips lower() on repeat writes)
+
+    def slot(self, key: str) -> int:
+        """Slot index for a key, assigning the next free slot to new keys."""
+        index = self._by_key.get(key)
+        if index is None:
+            name = key.lower()
+            index = self._by_name.get(name)
+            if index is None:
+                index = self._by_name[name] = len(self._by_name)
+            self._by_key[key] = index
+        return index
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+
+class IndicatorValues(dict):
+    """
+    Per-symbol indicator cache.
+
+    Behaves as the plain {key: value} dict used for event payloads and
+    lookups, and mirrors every write into `slots` (indexed through the shared
+    IndicatorSlotTable) for compiled strategy plans.
+    """
+
+    __slots__ = ("table", "slots")
+
+    def __init__(self, table: IndicatorSlotTable, values: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        self.table = table
+        self.slots: List[Any] = []
+        if values:
+            self.update(values)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        index = self.table.slot(key)
+        slots = self.slots
+        if index >= len(slots):
+            slots.extend([_MISSING] * (index + 1 - len(slots)))
+        slots[index] = value
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.slots[self.table.slot(key)] = _MISSING
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            value = super().pop(key)
+            self.slots[self.table.slot(key)] = _MISSING
+            return value
+        return super().pop(key, *default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self) -> None:
+        super().clear()
+        self.slots = []
+
+    def copy(self) -> "IndicatorValues":
+        clone = IndicatorValues(self.table)
+        dict.update(clone, self)
+        clone.slots = list(self.slots)
+        return clone
+
+    def slot_view(self) -> List[Any]:
+        """Slot list sized for every slot assigned so far (grown in place when needed)."""
+        slots = self.slots
+        width = len(self.table)
+        if len(slots) < width:
+            slots.extend([_MISSING] * (width - len(slots)))
+        return slots
+
+
+def _between(bounds: Any) -> Callable[[Any], bool]:
+    low, high = bounds
+    return lambda actual: low <= actual <= high
+
+
+# Operator spelling -> factory binding the condition value into a one-argument test
+_COMPARATOR_FACTORIES: Dict[str, Callable[[Any], Callable[[Any], bool]]] = {
+    "gte": lambda target: lambda actual: actual >= target,
+    "lte": lambda target: lambda actual: actual <= target,
+    "gt": lambda target: lambda actual: actual > target,
+    "lt": lambda target: lambda actual: actual < target,
+    "eq": lambda target: lambda actual: actual == target,
+    "between": _between,
+    "allowed": lambda allowed: lambda actual: actual in allowed,
+}
+for _alias, _canonical in ((">=", "gte"), ("<=", "lte"), (">", "gt"), ("<", "lt"), ("==", "eq"), ("=", "eq")):
+    _COMPARATOR_FACTORIES[_alias] = _COMPARATOR_FACTORIES[_canonical]
+
+
+def compile_condition(condition: Condition, table: IndicatorSlotTable) -> Callable[[List[Any]], ConditionResult]:
+    """
+    Compile a condition into a closure over a symbol's slot list.
+
+    Matches Condition.evaluate(): PENDING when disabled or the indicator is
+    missing, ERROR for unknown operators, malformed values or failed comparisons.
+    """
+    if not condition.enabled:
+        return lambda slots: ConditionResult.PENDING
+
+    slot = table.slot(condition.condition_type)
+    op = condition.operator.lower().strip() if isinstance(condition.operator, str) else condition.operator
+    try:
+        compare = _COMPARATOR_FACTORIES[op](condition.value)
+    except Exception:
+        compare = None  # Unknown operator or malformed value (e.g. "between" without two bounds)
+
+    if compare is None:
+        def evaluate(slots: List[Any]) -> ConditionResult:
+            return ConditionResult.PENDING if slots[slot] is _MISSING else ConditionResult.ERROR
+        return evaluate
+
+    def evaluate(slots: List[Any]) -> ConditionResult:
+        actual = slots[slot]
+        if actual is _MISSING:
+            return ConditionResult.PENDING
+        try:
+            return ConditionResult.TRUE if compare(actual) else ConditionResult.FALSE
+        except Exception:
+            return ConditionResult.ERROR
+    return evaluate
+
+
+class CompiledConditionGroup:
+    """A ConditionGroup compiled against an IndicatorSlotTable."""
+
+    __slots__ = ("source", "count", "require_all", "evaluators")
+
+    def __init__(self, group: ConditionGroup, table: IndicatorSlotTable):
+        self.source = group.conditions
+        self.count = len(group.conditions)
+        self.require_all = group.require_all
+        self.evaluators = tuple(compile_condition(condition, table) for condition in group.conditions)
+
+    def is_current(self, group: ConditionGroup) -> bool:
+        """False once the group's condition list was replaced or resized since compiling."""
+        return (group.conditions is self.source and len(group.conditions) == self.count
+                and group.require_all == self.require_all)
+
+    def evaluate(self, slots: List[Any]) -> ConditionResult:
+        """Same semantics as ConditionGroup.evaluate() (empty group = FALSE, any ERROR = ERROR)."""
+        if not self.evaluators:
+            return ConditionResult.FALSE
+
+        all_true = True
+        any_true = False
+        for evaluate in self.evaluators:
+            result = evaluate(slots)
+            if result is ConditionResult.TRUE:
+                any_true = True
+            elif result is ConditionResult.ERROR:
+                return ConditionResult.ERROR
+            else:
+                all_true = False
+
+        if self.require_all:
+            return ConditionResult.TRUE if all_true else ConditionResult.FALSE
+        return ConditionResult.TRUE if any_true else ConditionResult.FALSE
+
+
+class CompiledStrategy:
+    """Compiled S1/O1/Z1/ZE1/E1 plans of one strategy."""
+
+    SECTIONS = ("signal_detection", "signal_cancellation", "entry_conditions",
+                "close_order_detection", "emergency_exit")
+
+    __slots__ = ("table", "sections")
+
+    def __init__(self, strategy: "Strategy", table: IndicatorSlotTable):
+        self.table = table
+        self.sections: Dict[str, CompiledConditionGroup] = {
+            name: CompiledConditionGroup(getattr(strategy, name), table) for name in self.SECTIONS
+        }
+
+    def section(self, name: str, group: ConditionGroup) -> CompiledConditionGroup:
+        """Compiled plan for a section, recompiled if its conditions were replaced."""
+        compiled = self.sections[name]
+        if not compiled.is_current(group):
+            compiled = self.sections[name] = CompiledConditionGroup(group, self.table)
+        return compiled
+
+
+# Condition sections _evaluate_strategy_locked() checks in each state. Other
+# states run order handling and cooldown transitions on every update.
+_STATE_SECTIONS: Dict[StrategyState, frozenset] = {
+    StrategyState.MONITORING: frozenset({"signal_detection"}),
+    StrategyState.SIGNAL_DETECTED: frozenset({"signal_cancellation", "entry_conditions"}),
+    StrategyState.POSITION_ACTIVE: frozenset({"emergency_exit", "close_order_detection"}),
+}
+
+# Condition keys not carried by indicator.updated (price events, values derived
+# at evaluation time); sections using them are re-checked on every update.
+_AMBIENT_CONDITION_KEYS = frozenset({"price", "last_price", "signal_age_seconds"})
+
+
+class StrategyDependencyIndex:
+    """
+    Indicator key -> strategies and condition sections of one symbol that reference it.
+
+    Built from the symbol's active strategy list; is_current() turns False when
+    that list, its members or any section's condition list is replaced.
+    """
+
+    __slots__ = ("source", "members", "by_key", "ambient")
+
+    def __init__(self, strategies: List["Strategy"]):
+        self.source = strategies
+        self.members = tuple(
+            (strategy, tuple(getattr(strategy, name).conditions for name in CompiledStrategy.SECTIONS),
+             tuple(len(getattr(strategy, name).conditions) for name in CompiledStrategy.SECTIONS))
+            for strategy in strategies
+        )
+        self.by_key: Dict[str, Dict[str, Set[str]]] = {}  # lowercased key -> {strategy_name: sections}
+        self.ambient: Dict[str, Set[str]] = {}            # strategy_name -> sections using ambient keys
+        for strategy in strategies:
+            for name in CompiledStrategy.SECTIONS:
+                for condition in getattr(strategy, name).conditions:
+                    key = str(condition.condition_type).lower()
+                    target = self.ambient if key in _AMBIENT_CONDITION_KEYS else self.by_key.setdefault(key, {})
+                    target.setdefault(strategy.strategy_name, set()).add(name)
+
+    def is_current(self, strategies: List["Strategy"]) -> bool:
+        if strategies is not self.source or len(strategies) != len(self.members):
+            return False
+        for strategy, (indexed, conditions, counts) in zip(strategies, self.members):
+            if strategy is not indexed:
+                return False
+            for name, source, count in zip(CompiledStrategy.SECTIONS, conditions, counts):
+                current = getattr(strategy, name).conditions
+                if current is not source or len(current) != count:
+                    return False
+        return True
+
+    def affected_sections(self, keys: Iterable[str]) -> Dict[str, Set[str]]:
+        """strategy_name -> sections whose conditions depend on any of the updated keys."""
+        affected = {name: set(sections) for name, sections in self.ambient.items()}
+        for key in keys:
+            for name, sections in self.by_key.get(key.lower(), {}).items():
+                affected.setdefault(name, set()).update(sections)
+        return affected
+
+
 @dataclass
 class Strategy:
     """Complete strategy with 5 condition groups + SHORT support"""
@@ -177,6 +454,9 @@ class Strategy:
     last_signal_cancelled: Optional[datetime] = None  # O1 cooldown
     last_emergency_exit: Optional[datetime] = None  # E1 cooldown
 
+    # Compiled condition plans (see compile()); not part of strategy identity
+    compiled_plan: Optional[CompiledStrategy] = field(default=None, repr=False, compare=False)
+
     def get_entry_order_type(self) -> OrderType:
         """Get entry order type based on strategy direction
 
@@ -201,25 +481,36 @@ class Strategy:
         else:
             raise ValueError(f"Invalid direction: {self.direction}. Must be 'LONG', 'SHORT', or 'BOTH'.")
 
+    def compile(self, table: IndicatorSlotTable) -> CompiledStrategy:
+        """Compile all condition sections against a slot table (re-run after editing conditions in place)."""
+        self.compiled_plan = CompiledStrategy(self, table)
+        return self.compiled_plan
+
+    def _evaluate_section(self, name: str, group: ConditionGroup, indicator_values: Dict[str, Any]) -> ConditionResult:
+        plan = self.compiled_plan
+        if plan is not None and isinstance(indicator_values, IndicatorValues) and indicator_values.table is plan.table:
+            return plan.section(name, group).evaluate(indicator_values.slot_view())
+        return group.evaluate(indicator_values)
+
     def evaluate_signal_detection(self, indicator_values: Dict[str, Any]) -> ConditionResult:
         """Evaluate signal detection conditions"""
-        return self.signal_detection.evaluate(indicator_values)
+        return self._evaluate_section("signal_detection", self.signal_detection, indicator_values)
 
     def evaluate_entry_conditions(self, indicator_values: Dict[str, Any]) -> ConditionResult:
         """Evaluate entry conditions"""
-        return self.entry_conditions.evaluate(indicator_values)
+        return self._evaluate_section("entry_conditions", self.entry_conditions, indicator_values)
 
     def evaluate_signal_cancellation(self, indicator_values: Dict[str, Any]) -> ConditionResult:
         """Evaluate signal cancellation conditions (O1)"""
-        return self.signal_cancellation.evaluate(indicator_values)
+        return self._evaluate_section("signal_cancellation", self.signal_cancellation, indicator_values)
 
     def evaluate_close_order_detection(self, indicator_values: Dict[str, Any]) -> ConditionResult:
         """Evaluate close order detection conditions (ZE1)"""
-        return self.close_order_detection.evaluate(indicator_values)
+        return self._evaluate_section("close_order_detection", self.close_order_detection, indicator_values)
 
     def evaluate_emergency_exit(self, indicator_values: Dict[str, Any]) -> ConditionResult:
         """Evaluate emergency exit conditions"""
-        return self.emergency_exit.evaluate(indicator_values)
+        return self._evaluate_section("emergency_exit", self.emergency_exit, indicator_values)
 
     def is_in_cooldown(self) -> bool:
         """Check if strategy is currently in cooldown period"""
@@ -417,18 +708,22 @@ class StrategyManager:
         self.active_strategies: Dict[str, List[Strategy]] = {}  # symbol -> strategies
 
         # Indicator values cache
-        self.indicator_values: Dict[str, Dict[str, Any]] = {}  # symbol -> indicators
+        # ✅ PERFORMANCE: Slot-indexed per symbol for compiled strategy plans (see IndicatorValues)
+        self._indicator_slots = IndicatorSlotTable()
+        self.indicator_values: Dict[str, IndicatorValues] = {}  # symbol -> indicators
 
         # Telemetry: last events and active symbols per strategy
         self._strategy_telemetry: Dict[str, Dict[str, Any]] = {}
 
         # Enhanced circuit breaker for event loops
         self._evaluation_in_progress = set()  # Track symbols being evaluated
-        self._max_evaluations_per_second = 50  # Reduced rate limit
-        self._last_evaluation_reset = datetime.now()
-        self._evaluation_count = 0
         self._event_loop_detector = {}  # Track event patterns
 
+        # ✅ PERFORMANCE: Indicator updates are coalesced per symbol and only re-evaluate
+        # strategies whose current-state sections reference an updated key
+        self._pending_indicator_keys: Dict[str, Set[str]] = {}  # symbol -> keys updated since last pass
+        self._dependency_index: Dict[str, StrategyDependencyIndex] = {}  # symbol -> index
+
         # Slot management for concurrent signals (Phase 3 requirement)
         self._global_signal_slots = {}  # strategy_name -> active_signals_count
         self._max_concurrent_signals = 3  # Configurable global limit
@@ -514,6 +809,7 @@ class StrategyManager:
         # Clear cached indicator values
         async with self._indicator_values_lock:
             self.indicator_values.clear()
+            self._pending_indicator_keys.clear()
 
         self.logger.info("strategy_manager.reset_session_state_completed", {
             "slots_after": dict(self._global_signal_slots),
@@ -1099,6 +1395,8 @@ class StrategyManager:
                 )
                 strategy.emergency_exit.conditions.append(condition)
 
+        # ✅ PERFORMANCE: Compile condition plans once, not on every evaluation
+        strategy.compile(self._indicator_slots)
         return strategy
 
     # ============================================================================
@@ -1443,6 +1741,8 @@ class StrategyManager:
 
     def add_strategy(self, strategy: Strategy) -> None:
         """Add a strategy to the manager"""
+        if strategy.compiled_plan is None or strategy.compiled_plan.table is not self._indicator_slots:
+            strategy.compile(self._indicator_slots)
         self.strategies[strategy.strategy_name] = strategy
         if strategy.strategy_name not in self._strategy_telemetry:
             self._strategy_telemetry[strategy.strategy_name] = {
@@ -1573,7 +1873,7 @@ class StrategyManager:
         # Store price in indicator_values cache for strategy evaluation
         async with self._indicator_values_lock:
             if symbol not in self.indicator_values:
-                self.indicator_values[symbol] = {}
+                self.indicator_values[symbol] = IndicatorValues(self._indicator_slots)
             self.indicator_values[symbol]["price"] = float(price)
             self.indicator_values[symbol]["last_price"] = float(price)
 
@@ -1583,7 +1883,7 @@ class StrategyManager:
         })
 
     async def _on_indicator_update(self, data: Dict[str, Any]) -> None:
-        """Handle indicator update events with enhanced circuit breaker"""
+        """Handle indicator update events, coalescing them per symbol into evaluation passes"""
         symbol = data.get("symbol")
         indicator_name = data.get("indicator")
         # ✅ FIX (2025-12-01): Use indicator_type for condition matching
@@ -1597,7 +1897,7 @@ class StrategyManager:
             return
 
         # 🔍 DEBUG: Log indicator update receipt (using INFO for visibility)
-        self.logger.info("strategy_manager.indicator_update_received", {
+        self.logger.info("strategy_manager.indicator_update_received", lambda: {
             "symbol": symbol,
             "indicator_name": indicator_name,
             "indicator_type": indicator_type,
@@ -1606,25 +1906,6 @@ class StrategyManager:
             "active_count": len(self.active_strategies.get(symbol, []))
         })
 
-        # Enhanced rate limiting with exponential backoff
-        now = datetime.now()
-        if (now - self._last_evaluation_reset).total_seconds() > 1.0:
-            self._evaluation_count = 0
-            self._last_evaluation_reset = now
-        
-        if self._evaluation_count >= self._max_evaluations_per_second:
-            self.logger.debug("strategy_manager.rate_limit_exceeded", {
-                "symbol": symbol,
-                "count": self._evaluation_count
-            })
-            return
-        
-        self._evaluation_count += 1
-
-        # Enhanced circuit breaker - prevent cascading evaluations
-        if symbol in self._evaluation_in_progress:
-            return
-
         # Prevent event loops by checking if this is a strategy-generated event
         event_source = data.get("source", "external")
         if event_source == "strategy_manager":
@@ -1636,8 +1917,14 @@ class StrategyManager:
         storage_key = indicator_type if indicator_type else indicator_name.lower()
         async with self._indicator_values_lock:
             if symbol not in self.indicator_values:
-                self.indicator_values[symbol] = {}
+                self.indicator_values[symbol] = IndicatorValues(self._indicator_slots)
             self.indicator_values[symbol][storage_key] = value
+            self._pending_indicator_keys.setdefault(symbol, set()).add(storage_key)
+
+        # Circuit breaker - one evaluation pass per symbol at a time. Updates arriving
+        # meanwhile are not dropped: the running pass picks up their keys before it exits.
+        if symbol in self._evaluation_in_progress:
+            return
 
         # Async evaluation - NO TIMEOUT to debug signal generation flow
         # ✅ FIX (2025-12-03): Removed timeout completely to diagnose blocking issue
@@ -1645,7 +1932,12 @@ class StrategyManager:
         # We need to understand what's blocking AFTER slot_acquire_result before re-adding timeout.
         try:
             self._evaluation_in_progress.add(symbol)
-            await self._evaluate_strategies_for_symbol(symbol)
+            await asyncio.sleep(0)  # Let updates published in the same loop turn join this pass
+            while True:
+                updated_keys = self._pending_indicator_keys.pop(symbol, None)
+                if not updated_keys:
+                    break
+                await self._evaluate_strategies_for_symbol(symbol, updated_keys)
         except Exception as e:
             self.logger.error("strategy_manager.evaluation_error", {
                 "symbol": symbol,
@@ -1655,17 +1947,41 @@ class StrategyManager:
         finally:
             self._evaluation_in_progress.discard(symbol)
 
-    async def _evaluate_strategies_for_symbol(self, symbol: str) -> None:
-        """Evaluate all active strategies for a symbol with timeout protection"""
-        if symbol not in self.active_strategies:
+    def _get_dependency_index(self, symbol: str, strategies: List[Strategy]) -> StrategyDependencyIndex:
+        """Dependency index for a symbol's active strategies, rebuilt when they change."""
+        index = self._dependency_index.get(symbol)
+        if index is None or not index.is_current(strategies):
+            index = self._dependency_index[symbol] = StrategyDependencyIndex(strategies)
+        return index
+
+    def get_indicator_dependents(self, symbol: str, indicator_type: str) -> Dict[str, List[str]]:
+        """Active strategies on a symbol whose condition sections reference an indicator type."""
+        strategies = self.active_strategies.get(symbol)
+        if not strategies:
+            return {}
+        index = self._get_dependency_index(symbol, strategies)
+        return {name: sorted(sections) for name, sections in index.by_key.get(indicator_type.lower(), {}).items()}
+
+    async def _evaluate_strategies_for_symbol(self, symbol: str, updated_keys: Optional[Iterable[str]] = None) -> None:
+        """Evaluate active strategies for a symbol.
+
+        With updated_keys, strategies whose current-state sections do not
+        reference any of those keys are skipped; without, all are evaluated.
+        """
+        strategies = self.active_strategies.get(symbol)
+        if not strategies:
             return
 
         indicator_values = self.indicator_values.get(symbol, {})
-        
-        # ✅ CRITICAL FIX: Limit number of strategies evaluated per call
-        strategies_to_evaluate = [s for s in self.active_strategies[symbol] if s.enabled][:5]  # Max 5 strategies
-
-        for strategy in strategies_to_evaluate:
+        affected = None if updated_keys is None else self._get_dependency_index(symbol, strategies).affected_sections(updated_keys)
+
+        for strategy in list(strategies):
+            if not strategy.enabled:
+                continue
+            if affected is not None:
+                sections = _STATE_SECTIONS.get(strategy.current_state)
+                if sections is not None and sections.isdisjoint(affected.get(strategy.strategy_name, ())):
+                    continue
             try:
                 # ✅ FIX (2025-12-03): REMOVED per-strategy timeout
                 # The outer timeout (2.0s) is sufficient. Inner timeout was causing
@@ -1727,7 +2043,7 @@ class StrategyManager:
 
                 # 🔍 DEBUG: Log signal detection result - temporarily INFO for debugging
                 condition_type = strategy.signal_detection.conditions[0].condition_type if strategy.signal_detection and strategy.signal_detection.conditions else ""
-                self.logger.info("strategy_manager.signal_detection_result", {
+                self.logger.info("strategy_manager.signal_detection_result", lambda: {
                     "strategy_name": strategy.strategy_name,
                     "signal_result": signal_result.value if signal_result else "None",
                     "condition_type_needed": condition_type,
@@ -1813,7 +2129,7 @@ class StrategyManager:
             elif strategy.current_state == StrategyState.SIGNAL_DETECTED:
                 # O1: Check signal cancellation (optional)
                 # Add signal_age_seconds to indicator_values for O1 evaluation
-                extended_values = dict(indicator_values)
+                extended_values = indicator_values.copy()  # Keeps the slot view for compiled plans
                 if strategy.signal_detection_time:
                     signal_age = (datetime.now() - strategy.signal_detection_time).total_seconds()
                     extended_values["signal_age_seconds"] = signal_age
@@ -0,0 +1,205 @@
+"""
+Columnar Ring Buffer - Market data storage for StreamingIndicatorEngine
+=======================================================================
+Fixed-capacity, NumPy-backed storage for one symbol stream (price, deal or
+orderbook). A single buffer is shared by every timeframe key of the symbol,
+replacing the per-timeframe deques of identical dicts.
+
+Layout:
+- One float64 row per column, 2 x capacity slots wide
+- Rows are appended at the write position; when the slots run out the newest
+  `capacity` rows are moved back to the front (amortised O(1) per append)
+- Live rows are therefore always one contiguous slice, so column reads are
+  zero-copy NumPy views
+
+The buffer also supports the subset of the deque-of-dicts interface used by
+legacy readers: len(), iteration / indexing yielding row dicts, append(dict)
+and pop().
+
+Ordering:
+- The buffer remembers the append position of the newest row whose timestamp
+  (first column) was missing or older than its predecessor
+- Once that row has been evicted the live rows are known to be sorted, so
+  window lookups can bisect the timestamp column instead of scanning it
+
+Staged writes:
+- `watermark` is the absolute append position; rollback(watermark) drops every
+  row appended after it, so a writer can undo a failed ingest with one integer
+  per buffer instead of snapshotting lengths
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterator, Mapping, Sequence
+
+import numpy as np
+
+
+def as_float(value: Any) -> float:
+    """Coerce a stored field to float (datetime -> epoch seconds, None -> NaN)."""
+    if value is None:
+        return np.nan
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class ColumnarRingBuffer:
+    """
+    Fixed-capacity ring buffer storing rows as NumPy float64 columns.
+
+    Column views returned by column() / view() are only valid until the next
+    append, which may compact the underlying array.
+    """
+
+    __slots__ = (
+        "columns", "capacity", "last_access", "_index", "_data", "_end", "_size",
+        "_appended", "_last_disorder",
+    )
+
+    def __init__(self, columns: Sequence[str], capacity: int):
+        """
+        Initialize ring buffer.
+
+        Args:
+            columns: Column names in storage order (first column is the timestamp)
+            capacity: Maximum number of rows kept (oldest rows are evicted)
+
+        Raises:
+            ValueError: If capacity is not positive or no columns are given
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if not columns:
+            raise ValueError("at least one column is required")
+
+        self.columns = tuple(columns)
+        self.capacity = int(capacity)
+        self.last_access = 0.0  # Wall-clock time of last write, maintained by the owner for TTL cleanup
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        self._data = np.zeros((len(self.columns), 2 * self.capacity), dtype=np.float64)
+        self._end = 0
+        self._size = 0
+        self._appended = 0  # Absolute position of the next row (survives compaction)
+        self._last_disorder = -1  # Absolute position of the newest out-of-order row
+
+    @property
+    def maxlen(self) -> int:
+        """deque-compatible capacity."""
+        return self.capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the backing array."""
+        return self._data.nbytes
+
+    @property
+    def is_sorted(self) -> bool:
+        """True if the live timestamps are non-decreasing and contain no NaN."""
+        return self._last_disorder < self._appended - self._size
+
+    @property
+    def watermark(self) -> int:
+        """Absolute append position; pass to rollback() to undo later appends."""
+        return self._appended
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append_row(self, *values: float) -> None:
+        """Append one row given in column order (hot path, no dict allocation)."""
+        if self._end == self._data.shape[1]:
+            self._compact()
+        ts = values[0]
+        # NaN never compares >=, so missing timestamps are flagged as disorder too
+        if ts != ts or (self._size and not ts >= self._data[0, self._end - 1]):
+            self._last_disorder = self._appended
+        self._data[:, self._end] = values
+        self._end += 1
+        self._appended += 1
+        if self._size < self.capacity:
+            self._size += 1
+
+    def append(self, row: Mapping[str, Any]) -> None:
+        """deque-compatible append of a row dict (missing columns are stored as 0.0)."""
+        self.append_row(*(as_float(row.get(name, 0.0)) for name in self.columns))
+
+    def pop(self) -> Dict[str, float]:
+        """Remove and return the newest row."""
+        if self._size == 0:
+            raise IndexError("pop from an empty ColumnarRingBuffer")
+        row = self._row_at(self._end - 1)
+        self._end -= 1
+        self._size -= 1
+        self._appended -= 1
+        self._rescan_order()
+        return row
+
+    def truncate(self, length: int) -> None:
+        """Drop the newest rows so that at most `length` rows remain."""
+        if 0 <= length < self._size:
+            dropped = self._size - length
+            self._end -= dropped
+            self._size = length
+            self._appended -= dropped
+            self._rescan_order()
+
+    def rollback(self, watermark: int) -> int:
+        """
+        Drop the rows appended after `watermark`.
+
+        Rows evicted by those appends are not restored.
+
+        Returns:
+            Number of rows removed
+        """
+        dropped = min(max(self._appended - watermark, 0), self._size)
+        self.truncate(self._size - dropped)
+        return dropped
+
+    def clear(self) -> None:
+        self._end = 0
+        self._size = 0
+        self._last_disorder = -1
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy view of one column, oldest to newest."""
+        return self._data[self._index[name], self._end - self._size:self._end]
+
+    def view(self) -> np.ndarray:
+        """Zero-copy 2D view (columns x rows), oldest to newest."""
+        return self._data[:, self._end - self._size:self._end]
+
+    def __getitem__(self, index: int) -> Dict[str, float]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ColumnarRingBuffer index out of range")
+        return self._row_at(self._end - self._size + index)
+
+    def __iter__(self) -> Iterator[Dict[str, float]]:
+        names = self.columns
+        for values in self.view().T.tolist():
+            yield dict(zip(names, values))
+
+    def _row_at(self, slot: int) -> Dict[str, float]:
+        return dict(zip(self.columns, self._data[:, slot].tolist()))
+
+    def _rescan_order(self) -> None:
+        """Recompute the disorder marker after the newest rows were removed."""
+        if self._last_disorder < self._appended:
+            return
+        ts = self._data[0, self._end - self._size:self._end]
+        bad = np.flatnonzero(np.isnan(ts[1:]) | (ts[1:] < ts[:-1])) + 1
+        if len(ts) and np.isnan(ts[0]):
+            bad = np.concatenate(([0], bad))
+        first = self._appended - self._size
+        self._last_disorder = first + int(bad[-1]) if len(bad) else -1
+
+    def _compact(self) -> None:
+        """Move the live rows to the front of the backing array."""
+        start = self._end - self._size
+        self._data[:, :self._size] = self._data[:, start:self._end]
+        self._end = self._size
+
+    def __repr__(self) -> str:
+        return f"ColumnarRingBuffer(columns={self.columns}, size={self._size}, capacity={self.capacity})"
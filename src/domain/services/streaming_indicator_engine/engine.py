@@ -15,20 +15,31 @@ from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 # Removed legacy TimeWeightedPriceAverage import - using algorithm registry only
 
 try:
-    from ...core.event_bus import EventBus
-    from ...core.logger import StructuredLogger
+    from ...core.event_bus import BatchDeliveryError, EventBus
+    from ...core.logger import StructuredLogger, configure_event_throttle
     from ..types.indicator_types import IndicatorConfig, VariantParameter
 except Exception:
-    from src.core.event_bus import EventBus
-    from src.core.logger import StructuredLogger
+    from src.core.event_bus import BatchDeliveryError, EventBus
+    from src.core.logger import StructuredLogger, configure_event_throttle
     from src.domain.types.indicator_types import IndicatorConfig, VariantParameter
 
 # Configuration constants
 INDICATORS_CONFIG_DIR = Path("config/indicators")
 
+# Per-tick diagnostics stay at INFO but are rate-limited (see StructuredLogger)
+configure_event_throttle("streaming_indicator_engine.updates_collected", per_second=5)
+configure_event_throttle("streaming_indicator_engine.symbol_skipped_no_indicators", per_second=1)
+
+# Column layouts of the per-symbol market data ring buffers
+PRICE_COLUMNS = ("timestamp", "price")
+DEAL_COLUMNS = ("timestamp", "price", "volume")
+ORDERBOOK_COLUMNS = ("timestamp", "best_bid", "best_ask", "bid_qty", "ask_qty")
+
 # ✅ DEDUPLICATION: Import types from extracted module (removed 250+ lines of duplicate code)
 from .core.types import (
     IndicatorType,
@@ -41,6 +52,7 @@ from .core.types import (
     IndicatorRegistry,
     indicator_registration
 )
+from .core.ring_buffer import ColumnarRingBuffer, as_float
 
 
 class StreamingIndicatorEngine:
@@ -120,9 +132,12 @@ class StreamingIndicatorEngine:
         # Indicator storage with symbol indexing for O(1) access
         self._indicators: Dict[str, StreamingIndicator] = {}
         self._indicators_by_symbol: Dict[str, List[str]] = {}  # O(1) symbol lookup
-        self._price_data: Dict[str, deque] = {}
-        self._orderbook_data: Dict[str, deque] = {}
-        self._deal_data: Dict[str, deque] = {}
+        # Market data: "{symbol}_{timeframe}" -> ColumnarRingBuffer
+        # ✅ PERFORMANCE: One buffer per symbol and stream, shared by every supported timeframe key
+        # (previously 4 deques of identical dicts per stream, see _get_stream_buffer)
+        self._price_data: Dict[str, ColumnarRingBuffer] = {}
+        self._orderbook_data: Dict[str, ColumnarRingBuffer] = {}
+        self._deal_data: Dict[str, ColumnarRingBuffer] = {}
 
         # Variant storage
         self._variants: Dict[str, IndicatorVariant] = {}  # variant_id -> variant
@@ -148,6 +163,9 @@ class StreamingIndicatorEngine:
             "indicators_count": 0,
             "data_structures_size": {},
             "cleanup_frequency": 0.0,
+            "ingest_latency_us": 0.0,
+            "avg_ingest_latency_us": 0.0,
+            "ingest_count": 0,
             "last_update": time.time()
         }
 
@@ -199,7 +217,8 @@ class StreamingIndicatorEngine:
         if self._subscription_task is None:
             # ✅ EVENT TOPIC FIX: Changed from "market.data_update" to "market.price_update"
             # to match publisher in execution_processor.py:597
-            await self.event_bus.subscribe("market.price_update", self._on_market_data)
+            # ✅ PERFORMANCE: Batch subscription - bursts from publish_many() arrive as one list
+            await self.event_bus.subscribe("market.price_update", self._on_market_data_batch, batch=True)
             self._subscription_task = True  # Mark as subscribed
         if self._time_scheduler_task is None:
             self._time_scheduler_task = asyncio.create_task(self._run_time_driven_scheduler())
@@ -552,7 +571,10 @@ class StreamingIndicatorEngine:
             # ✅ CRITICAL FIX: Initialize price data storage with TTL tracking
             price_key = f"{symbol}_{timeframe}"
             if price_key not in self._price_data:
-                self._price_data[price_key] = deque(maxlen=self._max_series_length)
+                if timeframe in self._supported_timeframes:
+                    self._get_stream_buffer(self._price_data, symbol, PRICE_COLUMNS)
+                else:
+                    self._price_data[price_key] = ColumnarRingBuffer(PRICE_COLUMNS, self._max_series_length)
                 self._data_access_times[price_key] = time.time()
 
             # Create indicator
@@ -738,8 +760,8 @@ class StreamingIndicatorEngine:
 
         # ✅ CRITICAL FIX: Cleanup price data based on access time TTL
         expired_price_keys = []
-        for key in list(self._price_data.keys()):
-            last_access = self._data_access_times.get(key, 0)
+        for key, buffer in list(self._price_data.items()):
+            last_access = self._last_access_time(key, buffer)
             if now - last_access > self._data_ttl_seconds:
                 expired_price_keys.append(key)
 
@@ -751,8 +773,8 @@ class StreamingIndicatorEngine:
 
         # ✅ CRITICAL FIX: Cleanup orderbook data based on access time TTL
         expired_ob_keys = []
-        for key in list(self._orderbook_data.keys()):
-            last_access = self._data_access_times.get(f"ob_{key}", 0)
+        for key, buffer in list(self._orderbook_data.items()):
+            last_access = self._last_access_time(f"ob_{key}", buffer)
             if now - last_access > self._data_ttl_seconds:
                 expired_ob_keys.append(key)
 
@@ -764,8 +786,8 @@ class StreamingIndicatorEngine:
 
         # ✅ CRITICAL FIX: Cleanup deal data based on access time TTL
         expired_deal_keys = []
-        for key in list(self._deal_data.keys()):
-            last_access = self._data_access_times.get(f"deal_{key}", 0)
+        for key, buffer in list(self._deal_data.items()):
+            last_access = self._last_access_time(f"deal_{key}", buffer)
             if now - last_access > self._data_ttl_seconds:
                 expired_deal_keys.append(key)
 
@@ -989,10 +1011,90 @@ class StreamingIndicatorEngine:
                 "prev_price": None
             }
 
+    def _last_access_time(self, access_key: str, buffer: Any) -> float:
+        """Last access of a data key: explicit access time or last write to its (shared) buffer."""
+        return max(self._data_access_times.get(access_key, 0), getattr(buffer, "last_access", 0.0))
+
+    def _get_stream_buffer(self, store: Dict[str, ColumnarRingBuffer], symbol: str,
+                           columns: tuple) -> ColumnarRingBuffer:
+        """
+        Return the shared ring buffer of a symbol stream, creating it on first use.
+
+        The same buffer object is registered under "{symbol}_{timeframe}" for every
+        supported timeframe, so each tick is stored once instead of once per timeframe.
+        """
+        buffer = store.get(f"{symbol}_{self._supported_timeframes[0]}")
+        if isinstance(buffer, ColumnarRingBuffer):
+            return buffer
+
+        buffer = ColumnarRingBuffer(columns, self._max_series_length)
+        for timeframe in self._supported_timeframes:
+            store[f"{symbol}_{timeframe}"] = buffer
+        return buffer
+
+    @staticmethod
+    def _series_columns(series: Any, *names: str) -> tuple:
+        """
+        Column arrays of a market data buffer, oldest to newest.
+
+        Zero-copy views for ColumnarRingBuffer; plain sequences of row dicts
+        (externally injected buffers) are converted.
+        """
+        if isinstance(series, ColumnarRingBuffer):
+            return tuple(series.column(name) for name in names)
+        rows = list(series) if series else []
+        return tuple(
+            np.array([as_float(row.get(name, 0.0)) for row in rows], dtype=np.float64)
+            for name in names
+        )
+
+    @classmethod
+    def _sorted_series_columns(cls, series: Any, *names: str) -> tuple:
+        """
+        Column arrays ordered by normalized timestamp (first name must be the timestamp).
+
+        Sorted ring buffers holding second timestamps are returned as zero-copy
+        views. Anything else (out-of-order rows, millisecond timestamps, plain
+        sequences) is normalized to seconds, stripped of rows without a
+        timestamp and stable-sorted once so windows can be found by bisection.
+        """
+        columns = cls._series_columns(series, *names)
+        ts = columns[0]
+        if isinstance(series, ColumnarRingBuffer) and series.is_sorted and (not len(ts) or ts[-1] <= 1e12):
+            return columns
+
+        ts = np.where(ts > 1e12, ts / 1000.0, ts)
+        keep = ~np.isnan(ts)
+        order = np.argsort(ts[keep], kind="stable")
+        return (ts[keep][order],) + tuple(column[keep][order] for column in columns[1:])
+
+    @staticmethod
+    def _window_bounds(ts_column: np.ndarray, start_ts: float, end_ts: float) -> tuple:
+        """Slice bounds [lo, hi) of sorted ts_column with start_ts <= timestamp <= end_ts."""
+        lo = int(np.searchsorted(ts_column, start_ts, side="left"))
+        hi = int(np.searchsorted(ts_column, end_ts, side="right"))
+        return lo, max(lo, hi)
+
     def _should_cleanup_data(self) -> bool:
         """Check if data cleanup should be performed"""
         return time.time() - self._last_cleanup_time > self._cleanup_interval_seconds
 
+    async def _on_market_data_batch(self, items: List[Dict[str, Any]]) -> None:
+        """Handle a batch of market data updates (EventBus batch subscription)."""
+        failed_items: List[Dict[str, Any]] = []
+        errors: List[BaseException] = []
+        for data in items:
+            try:
+                await self._on_market_data(data)
+            except Exception as e:
+                # Already logged and rolled back per tick; keep processing the batch
+                failed_items.append(data)
+                errors.append(e)
+
+        if failed_items:
+            # Surface failures to the EventBus so it retries (only) the failed ticks
+            raise BatchDeliveryError(failed_items, errors)
+
     async def _on_market_data(self, data: Dict[str, Any]) -> None:
         """Handle market data update with thread safety and error handling"""
         start_time = time.time()
@@ -1020,46 +1122,40 @@ class StreamingIndicatorEngine:
         if not has_indicators:
             # ✅ DIAGNOSTIC LOG: Track symbols being skipped due to no indicators
             # This helps identify when indicators aren't registered for a symbol during backtest
-            self.logger.info("streaming_indicator_engine.symbol_skipped_no_indicators", {
+            self.logger.info("streaming_indicator_engine.symbol_skipped_no_indicators", lambda: {
                 "symbol": symbol,
                 "all_registered_symbols": list(self._indicators_by_symbol.keys())[:10],
                 "total_symbols_with_indicators": len(self._indicators_by_symbol)
             })
             return  # Skip data storage and processing if no indicators are using this symbol
 
-        # ✅ CRITICAL FIX: Create data checkpoint for rollback capability
-        checkpoint = self._create_data_checkpoint(symbol)
+        # ✅ PERFORMANCE: Staged ingest - each appended buffer is recorded with its
+        # watermark (one int) so a failure can roll the appends back; replaces the
+        # per-tick checkpoint dict of lengths for every timeframe key
+        staged = []
 
         try:
             async with self._data_lock:
-                # ✅ CRITICAL FIX: Update price data with access time tracking
+                # ✅ PERFORMANCE: Each stream is appended once to the symbol's shared
+                # ring buffer (all timeframe keys alias it); last_access drives TTL cleanup
+                ingest_started = time.perf_counter()
+                now = time.time()
+                ts = as_float(timestamp)
+
                 if price is not None:
-                    for timeframe in self._supported_timeframes:
-                        price_key = f"{symbol}_{timeframe}"
-                        if price_key not in self._price_data:
-                            self._price_data[price_key] = deque(maxlen=self._max_series_length)
-                        self._price_data[price_key].append({
-                            "timestamp": timestamp,
-                            "price": float(price)
-                        })
-                        # ✅ CRITICAL FIX: Track access time for TTL cleanup
-                        self._data_access_times[price_key] = time.time()
+                    price_buffer = self._get_stream_buffer(self._price_data, symbol, PRICE_COLUMNS)
+                    staged.append((price_buffer, price_buffer.watermark))
+                    price_buffer.append_row(ts, float(price))
+                    price_buffer.last_access = now
 
                 # ✅ CRITICAL FIX: Store deal data with access time tracking
                 if data.get("volume") is not None:
                     vol = float(data.get("volume", 0.0))
                     pr = float(price) if price is not None else 0.0
-                    for timeframe in self._supported_timeframes:
-                        dkey = f"{symbol}_{timeframe}"
-                        if dkey not in self._deal_data:
-                            self._deal_data[dkey] = deque(maxlen=self._max_series_length)
-                        self._deal_data[dkey].append({
-                            "timestamp": timestamp,
-                            "price": pr,
-                            "volume": vol
-                        })
-                        # ✅ CRITICAL FIX: Track access time for TTL cleanup
-                        self._data_access_times[f"deal_{dkey}"] = time.time()
+                    deal_buffer = self._get_stream_buffer(self._deal_data, symbol, DEAL_COLUMNS)
+                    staged.append((deal_buffer, deal_buffer.watermark))
+                    deal_buffer.append_row(ts, pr, vol)
+                    deal_buffer.last_access = now
 
                 # ✅ CRITICAL FIX: Update orderbook data with access time tracking
                 bids = data.get("bids")
@@ -1069,19 +1165,12 @@ class StreamingIndicatorEngine:
                     best_ask = float(asks[0][0]) if asks else 0.0
                     bid_qty = float(bids[0][1]) if bids else 0.0
                     ask_qty = float(asks[0][1]) if asks else 0.0
-                    for timeframe in self._supported_timeframes:
-                        ob_key = f"{symbol}_{timeframe}"
-                        if ob_key not in self._orderbook_data:
-                            self._orderbook_data[ob_key] = deque(maxlen=self._max_series_length)
-                        self._orderbook_data[ob_key].append({
-                            "timestamp": timestamp,
-                            "best_bid": best_bid,
-                            "best_ask": best_ask,
-                            "bid_qty": bid_qty,
-                            "ask_qty": ask_qty,
-                        })
-                        # ✅ CRITICAL FIX: Track access time for TTL cleanup
-                        self._data_access_times[f"ob_{ob_key}"] = time.time()
+                    ob_buffer = self._get_stream_buffer(self._orderbook_data, symbol, ORDERBOOK_COLUMNS)
+                    staged.append((ob_buffer, ob_buffer.watermark))
+                    ob_buffer.append_row(ts, best_bid, best_ask, bid_qty, ask_qty)
+                    ob_buffer.last_access = now
+
+                self._record_ingest_latency((time.perf_counter() - ingest_started) * 1_000_000)
 
             # Update all indicators for this symbol (outside lock to prevent deadlock)
             price_val = float(price) if price is not None else 0.0
@@ -1100,7 +1189,7 @@ class StreamingIndicatorEngine:
 
         except Exception as e:
             # ✅ CRITICAL FIX: Rollback on error
-            await self._rollback_to_checkpoint(checkpoint)
+            await self._rollback_staged_appends(symbol, staged)
             self.logger.error("streaming_indicator_engine.market_data_error", {
                 "symbol": symbol,
                 "error": str(e),
@@ -1151,7 +1240,8 @@ class StreamingIndicatorEngine:
             if price is not None and symbol:
                 price_key = f"{symbol}_1m"
                 if price_key in self._price_data and len(self._price_data[price_key]) > 1:
-                    recent_prices = [p["price"] for p in list(self._price_data[price_key])[-10:]]
+                    (recent_column,) = self._series_columns(self._price_data[price_key], "price")
+                    recent_prices = recent_column[-10:].tolist()
                     if recent_prices:
                         avg_recent = sum(recent_prices) / len(recent_prices)
                         change_pct = abs(price - avg_recent) / avg_recent
@@ -1178,61 +1268,28 @@ class StreamingIndicatorEngine:
             # Still process data even if validation fails
             return True
     
-    def _create_data_checkpoint(self, symbol: str) -> Dict[str, Any]:
-        """✅ CRITICAL FIX: Create data checkpoint for rollback capability"""
-        checkpoint = {
-            "symbol": symbol,
-            "price_data_lengths": {},
-            "deal_data_lengths": {},
-            "orderbook_data_lengths": {},
-            "timestamp": time.time()
-        }
-
-        # Record current lengths for rollback
-        for timeframe in self._supported_timeframes:
-            price_key = f"{symbol}_{timeframe}"
-            if price_key in self._price_data:
-                checkpoint["price_data_lengths"][price_key] = len(self._price_data[price_key])
-
-            dkey = f"{symbol}_{timeframe}"
-            if dkey in self._deal_data:
-                checkpoint["deal_data_lengths"][dkey] = len(self._deal_data[dkey])
-
-            ob_key = f"{symbol}_{timeframe}"
-            if ob_key in self._orderbook_data:
-                checkpoint["orderbook_data_lengths"][ob_key] = len(self._orderbook_data[ob_key])
-
-        return checkpoint
+    def _record_ingest_latency(self, latency_us: float) -> None:
+        """Track per-tick ingest latency (buffer appends under the data lock)."""
+        metrics = self._performance_metrics
+        metrics["ingest_latency_us"] = latency_us
+        metrics["ingest_count"] += 1
+        if metrics["ingest_count"] == 1:
+            metrics["avg_ingest_latency_us"] = latency_us
+        else:
+            # Exponential moving average over roughly the last 100 ticks
+            metrics["avg_ingest_latency_us"] += 0.01 * (latency_us - metrics["avg_ingest_latency_us"])
 
-    async def _rollback_to_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
-        """✅ CRITICAL FIX: Rollback data to checkpoint state"""
-        if not checkpoint:
+    async def _rollback_staged_appends(self, symbol: str, staged: List[tuple]) -> None:
+        """✅ CRITICAL FIX: Undo the appends of a failed ingest using the staged watermarks"""
+        if not staged:
             return
 
-        symbol = checkpoint["symbol"]
-
         async with self._data_lock:
-            # Rollback price data
-            for price_key, original_length in checkpoint["price_data_lengths"].items():
-                if price_key in self._price_data:
-                    while len(self._price_data[price_key]) > original_length:
-                        self._price_data[price_key].pop()
-
-            # Rollback deal data
-            for dkey, original_length in checkpoint["deal_data_lengths"].items():
-                if dkey in self._deal_data:
-                    while len(self._deal_data[dkey]) > original_length:
-                        self._deal_data[dkey].pop()
-
-            # Rollback orderbook data
-            for ob_key, original_length in checkpoint["orderbook_data_lengths"].items():
-                if ob_key in self._orderbook_data:
-                    while len(self._orderbook_data[ob_key]) > original_length:
-                        self._orderbook_data[ob_key].pop()
+            rows_removed = sum(buffer.rollback(watermark) for buffer, watermark in staged)
 
         self.logger.warning("streaming_indicator_engine.rollback_completed", {
             "symbol": symbol,
-            "checkpoint_age_seconds": time.time() - checkpoint["timestamp"]
+            "rows_removed": rows_removed
         })
 
     async def _update_indicators_safe(self, symbol: str, price: float, timestamp: Any) -> None:
@@ -1309,23 +1366,21 @@ class StreamingIndicatorEngine:
 
         # ✅ DIAGNOSTIC: Log how many indicator updates were collected
         if updates_to_publish:
-            self.logger.info("streaming_indicator_engine.updates_collected", {
+            self.logger.info("streaming_indicator_engine.updates_collected", lambda: {
                 "symbol": symbol,
                 "updates_count": len(updates_to_publish),
                 "indicator_types": [u.get("indicator_type") for u in updates_to_publish[:5]]
             })
 
         # ✅ CRITICAL FIX: Publish all updates outside the calculation loop to prevent deadlock
-        for update in updates_to_publish:
+        # ✅ PERFORMANCE: One publish_many() per tick instead of one publish() per indicator
+        if updates_to_publish:
             try:
-                await self.event_bus.publish(
-                    "indicator.updated",
-                    update,
-                )
+                await self.event_bus.publish_many("indicator.updated", updates_to_publish)
             except Exception as e:
                 self.logger.error("streaming_indicator.publish_error", {
-                    "symbol": update["symbol"],
-                    "indicator": update["indicator"],
+                    "symbol": symbol,
+                    "indicators": [u["indicator"] for u in updates_to_publish],
                     "error": str(e)
                 })
     
@@ -1368,7 +1423,10 @@ class StreamingIndicatorEngine:
         ] and len(price_data) < period:
             return None  # Not enough data
 
-        prices = [p["price"] for p in list(price_data)[-period:]]
+        # ✅ PERFORMANCE: Column views of the shared ring buffer (no per-row dicts)
+        ts_column, price_column = self._series_columns(price_data, "timestamp", "price")
+        ts_sorted = isinstance(price_data, ColumnarRingBuffer) and price_data.is_sorted
+        prices = price_column[-period:].tolist()
 
         # ✅ GOAL_03: Use algorithm registry for calculation functions
         algorithm = self._algorithm_registry.get_algorithm(indicator_type)
@@ -1385,9 +1443,13 @@ class StreamingIndicatorEngine:
                 data_windows = []
 
                 # Diagnostic: Log price_data range
-                if price_data:
-                    price_ts_min = min(p["timestamp"] for p in price_data)
-                    price_ts_max = max(p["timestamp"] for p in price_data)
+                if len(ts_column) and ts_sorted:
+                    price_ts_min = float(ts_column[0])
+                    price_ts_max = float(ts_column[-1])
+                    price_data_span = price_ts_max - price_ts_min
+                elif len(ts_column):
+                    price_ts_min = float(ts_column.min())
+                    price_ts_max = float(ts_column.max())
                     price_data_span = price_ts_max - price_ts_min
                 else:
                     price_ts_min = price_ts_max = price_data_span = 0
@@ -1399,11 +1461,7 @@ class StreamingIndicatorEngine:
                     window_end_ts = end_ts - spec.t2
 
                     # Filter price_data to this window
-                    window_data = [
-                        (p["timestamp"], p["price"])
-                        for p in price_data
-                        if start_ts <= p["timestamp"] <= window_end_ts
-                    ]
+                    window_data = self._window_points(ts_column, price_column, start_ts, window_end_ts, ts_sorted)
 
                     # ✅ FIX (2025-12-03): Adaptive window sizing for backtest warm-up period
                     # Problem: At the start of backtest, we don't have data from 30-60 seconds ago
@@ -1424,11 +1482,9 @@ class StreamingIndicatorEngine:
                             if oldest_data_age >= 2.0:
                                 # Use oldest portion of available data as baseline proxy
                                 fallback_end_ts = oldest_point_ts + min(spec.t1 - spec.t2, oldest_data_age / 2)
-                                window_data = [
-                                    (p["timestamp"], p["price"])
-                                    for p in price_data
-                                    if oldest_point_ts <= p["timestamp"] <= fallback_end_ts
-                                ]
+                                window_data = self._window_points(
+                                    ts_column, price_column, oldest_point_ts, fallback_end_ts, ts_sorted
+                                )
                                 if window_data:
                                     self.logger.debug("streaming_indicator_engine.window_fallback_used", {
                                         "indicator_type": indicator_type,
@@ -1445,11 +1501,9 @@ class StreamingIndicatorEngine:
                             # If start_ts is before our data begins, adjust to use available data
                             if start_ts < price_ts_min:
                                 # Use all data from oldest point to current window end
-                                window_data = [
-                                    (p["timestamp"], p["price"])
-                                    for p in price_data
-                                    if price_ts_min <= p["timestamp"] <= window_end_ts
-                                ]
+                                window_data = self._window_points(
+                                    ts_column, price_column, price_ts_min, window_end_ts, ts_sorted
+                                )
                                 if window_data:
                                     self.logger.debug("streaming_indicator_engine.current_window_fallback", {
                                         "indicator_type": indicator_type,
@@ -1506,6 +1560,16 @@ class StreamingIndicatorEngine:
         })
         return None
 
+    @classmethod
+    def _window_points(cls, ts_column: np.ndarray, value_column: np.ndarray,
+                       start_ts: float, end_ts: float, ts_sorted: bool = False) -> List[tuple]:
+        """(timestamp, value) pairs with start_ts <= timestamp <= end_ts (bisection if ts_sorted)."""
+        if ts_sorted:
+            lo, hi = cls._window_bounds(ts_column, start_ts, end_ts)
+            return list(zip(ts_column[lo:hi].tolist(), value_column[lo:hi].tolist()))
+        mask = (ts_column >= start_ts) & (ts_column <= end_ts)
+        return list(zip(ts_column[mask].tolist(), value_column[mask].tolist()))
+
     def _calculate_incremental_indicator(self, indicator_key: str, new_price: float) -> Optional[float]:
         """✅ CRITICAL FIX: Incremental calculation for performance-critical indicators"""
         if indicator_key not in self._incremental_indicators:
@@ -2300,8 +2364,10 @@ class StreamingIndicatorEngine:
         t1, t2 = self._validate_time_window_semantics(t1, t2, indicator.metadata.get("type", "UNKNOWN"))
 
         price_key = f"{indicator.symbol}_{indicator.timeframe}"
-        series = list(self._price_data.get(price_key, deque()))
-        if not series:
+        ts_column, price_column = self._sorted_series_columns(
+            self._price_data.get(price_key, ()), "timestamp", "price"
+        )
+        if not len(ts_column):
             # ✅ CRITICAL FIX: Always return 3 elements to maintain contract consistency
             # Calculate theoretical window timestamps even without data
             current_time = time.time()
@@ -2310,39 +2376,20 @@ class StreamingIndicatorEngine:
             return [], start_ts, end_ts
 
         # Determine reference 'now' as last seen timestamp in series
-        now_ts = self._normalize_timestamp(series[-1].get("timestamp") or time.time())
+        now_ts = float(ts_column[-1]) or time.time()
         start_ts = now_ts - float(t1)
         end_ts = now_ts - float(t2)
 
-        # ✅ TWPA FIX: Find the last transaction BEFORE the window
-        pre_window_point = None
-        for s in series:
-            ts = self._normalize_timestamp(s.get("timestamp"))
-            if s.get("timestamp") is not None and ts < start_ts:
-                # Keep updating to get the LAST point before window
-                pre_window_point = (ts, float(s.get("price", 0.0)))
-
-        # Get all points WITHIN the window [start_ts, end_ts]
-        window = [
-            (
-                self._normalize_timestamp(s.get("timestamp")),
-                float(s.get("price", 0.0)),
-            )
-            for s in series
-            if s.get("timestamp") is not None
-            and start_ts <= self._normalize_timestamp(s["timestamp"]) <= end_ts
-        ]
+        # ✅ PERFORMANCE: Bisect the sorted timestamp column instead of scanning every row
+        lo, hi = self._window_bounds(ts_column, start_ts, end_ts)
 
-        # ✅ TWPA FIX: ALWAYS include the pre-window point at the beginning
+        # ✅ TWPA FIX: ALWAYS include the last transaction BEFORE the window at the beginning
         # This is REQUIRED by TWPA algorithm to calculate duration of first price
         # This handles both cases:
         #   1. Window has points: pre_window_point is inserted at position 0
         #   2. Window is empty: pre_window_point creates a single-element list
-        if pre_window_point:
-            window.insert(0, pre_window_point)
-
-        # Ensure ascending by timestamp (should already be sorted, but ensure it)
-        window.sort(key=lambda x: x[0])
+        first = lo - 1 if lo > 0 else lo
+        window = list(zip(ts_column[first:hi].tolist(), price_column[first:hi].tolist()))
         return window, start_ts, end_ts
 
     def _get_volume_series_for_window(self, indicator: StreamingIndicator, t1: float, t2: float):
@@ -2360,9 +2407,11 @@ class StreamingIndicatorEngine:
         t1, t2 = self._validate_time_window_semantics(t1, t2, indicator.metadata.get("type", "UNKNOWN"))
 
         deal_key = f"{indicator.symbol}_{indicator.timeframe}"
-        series = list(self._deal_data.get(deal_key, deque()))
+        ts_column, volume_column = self._sorted_series_columns(
+            self._deal_data.get(deal_key, ()), "timestamp", "volume"
+        )
 
-        if not series:
+        if not len(ts_column):
             # No data available - return empty window
             current_time = time.time()
             start_ts = current_time - float(t1)
@@ -2370,23 +2419,13 @@ class StreamingIndicatorEngine:
             return [], start_ts, end_ts
 
         # Determine reference 'now' as last seen timestamp
-        now_ts = self._normalize_timestamp(series[-1].get("timestamp") or time.time())
+        now_ts = float(ts_column[-1]) or time.time()
         start_ts = now_ts - float(t1)
         end_ts = now_ts - float(t2)
 
-        # Get all volume points within the window
-        window = [
-            (
-                self._normalize_timestamp(s.get("timestamp")),
-                float(s.get("volume", 0.0)),
-            )
-            for s in series
-            if s.get("timestamp") is not None
-            and start_ts <= self._normalize_timestamp(s["timestamp"]) <= end_ts
-        ]
-
-        # Ensure ascending by timestamp
-        window.sort(key=lambda x: x[0])
+        # Get all volume points within the window (bisection on sorted timestamps)
+        lo, hi = self._window_bounds(ts_column, start_ts, end_ts)
+        window = list(zip(ts_column[lo:hi].tolist(), volume_column[lo:hi].tolist()))
         return window, start_ts, end_ts
 
     def _get_deal_series_for_window(self, indicator: StreamingIndicator, t1: float, t2: float):
@@ -2404,9 +2443,11 @@ class StreamingIndicatorEngine:
         t1, t2 = self._validate_time_window_semantics(t1, t2, indicator.metadata.get("type", "UNKNOWN"))
 
         deal_key = f"{indicator.symbol}_{indicator.timeframe}"
-        series = list(self._deal_data.get(deal_key, deque()))
+        ts_column, price_column, volume_column = self._sorted_series_columns(
+            self._deal_data.get(deal_key, ()), "timestamp", "price", "volume"
+        )
 
-        if not series:
+        if not len(ts_column):
             # No data available - return empty window
             current_time = time.time()
             start_ts = current_time - float(t1)
@@ -2414,73 +2455,50 @@ class StreamingIndicatorEngine:
             return [], start_ts, end_ts
 
         # Determine reference 'now' as last seen timestamp
-        now_ts = self._normalize_timestamp(series[-1].get("timestamp") or time.time())
+        now_ts = float(ts_column[-1]) or time.time()
         start_ts = now_ts - float(t1)
         end_ts = now_ts - float(t2)
 
-        # Get all deal points within the window
-        window = [
-            (
-                self._normalize_timestamp(s.get("timestamp")),
-                float(s.get("price", 0.0)),
-                float(s.get("volume", 0.0)),
-            )
-            for s in series
-            if s.get("timestamp") is not None
-            and start_ts <= self._normalize_timestamp(s["timestamp"]) <= end_ts
-        ]
-
-        # Ensure ascending by timestamp
-        window.sort(key=lambda x: x[0])
+        # Get all deal points within the window (bisection on sorted timestamps)
+        lo, hi = self._window_bounds(ts_column, start_ts, end_ts)
+        window = list(zip(
+            ts_column[lo:hi].tolist(),
+            price_column[lo:hi].tolist(),
+            volume_column[lo:hi].tolist(),
+        ))
         return window, start_ts, end_ts
 
     def _get_orderbook_series_for_window(self, indicator: StreamingIndicator, t1: float, t2: float):
         if t1 < t2:
             t1, t2 = t2, t1
         ob_key = f"{indicator.symbol}_{indicator.timeframe}"
-        series = list(self._orderbook_data.get(ob_key, deque()))
-        if not series:
+        columns = self._sorted_series_columns(self._orderbook_data.get(ob_key, ()), *ORDERBOOK_COLUMNS)
+        ts_column = columns[0]
+        if not len(ts_column):
             return [], 0.0, 0.0
-        now_ts = self._normalize_timestamp(series[-1].get("timestamp") or time.time())
+        now_ts = float(ts_column[-1]) or time.time()
         start_ts = now_ts - float(t1)
         end_ts = now_ts - float(t2)
         # keep entries inside [start_ts, end_ts]
-        window = [
-            {
-                "timestamp": self._normalize_timestamp(s.get("timestamp")),
-                "best_bid": float(s.get("best_bid", 0.0)),
-                "best_ask": float(s.get("best_ask", 0.0)),
-                "bid_qty": float(s.get("bid_qty", 0.0)),
-                "ask_qty": float(s.get("ask_qty", 0.0)),
-            }
-            for s in series
-            if s.get("timestamp") is not None
-            and start_ts <= self._normalize_timestamp(s["timestamp"]) <= end_ts
-        ]
-        window.sort(key=lambda x: x["timestamp"])
+        lo, hi = self._window_bounds(ts_column, start_ts, end_ts)
+        rows = zip(*(column[lo:hi].tolist() for column in columns))
+        window = [dict(zip(ORDERBOOK_COLUMNS, row)) for row in rows]
         return window, start_ts, end_ts
 
     def _get_deals_for_window(self, indicator: StreamingIndicator, t1: float, t2: float):
         if t1 < t2:
             t1, t2 = t2, t1
         key = f"{indicator.symbol}_{indicator.timeframe}"
-        series = list(self._deal_data.get(key, deque()))
-        if not series:
+        columns = self._sorted_series_columns(self._deal_data.get(key, ()), *DEAL_COLUMNS)
+        ts_column = columns[0]
+        if not len(ts_column):
             return [], 0.0, 0.0
-        now_ts = self._normalize_timestamp(series[-1].get("timestamp") or time.time())
+        now_ts = float(ts_column[-1]) or time.time()
         start_ts = now_ts - float(t1)
         end_ts = now_ts - float(t2)
-        window = [
-            {
-                "timestamp": self._normalize_timestamp(s.get("timestamp")),
-                "price": float(s.get("price", 0.0)),
-                "volume": float(s.get("volume", 0.0)),
-            }
-            for s in series
-            if s.get("timestamp") is not None
-            and start_ts <= self._normalize_timestamp(s["timestamp"]) <= end_ts
-        ]
-        window.sort(key=lambda x: x["timestamp"])
+        lo, hi = self._window_bounds(ts_column, start_ts, end_ts)
+        rows = zip(*(column[lo:hi].tolist() for column in columns))
+        window = [dict(zip(DEAL_COLUMNS, row)) for row in rows]
         return window, start_ts, end_ts
 
     def _calc_twpa(self, window_points: list, start_ts: float, end_ts: float) -> Optional[float]:
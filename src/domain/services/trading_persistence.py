@@ -8,6 +8,7 @@ Architecture:
 - Writes to QuestDB tables (strategy_signals, orders, positions)
 - Used by ALL modes: live, paper, backtest (NO mode-specific code)
 - Single source of truth for trading data persistence
+- Write-behind: handlers only enqueue; WriteBehindQueue batches and orders writes
 
 Database Tables:
 - strategy_signals: S1, Z1, ZE1, E1, O1, EMERGENCY signals
@@ -22,6 +23,7 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 from ...core.logger import StructuredLogger
 from ...core.event_bus import EventBus
+from .write_behind_queue import WriteBehindQueue
 
 
 def _safe_timestamp_to_datetime(timestamp) -> datetime:
@@ -55,6 +57,7 @@ class TradingPersistenceService:
     - Mode-agnostic: Works identically for live/paper/backtest
     - EventBus-driven: Reacts to events, doesn't poll
     - Async-first: All I/O is non-blocking
+    - Write-behind: DB latency stays off the EventBus handler path
     - Error-resilient: Logs errors but doesn't crash trading
     """
 
@@ -68,7 +71,9 @@ class TradingPersistenceService:
                  logger: Optional[StructuredLogger] = None,
                  min_pool_size: int = 2,
                  max_pool_size: int = 10,
-                 session_id: Optional[str] = None):
+                 session_id: Optional[str] = None,
+                 flush_batch_size: int = 500,
+                 flush_interval: float = 0.5):
         """
         Initialize trading persistence service.
 
@@ -82,6 +87,9 @@ class TradingPersistenceService:
             logger: Structured logger
             min_pool_size: Minimum connection pool size
             max_pool_size: Maximum connection pool size
+            session_id: Session ID stored with persisted rows
+            flush_batch_size: Queued writes that trigger an immediate flush
+            flush_interval: Maximum seconds a queued write waits before being flushed
         """
         self.host = host
         self.port = port
@@ -97,6 +105,15 @@ class TradingPersistenceService:
         self._pool: Optional[asyncpg.Pool] = None
         self._started = False
 
+        # Handlers enqueue; writes are batched and flushed in order
+        self._writes = WriteBehindQueue(
+            lambda: self._pool,
+            logger=logger,
+            name="trading_persistence",
+            max_batch=flush_batch_size,
+            flush_interval=flush_interval
+        )
+
         if self.logger:
             self.logger.info("trading_persistence.initialized", {
                 "host": host,
@@ -110,8 +127,8 @@ class TradingPersistenceService:
         Start persistence service.
 
         1. Create connection pool
-        2. Subscribe to EventBus events
-        3. Ready to persist trading data
+        2. Start write-behind flushing
+        3. Subscribe to EventBus events
         """
         if self._started:
             return
@@ -134,6 +151,8 @@ class TradingPersistenceService:
                     "max_size": self.max_pool_size
                 })
 
+        await self._writes.start()
+
         # Subscribe to EventBus events
         if self.event_bus:
             await self.event_bus.subscribe("signal_generated", self._on_signal_generated)
@@ -164,8 +183,8 @@ class TradingPersistenceService:
         Stop persistence service.
 
         1. Unsubscribe from EventBus
-        2. Close connection pool
-        3. Clean up resources
+        2. Flush queued writes
+        3. Close connection pool
         """
         if not self._started:
             return
@@ -183,6 +202,9 @@ class TradingPersistenceService:
             if self.logger:
                 self.logger.info("trading_persistence.unsubscribed_from_events")
 
+        # Drain queued writes before the pool goes away
+        await self._writes.stop()
+
         # Close pool
         if self._pool:
             await self._pool.close()
@@ -193,6 +215,14 @@ class TradingPersistenceService:
 
         self._started = False
 
+    async def flush(self) -> None:
+        """Write all queued signals/orders/positions now (e.g. before reading them back)."""
+        await self._writes.flush()
+
+    def get_write_stats(self) -> Dict[str, int]:
+        """Get write-behind queue statistics."""
+        return self._writes.get_stats()
+
     # ========================================================================
     # Event Handlers - Signal Persistence
     # ========================================================================
@@ -252,20 +282,18 @@ class TradingPersistenceService:
                 ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
             """
 
-            async with self._pool.acquire() as conn:
-                await conn.execute(
-                    query,
-                    strategy_id,
-                    symbol,
-                    signal_type,
-                    timestamp_dt,
-                    triggered,
-                    conditions_json,
-                    indicators_json,
-                    action,
-                    metadata_json,
-                    self.session_id  # ✅ FIX: Include session_id
-                )
+            self._writes.enqueue(query, (
+                strategy_id,
+                symbol,
+                signal_type,
+                timestamp_dt,
+                triggered,
+                conditions_json,
+                indicators_json,
+                action,
+                metadata_json,
+                self.session_id  # ✅ FIX: Include session_id
+            ))
 
             if self.logger:
                 self.logger.debug("trading_persistence.signal_saved", {
@@ -343,24 +371,22 @@ class TradingPersistenceService:
                 ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
             """
 
-            async with self._pool.acquire() as conn:
-                await conn.execute(
-                    query,
-                    order_id,
-                    strategy_id,
-                    symbol,
-                    side,
-                    order_type,
-                    timestamp_dt,
-                    quantity,
-                    price,
-                    0.0,  # filled_quantity (initially 0)
-                    None,  # filled_price (null until filled)
-                    status,
-                    0.0,  # commission (0 initially)
-                    metadata_json,
-                    self.session_id  # ✅ FIX: Include session_id
-                )
+            self._writes.enqueue(query, (
+                order_id,
+                strategy_id,
+                symbol,
+                side,
+                order_type,
+                timestamp_dt,
+                quantity,
+                price,
+                0.0,  # filled_quantity (initially 0)
+                None,  # filled_price (null until filled)
+                status,
+                0.0,  # commission (0 initially)
+                metadata_json,
+                self.session_id  # ✅ FIX: Include session_id
+            ), entity=("order", order_id))
 
             if self.logger:
                 self.logger.debug("trading_persistence.order_created_saved", {
@@ -408,15 +434,13 @@ class TradingPersistenceService:
                 WHERE order_id = $1
             """
 
-            async with self._pool.acquire() as conn:
-                result = await conn.execute(
-                    query,
-                    order_id,
-                    filled_quantity,
-                    filled_price,
-                    status,
-                    commission
-                )
+            # Successive (partial) fills supersede each other until flushed
+            self._writes.enqueue(
+                query,
+                (order_id, filled_quantity, filled_price, status, commission),
+                entity=("order", order_id),
+                coalesce=True
+            )
 
             if self.logger:
                 self.logger.debug("trading_persistence.order_filled_updated", {
@@ -445,8 +469,7 @@ class TradingPersistenceService:
                 WHERE order_id = $1
             """
 
-            async with self._pool.acquire() as conn:
-                await conn.execute(query, order_id)
+            self._writes.enqueue(query, (order_id,), entity=("order", order_id))
 
             if self.logger:
                 self.logger.debug("trading_persistence.order_cancelled_updated", {
@@ -522,25 +545,23 @@ class TradingPersistenceService:
                 ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
             """
 
-            async with self._pool.acquire() as conn:
-                await conn.execute(
-                    query,
-                    position_id,
-                    strategy_id,
-                    symbol,
-                    timestamp_dt,
-                    side,
-                    quantity,
-                    entry_price,
-                    current_price,
-                    0.0,  # unrealized_pnl (initially 0)
-                    0.0,  # realized_pnl (0 until closed)
-                    stop_loss,
-                    take_profit,
-                    status,
-                    metadata_json,
-                    self.session_id  # ✅ FIX: Include session_id
-                )
+            self._writes.enqueue(query, (
+                position_id,
+                strategy_id,
+                symbol,
+                timestamp_dt,
+                side,
+                quantity,
+                entry_price,
+                current_price,
+                0.0,  # unrealized_pnl (initially 0)
+                0.0,  # realized_pnl (0 until closed)
+                stop_loss,
+                take_profit,
+                status,
+                metadata_json,
+                self.session_id  # ✅ FIX: Include session_id
+            ), entity=("position", position_id))
 
             if self.logger:
                 self.logger.debug("trading_persistence.position_opened_saved", {
@@ -582,108 +603,114 @@ class TradingPersistenceService:
             # Convert timestamp to datetime (handles milliseconds)
             timestamp_dt = _safe_timestamp_to_datetime(timestamp)
 
-            async with self._pool.acquire() as conn:
-                if status_value == "opened":
-                    # INSERT new position (first time we see it)
-                    query = """
-                        INSERT INTO positions (
-                            position_id,
-                            strategy_id,
-                            symbol,
-                            timestamp,
-                            side,
-                            quantity,
-                            entry_price,
-                            current_price,
-                            unrealized_pnl,
-                            realized_pnl,
-                            stop_loss,
-                            take_profit,
-                            status,
-                            metadata
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-                    """
-                    await conn.execute(
-                        query,
+            if status_value == "opened":
+                # INSERT new position (first time we see it)
+                query = """
+                    INSERT INTO positions (
                         position_id,
-                        "live_trading",  # Default strategy_id
+                        strategy_id,
                         symbol,
-                        timestamp_dt,
+                        timestamp,
                         side,
                         quantity,
                         entry_price,
                         current_price,
                         unrealized_pnl,
-                        0.0,  # realized_pnl (0 until closed)
-                        None,  # stop_loss (not tracked by PositionSyncService)
-                        None,  # take_profit (not tracked by PositionSyncService)
-                        "OPEN",  # status
-                        None  # metadata
-                    )
-
-                    if self.logger:
-                        self.logger.debug("trading_persistence.position_inserted", {
-                            "position_id": position_id,
-                            "symbol": symbol,
-                            "side": side,
-                            "quantity": quantity
-                        })
-
-                elif status_value == "liquidated":
-                    # UPDATE to liquidated status
-                    query = """
-                        UPDATE positions
-                        SET current_price = $2,
-                            unrealized_pnl = 0.0,
-                            status = 'LIQUIDATED',
-                            quantity = 0.0
-                        WHERE position_id = $1
-                    """
-                    await conn.execute(query, position_id, current_price)
-
-                    if self.logger:
-                        self.logger.warning("trading_persistence.position_liquidated", {
-                            "position_id": position_id,
-                            "liquidation_price": current_price
-                        })
-
-                elif status_value == "closed":
-                    # UPDATE to closed status (handled by _on_position_closed, but support here too)
-                    realized_pnl = float(data.get("realized_pnl", unrealized_pnl))
-                    query = """
-                        UPDATE positions
-                        SET current_price = $2,
-                            unrealized_pnl = 0.0,
-                            realized_pnl = $3,
-                            status = 'CLOSED',
-                            quantity = 0.0
-                        WHERE position_id = $1
-                    """
-                    await conn.execute(query, position_id, current_price, realized_pnl)
-
-                    if self.logger:
-                        self.logger.debug("trading_persistence.position_closed_via_updated", {
-                            "position_id": position_id,
-                            "realized_pnl": realized_pnl
-                        })
-                else:
-                    # UPDATE existing position (price/PnL/quantity changes)
-                    query = """
-                        UPDATE positions
-                        SET current_price = $2,
-                            unrealized_pnl = $3,
-                            quantity = $4
-                        WHERE position_id = $1
-                    """
-                    await conn.execute(query, position_id, current_price, unrealized_pnl, quantity)
-
-                    if self.logger:
-                        self.logger.debug("trading_persistence.position_updated", {
-                            "position_id": position_id,
-                            "current_price": current_price,
-                            "unrealized_pnl": unrealized_pnl,
-                            "quantity": quantity
-                        })
+                        realized_pnl,
+                        stop_loss,
+                        take_profit,
+                        status,
+                        metadata
+                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
+                """
+                self._writes.enqueue(query, (
+                    position_id,
+                    "live_trading",  # Default strategy_id
+                    symbol,
+                    timestamp_dt,
+                    side,
+                    quantity,
+                    entry_price,
+                    current_price,
+                    unrealized_pnl,
+                    0.0,  # realized_pnl (0 until closed)
+                    None,  # stop_loss (not tracked by PositionSyncService)
+                    None,  # take_profit (not tracked by PositionSyncService)
+                    "OPEN",  # status
+                    None  # metadata
+                ), entity=("position", position_id))
+
+                if self.logger:
+                    self.logger.debug("trading_persistence.position_inserted", {
+                        "position_id": position_id,
+                        "symbol": symbol,
+                        "side": side,
+                        "quantity": quantity
+                    })
+
+            elif status_value == "liquidated":
+                # UPDATE to liquidated status
+                query = """
+                    UPDATE positions
+                    SET current_price = $2,
+                        unrealized_pnl = 0.0,
+                        status = 'LIQUIDATED',
+                        quantity = 0.0
+                    WHERE position_id = $1
+                """
+                self._writes.enqueue(query, (position_id, current_price), entity=("position", position_id))
+
+                if self.logger:
+                    self.logger.warning("trading_persistence.position_liquidated", {
+                        "position_id": position_id,
+                        "liquidation_price": current_price
+                    })
+
+            elif status_value == "closed":
+                # UPDATE to closed status (handled by _on_position_closed, but support here too)
+                realized_pnl = float(data.get("realized_pnl", unrealized_pnl))
+                query = """
+                    UPDATE positions
+                    SET current_price = $2,
+                        unrealized_pnl = 0.0,
+                        realized_pnl = $3,
+                        status = 'CLOSED',
+                        quantity = 0.0
+                    WHERE position_id = $1
+                """
+                self._writes.enqueue(
+                    query, (position_id, current_price, realized_pnl), entity=("position", position_id)
+                )
+
+                if self.logger:
+                    self.logger.debug("trading_persistence.position_closed_via_updated", {
+                        "position_id": position_id,
+                        "realized_pnl": realized_pnl
+                    })
+            else:
+                # UPDATE existing position (price/PnL/quantity changes)
+                query = """
+                    UPDATE positions
+                    SET current_price = $2,
+                        unrealized_pnl = $3,
+                        quantity = $4
+                    WHERE position_id = $1
+                """
+                # Mark-to-market updates coalesce: only the latest one per flush is written
+                self._writes.enqueue(
+                    query,
+                    (position_id, current_price, unrealized_pnl, quantity),
+                    entity=("position", position_id),
+                    coalesce=True
+                )
+
+                if self.logger:
+                    self.logger.debug("trading_persistence.position_updated", {
+                        "position_id": position_id,
+                        "current_price": current_price,
+                        "unrealized_pnl": unrealized_pnl,
+                        "quantity": quantity
+                    })
 
         except Exception as e:
             if self.logger:
@@ -710,8 +737,11 @@ class TradingPersistenceService:
                 WHERE position_id = $1
             """
 
-            async with self._pool.acquire() as conn:
-                await conn.execute(query, position_id, current_price, realized_pnl, status)
+            self._writes.enqueue(
+                query,
+                (position_id, current_price, realized_pnl, status),
+                entity=("position", position_id)
+            )
 
             if self.logger:
                 self.logger.debug("trading_persistence.position_closed_updated", {
@@ -0,0 +1,279 @@
+"""
+Write-Behind Queue
+==================
+Ordered, batching write buffer for asyncpg-backed persistence services.
+
+Event handlers enqueue (statement, args) pairs and return immediately; a
+background task flushes them when the queue reaches ``max_batch`` writes or
+every ``flush_interval`` seconds, whichever comes first.
+
+Ordering:
+- Writes are applied strictly in enqueue order, one flush at a time
+- Consecutive writes with the same statement are sent as one executemany()
+  batch (multi-row pipeline on a single connection)
+- A coalescable write replaces the pending write for the same entity only if
+  nothing else for that entity was enqueued after it, so an UPDATE can never
+  be reordered ahead of the INSERT or status change it follows
+
+Failure handling:
+- Connection errors keep the failed batch and everything after it at the head
+  of the queue for the next flush (nothing is lost while QuestDB restarts)
+- A statement error in a multi-row batch retries that batch one row at a
+  time, so only the rows that fail on their own are dropped (and logged)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Sequence
+
+import asyncpg
+
+from ...core.logger import StructuredLogger
+
+# Errors after which a retry can succeed (server restart, pool exhaustion, network)
+_TRANSIENT_ERRORS = (
+    asyncpg.PostgresConnectionError,
+    asyncpg.InterfaceError,
+    ConnectionError,
+    OSError,
+    asyncio.TimeoutError,
+)
+
+
+@dataclass
+class _PendingWrite:
+    """One queued statement"""
+    query: str
+    args: Sequence[Any]
+    entity: Optional[Hashable] = None
+    coalesce: bool = False
+
+
+class WriteBehindQueue:
+    """
+    Batches and orders database writes off the caller's critical path.
+
+    Usage:
+        queue = WriteBehindQueue(lambda: self._pool, logger, name="trading_persistence")
+        await queue.start()
+        queue.enqueue(INSERT_SQL, (a, b, c))
+        queue.enqueue(UPDATE_SQL, (id, price), entity=("position", id), coalesce=True)
+        await queue.stop()  # drains pending writes
+    """
+
+    def __init__(
+        self,
+        pool_getter: Callable[[], Optional[asyncpg.Pool]],
+        logger: Optional[StructuredLogger] = None,
+        name: str = "write_behind",
+        max_batch: int = 500,
+        flush_interval: float = 0.5,
+        max_pending: int = 100000
+    ):
+        """
+        Initialize write-behind queue.
+
+        Args:
+            pool_getter: Returns the asyncpg pool to write through (None while closed)
+            logger: Structured logger
+            name: Log event prefix (e.g. "trading_persistence")
+            max_batch: Pending writes that trigger an immediate flush
+            flush_interval: Maximum seconds a write waits before being flushed
+            max_pending: Pending writes beyond which the oldest are dropped
+        """
+        self._pool_getter = pool_getter
+        self.logger = logger
+        self.name = name
+        self.max_batch = max(1, max_batch)
+        self.flush_interval = flush_interval
+        self.max_pending = max(self.max_batch, max_pending)
+
+        self._pending: Deque[_PendingWrite] = deque(maxlen=self.max_pending)
+        self._last_by_entity: Dict[Hashable, _PendingWrite] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self._written = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._failed_flushes = 0
+
+    # ========================================================================
+    # Lifecycle
+    # ========================================================================
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and drain pending writes."""
+        if self._task is not None:
+            # Let an in-progress flush finish rather than cancelling it mid-batch
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of writes waiting to be flushed."""
+        return len(self._pending)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get queue statistics."""
+        return {
+            "pending": len(self._pending),
+            "written": self._written,
+            "coalesced": self._coalesced,
+            "dropped": self._dropped,
+            "failed_flushes": self._failed_flushes,
+        }
+
+    # ========================================================================
+    # Enqueue (synchronous, called from event handlers)
+    # ========================================================================
+
+    def enqueue(
+        self,
+        query: str,
+        args: Sequence[Any],
+        entity: Optional[Hashable] = None,
+        coalesce: bool = False
+    ) -> None:
+        """
+        Queue a write.
+
+        Args:
+            query: SQL statement with $n placeholders
+            args: Statement arguments
+            entity: Key of the row/object the write affects (orders for one
+                entity are preserved)
+            coalesce: Replace the entity's pending write if it is the entity's
+                latest write and uses the same statement
+        """
+        if entity is not None and coalesce:
+            last = self._last_by_entity.get(entity)
+            if last is not None and last.coalesce and last.query == query:
+                last.args = args
+                self._coalesced += 1
+                return
+
+        if len(self._pending) >= self.max_pending:
+            self._drop_oldest(1)
+
+        write = _PendingWrite(query, args, entity, coalesce)
+        self._pending.append(write)
+        if entity is not None:
+            self._last_by_entity[entity] = write
+
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+
+    # ========================================================================
+    # Flushing
+    # ========================================================================
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all pending writes in order (no-op while the pool is closed)."""
+        async with self._flush_lock:
+            pool = self._pool_getter()
+            if not self._pending or pool is None:
+                return
+
+            writes = list(self._pending)
+            self._pending = deque(maxlen=self.max_pending)
+            self._last_by_entity.clear()
+            start = 0
+
+            try:
+                async with pool.acquire() as conn:
+                    while start < len(writes):
+                        end = start + 1
+                        while end < len(writes) and writes[end].query == writes[start].query:
+                            end += 1
+
+                        batch = writes[start:end]
+                        try:
+                            if len(batch) == 1:
+                                await conn.execute(batch[0].query, *batch[0].args)
+                            else:
+                                await conn.executemany(batch[0].query, [write.args for write in batch])
+                            self._written += len(batch)
+                        except _TRANSIENT_ERRORS:
+                            raise
+                        except Exception as e:
+                            if len(batch) == 1:
+                                self._log_dropped(batch[0], e)
+                            else:
+                                # executemany() is all-or-nothing: retry row by row so
+                                # only the rows that fail on their own are dropped
+                                for write in batch:
+                                    try:
+                                        await conn.execute(write.query, *write.args)
+                                        self._written += 1
+                                    except _TRANSIENT_ERRORS:
+                                        raise
+                                    except Exception as row_error:
+                                        self._log_dropped(write, row_error)
+                                    start += 1
+                        start = end
+
+            except Exception as e:
+                # Connection-level failure: keep unwritten writes at the head of the queue, in order
+                self._requeue(writes[start:])
+                self._failed_flushes += 1
+                if self.logger:
+                    self.logger.warning(f"{self.name}.flush_deferred", {
+                        "pending": len(self._pending),
+                        "error": str(e),
+                        "error_type": type(e).__name__
+                    })
+
+    def _log_dropped(self, write: _PendingWrite, error: Exception) -> None:
+        self._dropped += 1
+        if self.logger:
+            self.logger.error(f"{self.name}.batch_write_failed", {
+                "rows": 1,
+                "query": write.query.split("(")[0].strip(),
+                "error": str(error),
+                "error_type": type(error).__name__
+            })
+
+    def _drop_oldest(self, count: int) -> None:
+        for _ in range(count):
+            dropped = self._pending.popleft()
+            if dropped.entity is not None and self._last_by_entity.get(dropped.entity) is dropped:
+                del self._last_by_entity[dropped.entity]
+            self._dropped += 1
+            if self.logger and self._dropped % 1000 == 1:
+                self.logger.error(f"{self.name}.write_queue_overflow", {
+                    "max_pending": self.max_pending,
+                    "dropped_total": self._dropped
+                })
+
+    def _requeue(self, writes: List[_PendingWrite]) -> None:
+        # Writes enqueued during the failed flush stay after the requeued ones;
+        # the entity index only tracks them, so coalescing can't jump the queue
+        self._pending = deque(writes + list(self._pending))
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            self._drop_oldest(overflow)
+        self._pending = deque(self._pending, maxlen=self.max_pending)
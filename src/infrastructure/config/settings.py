@@ -105,6 +105,13 @@ class ExchangeSettings(BaseSettings):
     mexc_pong_warn_threshold_seconds: int = Field(default=60, description="Pong age threshold for WARNING log")
     mexc_pong_reconnect_threshold_seconds: int = Field(default=120, description="Pong age threshold for reconnect")
 
+    # Incremental orderbook cache depth
+    mexc_orderbook_max_depth: int = Field(default=1000, ge=1, description="Orderbook levels kept per side")
+    mexc_orderbook_publish_levels: int = Field(default=20, ge=1, description="Orderbook levels per side in published events")
+
+    # Max WebSocket frames handled per message loop batch
+    mexc_message_batch_size: int = Field(default=256, ge=1, description="Max buffered frames handled as one batch")
+
     # BUG-008-6: Data activity monitoring thresholds per symbol volume category
     mexc_activity_threshold_high_volume: int = Field(default=60, description="Activity threshold for high volume symbols (BTC, ETH)")
     mexc_activity_threshold_medium_volume: int = Field(default=120, description="Activity threshold for medium volume symbols")
@@ -364,6 +371,8 @@ class LoggingSettings(BaseSettings):
     log_dir: str = Field(default="logs")
     max_file_size_mb: int = Field(default=100)
     backup_count: int = Field(default=5)
+    async_enabled: bool = Field(default=True, description="Format and write records on a background thread")
+    queue_size: int = Field(default=10000, description="Records buffered for the writer thread before dropping")
     
     model_config = ConfigDict(
         env_prefix = "LOG_",
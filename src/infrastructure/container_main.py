@@ -52,6 +52,7 @@ from ..application.controllers.unified_trading_controller import UnifiedTradingC
 # Only MexcFuturesAdapter and MexcPaperAdapter are supported.
 from ..infrastructure.adapters.mexc_paper_adapter import MexcPaperAdapter
 from ..infrastructure.adapters.mexc_futures_adapter import MexcFuturesAdapter
+from ..infrastructure.exchanges.rate_limiter import TokenBucketRateLimiter
 from ..api.broadcast_provider import BroadcastProvider
 from ..api.event_bridge import EventBridge
 from ..api.execution_processor import ExecutionProcessor
@@ -705,12 +706,20 @@ class Container:
                     1000
                 )
 
+                # Order status queries share one budget (well below MEXC's 100 req/s per IP)
+                status_rate_limiter = TokenBucketRateLimiter(
+                    max_tokens=20,
+                    refill_rate=20.0,
+                    name="live_order_status"
+                )
+
                 # ✅ AGENT 3 INTEGRATION: LiveOrderManager with full dependencies
                 return LiveOrderManager(
                     event_bus=self.event_bus,
                     mexc_adapter=mexc_adapter,
                     risk_manager=risk_manager,
-                    max_orders=max_orders
+                    max_orders=max_orders,
+                    status_rate_limiter=status_rate_limiter
                 )
             except Exception as e:
                 self.logger.error("container.live_order_manager_creation_failed", {
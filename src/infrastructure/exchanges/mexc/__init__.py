@@ -10,9 +10,9 @@ and improve maintainability of the MEXC WebSocket adapter.
 Components:
 - subscription: Subscription management (SubscriptionConfirmer)
 - connection: Connection pooling (planned)
-- messaging: Message processing (planned)
+- messaging: Inline JSON decoding, batched frame reads, stream statistics
 - monitoring: Health tracking (planned)
-- cache: Orderbook caching (planned)
+- cache: Incremental sorted-array orderbook
 """
 
 # Currently, only subscription components are extracted
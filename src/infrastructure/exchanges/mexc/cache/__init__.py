@@ -0,0 +1,13 @@
+"""
+MEXC Orderbook Cache Components
+===============================
+
+Per-symbol orderbook state maintained from depth snapshots and deltas.
+"""
+
+from .orderbook import OrderBook, OrderBookSide
+
+__all__ = [
+    "OrderBook",
+    "OrderBookSide",
+]
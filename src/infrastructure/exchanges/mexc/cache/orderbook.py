@@ -0,0 +1,208 @@
+"""
+MEXC Incremental Orderbook
+==========================
+
+Per-symbol orderbook kept as sorted parallel arrays, updated in place from
+depth snapshots and deltas.
+
+Each side stores three parallel lists ordered best-first: sort keys, prices
+and quantities. A level update bisects the key list (O(log n) search) and
+inserts, updates or removes one slot, so a delta never re-sorts the book or
+rebuilds containers.
+
+Price keys:
+- tick_size=None: keys are the float prices themselves
+- tick_size set: keys are integer tick counts (round(price / tick_size)), so
+  prices that differ only by float noise ("0.1" vs 0.1000000001) hit the
+  same level
+
+Bid keys are negated so both sides are ascending internally and index 0 is
+always the best level.
+
+Design Principles:
+- Full depth is kept up to max_depth levels per side (worst levels dropped)
+- Queries (top-N, mid, spread, cumulative depth) read the arrays directly
+- Not thread-safe: callers serialise access (the adapter's per-symbol lock)
+"""
+
+import time
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+PriceKey = Union[int, float]
+Level = Tuple[float, float]
+
+
+class OrderBookSide:
+    """One side of an orderbook as best-first sorted parallel arrays."""
+
+    __slots__ = ("is_bid", "tick_size", "max_depth", "_keys", "_prices", "_qtys")
+
+    def __init__(self, is_bid: bool, tick_size: Optional[float] = None, max_depth: int = 1000):
+        if max_depth <= 0:
+            raise ValueError("max_depth must be > 0")
+        self.is_bid = is_bid
+        self.tick_size = tick_size
+        self.max_depth = max_depth
+        self._keys: List[PriceKey] = []
+        self._prices: List[float] = []
+        self._qtys: List[float] = []
+
+    def _key(self, price: float) -> PriceKey:
+        key = round(price / self.tick_size) if self.tick_size else price
+        return -key if self.is_bid else key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def update(self, price: float, qty: float) -> None:
+        """Set the quantity at a price level; qty <= 0 removes the level."""
+        key = self._key(price)
+        keys = self._keys
+        index = bisect_left(keys, key)
+        exists = index < len(keys) and keys[index] == key
+
+        if qty <= 0:
+            if exists:
+                del keys[index]
+                del self._prices[index]
+                del self._qtys[index]
+            return
+
+        if exists:
+            self._qtys[index] = qty
+            return
+
+        if index >= self.max_depth:
+            return  # Worse than every kept level of a full side
+        keys.insert(index, key)
+        self._prices.insert(index, price)
+        self._qtys.insert(index, qty)
+        if len(keys) > self.max_depth:
+            keys.pop()
+            self._prices.pop()
+            self._qtys.pop()
+
+    def replace(self, levels: Iterable[Sequence[float]]) -> None:
+        """Replace the side with snapshot levels (sorted once)."""
+        merged = {}
+        for price, qty in levels:
+            if qty > 0:
+                merged[self._key(price)] = (price, qty)
+        ordered = sorted(merged.items())[:self.max_depth]
+        self._keys = [key for key, _ in ordered]
+        self._prices = [level[0] for _, level in ordered]
+        self._qtys = [level[1] for _, level in ordered]
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._prices.clear()
+        self._qtys.clear()
+
+    def best(self) -> Optional[Level]:
+        """Best level as (price, qty), or None for an empty side."""
+        if not self._keys:
+            return None
+        return self._prices[0], self._qtys[0]
+
+    def top(self, n: Optional[int] = None) -> List[Level]:
+        """Best n levels as (price, qty) tuples, best first (all levels when n is None)."""
+        return list(zip(self._prices[:n], self._qtys[:n]))
+
+    def cumulative_depth(self, n: Optional[int] = None) -> float:
+        """Total quantity of the best n levels (all levels when n is None)."""
+        return sum(self._qtys[:n])
+
+    def depth_within(self, price_limit: float) -> float:
+        """Total quantity at prices at or better than price_limit."""
+        return sum(self._qtys[:bisect_right(self._keys, self._key(price_limit))])
+
+    def qty_at(self, price: float) -> float:
+        """Quantity resting at a price level (0.0 when absent)."""
+        key = self._key(price)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return self._qtys[index]
+        return 0.0
+
+
+class OrderBook:
+    """
+    Incremental orderbook for one symbol.
+
+    Example:
+        book = OrderBook("BTC_USDT", max_depth=500)
+        book.apply_snapshot(bids, asks, version=100)
+        book.apply_delta([(50000.0, 0.0)], [(50001.0, 2.5)], version=101)
+        bids, asks = book.top(20)
+    """
+
+    __slots__ = ("symbol", "bids", "asks", "version", "timestamp")
+
+    def __init__(self, symbol: str, max_depth: int = 1000, tick_size: Optional[float] = None):
+        self.symbol = symbol
+        self.bids = OrderBookSide(is_bid=True, tick_size=tick_size, max_depth=max_depth)
+        self.asks = OrderBookSide(is_bid=False, tick_size=tick_size, max_depth=max_depth)
+        self.version = 0
+        self.timestamp = time.time()
+
+    def apply_snapshot(self, bids: Iterable[Sequence[float]], asks: Iterable[Sequence[float]],
+                       version: int = 0) -> None:
+        """Replace the whole book."""
+        self.bids.replace(bids)
+        self.asks.replace(asks)
+        self.version = version
+        self.timestamp = time.time()
+
+    def replace_sides(self, bids: Sequence[Sequence[float]], asks: Sequence[Sequence[float]]) -> None:
+        """Replace only the sides that have levels (partial pushes and REST refreshes)."""
+        if bids:
+            self.bids.replace(bids)
+        if asks:
+            self.asks.replace(asks)
+        self.timestamp = time.time()
+
+    def apply_delta(self, bids: Iterable[Sequence[float]], asks: Iterable[Sequence[float]],
+                    version: Optional[int] = None) -> None:
+        """Apply changed levels; a qty of 0 removes the level."""
+        for price, qty in bids:
+            self.bids.update(price, qty)
+        for price, qty in asks:
+            self.asks.update(price, qty)
+        if version is not None:
+            self.version = version
+        self.timestamp = time.time()
+
+    def top(self, n: Optional[int] = None) -> Tuple[List[Level], List[Level]]:
+        """Best n bids and asks."""
+        return self.bids.top(n), self.asks.top(n)
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        best = self.bids.best()
+        return best[0] if best else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        best = self.asks.best()
+        return best[0] if best else None
+
+    def mid_price(self) -> Optional[float]:
+        """Midpoint of best bid and ask, or None if a side is empty."""
+        bid, ask = self.best_bid, self.best_ask
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    def spread(self) -> Optional[float]:
+        """Best ask minus best bid, or None if a side is empty."""
+        bid, ask = self.best_bid, self.best_ask
+        if bid is None or ask is None:
+            return None
+        return ask - bid
+
+    def is_empty(self) -> bool:
+        return not self.bids and not self.asks
@@ -0,0 +1,18 @@
+"""
+MEXC Message Processing Components
+==================================
+
+Inline JSON decoding, batched reads of buffered WebSocket frames and
+per-connection throughput / parse latency statistics.
+"""
+
+from .decoding import JSON_DECODER, decode_json
+from .frame_reader import FrameBatchReader
+from .stream_stats import MessageStreamStats
+
+__all__ = [
+    "JSON_DECODER",
+    "decode_json",
+    "FrameBatchReader",
+    "MessageStreamStats",
+]
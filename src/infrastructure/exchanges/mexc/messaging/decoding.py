@@ -0,0 +1,33 @@
+"""
+MEXC Frame Decoding
+===================
+
+JSON decoding for WebSocket frames, run inline on the event loop.
+
+MEXC push frames are small (a few hundred bytes), so parsing them takes
+microseconds - less than handing each frame to a worker thread and back.
+orjson is used when installed; its JSONDecodeError subclasses
+json.JSONDecodeError, so callers catch a single exception type either way.
+"""
+
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+    JSON_DECODER = "orjson"
+    _loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+except ImportError:
+    # pyright: reportMissingImports=false
+    JSON_DECODER = "json"
+    _loads = json.loads
+
+
+def decode_json(message: Union[str, bytes]) -> Any:
+    """
+    Decode one text or binary frame.
+
+    Raises:
+        json.JSONDecodeError: If the frame is not valid JSON
+    """
+    return _loads(message)
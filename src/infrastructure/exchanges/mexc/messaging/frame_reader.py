@@ -0,0 +1,110 @@
+"""
+Batched WebSocket Frame Reader
+==============================
+
+Reads frames from a WebSocket connection on a background task into a
+bounded queue, so the consumer can take every frame that has already
+arrived in one step instead of one await per frame.
+
+While the consumer processes a batch, the reader keeps receiving; the next
+next_batch() call returns all frames buffered in the meantime (up to
+max_batch). When the queue is full the reader stops receiving, which lets
+the WebSocket library apply TCP backpressure as before.
+
+End of stream and receive errors are delivered in order after the frames
+that preceded them.
+"""
+
+import asyncio
+from typing import Any, List, Optional, Union
+
+_END_OF_STREAM = object()
+
+Frame = Union[str, bytes]
+
+
+class FrameBatchReader:
+    """
+    Drains a WebSocket connection in batches.
+
+    Usage:
+        reader = FrameBatchReader(websocket)
+        reader.start()
+        try:
+            while batch := await reader.next_batch():
+                ...
+        finally:
+            await reader.close()
+    """
+
+    def __init__(self, websocket: Any, max_batch: int = 256, max_buffered: int = 4096):
+        if max_batch <= 0:
+            raise ValueError("max_batch must be > 0")
+        self.websocket = websocket
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(max_buffered, max_batch))
+        self._task: Optional[asyncio.Task] = None
+        self._finished = False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._read_frames())
+
+    async def _read_frames(self) -> None:
+        try:
+            async for message in self.websocket:
+                await self._queue.put(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Delivered to the consumer after the frames received before it
+            await self._queue.put(e)
+            return
+        await self._queue.put(_END_OF_STREAM)
+
+    async def next_batch(self) -> List[Frame]:
+        """
+        Wait for at least one frame, then take every frame already buffered.
+
+        Returns:
+            Frames in arrival order; an empty list once the stream has ended
+
+        Raises:
+            Exception: The receive error (e.g. ConnectionClosed), once the
+                frames received before it have been returned
+        """
+        if self._finished:
+            return []
+        self.start()
+
+        batch: List[Frame] = []
+        item = await self._queue.get()
+        while True:
+            if item is _END_OF_STREAM or isinstance(item, Exception):
+                if batch:
+                    # Hand out the frames first; report the end on the next call
+                    self._queue.put_nowait(item)
+                    return batch
+                self._finished = True
+                if item is _END_OF_STREAM:
+                    return []
+                raise item
+            batch.append(item)
+            if len(batch) >= self.max_batch or self._queue.empty():
+                return batch
+            item = self._queue.get_nowait()
+
+    @property
+    def buffered(self) -> int:
+        """Frames received but not yet handed out."""
+        return self._queue.qsize()
+
+    async def close(self) -> None:
+        """Stop the reader task (the WebSocket itself is not closed)."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._finished = True
@@ -0,0 +1,96 @@
+"""
+Message Stream Statistics
+=========================
+
+Per-connection throughput and JSON parse latency for the MEXC message loop.
+
+Recording is O(1) per frame (counter increments and a bounded deque append);
+percentiles are computed only when a snapshot is requested.
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
+
+
+class MessageStreamStats:
+    """
+    Throughput and parse latency of one WebSocket connection.
+
+    Attributes:
+        messages: Frames received
+        batches: Batches handled (frames drained together)
+        parse_errors: Frames that were not valid JSON
+    """
+
+    def __init__(self, rate_window_seconds: float = 10.0, latency_samples: int = 2048):
+        self.rate_window_seconds = rate_window_seconds
+        self.messages = 0
+        self.batches = 0
+        self.parse_errors = 0
+        self.max_batch_size = 0
+        self._started = time.monotonic()
+        self._parse_ns: Deque[int] = deque(maxlen=latency_samples)
+        self._batch_times: Deque[Tuple[float, int]] = deque()  # (monotonic time, batch size)
+        self._window_messages = 0
+
+    def record_parse(self, elapsed_ns: int, ok: bool = True) -> None:
+        """Record the decode time of one frame."""
+        self._parse_ns.append(elapsed_ns)
+        if not ok:
+            self.parse_errors += 1
+
+    def record_batch(self, size: int) -> None:
+        """Record a batch of `size` frames handled together."""
+        now = time.monotonic()
+        self.messages += size
+        self.batches += 1
+        if size > self.max_batch_size:
+            self.max_batch_size = size
+        self._batch_times.append((now, size))
+        self._window_messages += size
+        self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.rate_window_seconds
+        batch_times = self._batch_times
+        while batch_times and batch_times[0][0] < cutoff:
+            self._window_messages -= batch_times.popleft()[1]
+
+    @property
+    def messages_per_second(self) -> float:
+        """Frames per second over the last rate_window_seconds."""
+        now = time.monotonic()
+        self._expire(now)
+        if not self._batch_times:
+            return 0.0
+        elapsed = min(self.rate_window_seconds, now - self._started)
+        return self._window_messages / max(elapsed, 1e-3)
+
+    def parse_latency_percentiles(self) -> Dict[str, float]:
+        """p50 / p95 / p99 / max parse latency in microseconds over recent frames."""
+        if not self._parse_ns:
+            return {"p50_us": 0.0, "p95_us": 0.0, "p99_us": 0.0, "max_us": 0.0}
+        samples = sorted(self._parse_ns)
+        last = len(samples) - 1
+
+        def percentile(fraction: float) -> float:
+            return round(samples[min(last, int(fraction * len(samples)))] / 1000, 2)
+
+        return {
+            "p50_us": percentile(0.50),
+            "p95_us": percentile(0.95),
+            "p99_us": percentile(0.99),
+            "max_us": round(samples[last] / 1000, 2),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "messages": self.messages,
+            "batches": self.batches,
+            "avg_batch_size": round(self.messages / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "messages_per_second": round(self.messages_per_second, 2),
+            "parse_errors": self.parse_errors,
+            "parse_latency": self.parse_latency_percentiles(),
+        }
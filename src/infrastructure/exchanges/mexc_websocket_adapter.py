@@ -15,7 +15,6 @@ import logging
 from typing import Optional, Set, Dict, Any, List, AsyncIterator
 from datetime import datetime
 from decimal import Decimal
-from collections import OrderedDict
 from contextlib import asynccontextmanager
 
 import websockets
@@ -31,6 +30,8 @@ from ...infrastructure.config.settings import ExchangeSettings
 from .circuit_breaker import CircuitBreaker
 from .rate_limiter import TokenBucketRateLimiter
 from .mexc.subscription import SubscriptionConfirmer
+from .mexc.cache import OrderBook
+from .mexc.messaging import FrameBatchReader, MessageStreamStats, decode_json
 
 
 class MexcWebSocketAdapter(IMarketDataProvider):
@@ -139,6 +140,10 @@ class MexcWebSocketAdapter(IMarketDataProvider):
         # Prevents race condition: connection cleanup vs in-flight confirmation processing
         self._message_processing_count: Dict[int, int] = {}  # connection_id -> count of active message handlers
 
+        # ✅ PERFORMANCE: Frames already buffered on a socket are drained and handled as one batch
+        self._message_batch_size = getattr(settings, 'mexc_message_batch_size', 256)  # Max frames per batch
+        self._stream_stats: Dict[int, MessageStreamStats] = {}  # connection_id -> msgs/s and parse latency
+
         # Market data cache removed - EventBus is the single source of truth
         # All data flows through EventBus to subscribers (ExecutionController, etc.)
         
@@ -182,7 +187,11 @@ class MexcWebSocketAdapter(IMarketDataProvider):
         self._message_count = 0  # Counter for message batching
         
         # ✅ ORDERBOOK CACHE: Maintain full state between incremental updates
-        self._orderbook_cache = {}  # symbol -> {"bids": OrderedDict, "asks": OrderedDict, "version": int, "timestamp": float}
+        # ✅ PERFORMANCE: Sorted parallel-array books; a delta bisects each changed level
+        # instead of re-sorting the book, and depth is kept up to orderbook_max_depth
+        self._orderbook_cache: Dict[str, OrderBook] = {}  # symbol -> OrderBook
+        self._orderbook_max_depth = getattr(settings, 'mexc_orderbook_max_depth', 1000)  # Levels kept per side
+        self._orderbook_publish_levels = getattr(settings, 'mexc_orderbook_publish_levels', 20)  # Levels per side in events
         self._orderbook_locks: Dict[str, asyncio.Lock] = {}  # Per-symbol locks for concurrent orderbook updates
         self._orderbook_versions = {}  # symbol -> last_processed_version for delta synchronization
         
@@ -609,6 +618,22 @@ class MexcWebSocketAdapter(IMarketDataProvider):
         """Update expiry time for tracking structures to prevent memory leaks"""
         self._tracking_expiry[symbol] = time.time() + self._max_tracking_age
 
+    def _get_or_create_orderbook(self, symbol: str) -> OrderBook:
+        """Get or create the cached orderbook for a symbol (call with the symbol's lock held)."""
+        book = self._orderbook_cache.get(symbol)
+        if book is None:
+            book = self._orderbook_cache[symbol] = OrderBook(symbol, max_depth=self._orderbook_max_depth)
+        return book
+
+    def get_orderbook(self, symbol: str) -> Optional[OrderBook]:
+        """
+        Cached orderbook for a symbol, for top-N / mid / spread / depth queries.
+
+        The book is updated in place by depth messages; read it without
+        awaiting in between to get a consistent view.
+        """
+        return self._orderbook_cache.get(symbol.upper())
+
     def _get_orderbook_lock(self, symbol: str) -> asyncio.Lock:
         """
         Get or create a per-symbol lock for orderbook updates.
@@ -856,13 +881,21 @@ class MexcWebSocketAdapter(IMarketDataProvider):
         max_transient_errors = 10
         max_json_errors = 5
 
+        # ✅ PERFORMANCE: Receive on a reader task and handle every frame buffered
+        # since the last batch in one pass (one await per batch, not per frame)
+        reader = FrameBatchReader(websocket, max_batch=self._message_batch_size)
+
         try:
-            async for message in websocket:
+            while True:
+                batch = await reader.next_batch()
+                if not batch:
+                    break  # Stream ended (connection closed normally)
+                message = batch[-1]  # Sample for error logs
                 try:
-                    # BUG-008-6 AC4: _handle_message returns True if data message received
+                    # BUG-008-6 AC4: _handle_message_batch returns True if data message received
                     # Only data messages (trade, orderbook) reset activity timer
                     # Ping/pong does NOT reset timer (distinguishes quiet market vs dead connection)
-                    is_data_message = await self._handle_message(message, connection_id)
+                    is_data_message = await self._handle_message_batch(batch, connection_id)
                     if is_data_message:
                         connection_info["last_heartbeat"] = time.time()
                     # Reset error counters on successful processing
@@ -960,6 +993,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             })
             await self._handle_connection_error(connection_id, e)
         finally:
+            await reader.close()
             # Mark connection as disconnected with proper locking
             if connection_id in self._connections:
                 async with self._connections[connection_id]["state_lock"]:
@@ -1222,6 +1256,27 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                 await self._close_connection(connection_id)
                 break
 
+    async def _safe_publish_many(self, event_type: str, items: List[dict]) -> None:
+        """
+        ✅ PERF FIX: Fire-and-forget publishing of a burst of high-frequency events.
+
+        One EventBus.publish_many() call for all items, under the same 50ms
+        failsafe timeout as a single high-frequency publish; the burst is dropped
+        on timeout or error (no retries).
+        """
+        try:
+            await asyncio.wait_for(self.event_bus.publish_many(event_type, items), timeout=0.05)
+        except asyncio.TimeoutError:
+            await self._handle_backpressure(event_type, items[-1])
+        except Exception as e:
+            self.logger.error("mexc_adapter.event_publish_error", {
+                "event_type": event_type,
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "symbol": items[-1].get("symbol", "unknown"),
+                "batch_size": len(items)
+            })
+
     async def _safe_publish_event(self, event_type: str, data: dict, max_retries: int = 0) -> None:
         """
         ✅ PERF FIX: Fire-and-forget event publishing for real-time trading.
@@ -1324,103 +1379,61 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             True if data message received (resets activity timer)
             False if non-data message (does NOT reset activity timer)
         """
+        return await self._handle_message_batch([message], connection_id)
+
+    async def _handle_message_batch(self, messages: List[str], connection_id: int) -> bool:
+        """
+        Handle a batch of frames drained from one connection, in arrival order.
+
+        ✅ PERFORMANCE: Frames are decoded inline (no thread handoff, so order is
+        preserved). push.deal price updates are collected per symbol and published
+        with one publish_many() per symbol; push.depth / push.depth.full are applied
+        to the orderbook in order and each touched symbol's book is published once,
+        with its state after the whole batch.
+
+        Returns:
+            True if any frame was a data message (resets activity timer)
+        """
         # ✅ FIX (Propozycja #1B): Increment counter to track in-flight message processing
         # This prevents race condition: _close_connection() will wait for this to complete
         self._message_processing_count[connection_id] = (
             self._message_processing_count.get(connection_id, 0) + 1
         )
 
-        is_data_message = False  # BUG-008-6: Track if this is a data message
+        is_data_message = False  # BUG-008-6: Track if any frame is a data message
+        stats = self._stream_stats.get(connection_id)
+        if stats is None:
+            stats = self._stream_stats[connection_id] = MessageStreamStats()
+        price_updates: Dict[str, List[dict]] = {}  # symbol -> deal price updates, in order
+        depth_symbols: Dict[str, None] = {}  # Ordered set of symbols with a changed book
 
         try:
-            # Offload JSON parsing to thread pool for performance
-            data = await asyncio.to_thread(json.loads, message)
-            
-            # Rate-limited debug logging for messages (every 100th message)
-            self._message_count += 1
-            if self.logger.logger.isEnabledFor(logging.DEBUG) and self._message_count % 100 == 0:
-                self.logger.debug("mexc_adapter.message_batch", {
-                    "connection_id": connection_id,
-                    "messages_processed": self._message_count,
-                    "last_message_keys": list(data.keys()) if isinstance(data, dict) else "not_dict",
-                    "last_message_sample": str(message)[:200]  # Reduced from 500 to 200 chars
-                })
-            
-            # Handle subscription responses (futures format)
-            if "channel" in data:
-                channel = data.get("channel")
-                
-                # Handle subscription confirmations
-                if channel.startswith("rs."):
-                    await self._handle_futures_subscription_response(data, connection_id)
-                
-                # Handle market data - futures deal format
-                elif channel == "push.deal":
-                    symbol = data.get("symbol", "")
-                    await self._handle_futures_deal_data(data)
-                    # BUG-008-6: Track message type and check false positives
-                    self._record_message_type(connection_id, "trade")
-                    self._check_false_positive_on_data(symbol, connection_id)
-                    is_data_message = True  # AC4: Trade data resets activity timer
-
-                # Handle market data - futures depth format
-                # ✅ CORRECTED: MEXC uses TWO separate channels for orderbook data:
-                # - push.depth: incremental deltas (from sub.depth) - MERGE with cache
-                # - push.depth.full: full snapshots (from sub.depth.full) - RESET cache
-                # Both channels exist and serve different purposes (verified by test_mexc_depth_subscription.py)
-                elif channel == "push.depth":
-                    symbol = data.get("symbol", "")
-                    await self._handle_futures_depth_data(data, is_snapshot=False)
-                    # BUG-008-6: Track message type and check false positives
-                    self._record_message_type(connection_id, "orderbook")
-                    self._check_false_positive_on_data(symbol, connection_id)
-                    is_data_message = True  # AC4: Orderbook data resets activity timer
-
-                # Handle market data - futures depth full snapshot format
-                elif channel == "push.depth.full":
-                    symbol = data.get("symbol", "")
-                    await self._handle_futures_depth_data(data, is_snapshot=True)
-                    # BUG-008-6: Track message type and check false positives
-                    self._record_message_type(connection_id, "depth_snapshot")
-                    self._check_false_positive_on_data(symbol, connection_id)
-                    is_data_message = True  # AC4: Depth snapshot resets activity timer
-
-                # Handle pong messages - update last_pong_received to track connection health
-                elif channel == "pong":
-                    if connection_id in self._connections:
-                        self._connections[connection_id]["last_pong_received"] = time.time()
-                    # BUG-008-6: Track ping/pong (does NOT reset activity timer per AC4)
-                    self._record_message_type(connection_id, "ping_pong")
-                    # AC4: Pong does NOT set is_data_message - it does NOT reset activity timer
-
-                    self.logger.debug("mexc_adapter.pong_received", {
-                        "connection_id": connection_id,
-                        "timestamp": data.get("data")
-                    })
-                
-                else:
-                    self.logger.debug("mexc_adapter.unknown_channel", {
+            for message in messages:
+                data = self._decode_message(message, connection_id, stats)
+                if data is None:
+                    continue
+                try:
+                    if await self._dispatch_message(data, message, connection_id, price_updates, depth_symbols):
+                        is_data_message = True
+                except Exception as e:
+                    self.logger.error("mexc_adapter.message_processing_error", {
                         "connection_id": connection_id,
-                        "channel": channel
+                        "error": str(e),
+                        "message": str(message)[:200]
                     })
-            
-            else:
-                self.logger.warning("mexc_adapter.unknown_message_format", {
-                    "connection_id": connection_id,
-                    "keys": list(data.keys()) if isinstance(data, dict) else "not_dict",
-                    "full_message": message
-                })
-                
-        except json.JSONDecodeError:
-            self.logger.warning("mexc_adapter.invalid_json", {
-                "connection_id": connection_id,
-                "message": message[:200]
-            })
+            stats.record_batch(len(messages))
+
+            # ✅ PERF FIX: Fire-and-forget async publishing for zero latency
+            for updates in price_updates.values():
+                asyncio.create_task(self._safe_publish_many("market.price_update", updates))
+            for symbol in depth_symbols:
+                await self._publish_orderbook_from_cache(symbol)
+
         except Exception as e:
-            self.logger.error("mexc_adapter.message_processing_error", {
+            self.logger.error("mexc_adapter.message_batch_error", {
                 "connection_id": connection_id,
-                "error": str(e),
-                "message": message[:200]
+                "batch_size": len(messages),
+                "error": str(e)
             })
         finally:
             # ✅ FIX (Propozycja #1B): Decrement counter - message processing complete
@@ -1430,9 +1443,107 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             else:
                 self._message_processing_count[connection_id] = count
 
-        # BUG-008-6 AC4: Return whether this was a data message
+        # BUG-008-6 AC4: Return whether this batch contained a data message
         return is_data_message
 
+    def _decode_message(self, message: str, connection_id: int, stats: MessageStreamStats) -> Optional[Any]:
+        """Decode one frame inline, recording parse latency; None if it is not valid JSON."""
+        start_ns = time.perf_counter_ns()
+        try:
+            data = decode_json(message)
+        except json.JSONDecodeError:
+            stats.record_parse(time.perf_counter_ns() - start_ns, ok=False)
+            self.logger.warning("mexc_adapter.invalid_json", {
+                "connection_id": connection_id,
+                "message": str(message)[:200]
+            })
+            return None
+        stats.record_parse(time.perf_counter_ns() - start_ns)
+        return data
+
+    async def _dispatch_message(self, data: Any, message: str, connection_id: int,
+                                price_updates: Dict[str, List[dict]], depth_symbols: Dict[str, None]) -> bool:
+        """
+        Route one decoded frame by channel.
+
+        Deal price updates are appended to `price_updates` and symbols whose
+        orderbook changed are added to `depth_symbols`; the caller publishes both.
+
+        Returns:
+            True if data message (resets activity timer)
+        """
+        # Rate-limited debug logging for messages (every 100th message)
+        self._message_count += 1
+        if self.logger.logger.isEnabledFor(logging.DEBUG) and self._message_count % 100 == 0:
+            self.logger.debug("mexc_adapter.message_batch", {
+                "connection_id": connection_id,
+                "messages_processed": self._message_count,
+                "last_message_keys": list(data.keys()) if isinstance(data, dict) else "not_dict",
+                "last_message_sample": str(message)[:200]  # Reduced from 500 to 200 chars
+            })
+
+        if not isinstance(data, dict) or "channel" not in data:
+            self.logger.warning("mexc_adapter.unknown_message_format", {
+                "connection_id": connection_id,
+                "keys": list(data.keys()) if isinstance(data, dict) else "not_dict",
+                "full_message": message
+            })
+            return False
+
+        # Handle subscription responses (futures format)
+        channel = data.get("channel")
+
+        # Handle subscription confirmations
+        if channel.startswith("rs."):
+            await self._handle_futures_subscription_response(data, connection_id)
+            return False
+
+        # Handle market data - futures deal format
+        if channel == "push.deal":
+            symbol = data.get("symbol", "")
+            updates = await self._handle_futures_deal_data(data, publish=False)
+            if updates:
+                price_updates.setdefault(symbol, []).extend(updates)
+            # BUG-008-6: Track message type and check false positives
+            self._record_message_type(connection_id, "trade")
+            self._check_false_positive_on_data(symbol, connection_id)
+            return True  # AC4: Trade data resets activity timer
+
+        # Handle market data - futures depth format
+        # ✅ CORRECTED: MEXC uses TWO separate channels for orderbook data:
+        # - push.depth: incremental deltas (from sub.depth) - MERGE with cache
+        # - push.depth.full: full snapshots (from sub.depth.full) - RESET cache
+        # Both channels exist and serve different purposes (verified by test_mexc_depth_subscription.py)
+        if channel in ("push.depth", "push.depth.full"):
+            symbol = data.get("symbol", "")
+            is_snapshot = channel == "push.depth.full"
+            if await self._handle_futures_depth_data(data, is_snapshot=is_snapshot, publish=False):
+                depth_symbols[symbol] = None
+            # BUG-008-6: Track message type and check false positives
+            self._record_message_type(connection_id, "depth_snapshot" if is_snapshot else "orderbook")
+            self._check_false_positive_on_data(symbol, connection_id)
+            return True  # AC4: Orderbook data / depth snapshot resets activity timer
+
+        # Handle pong messages - update last_pong_received to track connection health
+        if channel == "pong":
+            if connection_id in self._connections:
+                self._connections[connection_id]["last_pong_received"] = time.time()
+            # BUG-008-6: Track ping/pong (does NOT reset activity timer per AC4)
+            self._record_message_type(connection_id, "ping_pong")
+            # AC4: Pong does NOT set is_data_message - it does NOT reset activity timer
+
+            self.logger.debug("mexc_adapter.pong_received", {
+                "connection_id": connection_id,
+                "timestamp": data.get("data")
+            })
+            return False
+
+        self.logger.debug("mexc_adapter.unknown_channel", {
+            "connection_id": connection_id,
+            "channel": channel
+        })
+        return False
+
     async def _handle_futures_subscription_response(self, data: dict, connection_id: int) -> None:
         """
         Handle futures subscription/unsubscription responses.
@@ -1458,8 +1569,19 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             connection_id=connection_id
         )
     
-    async def _handle_futures_deal_data(self, data: dict) -> None:
-        """Handle futures deal data (transaction data)"""
+    async def _handle_futures_deal_data(self, data: dict, publish: bool = True) -> List[dict]:
+        """
+        Handle futures deal data (transaction data).
+
+        Args:
+            data: push.deal message
+            publish: Publish the price updates here; batch handling passes False
+                and publishes them per symbol itself
+
+        Returns:
+            market.price_update events built from the message's deals
+        """
+        price_updates = []
         try:
             symbol = data.get("symbol", "")
             deal_list = data.get("data", [])
@@ -1469,7 +1591,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                     "symbol": symbol,
                     "has_data": bool(deal_list)
                 })
-                return
+                return price_updates
             
             # Process each deal in the list (data can contain multiple deals)
             for deal_data in deal_list:
@@ -1507,9 +1629,8 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                         self._debug_log_rates[publish_log_key] = current_time
                         self._update_tracking_expiry(publish_log_key)
                     
-                    # ✅ PERF FIX: Fire-and-forget async publishing for zero latency
-                    # No batching - trading requires real-time data delivery
-                    asyncio.create_task(self._safe_publish_event("market.price_update", {
+                    # Collected and published once per message (see below)
+                    price_updates.append({
                         "exchange": "mexc",
                         "symbol": symbol,
                         "price": price,
@@ -1520,7 +1641,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                         "source": "futures_deal",
                         "mexc_timestamp": timestamp,  # Original MEXC timestamp in ms
                         "system_timestamp": time.time()  # Our system timestamp for comparison
-                    }))
+                    })
                     
                     # Rate-limited debug logging for price updates (max once per minute per symbol)
                     current_time = time.time()
@@ -1535,16 +1656,34 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                         })
                         self._debug_log_rates[symbol] = current_time
                         self._update_tracking_expiry(symbol)
-                
+
+            # ✅ PERF FIX: Fire-and-forget async publishing for zero latency
+            # All deals of one push message travel as a single publish_many() burst
+            if price_updates and publish:
+                asyncio.create_task(self._safe_publish_many("market.price_update", price_updates))
+
         except Exception as e:
             self.logger.error("mexc_adapter.futures_deal_processing_error", {
                 "symbol": data.get("symbol", ""),
                 "error": str(e),
                 "data": data
             })
+        return price_updates
+
+    async def _handle_futures_depth_data(self, data: dict, is_snapshot: bool = False, publish: bool = True) -> bool:
+        """
+        Handle futures depth data (order book data) with proper snapshot/delta logic.
 
-    async def _handle_futures_depth_data(self, data: dict, is_snapshot: bool = False) -> None:
-        """Handle futures depth data (order book data) with proper snapshot/delta logic"""
+        Args:
+            data: push.depth / push.depth.full message
+            is_snapshot: Replace the book instead of merging
+            publish: Publish the updated book here; batch handling passes False
+                and publishes each changed book once per batch
+
+        Returns:
+            True if the cached orderbook was updated
+        """
+        applied = False
         try:
             symbol = data.get("symbol", "")
             depth_data = data.get("data", {})
@@ -1555,7 +1694,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                     "has_data": bool(depth_data),
                     "is_snapshot": is_snapshot
                 })
-                return
+                return applied
             
             # Extract order book data from futures format
             asks = depth_data.get("asks", [])
@@ -1565,10 +1704,14 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             # Process orderbook with proper snapshot/delta logic
             if is_snapshot:
                 # Full snapshot - reset orderbook state
-                await self._process_orderbook_snapshot(symbol, {"asks": asks, "bids": bids, "version": version})
+                applied = await self._process_orderbook_snapshot(
+                    symbol, {"asks": asks, "bids": bids, "version": version}, publish=publish
+                )
             else:
                 # Delta update - merge with existing state
-                await self._process_orderbook_delta(symbol, {"asks": asks, "bids": bids, "version": version})
+                applied = await self._process_orderbook_delta(
+                    symbol, {"asks": asks, "bids": bids, "version": version}, publish=publish
+                )
                 
             # Rate-limited debug logging for depth updates (max once per minute per symbol)
             current_time = time.time()
@@ -1592,6 +1735,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                 "data": data,
                 "is_snapshot": is_snapshot
             })
+        return applied
 
     async def _handle_subscription_response(self, data: dict, connection_id: int) -> None:
         """Handle subscription/unsubscription responses"""
@@ -1644,7 +1788,8 @@ class MexcWebSocketAdapter(IMarketDataProvider):
         """Process aggregated deals data (price updates) - FIXED attribute parsing"""
         try:
             deals = data.get("deals", [])
-            
+            price_updates = []
+
             for deal in deals:
                 # FIXED: Use correct MEXC API attribute names
                 price = float(deal.get("p", 0))      # price
@@ -1654,8 +1799,8 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                 timestamp = int(deal.get("t", 0))    # timestamp
                 
                 if price > 0 and volume > 0:
-                    # Publish price update event via EventBus (no cache - EventBus is source of truth)
-                    await self._safe_publish_event("market.price_update", {
+                    # Price update event for EventBus (no cache - EventBus is source of truth)
+                    price_updates.append({
                         "exchange": "mexc",
                         "symbol": symbol,
                         "price": price,
@@ -1672,7 +1817,10 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                         "volume": volume,
                         "side": side
                     })
-                    
+
+            if price_updates:
+                await self._safe_publish_many("market.price_update", price_updates)
+
         except Exception as e:
             self.logger.error("mexc_adapter.deals_processing_error", {
                 "symbol": symbol,
@@ -1722,16 +1870,16 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             bids_raw = data.get("bids", [])
             asks_raw = data.get("asks", [])
             
-            # Safely parse bids and asks - increased to TOP 20 for better market depth
+            # Safely parse bids and asks (full depth is kept in the book)
             bids = []
             asks = []
             
-            for bid in bids_raw[:20]:  # ✅ INCREASED: TOP 20 levels for better depth
+            for bid in bids_raw:
                 parsed_bid = self._safe_parse_orderbook_level(bid)
                 if parsed_bid:
                     bids.append(parsed_bid)
             
-            for ask in asks_raw[:20]:  # ✅ INCREASED: TOP 20 levels for better depth
+            for ask in asks_raw:
                 parsed_ask = self._safe_parse_orderbook_level(ask)
                 if parsed_ask:
                     asks.append(parsed_ask)
@@ -1739,30 +1887,20 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             # ✅ CACHE UPDATE: Maintain full orderbook state
             # ✅ PERF FIX: Per-symbol lock instead of global lock (eliminates contention)
             async with self._get_orderbook_lock(symbol):
-                if symbol not in self._orderbook_cache:
-                    # ✅ FIX: Initialize with OrderedDict for consistency with snapshot/delta processing
-                    self._orderbook_cache[symbol] = {
-                        "bids": OrderedDict(),
-                        "asks": OrderedDict(),
-                        "version": 0,
-                        "timestamp": time.time()
-                    }
-
-                cache_entry = self._orderbook_cache[symbol]
-                current_time = time.time()
+                book = self._get_or_create_orderbook(symbol)
 
-                # Update cache with new data (only if we received that side)
-                # Convert list format to OrderedDict
-                if bids:  # Update bids only if MEXC sent them
-                    cache_entry["bids"] = OrderedDict((str(float(price)), float(qty)) for price, qty in bids)
-                if asks:  # Update asks only if MEXC sent them
-                    cache_entry["asks"] = OrderedDict((str(float(price)), float(qty)) for price, qty in asks)
-
-                cache_entry["timestamp"] = current_time
+                # Update cache with new data (only the sides MEXC sent)
+                book.replace_sides(bids, asks)
+                current_time = book.timestamp
                 
                 # ✅ COMPLETE ORDERBOOK: Always publish with both sides from cache
-                final_bids = cache_entry["bids"]
-                final_asks = cache_entry["asks"]
+                final_bids, final_asks = book.top(self._orderbook_publish_levels)
+                book_stats = {
+                    "mid_price": book.mid_price(),
+                    "spread": book.spread(),
+                    "bid_depth": book.bids.cumulative_depth(self._orderbook_publish_levels),
+                    "ask_depth": book.asks.cumulative_depth(self._orderbook_publish_levels),
+                }
             
             # Publish orderbook update with guaranteed complete data
             if final_bids or final_asks:
@@ -1774,6 +1912,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                     "asks": final_asks,  # Always complete from cache
                     "best_bid": final_bids[0][0] if final_bids else 0,
                     "best_ask": final_asks[0][0] if final_asks else 0,
+                    **book_stats,
                     "timestamp": current_time,
                     "source": "orderbook",
                     "levels_parsed": {
@@ -1823,8 +1962,8 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                 "error": str(e)
             })
 
-    async def _process_orderbook_snapshot(self, symbol: str, data: dict) -> None:
-        """Process full orderbook snapshot - completely replace cached state"""
+    async def _process_orderbook_snapshot(self, symbol: str, data: dict, publish: bool = True) -> bool:
+        """Process full orderbook snapshot - completely replace cached state; returns True if applied"""
         try:
             bids_raw = data.get("bids", [])
             asks_raw = data.get("asks", [])
@@ -1844,39 +1983,34 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                 if parsed_ask:
                     asks.append(parsed_ask)
             
-            # Sort orderbook levels properly
-            bids.sort(key=lambda x: float(x[0]), reverse=True)  # Highest price first
-            asks.sort(key=lambda x: float(x[0]))  # Lowest price first
-
             # ✅ PERF FIX: Per-symbol lock instead of global lock
             async with self._get_orderbook_lock(symbol):
-                # Create new cache state from snapshot
-                self._orderbook_cache[symbol] = {
-                    "bids": OrderedDict((str(float(price)), float(qty)) for price, qty in bids),
-                    "asks": OrderedDict((str(float(price)), float(qty)) for price, qty in asks),
-                    "version": version,
-                    "timestamp": time.time()
-                }
+                # Replace cached state from snapshot (levels are sorted once here)
+                book = self._get_or_create_orderbook(symbol)
+                book.apply_snapshot(bids, asks, version)
                 self._orderbook_versions[symbol] = version
                 
                 self.logger.debug("mexc_adapter.orderbook_snapshot_processed", {
                     "symbol": symbol,
-                    "bid_levels": len(bids),
-                    "ask_levels": len(asks),
+                    "bid_levels": len(book.bids),
+                    "ask_levels": len(book.asks),
                     "version": version
                 })
             
             # Publish updated orderbook
-            await self._publish_orderbook_from_cache(symbol)
+            if publish:
+                await self._publish_orderbook_from_cache(symbol)
+            return True
             
         except Exception as e:
             self.logger.error("mexc_adapter.orderbook_snapshot_error", {
                 "symbol": symbol,
                 "error": str(e)
             })
+            return False
 
-    async def _process_orderbook_delta(self, symbol: str, data: dict) -> None:
-        """Process incremental orderbook delta - merge with cached state"""
+    async def _process_orderbook_delta(self, symbol: str, data: dict, publish: bool = True) -> bool:
+        """Process incremental orderbook delta - merge with cached state; returns True if applied"""
         try:
             bids_raw = data.get("bids", [])
             asks_raw = data.get("asks", [])
@@ -1890,7 +2024,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                     "delta_version": version,
                     "last_version": last_version
                 })
-                return
+                return False
             
             # Parse delta levels
             bid_updates = []
@@ -1909,49 +2043,11 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             # ✅ PERF FIX: Per-symbol lock instead of global lock
             async with self._get_orderbook_lock(symbol):
                 # Initialize cache if not exists (fallback)
-                if symbol not in self._orderbook_cache:
-                    self._orderbook_cache[symbol] = {
-                        "bids": OrderedDict(),
-                        "asks": OrderedDict(),
-                        "version": 0,
-                        "timestamp": time.time()
-                    }
-                
-                cache_entry = self._orderbook_cache[symbol]
-                
-                # Apply bid updates
-                for price, qty in bid_updates:
-                    price_str = str(float(price))
-                    if float(qty) == 0:
-                        # Remove level
-                        cache_entry["bids"].pop(price_str, None)
-                    else:
-                        # Add/update level
-                        cache_entry["bids"][price_str] = float(qty)
-                
-                # Apply ask updates
-                for price, qty in ask_updates:
-                    price_str = str(float(price))
-                    if float(qty) == 0:
-                        # Remove level
-                        cache_entry["asks"].pop(price_str, None)
-                    else:
-                        # Add/update level
-                        cache_entry["asks"][price_str] = float(qty)
-                
-                # Sort and maintain top levels only (limit memory usage)
-                cache_entry["bids"] = OrderedDict(
-                    sorted(cache_entry["bids"].items(), 
-                           key=lambda x: float(x[0]), reverse=True)[:20]
-                )
-                cache_entry["asks"] = OrderedDict(
-                    sorted(cache_entry["asks"].items(), 
-                           key=lambda x: float(x[0]))[:20]
-                )
-                
-                # Update version and timestamp
-                cache_entry["version"] = version
-                cache_entry["timestamp"] = time.time()
+                book = self._get_or_create_orderbook(symbol)
+
+                # ✅ PERFORMANCE: Each changed level is bisected into place (qty 0 removes it);
+                # the book is never re-sorted and keeps depth beyond the published levels
+                book.apply_delta(bid_updates, ask_updates, version)
                 self._orderbook_versions[symbol] = version
                 
                 self.logger.debug("mexc_adapter.orderbook_delta_processed", {
@@ -1959,31 +2055,33 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                     "bid_updates": len(bid_updates),
                     "ask_updates": len(ask_updates),
                     "version": version,
-                    "total_bid_levels": len(cache_entry["bids"]),
-                    "total_ask_levels": len(cache_entry["asks"])
+                    "total_bid_levels": len(book.bids),
+                    "total_ask_levels": len(book.asks)
                 })
             
             # Publish updated orderbook
-            await self._publish_orderbook_from_cache(symbol)
+            if publish:
+                await self._publish_orderbook_from_cache(symbol)
+            return True
             
         except Exception as e:
             self.logger.error("mexc_adapter.orderbook_delta_error", {
                 "symbol": symbol,
                 "error": str(e)
             })
+            return False
 
     async def _publish_orderbook_from_cache(self, symbol: str) -> None:
         """Publish orderbook update from cache"""
         try:
             # ✅ PERF FIX: Per-symbol lock instead of global lock
             async with self._get_orderbook_lock(symbol):
-                cache_entry = self._orderbook_cache.get(symbol)
-                if not cache_entry:
+                book = self._orderbook_cache.get(symbol)
+                if book is None:
                     return
                 
-                # Convert OrderedDict back to list format for publishing with numeric prices
-                bids = [(float(price), qty) for price, qty in cache_entry["bids"].items()]
-                asks = [(float(price), qty) for price, qty in cache_entry["asks"].items()]
+                # Top levels as (price, qty) lists, best first
+                bids, asks = book.top(self._orderbook_publish_levels)
                 
                 if not bids and not asks:
                     return
@@ -1997,14 +2095,18 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                     "asks": asks,
                     "best_bid": bids[0][0] if bids else 0,
                     "best_ask": asks[0][0] if asks else 0,
-                    "timestamp": cache_entry["timestamp"],
+                    "mid_price": book.mid_price(),
+                    "spread": book.spread(),
+                    "bid_depth": book.bids.cumulative_depth(self._orderbook_publish_levels),
+                    "ask_depth": book.asks.cumulative_depth(self._orderbook_publish_levels),
+                    "timestamp": book.timestamp,
                     "source": "orderbook_cache",
-                    "version": cache_entry["version"],
+                    "version": book.version,
                     "levels_parsed": {
                         "bids": len(bids),
                         "asks": len(asks),
-                        "total_bids": len(cache_entry["bids"]),
-                        "total_asks": len(cache_entry["asks"])
+                        "total_bids": len(book.bids),
+                        "total_asks": len(book.asks)
                     }
                 }))
                 
@@ -2359,6 +2461,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
 
         # Clean up pending subscriptions for this connection
         self._pending_subscriptions.pop(connection_id, None)
+        self._stream_stats.pop(connection_id, None)
         
         # Remove connection
         del self._connections[connection_id]
@@ -2652,6 +2755,10 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             }
         }
 
+    def get_message_stream_stats(self) -> Dict[int, Dict[str, Any]]:
+        """Per-connection msgs/s, batch sizes and JSON parse latency percentiles"""
+        return {conn_id: stats.snapshot() for conn_id, stats in self._stream_stats.items()}
+
     def get_detailed_metrics(self) -> dict:
         """Get detailed performance metrics including circuit breaker, rate limiter, and cache statistics"""
         uptime_seconds = time.time() - self._start_time
@@ -2689,6 +2796,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
             },
             "circuit_breaker": self.circuit_breaker.get_stats(),
             "rate_limiter": self.subscription_rate_limiter.get_stats(),
+            "message_stream": self.get_message_stream_stats(),
             "reliability": {
                 "circuit_breaker_state": self.circuit_breaker.get_state(),
                 "rate_limit_tokens_available": round(float(self.subscription_rate_limiter.tokens), 2),
@@ -2877,7 +2985,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                         bids = []
                         asks = []
                         
-                        for bid_raw in bids_raw[:20]:
+                        for bid_raw in bids_raw:
                             if len(bid_raw) >= 2:
                                 try:
                                     price = float(bid_raw[0])
@@ -2887,7 +2995,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                                 except (ValueError, TypeError):
                                     continue
                         
-                        for ask_raw in asks_raw[:20]:
+                        for ask_raw in asks_raw:
                             if len(ask_raw) >= 2:
                                 try:
                                     price = float(ask_raw[0])
@@ -2901,20 +3009,7 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                         if bids or asks:
                             # ✅ PERF FIX: Per-symbol lock instead of global lock
                             async with self._get_orderbook_lock(symbol):
-                                if symbol not in self._orderbook_cache:
-                                    # ✅ FIX: Initialize with OrderedDict for consistency with snapshot/delta processing
-                                    self._orderbook_cache[symbol] = {
-                                        "bids": OrderedDict(),
-                                        "asks": OrderedDict(),
-                                        "version": 0,
-                                        "timestamp": time.time()
-                                    }
-
-                                cache_entry = self._orderbook_cache[symbol]
-                                # Convert list format to OrderedDict
-                                cache_entry["bids"] = OrderedDict((str(float(price)), float(qty)) for price, qty in bids)
-                                cache_entry["asks"] = OrderedDict((str(float(price)), float(qty)) for price, qty in asks)
-                                cache_entry["timestamp"] = time.time()
+                                self._get_or_create_orderbook(symbol).replace_sides(bids, asks)
                                 
                             self.logger.debug("mexc_adapter.orderbook_refreshed_from_rest", {
                                 "symbol": symbol,
@@ -2952,12 +3047,11 @@ class MexcWebSocketAdapter(IMarketDataProvider):
                         break
 
                     # Check if cache is stale (older than 2 minutes)
-                    # ✅ PERF FIX: Per-symbol lock instead of global lock
-                    async with self._get_orderbook_lock(symbol):
-                        if symbol in self._orderbook_cache:
-                            cache_age = time.time() - self._orderbook_cache[symbol]["timestamp"]
-                            if cache_age > 120:  # 2 minutes
-                                await self._refresh_orderbook_from_rest(symbol)
+                    # ✅ FIX: Refresh outside the per-symbol lock - the refresh takes the
+                    # same (non-reentrant) lock to update the book
+                    book = self._orderbook_cache.get(symbol)
+                    if book is not None and time.time() - book.timestamp > 120:  # 2 minutes
+                        await self._refresh_orderbook_from_rest(symbol)
                     
                     # Small delay between symbols to avoid rate limits
                     await asyncio.sleep(0.1)
@@ -22,6 +22,7 @@ Features:
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 from ..data_feed.questdb_provider import QuestDBProvider
@@ -50,6 +51,57 @@ class IndicatorSnapshot:
     indicators: Dict[str, float]  # {indicator_id: value}
 
 
+@dataclass
+class PriceColumns:
+    """
+    OHLCV for several symbols aligned on one time axis.
+
+    Each price array has shape (len(symbols), len(timestamps)); a symbol
+    without a candle at a timestamp holds NaN there.
+    """
+    symbols: List[str]
+    timestamps: List[datetime]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, symbols: List[str]) -> "PriceColumns":
+        """Pivot long-format rows (timestamp, symbol, OHLCV) onto a unified time axis."""
+        if df.empty:
+            empty = np.empty((len(symbols), 0))
+            return cls(symbols, [], empty, empty, empty, empty, empty)
+
+        timestamps = df["timestamp"]
+        if pd.api.types.is_numeric_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps, unit="s", utc=True)
+        else:
+            timestamps = pd.to_datetime(timestamps, utc=True)
+
+        wide = df.assign(timestamp=timestamps).pivot_table(
+            index="timestamp", columns="symbol",
+            values=["open", "high", "low", "close", "volume"], aggfunc="last"
+        ).sort_index()
+
+        def field(name: str) -> np.ndarray:
+            return wide[name].reindex(columns=symbols).to_numpy(dtype=float).T.copy()
+
+        return cls(
+            symbols=list(symbols),
+            timestamps=[ts.to_pydatetime() for ts in wide.index],
+            open=field("open"),
+            high=field("high"),
+            low=field("low"),
+            close=field("close"),
+            volume=field("volume"),
+        )
+
+
 class BacktestMarketDataProvider:
     """
     Provides historical market data and indicators from QuestDB.
@@ -247,6 +299,38 @@ class BacktestMarketDataProvider:
             })
             return []
 
+    async def get_price_columns(
+        self,
+        symbols: List[str],
+        start_time: datetime,
+        end_time: datetime,
+        timeframe: str = "1m"
+    ) -> PriceColumns:
+        """
+        Load OHLCV for all symbols with one query into aligned columnar arrays.
+
+        Used by portfolio backtests that step many symbols on a shared time axis.
+        """
+        try:
+            df = await self.db_provider.get_ohlcv_resample_multi(
+                symbols=symbols,
+                interval=timeframe,
+                start_time=start_time,
+                end_time=end_time
+            )
+            return PriceColumns.from_frame(df, symbols)
+
+        except Exception as e:
+            logger.error("error_querying_price_columns", {
+                "symbols": symbols,
+                "start_time": start_time.isoformat() if start_time else None,
+                "end_time": end_time.isoformat() if end_time else None,
+                "timeframe": timeframe,
+                "error": str(e),
+                "error_type": type(e).__name__
+            })
+            return PriceColumns.from_frame(pd.DataFrame(), symbols)
+
     async def get_indicators_at_time(
         self,
         symbol: str,
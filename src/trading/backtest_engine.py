@@ -23,10 +23,17 @@ from enum import Enum
 from typing import Dict, Any, List, Optional, Tuple
 from uuid import uuid4
 
+import numpy as np
+
 from src.core.logger import StructuredLogger, get_logger
 from src.core.event_bus import EventBus
 from src.data_feed.questdb_provider import QuestDBProvider
-from src.trading.backtest_data_provider_questdb import BacktestMarketDataProvider
+from src.trading.backtest_data_provider_questdb import (
+    BacktestMarketDataProvider,
+    MarketDataSnapshot,
+    PriceColumns
+)
+from src.trading.backtest_result_sink import BacktestResultSink
 from src.domain.services.backtest_order_manager import (
     BacktestOrderManager,
     OrderType,
@@ -46,6 +53,11 @@ class BacktestStatus(Enum):
     STOPPED = "stopped"
 
 
+def _split_ids(value: str) -> List[str]:
+    """Split a comma-separated session column ("BTC_USDT,ETH_USDT") into unique ids."""
+    return list(dict.fromkeys(part.strip() for part in (value or "").split(",") if part.strip()))
+
+
 @dataclass
 class BacktestConfig:
     """Configuration for a backtest session"""
@@ -58,7 +70,23 @@ class BacktestConfig:
     initial_balance: float = 10000.0
     stop_loss_percent: float = 5.0
     take_profit_percent: float = 10.0
+    entry_momentum_pct: float = 0.1  # Minimum candle body move (%) for entry
+    entry_volume_ratio: float = 1.5  # Minimum volume / running average volume for entry
+    position_size_pct: float = 2.0  # Position notional as % of initial balance
     timeframe: str = "1m"  # Candle timeframe for processing
+    symbols: List[str] = field(default_factory=list)  # Portfolio mode: all symbols
+    strategy_ids: List[str] = field(default_factory=list)  # Portfolio mode: all strategies
+
+    def __post_init__(self):
+        if not self.symbols:
+            self.symbols = _split_ids(self.symbol)
+        if not self.strategy_ids:
+            self.strategy_ids = _split_ids(self.strategy_id)
+
+    @property
+    def is_portfolio(self) -> bool:
+        """True when the session covers more than one symbol or strategy"""
+        return len(self.symbols) > 1 or len(self.strategy_ids) > 1
 
 
 @dataclass
@@ -109,6 +137,7 @@ class TradeRecord:
     entry_time: Optional[datetime] = None
     exit_time: Optional[datetime] = None
     strategy_signal: str = ""
+    strategy_id: str = ""
 
 
 @dataclass
@@ -128,6 +157,8 @@ class BacktestResult:
     strategy_id: str
     start_date: datetime
     end_date: datetime
+    symbols: List[str] = field(default_factory=list)
+    strategy_ids: List[str] = field(default_factory=list)
 
     # Performance metrics
     final_pnl: float = 0.0
@@ -146,6 +177,9 @@ class BacktestResult:
     # Trade list
     trades: List[TradeRecord] = field(default_factory=list)
 
+    # Per strategy/symbol totals: {strategy_id: {symbol: {"trades": n, "pnl": x}}}
+    breakdown: Dict[str, Dict[str, Dict[str, float]]] = field(default_factory=dict)
+
     # Execution stats
     duration_seconds: float = 0.0
     candles_processed: int = 0
@@ -161,6 +195,8 @@ class BacktestResult:
             "session_id": self.session_id,
             "symbol": self.symbol,
             "strategy_id": self.strategy_id,
+            "symbols": self.symbols,
+            "strategy_ids": self.strategy_ids,
             "start_date": self.start_date.isoformat(),
             "end_date": self.end_date.isoformat(),
             "final_pnl": round(self.final_pnl, 2),
@@ -175,6 +211,7 @@ class BacktestResult:
             "duration_seconds": round(self.duration_seconds, 2),
             "candles_processed": self.candles_processed,
             "signals_generated": self.signals_generated,
+            "breakdown": self.breakdown,
             "status": self.status.value,
             "error_message": self.error_message
         }
@@ -186,6 +223,7 @@ class BacktestEngine:
 
     Features:
     - Process historical market data candle-by-candle
+    - Portfolio mode: N strategies x M symbols over one shared data load
     - Evaluate strategy conditions and generate signals
     - Execute trades via BacktestOrderManager
     - Track P&L, equity curve, and drawdown
@@ -200,7 +238,8 @@ class BacktestEngine:
         db_provider: QuestDBProvider,
         event_bus: EventBus,
         logger: Optional[StructuredLogger] = None,
-        broadcast_interval: float = 1.0
+        broadcast_interval: float = 1.0,
+        result_flush_rows: int = BacktestResultSink.DEFAULT_FLUSH_ROWS
     ):
         """
         Initialize backtest engine.
@@ -211,6 +250,7 @@ class BacktestEngine:
             event_bus: EventBus for signal/event communication
             logger: Optional structured logger
             broadcast_interval: Seconds between progress broadcasts
+            result_flush_rows: Buffered result rows per table that trigger a background write
         """
         self.session_id = session_id
         self.db_provider = db_provider
@@ -228,6 +268,10 @@ class BacktestEngine:
         # Strategy loaded from database
         self.strategy_config: Optional[Dict[str, Any]] = None
 
+        # Portfolio mode: strategy configs and one order book per strategy
+        self.strategy_configs: Dict[str, Dict[str, Any]] = {}
+        self.order_managers: Dict[str, BacktestOrderManager] = {}
+
         # Progress tracking
         self.progress = BacktestProgress(session_id=session_id)
 
@@ -236,6 +280,9 @@ class BacktestEngine:
         self.equity_curve: List[EquityPoint] = []
         self.peak_equity: float = 0.0
 
+        # Trades, equity points and signals are bulk-written off the candle loop
+        self.result_sink = BacktestResultSink(db_provider, session_id, self.logger, result_flush_rows)
+
         # Signal tracking
         self._signals_generated = 0
         self._last_broadcast_time = 0.0
@@ -289,6 +336,8 @@ class BacktestEngine:
             "session_id": config.session_id,
             "strategy_id": config.strategy_id,
             "symbol": config.symbol,
+            "symbols": config.symbols,
+            "strategy_ids": config.strategy_ids,
             "start_date": config.start_date.isoformat(),
             "end_date": config.end_date.isoformat()
         })
@@ -543,12 +592,13 @@ class BacktestEngine:
 
         # Entry condition: positive momentum + volume surge
         # BUG-DV-003 FIX: Use UPPERCASE for consistency with MEXC API
-        if price_change_pct > 0.1 and volume_ratio > 1.5:
+        if price_change_pct > self.config.entry_momentum_pct and volume_ratio > self.config.entry_volume_ratio:
             return {
                 "signal_type": "S1",
                 "side": "BUY",
                 "price": candle_data.get("close", 0),
-                "quantity": self.config.initial_balance * 0.02 / candle_data.get("close", 1),  # 2% of balance
+                "quantity": (self.config.initial_balance * self.config.position_size_pct / 100
+                             / candle_data.get("close", 1)),
                 "reason": f"Price momentum {price_change_pct:.2f}%, Volume ratio {volume_ratio:.2f}"
             }
 
@@ -604,7 +654,10 @@ class BacktestEngine:
     async def _process_signal(
         self,
         signal: Dict[str, Any],
-        timestamp: datetime
+        timestamp: datetime,
+        symbol: Optional[str] = None,
+        strategy_id: Optional[str] = None,
+        order_manager: Optional[BacktestOrderManager] = None
     ) -> Optional[str]:
         """
         Process a trading signal through BacktestOrderManager.
@@ -612,10 +665,17 @@ class BacktestEngine:
         Args:
             signal: Signal dict with type, side, price, quantity
             timestamp: Signal timestamp
+            symbol: Symbol to trade (default: session symbol)
+            strategy_id: Strategy issuing the signal (default: session strategy)
+            order_manager: Strategy order book (default: session order manager)
 
         Returns:
             Order ID if executed, None if failed
         """
+        symbol = symbol or self.config.symbol
+        strategy_id = strategy_id or self.config.strategy_id
+        order_manager = order_manager or self.order_manager
+
         try:
             # BUG-DV-003 FIX: Normalize to UPPERCASE for consistency with MEXC API
             side = signal.get("side", "BUY").upper()
@@ -632,19 +692,22 @@ class BacktestEngine:
                 self.logger.warning("backtest_engine.invalid_signal_side", {"side": side})
                 return None
 
-            order_id = await self.order_manager.submit_order(
-                symbol=self.config.symbol,
+            order_id = await order_manager.submit_order(
+                symbol=symbol,
                 order_type=order_type,
                 quantity=signal.get("quantity", 0),
                 price=signal.get("price", 0),
-                strategy_name=self.config.strategy_id
+                strategy_name=strategy_id
             )
 
             self._signals_generated += 1
+            self.result_sink.add_signal(timestamp, symbol, strategy_id, signal, order_id)
 
             self.logger.info("backtest_engine.signal_executed", {
                 "session_id": self.session_id,
                 "order_id": order_id,
+                "symbol": symbol,
+                "strategy_id": strategy_id,
                 "signal_type": signal.get("signal_type"),
                 "side": side,
                 "price": signal.get("price")
@@ -692,80 +755,359 @@ class BacktestEngine:
             open_positions=len([p for p in positions if p.get("quantity", 0) != 0])
         )
         self.equity_curve.append(point)
+        self.result_sink.add_equity_point(point)
 
         # Update progress
         self.progress.equity = current_equity
         self.progress.open_positions = point.open_positions
 
-    async def _store_trade(self, trade: TradeRecord) -> None:
+    async def _run_single_symbol(self) -> int:
         """
-        Store completed trade to database.
+        Walk one symbol's candles through the session strategy.
 
-        Args:
-            trade: Trade record to store
+        Returns:
+            Number of candles processed
         """
-        try:
-            query = """
-                INSERT INTO backtest_trades (
-                    trade_id, session_id, symbol, order_type, quantity,
-                    entry_price, exit_price, pnl, entry_time, exit_time,
-                    strategy_signal, timestamp
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-            """
-
-            await self.db_provider.execute(
-                query,
-                trade.trade_id,
-                trade.session_id,
-                trade.symbol,
-                trade.order_type,
-                trade.quantity,
-                trade.entry_price,
-                trade.exit_price,
-                trade.pnl,
-                trade.entry_time,
-                trade.exit_time,
-                trade.strategy_signal,
-                datetime.now(timezone.utc)
+        # 4. Initialize order manager
+        self.order_manager = BacktestOrderManager(
+            logger=self.logger,
+            event_bus=self.event_bus,
+            slippage_pct=0.0  # No slippage for backtests
+        )
+        await self.order_manager.start()
+
+        # 5. Load strategy
+        self.strategy_config = await self.load_strategy(self.config.strategy_id)
+
+        # 6. Get historical data
+        candles = await self.data_provider.get_price_range(
+            symbol=self.config.symbol,
+            start_time=self.config.start_date,
+            end_time=self.config.end_date,
+            timeframe=self.config.timeframe
+        )
+
+        if not candles:
+            raise ValueError(f"No historical data found for {self.config.symbol} "
+                           f"from {self.config.start_date} to {self.config.end_date}")
+
+        self.logger.info("backtest_engine.data_loaded", {
+            "session_id": self.session_id,
+            "candle_count": len(candles),
+            "first_candle": candles[0].timestamp.isoformat(),
+            "last_candle": candles[-1].timestamp.isoformat()
+        })
+
+        # 7. Process candles
+        total_candles = len(candles)
+        candles_processed = 0
+
+        # Running average volume for indicator
+        volume_sum = 0.0
+        volume_count = 0
+        last_candle: Optional[MarketDataSnapshot] = None
+
+        for candle in candles:
+            if self._stop_requested:
+                self.logger.info("backtest_engine.stop_requested", {
+                    "session_id": self.session_id,
+                    "candles_processed": candles_processed
+                })
+                break
+
+            # Convert candle to dict
+            candle_data = {
+                "symbol": candle.symbol,
+                "timestamp": candle.timestamp,
+                "open": candle.open,
+                "high": candle.high,
+                "low": candle.low,
+                "close": candle.close,
+                "volume": candle.volume
+            }
+
+            # Update running average volume
+            volume_sum += candle.volume
+            volume_count += 1
+            avg_volume = volume_sum / volume_count if volume_count > 0 else candle.volume
+
+            indicator_values = {
+                "avg_volume": avg_volume,
+                "price": candle.close
+            }
+
+            # Update current price in data provider
+            self.data_provider.update_current_price(candle.symbol, candle.close)
+            last_candle = candle
+
+            # Get current positions
+            positions = await self.order_manager.get_all_positions()
+
+            # Check for exit signals on open positions
+            for position_dict in positions:
+                if position_dict.get("quantity", 0) != 0:
+                    position = PositionRecord(
+                        symbol=position_dict["symbol"],
+                        quantity=position_dict["quantity"],
+                        average_price=position_dict["average_price"],
+                        leverage=position_dict.get("leverage", 1.0)
+                    )
+
+                    exit_signal = self._evaluate_exit_signal(candle_data, position)
+                    if exit_signal:
+                        await self._close_position(
+                            self.config.strategy_id, self.order_manager, position, exit_signal, candle.timestamp
+                        )
+
+            # Refresh positions after exits
+            positions = await self.order_manager.get_all_positions()
+
+            # Check for entry signals if no open position
+            open_positions = [p for p in positions if p.get("quantity", 0) != 0]
+            if not open_positions:
+                entry_signal = self._evaluate_entry_signal(candle_data, indicator_values)
+                if entry_signal:
+                    await self._process_signal(entry_signal, candle.timestamp)
+
+            # Record equity point
+            self._record_equity_point(candle.timestamp, await self.order_manager.get_all_positions())
+
+            # Update progress
+            candles_processed += 1
+            self.progress.progress_pct = (candles_processed / total_candles) * 100
+            self.progress.current_timestamp = candle.timestamp
+
+            # Broadcast progress periodically
+            await self.broadcast_progress()
+
+            # Apply acceleration factor (optional sleep)
+            if self.config.acceleration_factor < 100:
+                # Real-time simulation would sleep here
+                # For backtests, we typically run at max speed
+                pass
+
+        # 8. Close any remaining positions at the last processed candle
+        final_positions = await self.order_manager.get_all_positions()
+        for position_dict in final_positions:
+            if position_dict.get("quantity", 0) != 0 and last_candle is not None:
+                position = PositionRecord(
+                    symbol=position_dict["symbol"],
+                    quantity=position_dict["quantity"],
+                    average_price=position_dict["average_price"],
+                    leverage=position_dict.get("leverage", 1.0)
+                )
+                await self._close_position(
+                    self.config.strategy_id, self.order_manager, position,
+                    self._close_signal(position, last_candle.close), last_candle.timestamp
+                )
+
+        return candles_processed
+
+    async def _run_portfolio(self) -> int:
+        """
+        Step every strategy over every symbol on one shared time axis.
+
+        All symbols are loaded once into columnar arrays. Each strategy trades
+        its own order book, so strategies holding the same symbol do not
+        collide; equity and drawdown are tracked for the combined account.
+
+        Returns:
+            Number of time steps processed
+        """
+        for strategy_id in self.config.strategy_ids:
+            self.strategy_configs[strategy_id] = await self.load_strategy(strategy_id)
+            order_manager = BacktestOrderManager(
+                logger=self.logger,
+                event_bus=self.event_bus,
+                slippage_pct=0.0  # No slippage for backtests
             )
-        except Exception as e:
-            # Log but don't fail - trade storage is not critical for execution
-            self.logger.warning("backtest_engine.trade_storage_failed", {
-                "trade_id": trade.trade_id,
-                "error": str(e)
-            })
+            await order_manager.start()
+            self.order_managers[strategy_id] = order_manager
+
+        symbols = self.config.symbols
+        data = await self.data_provider.get_price_columns(
+            symbols=symbols,
+            start_time=self.config.start_date,
+            end_time=self.config.end_date,
+            timeframe=self.config.timeframe
+        )
 
-    async def _store_equity_curve(self) -> None:
-        """Store equity curve points to database."""
-        if not self.equity_curve:
-            return
+        if not len(data):
+            raise ValueError(f"No historical data found for {', '.join(symbols)} "
+                           f"from {self.config.start_date} to {self.config.end_date}")
 
-        try:
-            # Sample equity curve to reduce storage (every 10th point)
-            sampled = self.equity_curve[::10]
-            if self.equity_curve[-1] not in sampled:
-                sampled.append(self.equity_curve[-1])
-
-            for point in sampled:
-                query = """
-                    INSERT INTO backtest_equity_curve (
-                        session_id, timestamp, equity, drawdown_pct, open_positions
-                    ) VALUES ($1, $2, $3, $4, $5)
-                """
-
-                await self.db_provider.execute(
-                    query,
-                    self.session_id,
-                    point.timestamp,
-                    point.equity,
-                    point.drawdown_pct,
-                    point.open_positions
+        self.logger.info("backtest_engine.portfolio_data_loaded", {
+            "session_id": self.session_id,
+            "symbols": symbols,
+            "strategy_ids": self.config.strategy_ids,
+            "time_steps": len(data),
+            "first_timestamp": data.timestamps[0].isoformat(),
+            "last_timestamp": data.timestamps[-1].isoformat()
+        })
+
+        # Running average volume per symbol, computed once for the whole range
+        present = ~np.isnan(data.close)
+        volume = np.where(present, data.volume, 0.0)
+        avg_volume = np.cumsum(volume, axis=1) / np.maximum(np.cumsum(present, axis=1), 1)
+
+        total_steps = len(data)
+        steps_processed = 0
+        last_close: Dict[str, float] = {}
+
+        for step, timestamp in enumerate(data.timestamps):
+            if self._stop_requested:
+                self.logger.info("backtest_engine.stop_requested", {
+                    "session_id": self.session_id,
+                    "candles_processed": steps_processed
+                })
+                break
+
+            for row, symbol in enumerate(symbols):
+                if not present[row, step]:
+                    continue
+
+                candle_data = self._portfolio_candle(data, row, step)
+                last_close[symbol] = candle_data["close"]
+                self.data_provider.update_current_price(symbol, candle_data["close"])
+
+                indicator_values = {
+                    "avg_volume": float(avg_volume[row, step]),
+                    "price": candle_data["close"]
+                }
+
+                for strategy_id, order_manager in self.order_managers.items():
+                    position = order_manager.get_open_position(symbol)
+                    if position is not None:
+                        exit_signal = self._evaluate_exit_signal(candle_data, position)
+                        if exit_signal:
+                            await self._close_position(
+                                strategy_id, order_manager, position, exit_signal, timestamp
+                            )
+
+                    # Same candle may re-enter after an exit, as in single-symbol mode
+                    if order_manager.get_open_position(symbol) is None:
+                        entry_signal = self._evaluate_entry_signal(candle_data, indicator_values)
+                        if entry_signal:
+                            await self._process_signal(
+                                entry_signal, timestamp,
+                                symbol=symbol, strategy_id=strategy_id, order_manager=order_manager
+                            )
+
+            self._record_equity_point(timestamp, self._portfolio_positions(last_close))
+
+            steps_processed += 1
+            self.progress.progress_pct = (steps_processed / total_steps) * 100
+            self.progress.current_timestamp = timestamp
+
+            await self.broadcast_progress()
+
+        # Close any remaining positions at the last seen prices
+        final_timestamp = self.progress.current_timestamp or data.timestamps[-1]
+        for strategy_id, order_manager in self.order_managers.items():
+            for symbol in symbols:
+                position = order_manager.get_open_position(symbol)
+                if position is None or symbol not in last_close:
+                    continue
+                await self._close_position(
+                    strategy_id, order_manager, position,
+                    self._close_signal(position, last_close[symbol]), final_timestamp
                 )
-        except Exception as e:
-            self.logger.warning("backtest_engine.equity_curve_storage_failed", {
-                "session_id": self.session_id,
-                "error": str(e)
-            })
+
+        return steps_processed
+
+    @staticmethod
+    def _portfolio_candle(data: PriceColumns, row: int, step: int) -> Dict[str, Any]:
+        """Build the candle dict the signal evaluators expect from columnar data."""
+        return {
+            "symbol": data.symbols[row],
+            "timestamp": data.timestamps[step],
+            "open": float(data.open[row, step]),
+            "high": float(data.high[row, step]),
+            "low": float(data.low[row, step]),
+            "close": float(data.close[row, step]),
+            "volume": float(data.volume[row, step])
+        }
+
+    def _portfolio_positions(self, last_close: Dict[str, float]) -> List[Dict[str, Any]]:
+        """Mark open positions across all strategy books to the last seen prices."""
+        positions = []
+        for order_manager in self.order_managers.values():
+            for symbol in self.config.symbols:
+                position = order_manager.get_open_position(symbol)
+                if position is None:
+                    continue
+                if symbol in last_close:
+                    position.update_unrealized_pnl(last_close[symbol])
+                positions.append({
+                    "symbol": symbol,
+                    "quantity": position.quantity,
+                    "unrealized_pnl": position.unrealized_pnl
+                })
+        return positions
+
+    @staticmethod
+    def _close_signal(position: PositionRecord, price: float) -> Dict[str, Any]:
+        """Build the end-of-period signal closing a position at price (marks its P&L first)."""
+        position.update_unrealized_pnl(price)
+        # BUG-DV-003 FIX: Use UPPERCASE for consistency with MEXC API
+        return {
+            "signal_type": "CLOSE",
+            "side": "SELL" if position.quantity > 0 else "COVER",
+            "price": price,
+            "quantity": abs(position.quantity),
+            "reason": "End of backtest period"
+        }
+
+    async def _close_position(
+        self,
+        strategy_id: str,
+        order_manager: BacktestOrderManager,
+        position: PositionRecord,
+        exit_signal: Dict[str, Any],
+        timestamp: datetime
+    ) -> None:
+        """Execute an exit signal for a strategy book and record the closed trade (both run modes)."""
+        # Capture before submitting: the fill updates the live position record
+        symbol = position.symbol
+        entry_price = position.average_price
+        pnl = position.unrealized_pnl
+
+        order_id = await self._process_signal(
+            exit_signal, timestamp, symbol=symbol, strategy_id=strategy_id, order_manager=order_manager
+        )
+        if not order_id:
+            return
+
+        trade = TradeRecord(
+            trade_id=f"trade_{uuid4().hex[:8]}",
+            session_id=self.session_id,
+            symbol=symbol,
+            order_type=exit_signal["side"],
+            quantity=exit_signal["quantity"],
+            entry_price=entry_price,
+            exit_price=exit_signal["price"],
+            pnl=pnl,
+            entry_time=None,
+            exit_time=timestamp,
+            strategy_signal=exit_signal.get("signal_type", ""),
+            strategy_id=strategy_id
+        )
+        self.trades.append(trade)
+        self.result_sink.add_trade(trade)
+
+        self.progress.current_pnl += trade.pnl
+        self.progress.total_trades += 1
+
+    def _build_breakdown(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Aggregate trade count and P&L per strategy and symbol."""
+        breakdown: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for trade in self.trades:
+            totals = breakdown.setdefault(trade.strategy_id, {}).setdefault(
+                trade.symbol, {"trades": 0, "pnl": 0.0}
+            )
+            totals["trades"] += 1
+            totals["pnl"] += trade.pnl
+        return breakdown
 
     async def run(self) -> BacktestResult:
         """
@@ -805,153 +1147,11 @@ class BacktestEngine:
             self.data_provider = BacktestMarketDataProvider(self.db_provider)
             await self.data_provider.initialize()
 
-            # 4. Initialize order manager
-            self.order_manager = BacktestOrderManager(
-                logger=self.logger,
-                event_bus=self.event_bus,
-                slippage_pct=0.0  # No slippage for backtests
-            )
-            await self.order_manager.start()
-
-            # 5. Load strategy
-            self.strategy_config = await self.load_strategy(self.config.strategy_id)
-
-            # 6. Get historical data
-            candles = await self.data_provider.get_price_range(
-                symbol=self.config.symbol,
-                start_time=self.config.start_date,
-                end_time=self.config.end_date,
-                timeframe=self.config.timeframe
-            )
-
-            if not candles:
-                raise ValueError(f"No historical data found for {self.config.symbol} "
-                               f"from {self.config.start_date} to {self.config.end_date}")
-
-            self.logger.info("backtest_engine.data_loaded", {
-                "session_id": self.session_id,
-                "candle_count": len(candles),
-                "first_candle": candles[0].timestamp.isoformat(),
-                "last_candle": candles[-1].timestamp.isoformat()
-            })
-
-            # 7. Process candles
-            total_candles = len(candles)
-            candles_processed = 0
-
-            # Running average volume for indicator
-            volume_sum = 0.0
-            volume_count = 0
-
-            for candle in candles:
-                if self._stop_requested:
-                    self.logger.info("backtest_engine.stop_requested", {
-                        "session_id": self.session_id,
-                        "candles_processed": candles_processed
-                    })
-                    break
-
-                # Convert candle to dict
-                candle_data = {
-                    "symbol": candle.symbol,
-                    "timestamp": candle.timestamp,
-                    "open": candle.open,
-                    "high": candle.high,
-                    "low": candle.low,
-                    "close": candle.close,
-                    "volume": candle.volume
-                }
-
-                # Update running average volume
-                volume_sum += candle.volume
-                volume_count += 1
-                avg_volume = volume_sum / volume_count if volume_count > 0 else candle.volume
-
-                indicator_values = {
-                    "avg_volume": avg_volume,
-                    "price": candle.close
-                }
-
-                # Update current price in data provider
-                self.data_provider.update_current_price(candle.symbol, candle.close)
-
-                # Get current positions
-                positions = await self.order_manager.get_all_positions()
-
-                # Check for exit signals on open positions
-                for position_dict in positions:
-                    if position_dict.get("quantity", 0) != 0:
-                        position = PositionRecord(
-                            symbol=position_dict["symbol"],
-                            quantity=position_dict["quantity"],
-                            average_price=position_dict["average_price"],
-                            leverage=position_dict.get("leverage", 1.0)
-                        )
-
-                        exit_signal = self._evaluate_exit_signal(candle_data, position)
-                        if exit_signal:
-                            order_id = await self._process_signal(exit_signal, candle.timestamp)
-                            if order_id:
-                                # Record trade
-                                trade = TradeRecord(
-                                    trade_id=f"trade_{uuid4().hex[:8]}",
-                                    session_id=self.session_id,
-                                    symbol=candle.symbol,
-                                    order_type=exit_signal["side"],
-                                    quantity=exit_signal["quantity"],
-                                    entry_price=position.average_price,
-                                    exit_price=exit_signal["price"],
-                                    pnl=position.unrealized_pnl,
-                                    entry_time=None,  # Would need to track from entry
-                                    exit_time=candle.timestamp,
-                                    strategy_signal=exit_signal.get("signal_type", "")
-                                )
-                                self.trades.append(trade)
-                                await self._store_trade(trade)
-
-                                self.progress.current_pnl += trade.pnl
-                                self.progress.total_trades += 1
-
-                # Refresh positions after exits
-                positions = await self.order_manager.get_all_positions()
-
-                # Check for entry signals if no open position
-                open_positions = [p for p in positions if p.get("quantity", 0) != 0]
-                if not open_positions:
-                    entry_signal = self._evaluate_entry_signal(candle_data, indicator_values)
-                    if entry_signal:
-                        await self._process_signal(entry_signal, candle.timestamp)
-
-                # Record equity point
-                self._record_equity_point(candle.timestamp, await self.order_manager.get_all_positions())
-
-                # Update progress
-                candles_processed += 1
-                self.progress.progress_pct = (candles_processed / total_candles) * 100
-                self.progress.current_timestamp = candle.timestamp
-
-                # Broadcast progress periodically
-                await self.broadcast_progress()
-
-                # Apply acceleration factor (optional sleep)
-                if self.config.acceleration_factor < 100:
-                    # Real-time simulation would sleep here
-                    # For backtests, we typically run at max speed
-                    pass
-
-            # 8. Close any remaining positions at end
-            # BUG-DV-003 FIX: Use UPPERCASE for consistency with MEXC API
-            final_positions = await self.order_manager.get_all_positions()
-            for position_dict in final_positions:
-                if position_dict.get("quantity", 0) != 0:
-                    close_signal = {
-                        "signal_type": "CLOSE",
-                        "side": "SELL" if position_dict["quantity"] > 0 else "COVER",
-                        "price": candles[-1].close if candles else 0,
-                        "quantity": abs(position_dict["quantity"]),
-                        "reason": "End of backtest period"
-                    }
-                    await self._process_signal(close_signal, candles[-1].timestamp if candles else datetime.now(timezone.utc))
+            # 4-8. Simulate the session
+            if self.config.is_portfolio:
+                candles_processed = await self._run_portfolio()
+            else:
+                candles_processed = await self._run_single_symbol()
 
             # 9. Calculate final metrics
             duration_seconds = time.time() - start_time
@@ -966,6 +1166,8 @@ class BacktestEngine:
                 strategy_id=self.config.strategy_id,
                 start_date=self.config.start_date,
                 end_date=self.config.end_date,
+                symbols=self.config.symbols,
+                strategy_ids=self.config.strategy_ids,
                 final_pnl=self.progress.current_pnl,
                 total_trades=len(self.trades),
                 winning_trades=winning_trades,
@@ -976,6 +1178,7 @@ class BacktestEngine:
                 final_balance=self.config.initial_balance + self.progress.current_pnl,
                 equity_curve=self.equity_curve,
                 trades=self.trades,
+                breakdown=self._build_breakdown(),
                 duration_seconds=duration_seconds,
                 candles_processed=candles_processed,
                 signals_generated=self._signals_generated,
@@ -991,8 +1194,8 @@ class BacktestEngine:
                 progress_pct=100.0
             )
 
-            # 11. Store equity curve
-            await self._store_equity_curve()
+            # 11. Write remaining buffered results
+            await self.result_sink.close()
 
             # 12. Broadcast completion
             await self.broadcast_progress(force=True)
@@ -1041,9 +1244,12 @@ class BacktestEngine:
         finally:
             self._running = False
 
-            # Cleanup
+            # Cleanup (persists partial results of failed runs; no-op after close)
+            await self.result_sink.flush()
             if self.order_manager:
                 await self.order_manager.stop()
+            for order_manager in self.order_managers.values():
+                await order_manager.stop()
             if self.data_provider:
                 await self.data_provider.close()
 
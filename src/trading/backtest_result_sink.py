@@ -0,0 +1,238 @@
+"""
+Backtest Result Sink
+====================
+Buffers backtest trades, equity points and executed signals in columnar form
+and bulk-writes them through the QuestDB ILP sender pool.
+
+The candle loop only appends to in-memory column lists. Once a table buffer
+reaches ``flush_rows`` a background task swaps it out and writes it with one
+ILP call per table, so storage never runs inline with trade simulation.
+``close()`` writes whatever is left when the run ends.
+
+Tables (auto-created by ILP on first write):
+- backtest_trades: one row per closed trade
+- backtest_equity_curve: one row per processed candle (full resolution)
+- backtest_signals: one row per executed signal
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+from src.core.logger import StructuredLogger, get_logger
+
+if TYPE_CHECKING:
+    from src.data_feed.questdb_provider import QuestDBProvider
+    from src.trading.backtest_engine import EquityPoint, TradeRecord
+
+
+class _ColumnBuffer:
+    """Parallel column lists for one ILP table"""
+
+    __slots__ = ("table", "symbol_names", "column_names", "timestamps", "values")
+
+    def __init__(self, table: str, symbol_names: Sequence[str], column_names: Sequence[str]):
+        self.table = table
+        self.symbol_names = tuple(symbol_names)
+        self.column_names = tuple(column_names)
+        self.timestamps: List[datetime] = []
+        self.values: List[List[Any]] = [[] for _ in range(len(self.symbol_names) + len(self.column_names))]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, timestamp: datetime, *row: Any) -> None:
+        """Append one row; values are ordered symbols first, then columns."""
+        self.timestamps.append(timestamp)
+        for column, value in zip(self.values, row):
+            column.append(value)
+
+    def take(self) -> Optional[Dict[str, Any]]:
+        """Return buffered rows as insert_columnar_batch kwargs and reset the buffer."""
+        if not self.timestamps:
+            return None
+
+        symbol_count = len(self.symbol_names)
+        batch = {
+            "table": self.table,
+            "timestamps": self.timestamps,
+            "symbols": dict(zip(self.symbol_names, self.values[:symbol_count])),
+            "columns": dict(zip(self.column_names, self.values[symbol_count:])),
+        }
+        self.timestamps = []
+        self.values = [[] for _ in self.values]
+        return batch
+
+
+class BacktestResultSink:
+    """
+    Write-behind store for backtest results.
+
+    Storage failures are logged and counted, never raised: result persistence
+    must not fail a backtest (the in-memory BacktestResult is still returned).
+    """
+
+    DEFAULT_FLUSH_ROWS = 5000
+
+    def __init__(
+        self,
+        db_provider: QuestDBProvider,
+        session_id: str,
+        logger: Optional[StructuredLogger] = None,
+        flush_rows: int = DEFAULT_FLUSH_ROWS
+    ):
+        """
+        Initialize result sink.
+
+        Args:
+            db_provider: QuestDB provider whose ILP sender pool performs the writes
+            session_id: Backtest session ID stored with every row
+            logger: Optional structured logger
+            flush_rows: Buffered rows per table that trigger a background flush
+        """
+        self.db_provider = db_provider
+        self.session_id = session_id
+        self.logger = logger or get_logger(__name__)
+        self.flush_rows = max(1, flush_rows)
+
+        self._trades = _ColumnBuffer(
+            "backtest_trades",
+            ("session_id", "strategy_id", "symbol", "order_type", "strategy_signal"),
+            ("trade_id", "quantity", "entry_price", "exit_price", "pnl", "entry_time", "exit_time"),
+        )
+        self._equity = _ColumnBuffer(
+            "backtest_equity_curve",
+            ("session_id",),
+            ("equity", "drawdown_pct", "open_positions"),
+        )
+        self._signals = _ColumnBuffer(
+            "backtest_signals",
+            ("session_id", "strategy_id", "symbol", "signal_type", "side"),
+            ("order_id", "price", "quantity", "reason"),
+        )
+
+        self._flush_task: Optional[asyncio.Task] = None
+        self._rows_written = 0
+        self._rows_failed = 0
+        self._flushes = 0
+
+    # ========================================================================
+    # Buffering (synchronous, called from the candle loop)
+    # ========================================================================
+
+    def add_trade(self, trade: TradeRecord) -> None:
+        """Buffer a closed trade."""
+        self._trades.append(
+            trade.exit_time or datetime.now(timezone.utc),
+            trade.session_id,
+            trade.strategy_id or None,
+            trade.symbol,
+            trade.order_type,
+            trade.strategy_signal or None,
+            trade.trade_id,
+            float(trade.quantity),
+            float(trade.entry_price),
+            float(trade.exit_price) if trade.exit_price is not None else None,
+            float(trade.pnl),
+            trade.entry_time,
+            trade.exit_time,
+        )
+        self._schedule_flush(self._trades)
+
+    def add_equity_point(self, point: EquityPoint) -> None:
+        """Buffer an equity curve point."""
+        self._equity.append(
+            point.timestamp,
+            self.session_id,
+            float(point.equity),
+            float(point.drawdown_pct),
+            int(point.open_positions),
+        )
+        self._schedule_flush(self._equity)
+
+    def add_signal(
+        self,
+        timestamp: datetime,
+        symbol: str,
+        strategy_id: str,
+        signal: Dict[str, Any],
+        order_id: Optional[str]
+    ) -> None:
+        """Buffer an executed signal."""
+        self._signals.append(
+            timestamp,
+            self.session_id,
+            strategy_id or None,
+            symbol,
+            signal.get("signal_type") or None,
+            str(signal.get("side", "")).upper() or None,
+            order_id,
+            float(signal.get("price", 0) or 0),
+            float(signal.get("quantity", 0) or 0),
+            signal.get("reason"),
+        )
+        self._schedule_flush(self._signals)
+
+    @property
+    def pending_rows(self) -> int:
+        """Rows buffered but not yet handed to a flush."""
+        return len(self._trades) + len(self._equity) + len(self._signals)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sink statistics."""
+        return {
+            "session_id": self.session_id,
+            "pending_rows": self.pending_rows,
+            "rows_written": self._rows_written,
+            "rows_failed": self._rows_failed,
+            "flushes": self._flushes,
+        }
+
+    # ========================================================================
+    # Flushing
+    # ========================================================================
+
+    def _schedule_flush(self, buffer: _ColumnBuffer) -> None:
+        """Start a background flush once a buffer is full and none is in flight."""
+        if len(buffer) < self.flush_rows:
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        self._flush_task = asyncio.create_task(self._write(self._take_all()))
+
+    def _take_all(self) -> List[Dict[str, Any]]:
+        return [batch for batch in (self._trades.take(), self._equity.take(), self._signals.take()) if batch]
+
+    async def _write(self, batches: List[Dict[str, Any]]) -> None:
+        for batch in batches:
+            row_count = len(batch["timestamps"])
+            try:
+                await self.db_provider.insert_columnar_batch(**batch)
+                self._rows_written += row_count
+            except Exception as e:
+                # Log but don't fail - result storage is not critical for execution
+                self._rows_failed += row_count
+                self.logger.warning("backtest_result_sink.flush_failed", {
+                    "session_id": self.session_id,
+                    "table": batch["table"],
+                    "rows": row_count,
+                    "error": str(e)
+                })
+        self._flushes += 1
+
+    async def flush(self) -> None:
+        """Wait for any in-flight flush, then write everything still buffered."""
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
+
+        batches = self._take_all()
+        if batches:
+            await self._write(batches)
+
+    async def close(self) -> None:
+        """Flush remaining rows and log storage totals."""
+        await self.flush()
+        self.logger.info("backtest_result_sink.closed", self.get_stats())
@@ -0,0 +1,523 @@
+"""
+Backtest Parameter Sweep
+========================
+Runs many backtest parameter combinations in parallel over one data load.
+
+Flow:
+1. Expand a parameter grid or draw a random search
+2. Load all symbols once into PriceColumns
+3. Copy the price arrays into one shared memory block
+4. Fan chunks of combinations out over a ProcessPoolExecutor; workers attach
+   to the block instead of receiving a pickled copy of the data
+5. Rank results as chunks complete and stream the leaderboard over the
+   backtest progress broadcast
+
+Workers run simulate_combination(), which scores simulate_trades(), a
+vectorized single-strategy replay of BacktestEngine's entry/exit rules
+(momentum + volume surge entry, stop loss / take profit exit, forced close at
+the end of the range). Sweep winners map directly onto BacktestConfig fields
+for a full engine run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import operator
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.event_bus import EventBus
+from src.core.logger import StructuredLogger, get_logger
+from src.data_feed.questdb_provider import QuestDBProvider
+from src.trading.backtest_data_provider_questdb import BacktestMarketDataProvider, PriceColumns
+from src.trading.backtest_engine import BacktestConfig, BacktestStatus
+
+
+SWEEPABLE_PARAMETERS: Tuple[str, ...] = (
+    "entry_momentum_pct",
+    "entry_volume_ratio",
+    "stop_loss_percent",
+    "take_profit_percent",
+    "position_size_pct",
+)
+
+DEFAULT_PARAMETERS: Dict[str, float] = {
+    f.name: f.default for f in fields(BacktestConfig) if f.name in SWEEPABLE_PARAMETERS
+}
+
+# Metrics that rank ascending (lower is better); all others rank descending
+_ASCENDING_METRICS = frozenset({"max_drawdown_pct"})
+RANKABLE_METRICS = frozenset({"final_pnl", "win_rate", "max_drawdown_pct", "total_trades"})
+
+# Fields packed into the shared memory block, in order
+_SHARED_FIELDS = ("open", "close", "volume")
+
+
+# =============================================================================
+# Combination generation
+# =============================================================================
+
+def _validate_names(names: Sequence[str]) -> None:
+    unknown = sorted(set(names) - set(SWEEPABLE_PARAMETERS))
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {unknown}. Allowed: {list(SWEEPABLE_PARAMETERS)}")
+
+
+def expand_grid(grid: Dict[str, Sequence[float]]) -> List[Dict[str, float]]:
+    """
+    Expand a parameter grid into every combination.
+
+    Args:
+        grid: Parameter name -> candidate values
+
+    Returns:
+        List of parameter dicts (cartesian product)
+    """
+    _validate_names(list(grid))
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def sample_parameters(
+    space: Dict[str, Tuple[float, float]],
+    samples: int,
+    seed: Optional[int] = None
+) -> List[Dict[str, float]]:
+    """
+    Draw a uniform random search over parameter ranges.
+
+    Args:
+        space: Parameter name -> (low, high)
+        samples: Number of combinations to draw
+        seed: Optional RNG seed for reproducible sweeps
+
+    Returns:
+        List of parameter dicts
+    """
+    _validate_names(list(space))
+    rng = random.Random(seed)
+    return [
+        {name: rng.uniform(low, high) for name, (low, high) in space.items()}
+        for _ in range(samples)
+    ]
+
+
+# =============================================================================
+# Simulation (runs inside worker processes)
+# =============================================================================
+
+@dataclass
+class SweepMarketData:
+    """Parameter-independent arrays derived once per worker"""
+    close: np.ndarray
+    close_ffill: np.ndarray
+    present: np.ndarray
+    change_pct: np.ndarray
+    volume_ratio: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, open_: np.ndarray, close: np.ndarray, volume: np.ndarray) -> "SweepMarketData":
+        present = ~np.isnan(close)
+        safe_volume = np.where(present, volume, 0.0)
+        avg_volume = np.cumsum(safe_volume, axis=1) / np.maximum(np.cumsum(present, axis=1), 1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change_pct = np.where(present & (open_ > 0), (close - open_) / open_ * 100, 0.0)
+            volume_ratio = np.where(present & (avg_volume > 0), safe_volume / avg_volume, 1.0)
+
+        # Last seen close per symbol, for marking open positions between candles
+        index = np.where(present, np.arange(close.shape[1]), 0)
+        np.maximum.accumulate(index, axis=1, out=index)
+        close_ffill = np.take_along_axis(np.where(present, close, 0.0), index, axis=1)
+
+        return cls(close, close_ffill, present, change_pct, volume_ratio)
+
+
+@dataclass
+class SweepTrade:
+    """One simulated round trip (exit_step is None if closed at the end of the range)"""
+    row: int
+    entry_step: int
+    exit_step: Optional[int]
+    entry_price: float
+    quantity: float
+    pnl: float
+
+
+def simulate_trades(
+    data: SweepMarketData,
+    params: Dict[str, float],
+    initial_balance: float
+) -> List[SweepTrade]:
+    """
+    Replay BacktestEngine's entry/exit rules for one parameter combination.
+
+    Symbols are independent (sizing uses the initial balance, one position per
+    symbol), so each symbol is walked trade by trade with vectorized searches
+    for the next entry and exit instead of stepping every candle.
+
+    Returns:
+        Trades in symbol order, then entry order
+    """
+    p = {**DEFAULT_PARAMETERS, **params}
+
+    candidates = (
+        data.present
+        & (data.change_pct > p["entry_momentum_pct"])
+        & (data.volume_ratio > p["entry_volume_ratio"])
+    )
+
+    trades: List[SweepTrade] = []
+
+    for row in range(data.close.shape[0]):
+        entries = np.flatnonzero(candidates[row])
+        if not entries.size:
+            continue
+
+        closes = data.close[row]
+        valid = np.flatnonzero(data.present[row])
+        step = 0
+
+        while True:
+            next_entry = np.searchsorted(entries, step)
+            if next_entry >= entries.size:
+                break
+
+            entry = int(entries[next_entry])
+            entry_price = float(closes[entry])
+            quantity = initial_balance * p["position_size_pct"] / 100 / entry_price
+
+            after = valid[np.searchsorted(valid, entry + 1):]
+            pnl_pct = (closes[after] - entry_price) / entry_price * 100
+            hits = np.flatnonzero((pnl_pct <= -p["stop_loss_percent"]) | (pnl_pct >= p["take_profit_percent"]))
+
+            if hits.size:
+                exit_step = int(after[hits[0]])
+                pnl = quantity * (closes[exit_step] - entry_price)
+                trades.append(SweepTrade(row, entry, exit_step, entry_price, quantity, float(pnl)))
+                step = exit_step  # The exit candle may open the next position
+            else:
+                # Still open at the end: closed at the last close
+                pnl = quantity * (data.close_ffill[row, -1] - entry_price)
+                trades.append(SweepTrade(row, entry, None, entry_price, quantity, float(pnl)))
+                break
+
+    return trades
+
+
+def simulate_combination(
+    data: SweepMarketData,
+    params: Dict[str, float],
+    initial_balance: float
+) -> Dict[str, Any]:
+    """
+    Score one parameter combination (see simulate_trades).
+
+    Returns:
+        Metrics dict (final_pnl, total_trades, winning_trades, win_rate, max_drawdown_pct)
+    """
+    trades = simulate_trades(data, params, initial_balance)
+    n_steps = data.close.shape[1]
+    realized_at = np.zeros(n_steps)
+    unrealized = np.zeros(n_steps)
+
+    for trade in trades:
+        # Open positions are marked to market until (excluding) the exit candle
+        end = n_steps if trade.exit_step is None else trade.exit_step
+        unrealized[trade.entry_step:end] += trade.quantity * (
+            data.close_ffill[trade.row, trade.entry_step:end] - trade.entry_price
+        )
+        if trade.exit_step is not None:
+            realized_at[trade.exit_step] += trade.pnl
+
+    equity = initial_balance + np.cumsum(realized_at) + unrealized
+    peak = np.maximum.accumulate(np.maximum(equity, initial_balance))
+    drawdown = (peak - equity) / peak * 100
+
+    winning = sum(1 for trade in trades if trade.pnl > 0)
+    return {
+        "final_pnl": float(sum(trade.pnl for trade in trades)),
+        "total_trades": len(trades),
+        "winning_trades": winning,
+        "win_rate": winning / len(trades) if trades else 0.0,
+        "max_drawdown_pct": float(drawdown.max(initial=0.0)),
+    }
+
+
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+_worker_data: Optional[SweepMarketData] = None
+
+
+def _attach_worker(name: str, shape: Tuple[int, ...]) -> None:
+    """Pool initializer: map the shared price block and derive sweep arrays once."""
+    global _worker_memory, _worker_data
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    arrays = np.ndarray(shape, dtype=np.float64, buffer=_worker_memory.buf)
+    _worker_data = SweepMarketData.from_arrays(*arrays)
+
+
+def _run_chunk(
+    chunk: List[Tuple[int, Dict[str, float]]],
+    initial_balance: float
+) -> List[Dict[str, Any]]:
+    """Evaluate a chunk of (index, params) combinations in a worker process."""
+    return [
+        {"index": index, "params": params, **simulate_combination(_worker_data, params, initial_balance)}
+        for index, params in chunk
+    ]
+
+
+# =============================================================================
+# Orchestration
+# =============================================================================
+
+@dataclass
+class SweepResult:
+    """Outcome of a parameter sweep"""
+    sweep_id: str
+    symbols: List[str]
+    combinations: int
+    completed: int = 0
+    rank_by: str = "final_pnl"
+    ranking: List[Dict[str, Any]] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    status: BacktestStatus = BacktestStatus.COMPLETED
+    error_message: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "sweep_id": self.sweep_id,
+            "symbols": self.symbols,
+            "combinations": self.combinations,
+            "completed": self.completed,
+            "rank_by": self.rank_by,
+            "ranking": self.ranking,
+            "duration_seconds": round(self.duration_seconds, 2),
+            "status": self.status.value,
+            "error_message": self.error_message
+        }
+
+
+class BacktestParameterSweep:
+    """
+    Fans backtest parameter combinations out over a process pool.
+
+    Features:
+    - Grid or random-search combinations (see expand_grid / sample_parameters)
+    - One multi-symbol data load shared with workers through shared memory
+    - Chunked submission to amortize inter-process overhead
+    - Ranked leaderboard streamed on "backtest.progress" while running
+    """
+
+    def __init__(
+        self,
+        sweep_id: str,
+        db_provider: QuestDBProvider,
+        event_bus: Optional[EventBus],
+        symbols: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        combinations: List[Dict[str, float]],
+        timeframe: str = "1m",
+        initial_balance: float = 10000.0,
+        rank_by: str = "final_pnl",
+        top_n: int = 10,
+        max_workers: Optional[int] = None,
+        broadcast_interval: float = 1.0,
+        logger: Optional[StructuredLogger] = None
+    ):
+        """
+        Initialize parameter sweep.
+
+        Args:
+            sweep_id: Unique sweep ID (used as session_id in broadcasts)
+            db_provider: QuestDB provider for data access
+            event_bus: EventBus for progress broadcasts (None disables them)
+            symbols: Symbols every combination trades
+            start_date: Backtest range start
+            end_date: Backtest range end
+            combinations: Parameter dicts to evaluate
+            timeframe: Candle timeframe
+            initial_balance: Account balance per combination
+            rank_by: Metric to rank by (see RANKABLE_METRICS)
+            top_n: Leaderboard size in broadcasts and the result
+            max_workers: Worker processes (default: all cores)
+            broadcast_interval: Seconds between progress broadcasts
+            logger: Optional structured logger
+        """
+        if rank_by not in RANKABLE_METRICS:
+            raise ValueError(f"Cannot rank by '{rank_by}'. Allowed: {sorted(RANKABLE_METRICS)}")
+        if not combinations:
+            raise ValueError("Parameter sweep needs at least one combination")
+        for params in combinations:
+            _validate_names(list(params))
+
+        self.sweep_id = sweep_id
+        self.db_provider = db_provider
+        self.event_bus = event_bus
+        self.symbols = list(symbols)
+        self.start_date = start_date
+        self.end_date = end_date
+        self.combinations = combinations
+        self.timeframe = timeframe
+        self.initial_balance = initial_balance
+        self.rank_by = rank_by
+        self.top_n = top_n
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.broadcast_interval = broadcast_interval
+        self.logger = logger or get_logger(__name__)
+
+        self.results: List[Dict[str, Any]] = []
+        self._last_broadcast_time = 0.0
+        self._stop_requested = False
+
+    def stop(self) -> None:
+        """Request the sweep to stop after in-flight chunks."""
+        self._stop_requested = True
+
+    def ranking(self) -> List[Dict[str, Any]]:
+        """Current top_n results by rank_by."""
+        key = operator.itemgetter(self.rank_by)
+        if self.rank_by in _ASCENDING_METRICS:
+            return heapq.nsmallest(self.top_n, self.results, key=key)
+        return heapq.nlargest(self.top_n, self.results, key=key)
+
+    async def run(self) -> SweepResult:
+        """
+        Load data, evaluate all combinations and return the ranked result.
+
+        Returns:
+            SweepResult with the leaderboard; FAILED status on errors
+        """
+        start_time = time.time()
+        result = SweepResult(
+            sweep_id=self.sweep_id,
+            symbols=self.symbols,
+            combinations=len(self.combinations),
+            rank_by=self.rank_by
+        )
+
+        try:
+            data_provider = BacktestMarketDataProvider(self.db_provider)
+            await data_provider.initialize()
+            data = await data_provider.get_price_columns(
+                symbols=self.symbols,
+                start_time=self.start_date,
+                end_time=self.end_date,
+                timeframe=self.timeframe
+            )
+            if not len(data):
+                raise ValueError(f"No historical data found for {', '.join(self.symbols)} "
+                                 f"from {self.start_date} to {self.end_date}")
+
+            self.logger.info("backtest_sweep.started", {
+                "sweep_id": self.sweep_id,
+                "symbols": self.symbols,
+                "time_steps": len(data),
+                "combinations": len(self.combinations),
+                "max_workers": self.max_workers
+            })
+
+            await self.run_on_data(data)
+
+            result.status = BacktestStatus.STOPPED if self._stop_requested else BacktestStatus.COMPLETED
+
+        except Exception as e:
+            result.status = BacktestStatus.FAILED
+            result.error_message = f"{type(e).__name__}: {str(e)}"
+            self.logger.error("backtest_sweep.failed", {
+                "sweep_id": self.sweep_id,
+                "error": result.error_message
+            })
+
+        result.completed = len(self.results)
+        result.ranking = self.ranking()
+        result.duration_seconds = time.time() - start_time
+
+        await self._publish("backtest.completed" if result.status != BacktestStatus.FAILED else "backtest.failed",
+                            result.to_dict())
+
+        self.logger.info("backtest_sweep.finished", {
+            "sweep_id": self.sweep_id,
+            "status": result.status.value,
+            "completed": result.completed,
+            "duration_seconds": result.duration_seconds
+        })
+        return result
+
+    async def run_on_data(self, data: PriceColumns) -> None:
+        """Evaluate all combinations against already loaded price columns."""
+        stacked = np.stack([getattr(data, name) for name in _SHARED_FIELDS]).astype(np.float64)
+        memory = shared_memory.SharedMemory(create=True, size=max(stacked.nbytes, 1))
+        executor = None
+        try:
+            np.ndarray(stacked.shape, dtype=np.float64, buffer=memory.buf)[:] = stacked
+            del stacked
+
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_attach_worker,
+                initargs=(memory.name, (len(_SHARED_FIELDS), len(data.symbols), len(data)))
+            )
+
+            indexed = list(enumerate(self.combinations))
+            chunk_size = max(1, math.ceil(len(indexed) / (self.max_workers * 4)))
+            loop = asyncio.get_running_loop()
+            pending = [
+                loop.run_in_executor(executor, _run_chunk, indexed[i:i + chunk_size], self.initial_balance)
+                for i in range(0, len(indexed), chunk_size)
+            ]
+
+            for future in asyncio.as_completed(pending):
+                self.results.extend(await future)
+                if self._stop_requested:
+                    break
+                await self.broadcast_progress(force=len(self.results) == len(self.combinations))
+
+        finally:
+            if executor is not None:
+                # Don't block the event loop on in-flight chunks when stopped or cancelled
+                executor.shutdown(wait=False, cancel_futures=True)
+            memory.close()
+            memory.unlink()
+
+    async def broadcast_progress(self, force: bool = False) -> None:
+        """
+        Broadcast completion count and current leaderboard.
+
+        Args:
+            force: If True, broadcast immediately regardless of interval
+        """
+        now = time.time()
+        if not force and (now - self._last_broadcast_time) < self.broadcast_interval:
+            return
+        self._last_broadcast_time = now
+
+        total = len(self.combinations)
+        await self._publish("backtest.progress", {
+            "session_id": self.sweep_id,
+            "sweep": True,
+            "status": BacktestStatus.RUNNING.value,
+            "progress_pct": round(len(self.results) / total * 100, 2),
+            "completed": len(self.results),
+            "total": total,
+            "rank_by": self.rank_by,
+            "ranking": self.ranking()
+        })
+
+    async def _publish(self, event_type: str, data: Dict[str, Any]) -> None:
+        if self.event_bus is None:
+            return
+        await self.event_bus.publish(event_type, {"type": event_type, "data": {"session_id": self.sweep_id, **data}})
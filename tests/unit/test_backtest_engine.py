@@ -10,6 +10,9 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from dataclasses import dataclass
 
+import numpy as np
+import pandas as pd
+
 from src.trading.backtest_engine import (
     BacktestEngine,
     BacktestConfig,
@@ -20,7 +23,7 @@ from src.trading.backtest_engine import (
     EquityPoint,
     run_backtest
 )
-from src.trading.backtest_data_provider_questdb import MarketDataSnapshot
+from src.trading.backtest_data_provider_questdb import MarketDataSnapshot, PriceColumns
 from src.domain.services.backtest_order_manager import OrderType, PositionRecord
 
 
@@ -702,6 +705,162 @@ class TestBacktestEngineRun:
         assert "session not found" in result.error_message.lower()
 
 
+# =============================================================================
+# Portfolio Mode Tests
+# =============================================================================
+
+def portfolio_frame():
+    """Long-format OHLCV: A_USDT enters at t1 and takes profit at t2, B_USDT starts at t1"""
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+    rows = [
+        (t0, "A_USDT", 100.0, 100.0, 100.0),
+        (t0 + 60, "A_USDT", 100.0, 101.0, 1000.0),
+        (t0 + 60, "B_USDT", 50.0, 50.0, 10.0),
+        (t0 + 120, "A_USDT", 101.0, 120.0, 100.0),
+        (t0 + 120, "B_USDT", 50.0, 50.0, 10.0),
+    ]
+    return pd.DataFrame([
+        {"timestamp": ts, "symbol": sym, "open": o, "high": max(o, c), "low": min(o, c), "close": c, "volume": v}
+        for ts, sym, o, c, v in rows
+    ])
+
+
+class TestPriceColumns:
+    """Tests for aligning several symbols on one time axis"""
+
+    def test_from_frame_aligns_symbols(self):
+        data = PriceColumns.from_frame(portfolio_frame(), ["A_USDT", "B_USDT", "C_USDT"])
+
+        assert len(data) == 3
+        assert data.timestamps[0] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert data.close.shape == (3, 3)
+        assert list(data.close[0]) == [100.0, 101.0, 120.0]
+        assert np.isnan(data.close[1, 0]) and data.close[1, 1] == 50.0
+        assert np.isnan(data.close[2]).all()
+
+
+class TestBacktestEnginePortfolio:
+    """Tests for multi-symbol, multi-strategy sessions"""
+
+    def test_config_splits_symbols_and_strategies(self, sample_config):
+        assert sample_config.symbols == ["BTCUSDT"]
+        assert not sample_config.is_portfolio
+
+        config = BacktestConfig(
+            session_id="bt_001", strategy_id="s1, s2", symbol="A_USDT,B_USDT,A_USDT",
+            start_date=sample_config.start_date, end_date=sample_config.end_date
+        )
+        assert config.symbols == ["A_USDT", "B_USDT"]
+        assert config.strategy_ids == ["s1", "s2"]
+        assert config.is_portfolio
+
+    @pytest.mark.asyncio
+    async def test_run_portfolio_single_data_load(self, mock_event_bus, mock_db_provider, mock_logger):
+        """N strategies x M symbols share one columnar load and keep separate books"""
+        mock_db_provider.execute_query.side_effect = [
+            [{
+                "session_id": "bt_001",
+                "strategy_id": "s1,s2",
+                "symbol": "A_USDT,B_USDT",
+                "start_date": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "end_date": datetime(2025, 1, 2, tzinfo=timezone.utc),
+                "acceleration_factor": 10,
+                "initial_balance": 10000.0
+            }],
+            [],  # s1 -> default strategy
+            [],  # s2 -> default strategy
+        ]
+        mock_db_provider.insert_columnar_batch = AsyncMock(return_value=0)
+
+        with patch('src.trading.backtest_engine.BacktestMarketDataProvider') as MockDataProvider:
+            mock_data_provider = MagicMock()
+            mock_data_provider.initialize = AsyncMock()
+            mock_data_provider.close = AsyncMock()
+            mock_data_provider.get_price_range = AsyncMock()
+            mock_data_provider.get_price_columns = AsyncMock(
+                return_value=PriceColumns.from_frame(portfolio_frame(), ["A_USDT", "B_USDT"])
+            )
+            MockDataProvider.return_value = mock_data_provider
+
+            engine = BacktestEngine(
+                session_id="bt_001",
+                db_provider=mock_db_provider,
+                event_bus=mock_event_bus,
+                logger=mock_logger
+            )
+            result = await engine.run()
+
+        assert result.status == BacktestStatus.COMPLETED
+        mock_data_provider.get_price_columns.assert_awaited_once()
+        mock_data_provider.get_price_range.assert_not_awaited()
+
+        assert result.candles_processed == 3
+        assert len(result.equity_curve) == 3
+        assert result.symbols == ["A_USDT", "B_USDT"]
+        assert set(engine.order_managers) == {"s1", "s2"}
+
+        expected_pnl = (10000.0 * 0.02 / 101.0) * (120.0 - 101.0)
+        assert result.total_trades == 2
+        for strategy_id in ("s1", "s2"):
+            totals = result.breakdown[strategy_id]["A_USDT"]
+            assert totals["trades"] == 1
+            assert totals["pnl"] == pytest.approx(expected_pnl)
+        assert result.final_pnl == pytest.approx(2 * expected_pnl)
+
+
+    @pytest.mark.asyncio
+    async def test_one_symbol_portfolio_matches_single_symbol(self, mock_event_bus, mock_db_provider, mock_logger):
+        """Exit, same-candle re-entry and end-of-period close give identical results in both modes"""
+        t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        # (open, close, volume): enter at t1, take profit and re-enter at t2, force close at t3
+        bars = [(100.0, 100.0, 100.0), (100.0, 101.0, 1000.0), (101.0, 120.0, 3000.0), (120.0, 125.0, 100.0)]
+        candles = [
+            MarketDataSnapshot(
+                symbol="A_USDT", timestamp=t0 + timedelta(minutes=i),
+                open=o, high=max(o, c), low=min(o, c), close=c, volume=v
+            )
+            for i, (o, c, v) in enumerate(bars)
+        ]
+        frame = pd.DataFrame([
+            {"timestamp": c.timestamp.timestamp(), "symbol": c.symbol, "open": c.open,
+             "high": c.high, "low": c.low, "close": c.close, "volume": c.volume}
+            for c in candles
+        ])
+
+        async def run(mode):
+            engine = BacktestEngine(
+                session_id="bt_001",
+                db_provider=mock_db_provider,
+                event_bus=mock_event_bus,
+                logger=mock_logger
+            )
+            engine.config = BacktestConfig(
+                session_id="bt_001", strategy_id="s1", symbol="A_USDT",
+                start_date=t0, end_date=t0 + timedelta(hours=1)
+            )
+            engine.peak_equity = engine.config.initial_balance
+            engine.data_provider = MagicMock()
+            engine.data_provider.get_price_range = AsyncMock(return_value=candles)
+            engine.data_provider.get_price_columns = AsyncMock(
+                return_value=PriceColumns.from_frame(frame, ["A_USDT"])
+            )
+            with patch.object(engine, "load_strategy", AsyncMock(return_value={})):
+                await getattr(engine, mode)()
+            return engine
+
+        single = await run("_run_single_symbol")
+        portfolio = await run("_run_portfolio")
+
+        expected_pnl = (200.0 / 101.0) * (120.0 - 101.0) + (200.0 / 120.0) * (125.0 - 120.0)
+        for engine in (single, portfolio):
+            assert engine.progress.total_trades == 2
+            assert engine.progress.current_pnl == pytest.approx(expected_pnl)
+            assert engine._signals_generated == 4
+        assert [(t.exit_price, t.pnl) for t in single.trades] == [
+            (t.exit_price, pytest.approx(t.pnl)) for t in portfolio.trades
+        ]
+
+
 # =============================================================================
 # TradeRecord Tests
 # =============================================================================
@@ -0,0 +1,143 @@
+"""
+Unit Tests for BacktestResultSink
+=================================
+Tests for columnar buffering and bulk ILP writes of backtest results.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from src.trading.backtest_engine import BacktestEngine, EquityPoint, TradeRecord
+from src.trading.backtest_result_sink import BacktestResultSink
+
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mock_db_provider():
+    """Create mock QuestDB provider recording columnar batches"""
+    provider = MagicMock()
+    provider.insert_columnar_batch = AsyncMock(side_effect=lambda **batch: len(batch["timestamps"]))
+    return provider
+
+
+def equity_point(minute: int) -> EquityPoint:
+    return EquityPoint(timestamp=START + timedelta(minutes=minute), equity=10000.0 + minute, open_positions=minute % 2)
+
+
+def batches_for(provider, table):
+    return [call.kwargs for call in provider.insert_columnar_batch.call_args_list if call.kwargs["table"] == table]
+
+
+class TestBuffering:
+    """Rows are buffered in columns and written on flush"""
+
+    @pytest.mark.asyncio
+    async def test_equity_curve_written_at_full_resolution(self, mock_db_provider):
+        sink = BacktestResultSink(mock_db_provider, "bt_001", MagicMock())
+        for minute in range(25):
+            sink.add_equity_point(equity_point(minute))
+
+        mock_db_provider.insert_columnar_batch.assert_not_called()
+        await sink.flush()
+
+        (batch,) = batches_for(mock_db_provider, "backtest_equity_curve")
+        assert len(batch["timestamps"]) == 25
+        assert batch["symbols"] == {"session_id": ["bt_001"] * 25}
+        assert batch["columns"]["equity"] == [10000.0 + m for m in range(25)]
+        assert batch["columns"]["open_positions"] == [m % 2 for m in range(25)]
+        assert sink.get_stats()["rows_written"] == 25
+
+    @pytest.mark.asyncio
+    async def test_trades_and_signals_written_per_table(self, mock_db_provider):
+        sink = BacktestResultSink(mock_db_provider, "bt_001", MagicMock())
+        sink.add_trade(TradeRecord(
+            trade_id="t1", session_id="bt_001", symbol="BTC_USDT", order_type="SELL",
+            quantity=0.1, entry_price=50000.0, exit_price=None, pnl=-5.0, exit_time=START
+        ))
+        sink.add_signal(START, "BTC_USDT", "strat_a", {"signal_type": "ENTRY", "side": "buy", "price": 50000, "quantity": 0.1}, "o1")
+        await sink.close()
+
+        (trades,) = batches_for(mock_db_provider, "backtest_trades")
+        assert trades["timestamps"] == [START]
+        assert trades["columns"]["trade_id"] == ["t1"]
+        assert trades["columns"]["exit_price"] == [None]
+        assert trades["symbols"]["strategy_signal"] == [None]
+
+        (signals,) = batches_for(mock_db_provider, "backtest_signals")
+        assert signals["symbols"]["side"] == ["BUY"]
+        assert signals["symbols"]["strategy_id"] == ["strat_a"]
+        assert signals["columns"]["order_id"] == ["o1"]
+        assert sink.pending_rows == 0
+
+
+class TestBackgroundFlush:
+    """Full buffers are written by a background task"""
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_flushed_in_background(self, mock_db_provider):
+        sink = BacktestResultSink(mock_db_provider, "bt_001", MagicMock(), flush_rows=10)
+        for minute in range(10):
+            sink.add_equity_point(equity_point(minute))
+
+        assert sink.pending_rows == 0  # Swapped out synchronously
+        await asyncio.sleep(0)
+        assert mock_db_provider.insert_columnar_batch.await_count == 1
+
+        for minute in range(10, 13):
+            sink.add_equity_point(equity_point(minute))
+        await sink.flush()
+
+        sizes = [len(b["timestamps"]) for b in batches_for(mock_db_provider, "backtest_equity_curve")]
+        assert sizes == [10, 3]
+
+    @pytest.mark.asyncio
+    async def test_one_flush_in_flight(self, mock_db_provider):
+        release = asyncio.Event()
+
+        async def slow_insert(**batch):
+            await release.wait()
+            return len(batch["timestamps"])
+
+        mock_db_provider.insert_columnar_batch.side_effect = slow_insert
+        sink = BacktestResultSink(mock_db_provider, "bt_001", MagicMock(), flush_rows=2)
+        for minute in range(6):
+            sink.add_equity_point(equity_point(minute))
+        await asyncio.sleep(0)
+
+        assert mock_db_provider.insert_columnar_batch.await_count == 1
+        assert sink.pending_rows == 4
+
+        release.set()
+        await sink.flush()
+        assert sink.get_stats()["rows_written"] == 6
+
+    @pytest.mark.asyncio
+    async def test_write_failure_logged_not_raised(self, mock_db_provider):
+        mock_db_provider.insert_columnar_batch.side_effect = RuntimeError("ILP unavailable")
+        logger = MagicMock()
+        sink = BacktestResultSink(mock_db_provider, "bt_001", logger)
+        sink.add_equity_point(equity_point(0))
+
+        await sink.flush()
+
+        assert sink.get_stats()["rows_failed"] == 1
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args[0][0] == "backtest_result_sink.flush_failed"
+
+
+class TestEngineIntegration:
+    """BacktestEngine feeds the sink instead of inserting row by row"""
+
+    def test_equity_points_buffered(self, mock_db_provider):
+        engine = BacktestEngine(session_id="bt_001", db_provider=mock_db_provider, event_bus=MagicMock())
+        engine.config = MagicMock(initial_balance=10000.0)
+        engine.peak_equity = 10000.0
+
+        for minute in range(15):
+            engine._record_equity_point(START + timedelta(minutes=minute), [])
+
+        assert engine.result_sink.pending_rows == 15
@@ -0,0 +1,247 @@
+"""
+Unit Tests for BacktestParameterSweep
+=====================================
+Tests for grid/random combinations, the vectorized simulation (and its
+parity with BacktestEngine) and process-pool fan-out with ranked progress
+broadcasts.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from src.trading.backtest_data_provider_questdb import PriceColumns
+from src.trading.backtest_engine import BacktestConfig, BacktestEngine
+from src.trading.backtest_sweep import (
+    BacktestParameterSweep,
+    DEFAULT_PARAMETERS,
+    SweepMarketData,
+    expand_grid,
+    sample_parameters,
+    simulate_combination,
+    simulate_trades,
+)
+
+
+SYMBOLS = ["A_USDT", "B_USDT"]
+
+
+def price_columns():
+    """A_USDT enters at t1 and reaches +18.8% at t2; B_USDT drops 10% after an entry at t1"""
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+    rows = [
+        (t0, "A_USDT", 100.0, 100.0, 100.0),
+        (t0 + 60, "A_USDT", 100.0, 101.0, 1000.0),
+        (t0 + 120, "A_USDT", 101.0, 120.0, 100.0),
+        (t0 + 60, "B_USDT", 50.0, 50.0, 10.0),
+        (t0 + 120, "B_USDT", 50.0, 51.0, 100.0),
+        (t0 + 180, "B_USDT", 51.0, 45.9, 10.0),
+    ]
+    df = pd.DataFrame([
+        {"timestamp": ts, "symbol": sym, "open": o, "high": max(o, c), "low": min(o, c), "close": c, "volume": v}
+        for ts, sym, o, c, v in rows
+    ])
+    return PriceColumns.from_frame(df, SYMBOLS)
+
+
+def market_data():
+    data = price_columns()
+    return SweepMarketData.from_arrays(data.open, data.close, data.volume)
+
+
+class TestCombinations:
+    """Tests for grid expansion and random search"""
+
+    def test_expand_grid(self):
+        combos = expand_grid({"stop_loss_percent": [1, 2], "take_profit_percent": [5, 10, 15]})
+
+        assert len(combos) == 6
+        assert {"stop_loss_percent": 2, "take_profit_percent": 15} in combos
+
+    def test_sample_parameters_reproducible(self):
+        space = {"entry_volume_ratio": (1.0, 3.0)}
+
+        first = sample_parameters(space, 20, seed=7)
+        assert first == sample_parameters(space, 20, seed=7)
+        assert all(1.0 <= c["entry_volume_ratio"] <= 3.0 for c in first)
+
+    def test_unknown_parameter_rejected(self):
+        with pytest.raises(ValueError, match="Unknown sweep parameters"):
+            expand_grid({"leverage": [1, 2]})
+
+
+class TestSimulation:
+    """Tests for the vectorized replay of BacktestEngine rules"""
+
+    def test_default_parameters_match_engine_rules(self):
+        result = simulate_combination(market_data(), {}, 10000.0)
+
+        # A_USDT: take profit at 120 (+18.8%); B_USDT: stop loss at 45.9 (-10%)
+        a_pnl = (10000.0 * 0.02 / 101.0) * (120.0 - 101.0)
+        b_pnl = (10000.0 * 0.02 / 51.0) * (45.9 - 51.0)
+        assert result["total_trades"] == 2
+        assert result["winning_trades"] == 1
+        assert result["final_pnl"] == pytest.approx(a_pnl + b_pnl)
+        assert result["max_drawdown_pct"] > 0
+
+    def test_open_position_closed_at_end(self):
+        result = simulate_combination(market_data(), {"take_profit_percent": 50.0, "stop_loss_percent": 50.0}, 10000.0)
+
+        a_pnl = (10000.0 * 0.02 / 101.0) * (120.0 - 101.0)
+        b_pnl = (10000.0 * 0.02 / 51.0) * (45.9 - 51.0)
+        assert result["total_trades"] == 2
+        assert result["final_pnl"] == pytest.approx(a_pnl + b_pnl)
+
+    def test_entry_threshold_filters_trades(self):
+        result = simulate_combination(market_data(), {"entry_volume_ratio": 5.0}, 10000.0)
+
+        assert result["total_trades"] == 0
+        assert result["final_pnl"] == 0.0
+
+
+def random_walk_columns(seed: int = 11, steps: int = 400):
+    """Three noisy symbols with volume spikes and missing candles"""
+    rng = np.random.default_rng(seed)
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+    symbols = ["A_USDT", "B_USDT", "C_USDT"]
+    rows = []
+    for symbol in symbols:
+        price = 100.0
+        for step in range(steps):
+            if rng.random() < 0.1:
+                continue  # Gap: symbol has no candle at this step
+            open_ = price
+            price = max(1.0, price * (1 + rng.normal(0, 0.01)))
+            volume = rng.uniform(10, 100) * (8 if rng.random() < 0.1 else 1)
+            rows.append({
+                "timestamp": t0 + step * 60, "symbol": symbol, "open": open_,
+                "high": max(open_, price), "low": min(open_, price), "close": price, "volume": volume
+            })
+    return PriceColumns.from_frame(pd.DataFrame(rows), symbols)
+
+
+async def run_engine_portfolio(data: PriceColumns, params, initial_balance: float = 10000.0):
+    """Run BacktestEngine._run_portfolio with one strategy on preloaded columns"""
+    db_provider = MagicMock()
+    db_provider.execute_query = AsyncMock(return_value=[])  # Default strategy
+    db_provider.insert_columnar_batch = AsyncMock(return_value=0)
+    event_bus = MagicMock()
+    event_bus.publish = AsyncMock()
+    event_bus.subscribe = AsyncMock()
+
+    engine = BacktestEngine(session_id="bt_parity", db_provider=db_provider, event_bus=event_bus, logger=MagicMock())
+    engine.config = BacktestConfig(
+        session_id="bt_parity", strategy_id="s1", symbol=",".join(data.symbols),
+        start_date=data.timestamps[0], end_date=data.timestamps[-1],
+        initial_balance=initial_balance, **params
+    )
+    engine.data_provider = MagicMock()
+    engine.data_provider.get_price_columns = AsyncMock(return_value=data)
+    engine.peak_equity = initial_balance
+
+    await engine._run_portfolio()
+    return engine
+
+
+class TestEngineParity:
+    """simulate_trades / simulate_combination must match BacktestEngine on the same data"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("params", [
+        {},
+        {"entry_momentum_pct": 0.2, "entry_volume_ratio": 1.5, "stop_loss_percent": 1.0, "take_profit_percent": 1.5},
+        {"entry_momentum_pct": 0.0, "entry_volume_ratio": 1.0, "stop_loss_percent": 3.0,
+         "take_profit_percent": 50.0, "position_size_pct": 5.0},
+    ])
+    async def test_trades_and_pnl_match_engine(self, params):
+        data = random_walk_columns()
+        sweep_data = SweepMarketData.from_arrays(data.open, data.close, data.volume)
+
+        engine = await run_engine_portfolio(data, params)
+        trades = simulate_trades(sweep_data, params, 10000.0)
+        metrics = simulate_combination(sweep_data, params, 10000.0)
+
+        exit_index = {timestamp: step for step, timestamp in enumerate(data.timestamps)}
+        engine_trades = sorted(
+            (data.symbols.index(t.symbol), exit_index[t.exit_time], t.entry_price, t.pnl) for t in engine.trades
+        )
+        last_step = len(data) - 1
+        sweep_trades = sorted(
+            (t.row, last_step if t.exit_step is None else t.exit_step, t.entry_price, t.pnl) for t in trades
+        )
+
+        assert len(sweep_trades) > 1
+        assert len(engine_trades) == len(sweep_trades)
+        for engine_trade, sweep_trade in zip(engine_trades, sweep_trades):
+            assert engine_trade[:2] == sweep_trade[:2]
+            assert engine_trade[2:] == pytest.approx(sweep_trade[2:])
+
+        assert metrics["total_trades"] == engine.progress.total_trades
+        assert metrics["final_pnl"] == pytest.approx(engine.progress.current_pnl)
+        assert metrics["max_drawdown_pct"] == pytest.approx(engine.progress.max_drawdown_pct)
+
+
+class TestParameterSweep:
+    """Tests for process-pool fan-out and ranked broadcasts"""
+
+    def make_sweep(self, combinations, **kwargs):
+        event_bus = MagicMock()
+        event_bus.publish = AsyncMock()
+        return BacktestParameterSweep(
+            sweep_id="sweep_001",
+            db_provider=MagicMock(),
+            event_bus=event_bus,
+            symbols=SYMBOLS,
+            start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2025, 1, 2, tzinfo=timezone.utc),
+            combinations=combinations,
+            max_workers=2,
+            logger=MagicMock(),
+            **kwargs
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_on_data_ranks_results(self):
+        combos = expand_grid({"entry_volume_ratio": [1.5, 5.0], "take_profit_percent": [10.0, 50.0]})
+        sweep = self.make_sweep(combos, top_n=3)
+
+        await sweep.run_on_data(price_columns())
+
+        assert sorted(r["index"] for r in sweep.results) == [0, 1, 2, 3]
+        ranking = sweep.ranking()
+        assert len(ranking) == 3
+        assert ranking[0]["final_pnl"] >= ranking[1]["final_pnl"] >= ranking[2]["final_pnl"]
+        for result in sweep.results:
+            expected = simulate_combination(market_data(), combos[result["index"]], 10000.0)
+            assert result["final_pnl"] == pytest.approx(expected["final_pnl"])
+
+        event_type, message = sweep.event_bus.publish.await_args_list[-1].args
+        assert event_type == "backtest.progress"
+        assert message["data"]["session_id"] == "sweep_001"
+        assert message["data"]["completed"] == 4
+        assert message["data"]["ranking"] == ranking
+
+    @pytest.mark.asyncio
+    async def test_drawdown_ranks_ascending(self):
+        sweep = self.make_sweep([{}], rank_by="max_drawdown_pct")
+        sweep.results = [{"max_drawdown_pct": 5.0}, {"max_drawdown_pct": 1.0}]
+
+        assert sweep.ranking()[0]["max_drawdown_pct"] == 1.0
+
+    def test_invalid_rank_metric_rejected(self):
+        with pytest.raises(ValueError, match="Cannot rank"):
+            self.make_sweep([{}], rank_by="sharpe")
+
+    @pytest.mark.asyncio
+    async def test_run_without_data_fails_gracefully(self):
+        sweep = self.make_sweep([DEFAULT_PARAMETERS])
+        sweep.db_provider.initialize = AsyncMock()
+        sweep.db_provider.get_ohlcv_resample_multi = AsyncMock(return_value=pd.DataFrame())
+
+        result = await sweep.run()
+
+        assert result.status.value == "failed"
+        assert "No historical data found" in result.error_message
+        assert sweep.event_bus.publish.await_args.args[0] == "backtest.failed"
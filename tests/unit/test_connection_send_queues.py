@@ -0,0 +1,148 @@
+"""
+Tests for per-client WebSocket send queues
+==========================================
+Verifies that broadcasts are enqueued onto bounded per-client queues drained
+by one writer task per client.
+
+Test Coverage:
+- A stalled client does not delay delivery to other clients
+- market_data / indicators frames are conflated per symbol while a client lags
+- Non-conflated streams drop the oldest frame when the queue is full
+- Clients backlogged longer than the timeout are disconnected
+- Queue depth and drop counts in get_connection_stats_snapshot
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.api.connection_manager import ConnectionManager, conflation_key
+
+
+class FakeWebSocket:
+    """websockets-style connection; send() blocks while the gate is closed"""
+
+    def __init__(self, stalled: bool = False):
+        self.sent = []
+        self.closed = False
+        self.close_code = None
+        self.gate = asyncio.Event()
+        if not stalled:
+            self.gate.set()
+
+    async def send(self, data):
+        await self.gate.wait()
+        self.sent.append(json.loads(data))
+
+    async def close(self, code=1000):
+        self.closed = True
+        self.close_code = code
+
+
+async def connect(manager: ConnectionManager, websocket: FakeWebSocket, subscription_type: str = "market_data") -> str:
+    client_id = await manager.add_connection(websocket, {"ip_address": "127.0.0.1"})
+    await manager.subscribe_client(client_id, subscription_type)
+    return client_id
+
+
+async def drain() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def tick(symbol: str, price: float) -> dict:
+    return {"type": "data", "stream": "market_data", "data": {"symbol": symbol, "price": price}}
+
+
+class TestConflationKey:
+    """Test conflation key derivation"""
+
+    def test_keys(self):
+        assert conflation_key("market_data", tick("BTC_USDT", 1.0)) == ("market_data", "BTC_USDT")
+        assert conflation_key("indicators", {"data": {"symbol": "BTC_USDT", "indicator": "TWPA"}}) == (
+            "indicators", "BTC_USDT", "TWPA"
+        )
+        assert conflation_key("signals", tick("BTC_USDT", 1.0)) is None
+        assert conflation_key("market_data", {"type": "batch_update", "data": {"BTC_USDT": {}}}) is None
+
+
+class TestSendQueues:
+    """Test per-client send queues"""
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_does_not_block_others(self):
+        manager = ConnectionManager()
+        stalled, healthy = FakeWebSocket(stalled=True), FakeWebSocket()
+        await connect(manager, stalled)
+        await connect(manager, healthy)
+
+        for i in range(5):
+            await asyncio.wait_for(manager.broadcast_to_subscription("market_data", tick(f"S{i}", 1.0)), timeout=1.0)
+        await drain()
+
+        assert [m["data"]["symbol"] for m in healthy.sent] == ["S0", "S1", "S2", "S3", "S4"]
+        assert stalled.sent == []
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_lagging_client_gets_latest_value_per_symbol(self):
+        manager = ConnectionManager()
+        websocket = FakeWebSocket(stalled=True)
+        await connect(manager, websocket)
+
+        for price in range(1, 6):
+            await manager.broadcast_to_subscription("market_data", tick("BTC_USDT", float(price)))
+            await manager.broadcast_to_subscription("market_data", tick("ETH_USDT", float(price * 10)))
+        await drain()
+
+        websocket.gate.set()
+        await drain()
+
+        # Pending frames collapsed to the latest per symbol, in first-seen order
+        assert [(m["data"]["symbol"], m["data"]["price"]) for m in websocket.sent] == [
+            ("BTC_USDT", 5.0), ("ETH_USDT", 50.0)
+        ]
+        stats = manager.get_connection_stats_snapshot()
+        assert stats["send_queue_conflated"] == 8
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        manager = ConnectionManager(send_queue_size=3)
+        websocket = FakeWebSocket(stalled=True)
+        await connect(manager, websocket, "signals")
+
+        for i in range(6):
+            await manager.broadcast_to_subscription("signals", {"type": "signal", "i": i})
+        await drain()
+
+        stats = manager.get_connection_stats_snapshot()
+        assert stats["send_queue_depth"] == 2  # Writer holds frame 3 in the stalled send
+        assert stats["max_send_queue_depth"] == 3
+        assert stats["send_queue_dropped"] == 3
+        assert stats["backpressured_clients"] == 1
+
+        websocket.gate.set()
+        await drain()
+        assert [m["i"] for m in websocket.sent] == [3, 4, 5]
+        assert manager.get_connection_stats_snapshot()["backpressured_clients"] == 0
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_sustained_backpressure_disconnects(self):
+        manager = ConnectionManager(send_queue_size=2, slow_consumer_timeout_seconds=0.05)
+        websocket = FakeWebSocket(stalled=True)
+        client_id = await connect(manager, websocket, "signals")
+
+        for i in range(5):
+            await manager.broadcast_to_subscription("signals", {"type": "signal", "i": i})
+        await asyncio.sleep(0.06)
+        sent = await manager.broadcast_to_subscription("signals", {"type": "signal", "i": 99})
+        await drain()
+
+        assert sent == 0
+        assert websocket.closed and websocket.close_code == 1008
+        assert await manager.get_connection(client_id) is None
+        assert manager.get_connection_stats_snapshot()["slow_consumer_disconnects"] == 1
+        await manager.shutdown()
@@ -2,7 +2,8 @@
 Tests for DashboardCacheService - BUG-004-4 Fix
 
 Tests that _get_session_symbols() retrieves symbols from session configuration
-(data_collection_sessions table) instead of tick_prices table.
+(data_collection_sessions table) instead of tick_prices table, and that the
+event-driven mode maintains rolling aggregates and flushes only changed rows.
 """
 
 import pytest
@@ -181,3 +182,270 @@ class TestGetSessionSymbols:
         call_args = mock_conn.fetchrow.call_args
         query = call_args[0][0]
         assert "is_deleted = false" in query
+
+
+class TestEventDrivenCache:
+    """Tests for the event-driven cache (rolling aggregates, dirty-row flushes)."""
+
+    T0 = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+
+    @pytest.fixture
+    def mock_conn(self):
+        conn = AsyncMock()
+        conn.fetch = AsyncMock(return_value=[])
+        conn.fetchrow = AsyncMock(return_value=None)
+        conn.executemany = AsyncMock()
+        return conn
+
+    @pytest.fixture
+    def mock_questdb(self, mock_conn):
+        mock = MagicMock()
+        mock.pg_pool = MagicMock()
+        mock.pg_pool.acquire = MagicMock(return_value=AsyncMock(
+            __aenter__=AsyncMock(return_value=mock_conn),
+            __aexit__=AsyncMock(return_value=None)
+        ))
+        return mock
+
+    @pytest.fixture
+    def service(self, mock_questdb):
+        event_bus = MagicMock()
+        event_bus.subscribe = AsyncMock()
+        event_bus.unsubscribe = AsyncMock()
+        return DashboardCacheService(mock_questdb, update_interval=1.0, event_bus=event_bus)
+
+    async def activate(self, service, sessions, price_buckets=(), positions=None):
+        """
+        Refresh sessions with {session_id: symbols}, skipping the QuestDB seed.
+
+        positions stands in for the positions table ({session_id: {symbol: position}});
+        without it open positions are parsed from mock_conn.fetch rows.
+        """
+        service._get_active_sessions = AsyncMock(return_value=list(sessions))
+        service._get_session_symbols = AsyncMock(side_effect=lambda sid: sessions[sid])
+        service._get_latest_price = AsyncMock(return_value={'price': 0.0})
+        if positions is not None:
+            service._get_open_positions = AsyncMock(side_effect=lambda sid: dict(positions.get(sid, {})))
+        service._calculate_max_drawdown = AsyncMock(return_value=0.0)
+        service._count_recent_signals = AsyncMock(return_value=0)
+        service._get_latest_balance = AsyncMock(return_value=0.0)
+        service._get_price_buckets = AsyncMock(return_value=list(price_buckets))
+        await service._refresh_sessions()
+
+    def written(self, mock_conn, table):
+        rows = []
+        for call in mock_conn.executemany.call_args_list:
+            if table in call.args[0]:
+                rows.extend(call.args[1])
+        return rows
+
+    @pytest.mark.asyncio
+    async def test_start_subscribes_instead_of_polling(self, service):
+        service._refresh_sessions = AsyncMock()
+
+        await service.start()
+        await service.stop()
+
+        topics = [call.args[0] for call in service.event_bus.subscribe.call_args_list]
+        assert "market.price_update" in topics
+        assert {"position_opened", "position_updated", "position_closed"} <= set(topics)
+        assert service.event_bus.unsubscribe.await_count == len(topics)
+
+    @pytest.mark.asyncio
+    async def test_rolling_24h_change_and_volume(self, service, mock_conn):
+        await self.activate(service, {"s1": ["BTC_USDT"]})
+        await service._flush_dirty()
+        mock_conn.executemany.reset_mock()
+
+        await service._on_price_updates([
+            {"symbol": "BTC_USDT", "price": 100.0, "volume": 1.0, "timestamp": self.T0},
+            {"symbol": "BTC_USDT", "price": 105.0, "volume": 2.0, "timestamp": self.T0 + 3600},
+            {"symbol": "BTC_USDT", "price": 110.0, "volume": 3.0, "timestamp": (self.T0 + 7200) * 1000},
+        ])
+        await service._flush_dirty()
+
+        (row,) = self.written(mock_conn, "watchlist_cache")
+        assert row[:5] == ("s1", "BTC_USDT", 110.0, pytest.approx(10.0), 6.0)
+
+        # The first hour's bucket leaves the window 24h later
+        await service._on_price_updates([
+            {"symbol": "BTC_USDT", "price": 99.0, "volume": 4.0, "timestamp": self.T0 + 24 * 3600 + 60},
+        ])
+        stats = service._symbol_stats["BTC_USDT"]
+        assert stats.volume == 9.0
+        assert stats.change_pct == pytest.approx((99.0 - 105.0) / 105.0 * 100.0)
+
+    @pytest.mark.asyncio
+    async def test_only_dirty_rows_flushed(self, service, mock_conn):
+        await self.activate(service, {"s1": ["BTC_USDT", "ETH_USDT"], "s2": ["ETH_USDT"]})
+        await service._flush_dirty()
+        mock_conn.executemany.reset_mock()
+
+        await service._on_price_updates([{"symbol": "ETH_USDT", "price": 3000.0, "volume": 1.0}])
+        await service._flush_dirty()
+
+        rows = self.written(mock_conn, "watchlist_cache")
+        assert sorted((r[0], r[1]) for r in rows) == [("s1", "ETH_USDT"), ("s2", "ETH_USDT")]
+        assert self.written(mock_conn, "dashboard_summary_cache") == []
+
+        mock_conn.executemany.reset_mock()
+        await service._flush_dirty()
+        mock_conn.executemany.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_positions_update_watchlist_and_summary(self, service, mock_conn):
+        table = {"s1": {}}
+        await self.activate(service, {"s1": ["BTC_USDT", "ETH_USDT"]}, positions=table)
+        await service._flush_dirty()
+        mock_conn.executemany.reset_mock()
+
+        table["s1"]["BTC_USDT"] = {"side": "LONG", "unrealized_pnl": 12.5, "margin_ratio": 0.2, "margin": 0.0}
+        table["s1"]["ETH_USDT"] = {"side": "SHORT", "unrealized_pnl": -2.5, "margin_ratio": 0.4, "margin": 0.0}
+        await service._on_position_event({"position_id": "ETH_USDT_o2", "symbol": "ETH_USDT"})
+        await service._on_signal_generated({"symbol": "BTC_USDT", "timestamp": self.T0})
+        await service._reload_positions()
+        await service._flush_dirty()
+
+        (summary,) = self.written(mock_conn, "dashboard_summary_cache")
+        assert summary[:4] == ("s1", 10.0, 2, 1)
+        assert summary[5] == pytest.approx(0.3)
+        btc = next(r for r in self.written(mock_conn, "watchlist_cache") if r[1] == "BTC_USDT")
+        assert btc[5:8] == ("LONG", 12.5, 0.2)
+
+        mock_conn.executemany.reset_mock()
+        del table["s1"]["BTC_USDT"]
+        await service._reload_positions()
+        await service._flush_dirty()
+
+        (summary,) = self.written(mock_conn, "dashboard_summary_cache")
+        assert summary[1:3] == (-2.5, 1)
+        (btc,) = self.written(mock_conn, "watchlist_cache")
+        assert btc[5] is None
+
+    @pytest.mark.asyncio
+    async def test_order_manager_position_events_across_sessions(self, service, mock_conn):
+        """OrderManager events carry per-order ids, no session and (after open) no symbol."""
+        table = {"s1": {}, "s2": {}}
+        await self.activate(service, {"s1": ["BTC_USDT"], "s2": ["BTC_USDT", "ETH_USDT"]}, positions=table)
+        await service._flush_dirty()
+        mock_conn.executemany.reset_mock()
+
+        async def replay(event, position):
+            # s1's TradingPersistence writes the positions table; the cache re-reads it
+            await service._on_position_event(event)
+            if position is None:
+                table["s1"].pop("BTC_USDT")
+            else:
+                table["s1"]["BTC_USDT"] = position
+            assert service._positions_stale
+            await service._reload_positions()
+            await service._flush_dirty()
+            summaries = {row[0]: row for row in self.written(mock_conn, "dashboard_summary_cache")}
+            watchlist = [(row[0], row[1], row[5]) for row in self.written(mock_conn, "watchlist_cache")]
+            mock_conn.executemany.reset_mock()
+            return summaries, watchlist
+
+        summaries, watchlist = await replay({
+            "position_id": "BTC_USDT_ord-1", "strategy_id": "momentum", "symbol": "BTC_USDT",
+            "side": "LONG", "quantity": 0.1, "entry_price": 50000.0, "current_price": 50000.0,
+            "stop_loss": None, "take_profit": None,
+            "metadata": {"leverage": 5.0, "liquidation_price": 40000.0}, "timestamp": self.T0
+        }, {"side": "LONG", "unrealized_pnl": 0.0, "margin_ratio": 0.2, "margin": 1000.0})
+        assert list(summaries) == ["s1"]
+        assert summaries["s1"][1:3] == (0.0, 1)
+        assert watchlist == [("s1", "BTC_USDT", "LONG")]
+
+        summaries, watchlist = await replay({
+            "position_id": "BTC_USDT_ord-2", "current_price": 51000.0,
+            "unrealized_pnl": 100.0, "timestamp": self.T0 + 60
+        }, {"side": "LONG", "unrealized_pnl": 100.0, "margin_ratio": 0.2, "margin": 1000.0})
+        assert summaries["s1"][1:3] == (100.0, 1)
+        assert service.get_stats()["open_positions"] == 1
+
+        summaries, watchlist = await replay({
+            "position_id": "BTC_USDT_ord-3", "current_price": 51000.0,
+            "realized_pnl": 100.0, "timestamp": self.T0 + 120
+        }, None)
+        assert summaries["s1"][1:3] == (0.0, 0)
+        assert watchlist == [("s1", "BTC_USDT", None)]
+        assert service.get_stats()["open_positions"] == 0
+
+        # An ended session takes its positions with it
+        table["s1"]["BTC_USDT"] = {"side": "SHORT", "unrealized_pnl": 1.0, "margin_ratio": None, "margin": 0.0}
+        await service._reload_positions()
+        await self.activate(service, {"s2": ["BTC_USDT", "ETH_USDT"]}, positions=table)
+        assert list(service._positions) == ["s2"]
+        assert service.get_stats()["open_positions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_drawdown_from_performance_events(self, service, mock_conn):
+        await self.activate(service, {"s1": ["BTC_USDT"]})
+
+        for balance in (10000.0, 11000.0, 9900.0, 10500.0):
+            await service._on_performance_updated({"session_id": "s1", "current_balance": balance})
+        await service._flush_dirty()
+
+        (summary,) = self.written(mock_conn, "dashboard_summary_cache")
+        assert summary[6] == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_budget_utilization_from_position_margin(self, service, mock_conn):
+        mock_conn.fetch.return_value = [
+            {"symbol": "BTC_USDT", "side": "long", "status": "OPEN", "unrealized_pnl": 5.0,
+             "margin_ratio": 0.2, "quantity": 0.1, "current_price": 50000.0, "metadata": '{"leverage": 5.0}'},
+            {"symbol": "ETH_USDT", "side": "SHORT", "status": "OPEN", "unrealized_pnl": None,
+             "margin_ratio": None, "quantity": -1.0, "current_price": 500.0, "metadata": None},
+            {"symbol": "SOL_USDT", "side": "LONG", "status": "CLOSED", "unrealized_pnl": 0.0,
+             "margin_ratio": None, "quantity": 10.0, "current_price": 150.0, "metadata": None},
+        ]
+        await self.activate(service, {"s1": ["BTC_USDT", "ETH_USDT"]})
+        await service._on_performance_updated({"session_id": "s1", "current_balance": 10000.0})
+        await service._flush_dirty()
+
+        (summary,) = self.written(mock_conn, "dashboard_summary_cache")
+        assert summary[1:3] == (5.0, 2)
+        assert summary[4] == pytest.approx((1000.0 + 500.0) / 10000.0 * 100.0)
+        btc = next(r for r in self.written(mock_conn, "watchlist_cache") if r[1] == "BTC_USDT")
+        assert btc[5] == "LONG"
+
+    @pytest.mark.asyncio
+    async def test_seeded_buckets_give_24h_change(self, service, mock_conn):
+        buckets = [(self.T0, 100.0, 5.0), (self.T0 + 3600, 104.0, 1.0)]
+        await self.activate(service, {"s1": ["BTC_USDT"]}, price_buckets=buckets)
+
+        await service._on_price_updates([
+            {"symbol": "BTC_USDT", "price": 110.0, "volume": 2.0, "timestamp": self.T0 + 7200},
+        ])
+        await service._flush_dirty()
+
+        (row,) = self.written(mock_conn, "watchlist_cache")
+        assert row[:5] == ("s1", "BTC_USDT", 110.0, pytest.approx(10.0), 8.0)
+        service._get_price_buckets.assert_awaited_once_with("s1", "BTC_USDT")
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_rows_dirty(self, service, mock_conn):
+        await self.activate(service, {"s1": ["BTC_USDT"]})
+        mock_conn.executemany.side_effect = ConnectionError("questdb down")
+
+        await service._flush_dirty()
+
+        assert service.get_stats()["dirty_watchlist_rows"] == 1
+        assert service.get_stats()["dirty_summary_rows"] == 1
+
+        mock_conn.executemany.side_effect = None
+        await service._flush_dirty()
+        assert service.get_stats()["rows_flushed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_new_session_seeded_once(self, service):
+        await self.activate(service, {"s1": ["BTC_USDT"]}, positions={})
+        service._get_latest_balance.assert_awaited_once_with("s1")
+
+        await service._refresh_sessions()
+        service._get_latest_balance.assert_awaited_once()
+        # Open positions are re-read on every refresh
+        assert service._get_open_positions.await_count == 2
+
+        await self.activate(service, {})
+        assert service.get_stats()["active_sessions"] == 0
+        assert service.get_stats()["dirty_summary_rows"] == 0
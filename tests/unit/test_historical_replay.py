@@ -0,0 +1,256 @@
+"""
+Unit Tests for QuestDBHistoricalDataSource replay
+=================================================
+
+Tests backtest replay from QuestDB without a running database.
+
+Test Coverage:
+- Virtual-clock replay publishes every tick without wall-clock sleeps, in
+  publish_many() chunks
+- Replay throughput stats (ticks/s, virtual time covered)
+- Invalid replay_mode rejected at construction
+- Multi-symbol replay is merged in timestamp order
+- Per-symbol pages are prefetched concurrently
+- Replay restarts cleanly after stop_stream()
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.application.controllers.data_sources import (
+    QuestDBHistoricalDataSource,
+    REPLAY_MODE_VIRTUAL_CLOCK,
+)
+from src.core.time_manager import VirtualClock
+
+
+class FakeQuestDBDataProvider:
+    """In-memory stand-in for QuestDBDataProvider (tick_prices only)"""
+
+    def __init__(self, ticks_by_symbol: Dict[str, List[Dict[str, Any]]], query_latency: float = 0.0):
+        self.ticks_by_symbol = ticks_by_symbol
+        self.query_latency = query_latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.db = None
+
+    async def count_records(self, session_id: str, symbol: str, data_type: str) -> int:
+        return len(self.ticks_by_symbol.get(symbol, []))
+
+    async def get_tick_prices(
+        self,
+        session_id: str,
+        symbol: str,
+        limit: Optional[int] = None,
+        after_timestamp: Optional[int] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.query_latency)
+        finally:
+            self.in_flight -= 1
+
+        rows = self.ticks_by_symbol.get(symbol, [])
+        if after_timestamp is not None:
+            rows = [r for r in rows if int(r["timestamp"].timestamp() * 1_000_000) > after_timestamp]
+        return rows[:limit] if limit else list(rows)
+
+
+class RecordingEventBus:
+    """Collects published events"""
+
+    def __init__(self):
+        self.events: List[tuple] = []
+        self.batch_sizes: List[int] = []
+
+    async def publish(self, topic: str, data: Dict[str, Any]) -> None:
+        self.events.append((topic, data))
+
+    async def publish_many(self, topic: str, items: List[Dict[str, Any]]) -> None:
+        self.batch_sizes.append(len(items))
+        self.events.extend((topic, data) for data in items)
+
+
+def make_ticks(count: int, start: datetime, step_seconds: float = 1.0) -> List[Dict[str, Any]]:
+    return [
+        {
+            "timestamp": start + timedelta(seconds=i * step_seconds),
+            "price": 100.0 + i,
+            "volume": 1.0,
+            "quote_volume": 100.0 + i,
+        }
+        for i in range(count)
+    ]
+
+
+async def run_replay(source: QuestDBHistoricalDataSource, timeout: float = 5.0) -> None:
+    await source.start_stream()
+    await asyncio.wait_for(source._replay_task, timeout=timeout)
+
+
+class TestVirtualClock:
+    """Test VirtualClock time advancement"""
+
+    def test_advances_with_event_timestamps(self):
+        clock = VirtualClock()
+        start = datetime(2025, 1, 1, 12, 0, 0)
+
+        assert clock.now() is None
+        clock.advance(start)
+        clock.advance(start + timedelta(seconds=30))
+
+        assert clock.elapsed == pytest.approx(30.0)
+
+    def test_never_moves_backwards(self):
+        clock = VirtualClock()
+        clock.advance(1_700_000_010_000)  # milliseconds
+        clock.advance(1_700_000_000_000)
+
+        assert clock.now() == pytest.approx(1_700_000_010.0)
+        assert clock.elapsed == 0.0
+
+
+class TestVirtualClockReplay:
+    """Test unthrottled replay mode"""
+
+    @pytest.mark.asyncio
+    async def test_replays_all_ticks_without_sleeping(self):
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        provider = FakeQuestDBDataProvider({"BTC_USDT": make_ticks(1000, start)})
+        bus = RecordingEventBus()
+        source = QuestDBHistoricalDataSource(
+            session_id="exec_test",
+            symbols=["BTC_USDT"],
+            db_provider=provider,
+            event_bus=bus,
+            execution_controller=None,
+            batch_size=250,
+            replay_mode=REPLAY_MODE_VIRTUAL_CLOCK,
+        )
+
+        started = time.perf_counter()
+        await run_replay(source)
+        elapsed = time.perf_counter() - started
+
+        # Paced mode would need >= 10s for 1000 ticks (10ms minimum per tick)
+        assert elapsed < 2.0
+        assert len(bus.events) == 1000
+        assert [e[1]["price"] for e in bus.events[:3]] == [100.0, 101.0, 102.0]
+        assert max(bus.batch_sizes) > 1  # Published in chunks via publish_many()
+
+        stats = source.get_replay_stats()
+        assert stats["replay_mode"] == REPLAY_MODE_VIRTUAL_CLOCK
+        assert stats["ticks_replayed"] == 1000
+        assert stats["virtual_seconds"] == pytest.approx(999.0)
+        assert stats["ticks_per_second"] > 500
+        assert source.get_progress() == 100.0
+
+    def test_invalid_replay_mode_rejected(self):
+        with pytest.raises(ValueError, match="replay_mode"):
+            QuestDBHistoricalDataSource(
+                session_id="exec_test",
+                symbols=["BTC_USDT"],
+                db_provider=FakeQuestDBDataProvider({}),
+                event_bus=None,
+                execution_controller=None,
+                replay_mode="warp",
+            )
+
+
+class TestMultiSymbolMerge:
+    """Test timestamp-ordered k-way merge across symbols"""
+
+    def make_source(self, provider, bus, symbols, batch_size=7):
+        return QuestDBHistoricalDataSource(
+            session_id="exec_test",
+            symbols=symbols,
+            db_provider=provider,
+            event_bus=bus,
+            execution_controller=None,
+            batch_size=batch_size,
+            replay_mode=REPLAY_MODE_VIRTUAL_CLOCK,
+        )
+
+    @pytest.mark.asyncio
+    async def test_ticks_published_in_timestamp_order(self):
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        provider = FakeQuestDBDataProvider({
+            "BTC_USDT": make_ticks(40, start, step_seconds=1.0),
+            "ETH_USDT": make_ticks(30, start + timedelta(milliseconds=500), step_seconds=1.5),
+            "SOL_USDT": make_ticks(10, start + timedelta(seconds=20), step_seconds=0.25),
+        })
+        bus = RecordingEventBus()
+        source = self.make_source(provider, bus, ["BTC_USDT", "ETH_USDT", "SOL_USDT"])
+
+        await run_replay(source)
+
+        timestamps = [e[1]["timestamp"] for e in bus.events]
+        assert len(timestamps) == 80
+        assert timestamps == sorted(timestamps)
+        assert {e[1]["symbol"] for e in bus.events} == {"BTC_USDT", "ETH_USDT", "SOL_USDT"}
+        assert source.get_progress() == 100.0
+
+    @pytest.mark.asyncio
+    async def test_equal_timestamps_keep_symbol_order(self):
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        provider = FakeQuestDBDataProvider({
+            "BTC_USDT": make_ticks(5, start),
+            "ETH_USDT": make_ticks(5, start),
+        })
+        bus = RecordingEventBus()
+        source = self.make_source(provider, bus, ["BTC_USDT", "ETH_USDT"], batch_size=2)
+
+        await run_replay(source)
+
+        symbols = [e[1]["symbol"] for e in bus.events]
+        assert symbols == ["BTC_USDT", "ETH_USDT"] * 5
+
+    @pytest.mark.asyncio
+    async def test_symbol_pages_fetched_concurrently(self):
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        symbols = ["BTC_USDT", "ETH_USDT", "SOL_USDT", "XRP_USDT"]
+        provider = FakeQuestDBDataProvider(
+            {symbol: make_ticks(20, start) for symbol in symbols},
+            query_latency=0.01,
+        )
+        bus = RecordingEventBus()
+        source = self.make_source(provider, bus, symbols, batch_size=5)
+
+        await run_replay(source)
+
+        assert len(bus.events) == 80
+        assert provider.max_in_flight >= len(symbols)
+
+
+    @pytest.mark.asyncio
+    async def test_restart_after_stop_replays_from_start(self):
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        provider = FakeQuestDBDataProvider(
+            {
+                "BTC_USDT": make_ticks(30, start),
+                "ETH_USDT": make_ticks(30, start + timedelta(milliseconds=500)),
+            },
+            query_latency=0.01,
+        )
+        bus = RecordingEventBus()
+        source = self.make_source(provider, bus, ["BTC_USDT", "ETH_USDT"], batch_size=4)
+
+        await source.start_stream()
+        while not bus.events:
+            await asyncio.sleep(0.005)
+        await source.stop_stream()
+        assert source._merge_heap is None
+
+        bus.events.clear()
+        await run_replay(source)
+
+        timestamps = [e[1]["timestamp"] for e in bus.events]
+        assert len(timestamps) == 60
+        assert timestamps == sorted(timestamps)
+        assert source.get_progress() == 100.0
@@ -0,0 +1,141 @@
+"""
+Unit Tests for batch (series) indicator calculations
+====================================================
+
+Tests the optional calculate_series() interface against the per-point
+calculate_from_windows() path used by OfflineIndicatorEngine.
+
+Test Coverage:
+- Prefix-integral TWPA matches the scalar time-weighted average
+- TWPA, TWPA_RATIO, PRICE_VELOCITY and PUMP_MAGNITUDE_PCT batch series match
+  per-point results, including warm-up points without a value
+- Algorithms without a batch implementation return None
+- OfflineIndicatorEngine uses the batch path automatically
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.domain.services.indicators.base_algorithm import IndicatorParameters
+from src.domain.services.indicators.price_velocity import price_velocity_algorithm
+from src.domain.services.indicators.pump_magnitude_pct import pump_magnitude_pct_algorithm
+from src.domain.services.indicators.rsi import rsi_algorithm
+from src.domain.services.indicators.twpa import twpa_algorithm
+from src.domain.services.indicators.twpa_ratio import twpa_ratio_algorithm
+from src.domain.services.indicators.window_calculations import (
+    compute_time_weighted_average,
+    compute_time_weighted_average_series,
+)
+from src.domain.services.offline_indicator_engine import OfflineIndicatorEngine
+from src.domain.services.streaming_indicator_engine import IndicatorType
+from src.domain.types.indicator_types import MarketDataPoint
+
+
+def make_points(count: int = 600, seed: int = 3) -> list:
+    rng = np.random.default_rng(seed)
+    gaps = rng.exponential(1.5, count)
+    gaps[::17] = 0.0  # Duplicate timestamps
+    timestamps = 1_700_000_000.0 + np.cumsum(gaps)
+    prices = 100.0 + np.cumsum(rng.normal(0.0, 0.2, count))
+    return [
+        MarketDataPoint(timestamp=float(ts), symbol="BTC_USDT", price=float(price), volume=1.0)
+        for ts, price in zip(timestamps, prices)
+    ]
+
+
+def make_engine(algorithm) -> OfflineIndicatorEngine:
+    registry = Mock(list_algorithms=Mock(return_value=[]), get_algorithm=Mock(return_value=algorithm))
+    engine = OfflineIndicatorEngine(questdb_data_provider=Mock(), algorithm_registry=registry)
+    engine.logger = Mock()
+    return engine
+
+
+def per_point_series(engine, algorithm, points, time_axis, params) -> list:
+    wrapped = IndicatorParameters(params)
+    specs = algorithm.get_window_specs(wrapped)
+    return [
+        algorithm.calculate_from_windows(windows, wrapped)
+        for windows in engine._sweep_windows(points, time_axis, specs)
+    ]
+
+
+class TestTimeWeightedAverageSeries:
+    """Test prefix-integral time-weighted average"""
+
+    @pytest.mark.parametrize("t1,t2", [(30.0, 0.0), (120.0, 45.0), (10.0, -5.0)])
+    def test_matches_scalar_average(self, t1, t2):
+        points = make_points()
+        engine = make_engine(None)
+        timestamps = np.array([p.timestamp for p in points])
+        prices = np.array([p.price for p in points])
+        time_axis = np.arange(timestamps[0] - 20.0, timestamps[-1] + 20.0, 1.0)
+
+        batch = compute_time_weighted_average_series(timestamps, prices, time_axis, t1, t2)
+
+        spec = SimpleNamespace(t1=t1, t2=t2)
+        for value, (window,) in zip(batch, engine._sweep_windows(points, time_axis, [spec])):
+            expected = compute_time_weighted_average(window.data, window.start_ts, window.end_ts)
+            if expected is None:
+                assert np.isnan(value)
+            else:
+                assert value == pytest.approx(expected, rel=1e-9)
+
+
+class TestAlgorithmSeries:
+    """Test calculate_series() against calculate_from_windows()"""
+
+    @pytest.mark.parametrize("algorithm,params", [
+        (twpa_algorithm, {"t1": 60.0, "t2": 0.0}),
+        (twpa_ratio_algorithm, {"t1": 30.0, "t2": 0.0, "t3": 300.0, "t4": 30.0}),
+        (price_velocity_algorithm, {"t1": 10.0, "t3": 60.0, "d": 30.0}),
+        (pump_magnitude_pct_algorithm, {"t1": 10.0, "t3": 120.0, "d": 60.0}),
+    ])
+    def test_batch_matches_per_point(self, algorithm, params):
+        points = make_points()
+        engine = make_engine(algorithm)
+        time_axis = np.arange(np.floor(points[0].timestamp), points[-1].timestamp, 1.0)
+
+        batch = algorithm.calculate_series(
+            np.array([p.timestamp for p in points]),
+            np.array([p.price for p in points]),
+            time_axis,
+            IndicatorParameters(params),
+        )
+        expected = per_point_series(engine, algorithm, points, time_axis, params)
+
+        assert len(batch) == len(expected)
+        assert any(v is None for v in expected)  # Warm-up points are covered
+        for value, reference in zip(batch.tolist(), expected):
+            if reference is None:
+                assert np.isnan(value)
+            else:
+                assert value == pytest.approx(reference, rel=1e-7, abs=1e-12)
+
+    def test_algorithm_without_batch_returns_none(self):
+        assert rsi_algorithm.calculate_series(
+            np.array([1.0]), np.array([1.0]), np.array([1.0]), IndicatorParameters({})
+        ) is None
+
+
+class TestOfflineEngineBatchPath:
+    """Test OfflineIndicatorEngine picks the batch path automatically"""
+
+    def test_uses_calculate_series(self):
+        points = make_points(200)
+        engine = make_engine(twpa_algorithm)
+        params = {"t1": 60.0, "t2": 0.0}
+
+        series = engine._calculate_indicator_series_new(
+            "BTC_USDT", IndicatorType.TWPA, "1m", 0, params, points
+        )
+
+        time_axis = [v.timestamp for v in series]
+        expected = per_point_series(engine, twpa_algorithm, points, time_axis, params)
+        assert [v.value is None for v in series] == [v is None for v in expected]
+        assert [v.value for v in series if v.value is not None] == pytest.approx(
+            [v for v in expected if v is not None], rel=1e-9
+        )
+        assert series[0].indicator_id == "TWPA_0_1m"
@@ -0,0 +1,326 @@
+"""
+Unit Tests for StreamingIndicatorEngine market data storage
+===========================================================
+
+Tests the columnar ring buffer and how the engine shares it across
+timeframes.
+
+Test Coverage:
+- Capacity / eviction and compaction keep rows in order
+- Column views and deque-compatible row access
+- One shared buffer per symbol stream for all timeframe keys
+- Staged ingest rolls back to per-buffer watermarks on failure
+- Failed ticks of a market data batch reach the EventBus retry
+- Windowed calculations read the shared buffer
+- Sortedness tracking and bisection-based window extraction
+- Incremental calculation over a sorted buffer
+- Offline sliding-window sweep matches per-timestamp extraction
+"""
+
+import time
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from src.core.event_bus import BatchDeliveryError, EventBus
+from src.domain.services.streaming_indicator_engine import StreamingIndicatorEngine
+from src.domain.services.offline_indicator_engine import OfflineIndicatorEngine
+from src.domain.services.streaming_indicator_engine.core.ring_buffer import ColumnarRingBuffer
+from src.domain.types.indicator_types import MarketDataPoint
+
+
+def make_engine() -> StreamingIndicatorEngine:
+    event_bus = Mock()
+    event_bus.subscribe = AsyncMock()
+    event_bus.publish = AsyncMock()
+
+    variant_repository = Mock()
+    variant_repository.algorithms = Mock()
+    variant_repository.algorithms.get_all_algorithms = Mock(return_value={})
+
+    return StreamingIndicatorEngine(event_bus=event_bus, logger=Mock(), variant_repository=variant_repository)
+
+
+class TestColumnarRingBuffer:
+    """Test ColumnarRingBuffer storage semantics"""
+
+    def test_evicts_oldest_rows_beyond_capacity(self):
+        buffer = ColumnarRingBuffer(("timestamp", "price"), capacity=5)
+
+        for i in range(23):  # Forces several compactions
+            buffer.append_row(float(i), 100.0 + i)
+
+        assert len(buffer) == 5
+        assert buffer.column("timestamp").tolist() == [18.0, 19.0, 20.0, 21.0, 22.0]
+        assert buffer.column("price").tolist() == [118.0, 119.0, 120.0, 121.0, 122.0]
+
+    def test_deque_compatible_row_access(self):
+        buffer = ColumnarRingBuffer(("timestamp", "price", "volume"), capacity=10)
+        buffer.append({"timestamp": 1.0, "price": 10.0, "volume": 2.0})
+        buffer.append({"timestamp": 2.0, "price": 11.0})  # Missing column stored as 0.0
+
+        assert buffer[-1] == {"timestamp": 2.0, "price": 11.0, "volume": 0.0}
+        assert [row["price"] for row in buffer] == [10.0, 11.0]
+        assert buffer.pop()["timestamp"] == 2.0
+        assert len(buffer) == 1
+        assert buffer.maxlen == 10
+
+    def test_column_is_zero_copy_view(self):
+        buffer = ColumnarRingBuffer(("timestamp", "price"), capacity=4)
+        buffer.append_row(1.0, 10.0)
+        buffer.append_row(2.0, 11.0)
+
+        prices = buffer.column("price")
+
+        assert isinstance(prices, np.ndarray)
+        assert prices.base is not None
+
+    def test_rollback_to_watermark(self):
+        buffer = ColumnarRingBuffer(("timestamp", "price"), capacity=3)
+        buffer.append_row(1.0, 10.0)
+        watermark = buffer.watermark
+        buffer.append_row(0.5, 11.0)  # Out of order
+        buffer.append_row(2.0, 12.0)
+
+        assert buffer.rollback(watermark) == 2
+        assert buffer.column("timestamp").tolist() == [1.0]
+        assert buffer.is_sorted
+        assert buffer.rollback(watermark) == 0
+
+    def test_invalid_capacity_rejected(self):
+        with pytest.raises(ValueError):
+            ColumnarRingBuffer(("timestamp",), capacity=0)
+
+
+class TestEngineSharedBuffers:
+    """Test engine stores each tick once per symbol stream"""
+
+    @pytest.mark.asyncio
+    async def test_all_timeframes_share_one_buffer(self):
+        engine = make_engine()
+        engine._indicators_by_symbol["BTC_USDT"] = ["dummy"]
+        now = time.time()
+
+        for i in range(3):
+            await engine._on_market_data({
+                "symbol": "BTC_USDT",
+                "price": 100.0 + i,
+                "volume": 1.5,
+                "timestamp": now + i,
+                "bids": [[99.0 + i, 2.0]],
+                "asks": [[101.0 + i, 3.0]],
+            })
+
+        for store in (engine._price_data, engine._deal_data, engine._orderbook_data):
+            buffers = {id(store[f"BTC_USDT_{tf}"]) for tf in engine._supported_timeframes}
+            assert len(buffers) == 1
+
+        assert engine._price_data["BTC_USDT_1h"].column("price").tolist() == [100.0, 101.0, 102.0]
+        assert engine._deal_data["BTC_USDT_5m"][-1]["volume"] == 1.5
+        assert engine._orderbook_data["BTC_USDT_15m"][-1]["best_ask"] == 103.0
+
+    @pytest.mark.asyncio
+    async def test_failed_ingest_rolls_back_staged_appends(self):
+        engine = make_engine()
+        engine._indicators_by_symbol["BTC_USDT"] = ["dummy"]
+        tick = {"symbol": "BTC_USDT", "price": 100.0, "volume": 1.0, "timestamp": time.time()}
+        await engine._on_market_data(tick)
+
+        engine._update_indicators_safe = AsyncMock(side_effect=RuntimeError("boom"))
+        with pytest.raises(RuntimeError):
+            await engine._on_market_data({**tick, "price": 101.0, "bids": [[99.0, 1.0]]})
+
+        assert engine._price_data["BTC_USDT_1m"].column("price").tolist() == [100.0]
+        assert len(engine._deal_data["BTC_USDT_1m"]) == 1
+        assert len(engine._orderbook_data["BTC_USDT_1m"]) == 0
+        metrics = await engine.get_performance_metrics()
+        assert metrics["ingest_count"] == 2
+
+
+    @pytest.mark.asyncio
+    async def test_batch_failures_raised_after_whole_batch(self):
+        engine = make_engine()
+        engine._indicators_by_symbol["BTC_USDT"] = ["dummy"]
+        now = time.time()
+        ticks = [{"symbol": "BTC_USDT", "price": 100.0 + i, "volume": 1.0, "timestamp": now + i} for i in range(3)]
+
+        async def update(symbol, price, timestamp):
+            if price == 101.0:
+                raise RuntimeError("boom")
+
+        engine._update_indicators_safe = AsyncMock(side_effect=update)
+        with pytest.raises(BatchDeliveryError) as excinfo:
+            await engine._on_market_data_batch(ticks)
+
+        assert excinfo.value.failed_items == [ticks[1]]
+        assert isinstance(excinfo.value.errors[0], RuntimeError)
+        assert engine._price_data["BTC_USDT_1m"].column("price").tolist() == [100.0, 102.0]
+
+    @pytest.mark.asyncio
+    async def test_event_bus_retries_only_failed_ticks(self, monkeypatch):
+        monkeypatch.setattr("src.core.event_bus.asyncio.sleep", AsyncMock())
+        engine = make_engine()
+        engine._indicators_by_symbol["BTC_USDT"] = ["dummy"]
+        now = time.time()
+        ticks = [{"symbol": "BTC_USDT", "price": 100.0 + i, "volume": 1.0, "timestamp": now + i} for i in range(3)]
+
+        failures = {101.0: 1}
+
+        async def update(symbol, price, timestamp):
+            if failures.get(price):
+                failures[price] -= 1
+                raise RuntimeError("transient")
+
+        engine._update_indicators_safe = AsyncMock(side_effect=update)
+        bus = EventBus()
+        await bus.subscribe("market.price_update", engine._on_market_data_batch, batch=True)
+        await bus.publish_many("market.price_update", ticks)
+
+        assert sorted(engine._price_data["BTC_USDT_1m"].column("price").tolist()) == [100.0, 101.0, 102.0]
+        assert bus._metrics.total_retries == 1
+
+
+def make_indicator(symbol: str = "BTC_USDT", timeframe: str = "1m") -> SimpleNamespace:
+    return SimpleNamespace(symbol=symbol, timeframe=timeframe, metadata={"type": "TWPA"})
+
+
+def scan_price_window(rows, t1: float, t2: float):
+    """Reference linear scan with the original window semantics."""
+    rows = sorted((r for r in rows if r["timestamp"] is not None), key=lambda r: r["timestamp"])
+    now_ts = rows[-1]["timestamp"]
+    start_ts, end_ts = now_ts - t1, now_ts - t2
+    before = [(r["timestamp"], r["price"]) for r in rows if r["timestamp"] < start_ts]
+    window = [(r["timestamp"], r["price"]) for r in rows if start_ts <= r["timestamp"] <= end_ts]
+    return before[-1:] + window, start_ts, end_ts
+
+
+class TestSortedWindows:
+    """Test bisection-based window extraction"""
+
+    def test_sortedness_tracks_out_of_order_rows(self):
+        buffer = ColumnarRingBuffer(("timestamp", "price"), capacity=3)
+        for ts in (1.0, 2.0, 2.0):
+            buffer.append_row(ts, 10.0)
+        assert buffer.is_sorted
+
+        buffer.append_row(1.5, 10.0)  # Out of order
+        assert not buffer.is_sorted
+
+        for ts in (3.0, 4.0, 5.0):  # Evicts the out-of-order row
+            buffer.append_row(ts, 10.0)
+        assert buffer.is_sorted
+
+        buffer.append_row(float("nan"), 10.0)
+        assert not buffer.is_sorted
+        buffer.pop()
+        assert buffer.is_sorted
+
+    def test_price_window_matches_linear_scan(self):
+        engine = make_engine()
+        rows = [{"timestamp": 1000.0 + i * 0.7, "price": 100.0 + i} for i in range(200)]
+        buffer = ColumnarRingBuffer(("timestamp", "price"), capacity=500)
+        for row in rows:
+            buffer.append(row)
+        engine._price_data["BTC_USDT_1m"] = buffer
+
+        for t1, t2 in ((30.0, 0.0), (60.0, 30.0), (500.0, 0.0)):
+            assert engine._get_price_series_for_window(make_indicator(), t1, t2) == scan_price_window(rows, t1, t2)
+
+    def test_unsorted_millisecond_deque_is_normalized(self):
+        engine = make_engine()
+        base = 1_700_000_000.0
+        rows = [{"timestamp": (base + i) * 1000, "price": 100.0 + i} for i in range(20)]
+        rows[5], rows[12] = rows[12], rows[5]
+        rows.append({"timestamp": None, "price": 1.0})
+        engine._price_data["BTC_USDT_1m"] = deque(rows)
+
+        window, start_ts, end_ts = engine._get_price_series_for_window(make_indicator(), 10.0, 0.0)
+
+        assert (start_ts, end_ts) == (base + 9, base + 19)
+        assert window[0] == (base + 8, 108.0)  # Pre-window point
+        assert [ts for ts, _ in window] == [base + 8 + i for i in range(12)]
+
+    def test_deal_and_orderbook_windows(self):
+        engine = make_engine()
+        deals = ColumnarRingBuffer(("timestamp", "price", "volume"), capacity=50)
+        book = ColumnarRingBuffer(("timestamp", "best_bid", "best_ask", "bid_qty", "ask_qty"), capacity=50)
+        for i in range(10):
+            deals.append_row(100.0 + i, 50.0 + i, float(i))
+            book.append_row(100.0 + i, 49.0, 51.0, 1.0, 2.0)
+        engine._deal_data["BTC_USDT_1m"] = deals
+        engine._orderbook_data["BTC_USDT_1m"] = book
+
+        volume, _, _ = engine._get_volume_series_for_window(make_indicator(), 3.0, 1.0)
+        assert volume == [(106.0, 6.0), (107.0, 7.0), (108.0, 8.0)]
+
+        deal_rows, _, _ = engine._get_deals_for_window(make_indicator(), 1.0, 0.0)
+        assert deal_rows == [
+            {"timestamp": 108.0, "price": 58.0, "volume": 8.0},
+            {"timestamp": 109.0, "price": 59.0, "volume": 9.0},
+        ]
+
+        ob_rows, _, _ = engine._get_orderbook_series_for_window(make_indicator(), 0.0, 0.0)
+        assert ob_rows == [{"timestamp": 109.0, "best_bid": 49.0, "best_ask": 51.0, "bid_qty": 1.0, "ask_qty": 2.0}]
+
+    @pytest.mark.asyncio
+    async def test_incremental_calculation_on_sorted_buffer(self):
+        engine = make_engine()
+        buffer = ColumnarRingBuffer(("timestamp", "price"), capacity=10)
+        buffer.append_row(100.0, 50.0)
+        buffer.append_row(101.0, 51.0)
+        engine._price_data["BTC_USDT_1m"] = buffer
+        assert buffer.is_sorted
+
+        algorithm = Mock(spec=["calculate_from_windows", "get_window_specs"])
+        algorithm.get_window_specs.return_value = [SimpleNamespace(t1=60.0, t2=30.0)]
+        algorithm.calculate_from_windows.return_value = 42.0
+        engine._algorithm_registry = Mock(get_algorithm=Mock(return_value=algorithm))
+
+        value = await engine._calculate_indicator_value_incremental("key", make_indicator(), 51.0, 101.0)
+
+        assert value == 42.0
+        (windows, _), _ = algorithm.calculate_from_windows.call_args
+        assert windows[0].data == ()
+        logged = engine.logger.debug.call_args_list[-1].args
+        assert logged[0] == "streaming_indicator_engine.window_data_empty"
+        assert logged[1]["price_data_span_seconds"] == 1.0
+
+    def test_offline_windows_include_pre_window_point(self):
+        engine = OfflineIndicatorEngine(questdb_data_provider=Mock(), algorithm_registry=Mock(list_algorithms=Mock(return_value=[])))
+        points = [MarketDataPoint(timestamp=float(t), symbol="BTC_USDT", price=float(t), volume=1.0) for t in range(0, 100, 5)]
+        specs = [SimpleNamespace(t1=20.0, t2=0.0), SimpleNamespace(t1=60.0, t2=30.0), SimpleNamespace(t1=500.0, t2=400.0)]
+
+        current, baseline, empty = engine._extract_windows_at_timestamp(points, 52.0, specs)
+
+        assert [ts for ts, _ in current.data] == [30.0, 35.0, 40.0, 45.0, 50.0]
+        assert [ts for ts, _ in baseline.data] == [0.0, 5.0, 10.0, 15.0, 20.0]
+        assert empty.data == ()
+
+
+class TestOfflineWindowSweep:
+    """Test two-pointer window sweep used for offline series"""
+
+    def make_engine(self) -> OfflineIndicatorEngine:
+        return OfflineIndicatorEngine(
+            questdb_data_provider=Mock(), algorithm_registry=Mock(list_algorithms=Mock(return_value=[]))
+        )
+
+    def test_sweep_matches_per_timestamp_extraction(self):
+        engine = self.make_engine()
+        rng = np.random.default_rng(7)
+        timestamps = np.sort(rng.uniform(0.0, 600.0, 400)).tolist()
+        points = [MarketDataPoint(timestamp=t, symbol="BTC_USDT", price=100.0 + i, volume=1.0) for i, t in enumerate(timestamps)]
+        specs = [SimpleNamespace(t1=30.0, t2=0.0), SimpleNamespace(t1=120.0, t2=60.0), SimpleNamespace(t1=5.0, t2=-5.0)]
+        time_axis = [float(t) for t in range(0, 601, 3)]
+
+        swept = list(engine._sweep_windows(points, time_axis, specs))
+
+        assert len(swept) == len(time_axis)
+        for target_ts, windows in zip(time_axis, swept):
+            expected = engine._extract_windows_at_timestamp(points, target_ts, specs)
+            for window, reference in zip(windows, expected):
+                assert window.data == reference.data
+                assert (window.start_ts, window.end_ts) == (reference.start_ts, reference.end_ts)
@@ -0,0 +1,201 @@
+"""
+Unit Tests for batched MEXC WebSocket message handling
+======================================================
+
+Tests inline JSON decoding, draining of buffered frames into batches and the
+per-connection stream statistics of MexcWebSocketAdapter.
+
+Test Coverage:
+- FrameBatchReader drains buffered frames, caps batch size, reports
+  end of stream / receive errors after the frames before them
+- MessageStreamStats msgs/s and parse latency percentiles
+- Deal updates published once per symbol per batch, in arrival order
+- Depth deltas applied in order, each changed book published once per batch
+- Invalid JSON and non-data frames do not break a batch
+- Message loop runs over batches and records stream stats
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from websockets.exceptions import ConnectionClosedError
+
+from src.core.event_bus import EventBus
+from src.core.logger import StructuredLogger
+from src.infrastructure.config.settings import ExchangeSettings
+from src.infrastructure.exchanges.mexc.messaging import FrameBatchReader, MessageStreamStats, decode_json
+from src.infrastructure.exchanges.mexc_websocket_adapter import MexcWebSocketAdapter
+
+
+class FakeWebSocket:
+    """Async-iterable WebSocket yielding queued frames, then ending or failing"""
+
+    def __init__(self, frames, error=None):
+        self.frames = list(frames)
+        self.error = error
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for frame in self.frames:
+            yield frame
+        if self.error:
+            raise self.error
+
+
+def deal(symbol, price, ts):
+    return json.dumps({"channel": "push.deal", "symbol": symbol,
+                       "data": [{"p": price, "v": 1, "T": 1, "t": ts}]})
+
+
+def depth(symbol, version, bids=(), asks=(), full=False):
+    return json.dumps({"channel": "push.depth.full" if full else "push.depth", "symbol": symbol,
+                       "data": {"bids": [list(b) for b in bids], "asks": [list(a) for a in asks], "version": version}})
+
+
+class TestFrameBatchReader:
+    """Test draining buffered frames"""
+
+    @pytest.mark.asyncio
+    async def test_buffered_frames_form_capped_batches(self):
+        reader = FrameBatchReader(FakeWebSocket([f"m{i}" for i in range(5)]), max_batch=3)
+        reader.start()
+        await asyncio.sleep(0)  # Reader task buffers every available frame
+
+        assert await reader.next_batch() == ["m0", "m1", "m2"]
+        assert await reader.next_batch() == ["m3", "m4"]
+        assert await reader.next_batch() == []
+        assert await reader.next_batch() == []
+        await reader.close()
+
+    @pytest.mark.asyncio
+    async def test_error_raised_after_preceding_frames(self):
+        error = ConnectionClosedError(None, None)
+        reader = FrameBatchReader(FakeWebSocket(["a", "b"], error=error))
+        reader.start()
+        await asyncio.sleep(0)
+
+        assert await reader.next_batch() == ["a", "b"]
+        with pytest.raises(ConnectionClosedError):
+            await reader.next_batch()
+        await reader.close()
+
+    def test_decode_json_accepts_text_and_bytes(self):
+        assert decode_json('{"a": 1}') == decode_json(b'{"a": 1}') == {"a": 1}
+        with pytest.raises(json.JSONDecodeError):
+            decode_json("{not json")
+
+
+class TestMessageStreamStats:
+    """Test throughput and parse latency statistics"""
+
+    def test_snapshot(self):
+        stats = MessageStreamStats()
+        for ns in range(1000, 101000, 1000):  # 1us .. 100us
+            stats.record_parse(ns)
+        stats.record_parse(5000, ok=False)
+        stats.record_batch(40)
+        stats.record_batch(60)
+
+        snapshot = stats.snapshot()
+        assert (snapshot["messages"], snapshot["batches"], snapshot["max_batch_size"]) == (100, 2, 60)
+        assert snapshot["avg_batch_size"] == 50.0
+        assert snapshot["parse_errors"] == 1
+        assert snapshot["messages_per_second"] > 0
+        latency = snapshot["parse_latency"]
+        assert latency["p50_us"] <= latency["p95_us"] <= latency["p99_us"] <= latency["max_us"] == 100.0
+
+
+@pytest.fixture
+def adapter():
+    event_bus = MagicMock(spec=EventBus)
+    event_bus.publish = AsyncMock()
+    event_bus.publish_many = AsyncMock()
+    logger = MagicMock(spec=StructuredLogger)
+    logger.logger = MagicMock()
+    logger.logger.isEnabledFor = MagicMock(return_value=False)
+    adapter = MexcWebSocketAdapter(
+        settings=ExchangeSettings(mexc_futures_ws_url="wss://contract.mexc.com/edge"),
+        event_bus=event_bus, logger=logger, data_types=["prices", "orderbook"]
+    )
+    adapter._safe_publish_many = AsyncMock()
+    adapter._safe_publish_event = AsyncMock()
+    return adapter
+
+
+class TestBatchDispatch:
+    """Test _handle_message_batch grouping and publishing"""
+
+    @pytest.mark.asyncio
+    async def test_deals_published_once_per_symbol_in_order(self, adapter):
+        batch = [deal("BTC_USDT", 100.0, 1000), deal("ETH_USDT", 10.0, 1001),
+                 deal("BTC_USDT", 101.0, 1002), '{"channel": "pong", "data": 1}']
+
+        assert await adapter._handle_message_batch(batch, connection_id=0) is True
+        await asyncio.sleep(0)
+
+        published = {call.args[1][0]["symbol"]: call.args[1] for call in adapter._safe_publish_many.call_args_list}
+        assert adapter._safe_publish_many.call_count == 2
+        assert [u["price"] for u in published["BTC_USDT"]] == [100.0, 101.0]
+        assert [u["price"] for u in published["ETH_USDT"]] == [10.0]
+        assert adapter._stream_stats[0].messages == 4
+
+    @pytest.mark.asyncio
+    async def test_depth_applied_in_order_and_published_once(self, adapter):
+        batch = [
+            depth("BTC_USDT", 1, bids=[(100.0, 1.0)], asks=[(101.0, 1.0)], full=True),
+            depth("BTC_USDT", 2, bids=[(100.5, 2.0)]),
+            depth("BTC_USDT", 2, bids=[(99.0, 5.0)]),  # Stale version - ignored
+            depth("BTC_USDT", 3, asks=[(101.0, 0)]),
+        ]
+
+        assert await adapter._handle_message_batch(batch, connection_id=0) is True
+        await asyncio.sleep(0)
+
+        book = adapter.get_orderbook("BTC_USDT")
+        assert book.top() == ([(100.5, 2.0), (100.0, 1.0)], [])
+        assert book.version == 3
+        assert adapter._safe_publish_event.call_count == 1
+        event = adapter._safe_publish_event.call_args.args[1]
+        assert event["bids"][0] == (100.5, 2.0) and event["version"] == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_frames_do_not_break_batch(self, adapter):
+        batch = ["{broken", '["not", "a", "dict"]', deal("BTC_USDT", 100.0, 1000)]
+
+        assert await adapter._handle_message_batch(batch, connection_id=0) is True
+        assert adapter._safe_publish_many.call_count == 1
+        stats = adapter.get_message_stream_stats()[0]
+        assert stats["parse_errors"] == 1 and stats["messages"] == 3
+        assert 0 not in adapter._message_processing_count
+
+    @pytest.mark.asyncio
+    async def test_non_data_message_does_not_reset_activity(self, adapter):
+        assert await adapter._handle_message('{"channel": "pong", "data": 1}', connection_id=0) is False
+
+
+class TestMessageLoop:
+    """Test _message_loop over batched frames"""
+
+    @pytest.mark.asyncio
+    async def test_loop_handles_batches_and_records_stats(self, adapter):
+        frames = [deal("BTC_USDT", 100.0 + i, 1000 + i) for i in range(10)]
+        adapter._connections[0] = {
+            "websocket": FakeWebSocket(frames),
+            "connected": True,
+            "last_heartbeat": 0.0,
+            "state_lock": asyncio.Lock(),
+        }
+
+        await adapter._message_loop(0)
+
+        stats = adapter.get_message_stream_stats()[0]
+        assert stats["messages"] == 10
+        assert stats["batches"] < 10  # Frames buffered while a batch was handled are drained together
+        assert adapter._connections[0]["connected"] is False  # Stream ended
+        assert adapter._connections[0]["last_heartbeat"] > 0
+        prices = [u["price"] for call in adapter._safe_publish_many.call_args_list for u in call.args[1]]
+        assert prices == [100.0 + i for i in range(10)]
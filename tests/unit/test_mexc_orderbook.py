@@ -0,0 +1,187 @@
+"""
+Unit Tests for the MEXC incremental orderbook
+=============================================
+
+Tests the sorted parallel-array OrderBook and its use by
+MexcWebSocketAdapter for snapshot / delta depth messages.
+
+Test Coverage:
+- Best-first ordering, level update / removal, max_depth trimming
+- Integer tick keys merge float-noise prices
+- Top-N, mid, spread, cumulative depth and depth_within queries
+- Randomized deltas match a reference dict book
+- Adapter snapshot + delta path keeps depth beyond the published levels
+"""
+
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.event_bus import EventBus
+from src.core.logger import StructuredLogger
+from src.infrastructure.config.settings import ExchangeSettings
+from src.infrastructure.exchanges.mexc.cache import OrderBook, OrderBookSide
+from src.infrastructure.exchanges.mexc_websocket_adapter import MexcWebSocketAdapter
+
+
+class TestOrderBookSide:
+    """Test one side of the book"""
+
+    def test_bids_descending_asks_ascending(self):
+        bids, asks = OrderBookSide(is_bid=True), OrderBookSide(is_bid=False)
+        for price in (100.0, 102.0, 101.0):
+            bids.update(price, 1.0)
+            asks.update(price, 1.0)
+
+        assert [p for p, _ in bids.top()] == [102.0, 101.0, 100.0]
+        assert [p for p, _ in asks.top()] == [100.0, 101.0, 102.0]
+
+    def test_update_and_remove_levels(self):
+        side = OrderBookSide(is_bid=False)
+        side.replace([(101.0, 1.0), (100.0, 2.0), (102.0, 0.0)])  # Zero-qty snapshot level ignored
+
+        side.update(100.0, 5.0)
+        side.update(101.0, 0.0)
+        side.update(103.0, 0.0)  # Removing a missing level is a no-op
+
+        assert side.top() == [(100.0, 5.0)]
+        assert side.qty_at(100.0) == 5.0
+        assert side.qty_at(101.0) == 0.0
+
+    def test_max_depth_keeps_best_levels(self):
+        side = OrderBookSide(is_bid=True, max_depth=3)
+        for price in (10.0, 11.0, 12.0, 13.0, 9.0):
+            side.update(price, 1.0)
+
+        assert [p for p, _ in side.top()] == [13.0, 12.0, 11.0]
+
+        side.replace([(float(p), 1.0) for p in range(10)])
+        assert [p for p, _ in side.top()] == [9.0, 8.0, 7.0]
+
+        with pytest.raises(ValueError):
+            OrderBookSide(is_bid=True, max_depth=0)
+
+    def test_tick_keys_merge_float_noise(self):
+        side = OrderBookSide(is_bid=False, tick_size=0.1)
+        side.update(0.1 + 0.2, 1.0)  # 0.30000000000000004
+        side.update(0.3, 2.0)
+
+        assert len(side) == 1
+        assert side.qty_at(0.3) == 2.0
+
+
+class TestOrderBookQueries:
+    """Test top-N / mid / spread / depth queries"""
+
+    def make_book(self) -> OrderBook:
+        book = OrderBook("BTC_USDT")
+        book.apply_snapshot(
+            bids=[(99.0, 1.0), (100.0, 2.0), (98.0, 3.0)],
+            asks=[(102.0, 4.0), (101.0, 5.0)],
+            version=7,
+        )
+        return book
+
+    def test_top_mid_and_spread(self):
+        book = self.make_book()
+
+        assert book.top(2) == ([(100.0, 2.0), (99.0, 1.0)], [(101.0, 5.0), (102.0, 4.0)])
+        assert (book.best_bid, book.best_ask) == (100.0, 101.0)
+        assert book.mid_price() == 100.5
+        assert book.spread() == 1.0
+        assert book.version == 7
+
+    def test_cumulative_depth_and_depth_within(self):
+        book = self.make_book()
+
+        assert book.bids.cumulative_depth(2) == 3.0
+        assert book.asks.cumulative_depth() == 9.0
+        assert book.bids.depth_within(99.0) == 3.0  # Bids at or above 99
+        assert book.asks.depth_within(101.5) == 5.0  # Asks at or below 101.5
+
+    def test_one_sided_book(self):
+        book = OrderBook("BTC_USDT")
+        assert book.is_empty()
+
+        book.replace_sides([(100.0, 1.0)], [])
+        assert book.mid_price() is None and book.spread() is None
+        book.replace_sides([], [(101.0, 1.0)])  # Bids kept when only asks arrive
+        assert book.spread() == 1.0
+
+    def test_random_deltas_match_reference(self):
+        rng = random.Random(3)
+        book = OrderBook("BTC_USDT", tick_size=0.5)
+        reference = {"bids": {}, "asks": {}}
+
+        for version in range(1, 2001):
+            side = rng.choice(("bids", "asks"))
+            price = (rng.randint(0, 200) if side == "bids" else rng.randint(201, 400)) * 0.5
+            qty = rng.choice((0.0, 0.0, rng.uniform(0.1, 10.0)))
+            if qty:
+                reference[side][price] = qty
+            else:
+                reference[side].pop(price, None)
+            book.apply_delta(*(([(price, qty)], []) if side == "bids" else ([], [(price, qty)])), version=version)
+
+        expected_bids = sorted(reference["bids"].items(), reverse=True)
+        expected_asks = sorted(reference["asks"].items())
+        assert book.top() == (expected_bids, expected_asks)
+        assert book.bids.cumulative_depth(10) == pytest.approx(sum(q for _, q in expected_bids[:10]))
+        assert book.version == 2000
+
+
+@pytest.fixture
+def adapter():
+    settings = ExchangeSettings(
+        mexc_futures_ws_url="wss://contract.mexc.com/edge",
+        mexc_orderbook_max_depth=100,
+        mexc_orderbook_publish_levels=5,
+    )
+    event_bus = MagicMock(spec=EventBus)
+    event_bus.publish = AsyncMock()
+    logger = MagicMock(spec=StructuredLogger)
+    adapter = MexcWebSocketAdapter(settings=settings, event_bus=event_bus, logger=logger, data_types=["orderbook"])
+    adapter._safe_publish_event = AsyncMock()
+    return adapter
+
+
+class TestAdapterOrderbook:
+    """Test MexcWebSocketAdapter snapshot / delta handling"""
+
+    @pytest.mark.asyncio
+    async def test_delta_keeps_depth_beyond_published_levels(self, adapter):
+        await adapter._process_orderbook_snapshot("BTC_USDT", {
+            "version": 10,
+            "bids": [[100.0 - i, 1.0] for i in range(60)],
+            "asks": [[101.0 + i, 1.0] for i in range(60)],
+        })
+        await adapter._process_orderbook_delta("BTC_USDT", {
+            "version": 11,
+            "bids": [[100.0, 0], [30.5, 3.0]],   # Remove best bid, add a deep level
+            "asks": [[101.5, 2.0]],
+        })
+        await adapter._process_orderbook_delta("BTC_USDT", {"version": 11, "bids": [[99.0, 0]]})  # Stale
+
+        book = adapter.get_orderbook("btc_usdt")
+        assert len(book.bids) == 60 and len(book.asks) == 61
+        assert book.bids.qty_at(30.5) == 3.0
+        assert (book.best_bid, book.best_ask, book.version) == (99.0, 101.0, 11)
+
+        event = adapter._safe_publish_event.call_args.args[1]
+        assert event["bids"][0] == (99.0, 1.0)
+        assert event["asks"][:2] == [(101.0, 1.0), (101.5, 2.0)]
+        assert len(event["bids"]) == 5
+        assert event["mid_price"] == 100.0 and event["spread"] == 2.0
+        assert event["ask_depth"] == 6.0
+        assert event["levels_parsed"]["total_bids"] == 60
+
+    @pytest.mark.asyncio
+    async def test_push_data_replaces_only_sent_side(self, adapter):
+        await adapter._process_orderbook_data("BTC_USDT", {"bids": [[100.0, 1.0]], "asks": [[101.0, 2.0]]})
+        await adapter._process_orderbook_data("BTC_USDT", {"bids": [], "asks": [[102.0, 3.0]]})
+
+        event = adapter._safe_publish_event.call_args.args[1]
+        assert event["bids"] == [(100.0, 1.0)]
+        assert event["asks"] == [(102.0, 3.0)]
+        assert event["best_bid"] == 100.0 and event["spread"] == 2.0
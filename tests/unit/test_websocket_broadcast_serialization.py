@@ -0,0 +1,160 @@
+"""
+Tests for serialize-once WebSocket broadcasts
+=============================================
+Verifies that broadcast envelopes are encoded once and the same pre-encoded
+frame is handed to every subscriber.
+
+Test Coverage:
+- Serializers (json / orjson) and EncodedFrame sizes
+- ConnectionManager.broadcast_to_subscription encodes once per message
+- WebSocketAPIServer.broadcast_to_subscribers shares one frame across clients
+  and uses its size for delivery stats
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.api.connection_manager import ConnectionManager
+from src.api.message_serializer import (
+    MessageSerializer,
+    ORJSON_AVAILABLE,
+    get_serializer,
+)
+from src.api.websocket_server import WebSocketAPIServer
+
+
+CLIENTS = 60
+
+
+class CountingSerializer(MessageSerializer):
+    """json serializer that counts encode() calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, message):
+        self.calls += 1
+        return super().encode(message)
+
+
+class FakeWebSocket:
+    """websockets-style connection recording sent frames"""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+
+    async def send(self, data):
+        self.sent.append(data)
+
+
+async def add_clients(manager: ConnectionManager, count: int, subscription_type: str = "market_data"):
+    sockets = {}
+    for _ in range(count):
+        websocket = FakeWebSocket()
+        client_id = await manager.add_connection(websocket, {"ip_address": "127.0.0.1"})
+        await manager.subscribe_client(client_id, subscription_type)
+        sockets[client_id] = websocket
+    return sockets
+
+
+async def drain() -> None:
+    """Let the per-client writer tasks flush their send queues."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestMessageSerializer:
+    """Test serializers and encoded frames"""
+
+    def test_frame_size_is_utf8_length(self):
+        frame = get_serializer("json").encode({"symbol": "BTC_USDT", "note": "ü"})
+
+        assert not frame.is_binary
+        assert frame.size == len(frame.payload.encode("utf-8"))
+        assert frame.binary == frame.payload.encode("utf-8")
+
+    @pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_orjson_matches_json_content(self):
+        message = {"type": "data", "data": {"price": 50000.5, "levels": [[1, 2.5]], 1: "int key"}}
+        frame = get_serializer("orjson").encode(message)
+
+        assert json.loads(frame.payload) == json.loads(json.dumps(message))
+        assert frame.size == len(frame.payload.encode("utf-8"))
+
+    def test_default_serializer_prefers_orjson(self):
+        assert get_serializer().name == ("orjson" if ORJSON_AVAILABLE else "json")
+
+    def test_unknown_serializer_rejected(self):
+        with pytest.raises(ValueError):
+            get_serializer("xml")
+
+
+class TestConnectionManagerBroadcast:
+    """Test ConnectionManager broadcast path"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once(self):
+        serializer = CountingSerializer()
+        manager = ConnectionManager(serializer=serializer)
+        sockets = await add_clients(manager, CLIENTS)
+
+        sent = await manager.broadcast_to_subscription("market_data", {"type": "data", "price": 1.0})
+        await drain()
+
+        assert sent == CLIENTS
+        assert serializer.calls == 1
+        payloads = [ws.sent[0] for ws in sockets.values()]
+        assert all(payload is payloads[0] for payload in payloads)  # Shared frame payload
+        connection = await manager.get_connection(next(iter(sockets)))
+        assert connection.messages_sent == 1
+        assert connection.bandwidth_used == len(payloads[0].encode("utf-8"))
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_send_to_client_still_serializes(self):
+        manager = ConnectionManager(serializer=get_serializer("json"))
+        sockets = await add_clients(manager, 1)
+        client_id, websocket = next(iter(sockets.items()))
+
+        assert await manager.send_to_client(client_id, {"type": "response"})
+        assert json.loads(websocket.sent[0]) == {"type": "response"}
+        await manager.shutdown()
+
+
+class TestServerBroadcast:
+    """Test WebSocketAPIServer.broadcast_to_subscribers"""
+
+    def make_server(self, connection_manager: ConnectionManager) -> WebSocketAPIServer:
+        server = WebSocketAPIServer.__new__(WebSocketAPIServer)
+        server.logger = MagicMock()
+        server.connection_manager = connection_manager
+        server.subscription_manager = MagicMock()
+        server.subscription_manager.should_send_to_client = MagicMock(return_value=True)
+        server.subscription_manager.record_message_delivery = AsyncMock()
+        return server
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_frame(self):
+        serializer = CountingSerializer()
+        manager = ConnectionManager(serializer=serializer)
+        server = self.make_server(manager)
+        sockets = await add_clients(manager, CLIENTS)
+        server.subscription_manager.get_subscribers = MagicMock(return_value=set(sockets))
+
+        sent = await server.broadcast_to_subscribers("market_data", {"type": "data", "data": {"price": 2.0}})
+        await drain()
+
+        assert sent == CLIENTS
+        assert serializer.calls == 1
+        payloads = {id(ws.sent[0]) for ws in sockets.values()}
+        assert len(payloads) == 1
+        message = json.loads(next(iter(sockets.values())).sent[0])
+        assert message["version"] == "1.0" and "timestamp" in message
+
+        sizes = {call.args[2] for call in server.subscription_manager.record_message_delivery.call_args_list}
+        assert sizes == {len(next(iter(sockets.values())).sent[0].encode("utf-8"))}
+        await manager.shutdown()
@@ -0,0 +1,188 @@
+"""
+Tests for the negotiated MessagePack wire format
+================================================
+Verifies that clients can negotiate MessagePack during the handshake, that
+value series are packed as float32 arrays, and that JSON stays the fallback.
+
+Test Coverage:
+- MsgpackSerializer float32 vector / matrix packing and decoding
+- Timestamps and non-series fields keep full precision
+- Indicator series and orderbook frames are several times smaller than JSON
+- Handshake negotiation (msgpack when offered and installed, json otherwise)
+- Mixed-format broadcasts encode once per format in use
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.api.connection_manager import ConnectionManager
+from src.api.message_serializer import MSGPACK_AVAILABLE, get_serializer
+from src.api.websocket_server import WebSocketAPIServer
+
+if MSGPACK_AVAILABLE:
+    import msgpack
+    from src.api.message_serializer import decode_msgpack_ext
+
+requires_msgpack = pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack not installed")
+
+
+class FakeWebSocket:
+    """websockets-style connection recording sent frames"""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+
+    async def send(self, data):
+        self.sent.append(data)
+
+
+def unpack(payload: bytes):
+    return msgpack.unpackb(payload, raw=False, ext_hook=decode_msgpack_ext)
+
+
+def indicator_history(points: int = 500) -> dict:
+    rng = np.random.default_rng(11)
+    return {
+        "type": "indicator_history",
+        "symbol": "BTC_USDT",
+        "indicator_id": "TWPA_0_1m",
+        "timestamps": (1_700_000_000.0 + np.arange(points) * 1.25).tolist(),
+        "values": (50000.0 + np.cumsum(rng.normal(0.0, 5.0, points))).tolist(),
+    }
+
+
+def orderbook(levels: int = 50) -> dict:
+    rng = np.random.default_rng(5)
+    return {
+        "type": "orderbook",
+        "symbol": "BTC_USDT",
+        "timestamp": 1_700_000_000.123,
+        "bids": [(round(65432.1 - i * 0.1, 1), float(rng.uniform(0.001, 5.0))) for i in range(levels)],
+        "asks": [(round(65432.2 + i * 0.1, 1), float(rng.uniform(0.001, 5.0))) for i in range(levels)],
+    }
+
+
+def make_server(manager: ConnectionManager) -> WebSocketAPIServer:
+    server = WebSocketAPIServer.__new__(WebSocketAPIServer)
+    server.logger = MagicMock()
+    server.connection_manager = manager
+    return server
+
+
+def handshake(**extra) -> dict:
+    return {"type": "handshake", "version": "1.0", "client_id": "web", "capabilities": ["market_data"], **extra}
+
+
+@requires_msgpack
+class TestMsgpackSerializer:
+    """Test float32 series packing"""
+
+    def test_series_round_trip_as_float32(self):
+        message = indicator_history()
+        decoded = unpack(get_serializer("msgpack").encode(message).payload)
+
+        assert decoded["values"] == np.asarray(message["values"], dtype=np.float32).tolist()
+        assert decoded["timestamps"] == message["timestamps"]  # Not a float32 key: exact
+        assert decoded["indicator_id"] == "TWPA_0_1m"
+
+    def test_orderbook_levels_pack_as_matrix(self):
+        message = orderbook(5)
+        decoded = unpack(get_serializer("msgpack").encode(message).payload)
+
+        assert decoded["bids"] == np.asarray(message["bids"], dtype=np.float32).tolist()
+        assert decoded["timestamp"] == message["timestamp"]
+
+    def test_nested_numpy_and_mixed_series(self):
+        message = {
+            "indicators": [{"values": np.linspace(0.0, 1.0, 8)}, {"values": [1, "n/a"]}],
+            "series": [],
+            "history": [{"timestamp": 1.0, "value": 2.0}],
+            "score": np.float64(0.5),
+        }
+        decoded = unpack(get_serializer("msgpack").encode(message).payload)
+
+        assert decoded["indicators"][0]["values"] == pytest.approx(np.linspace(0.0, 1.0, 8).tolist(), rel=1e-6)
+        assert decoded["indicators"][1]["values"] == [1, "n/a"]  # Non-numeric series left as-is
+        assert decoded["series"] == []
+        assert decoded["history"] == [{"timestamp": 1.0, "value": 2.0}]
+        assert decoded["score"] == 0.5
+
+    @pytest.mark.parametrize("message", [indicator_history(), orderbook()], ids=["indicator_history", "orderbook"])
+    def test_frames_several_times_smaller_than_json(self, message):
+        json_size = get_serializer("json").encode(message).size
+        msgpack_size = get_serializer("msgpack").encode(message).size
+
+        assert json_size >= msgpack_size * 2
+
+
+@requires_msgpack
+class TestHandshakeNegotiation:
+    """Test wire format negotiation in _handle_handshake"""
+
+    @pytest.mark.asyncio
+    async def test_msgpack_selected_and_used_for_later_frames(self):
+        manager = ConnectionManager()
+        server = make_server(manager)
+        websocket = FakeWebSocket()
+        client_id = await manager.add_connection(websocket, {"ip_address": "127.0.0.1"})
+
+        ack = await server._handle_handshake(client_id, handshake(encodings=["msgpack", "json"]))
+        assert ack["status"] == "accepted"
+        assert ack["encoding"] == "msgpack"
+        assert ack["supported_encodings"] == ["msgpack", "json"]
+
+        assert await manager.send_to_client(client_id, ack)
+        assert isinstance(websocket.sent[0], bytes)
+        assert unpack(websocket.sent[0])["encoding"] == "msgpack"
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_mixed_formats_encode_once_per_format(self):
+        manager = ConnectionManager(serializer=get_serializer("json"))
+        server = make_server(manager)
+        sockets = {}
+        for encodings in (["msgpack"], ["msgpack"], None, None):
+            websocket = FakeWebSocket()
+            client_id = await manager.add_connection(websocket, {"ip_address": "127.0.0.1"})
+            await manager.subscribe_client(client_id, "indicators")
+            await server._handle_handshake(client_id, handshake(encodings=encodings))
+            sockets[client_id] = websocket
+
+        frames = manager.frame_set(indicator_history(50))
+        for client_id in sockets:
+            manager.enqueue_frame(client_id, manager.frame_for(client_id, frames))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert sorted(frames.encoded_formats) == ["json", "msgpack"]
+        binary = [ws.sent[0] for ws in sockets.values() if isinstance(ws.sent[0], bytes)]
+        text = [ws.sent[0] for ws in sockets.values() if isinstance(ws.sent[0], str)]
+        assert len(binary) == 2 and binary[0] is binary[1]
+        assert len(text) == 2 and json.loads(text[0])["symbol"] == unpack(binary[0])["symbol"]
+        assert manager.get_connection_stats_snapshot()["wire_formats"] == {"msgpack": 2, "json": 2}
+        await manager.shutdown()
+
+
+class TestJsonFallback:
+    """Test JSON stays the default and fallback wire format"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encodings", [None, ["cbor"], "xml"])
+    async def test_unsupported_or_missing_encodings_fall_back_to_json(self, encodings):
+        manager = ConnectionManager()
+        server = make_server(manager)
+        websocket = FakeWebSocket()
+        client_id = await manager.add_connection(websocket, {"ip_address": "127.0.0.1"})
+
+        ack = await server._handle_handshake(client_id, handshake(encodings=encodings))
+        assert ack["encoding"] == "json"
+
+        assert await manager.send_to_client(client_id, {"type": "response", "ts": time.time()})
+        assert isinstance(websocket.sent[0], str)
+        await manager.shutdown()
@@ -0,0 +1,244 @@
+"""
+Unit Tests for WriteBehindQueue
+===============================
+Tests for ordered batching, per-entity coalescing and failure handling of
+queued persistence writes.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.domain.services.write_behind_queue import WriteBehindQueue
+
+
+INSERT = "INSERT INTO orders (id, status) VALUES ($1, $2)"
+UPDATE = "UPDATE positions SET price = $2 WHERE id = $1"
+
+
+class FakePool:
+    """asyncpg pool stand-in recording statements in execution order"""
+
+    def __init__(self):
+        self.conn = MagicMock()
+        self.calls = []
+        self.fail_next = None
+        self.bad_rows = set()
+
+        async def execute(query, *args):
+            self._maybe_fail([args])
+            self.calls.append(("execute", query, [tuple(args)]))
+
+        async def executemany(query, rows):
+            self._maybe_fail(rows)
+            self.calls.append(("executemany", query, [tuple(r) for r in rows]))
+
+        self.conn.execute = AsyncMock(side_effect=execute)
+        self.conn.executemany = AsyncMock(side_effect=executemany)
+
+    def _maybe_fail(self, rows):
+        if self.fail_next is not None:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        if any(tuple(row) in self.bad_rows for row in rows):
+            raise ValueError("invalid input syntax")
+
+    def acquire(self):
+        pool = self
+
+        class _Acquire:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Acquire()
+
+    def rows(self):
+        return [(query, row) for _, query, rows in self.calls for row in rows]
+
+
+@pytest.fixture
+def pool():
+    return FakePool()
+
+
+def make_queue(pool, **kwargs):
+    return WriteBehindQueue(lambda: pool, logger=MagicMock(), name="test", **kwargs)
+
+
+class TestOrdering:
+    """Writes are applied in enqueue order, grouped by statement"""
+
+    @pytest.mark.asyncio
+    async def test_consecutive_statements_batched(self, pool):
+        queue = make_queue(pool)
+        queue.enqueue(INSERT, ("o1", "NEW"))
+        queue.enqueue(INSERT, ("o2", "NEW"))
+        queue.enqueue(UPDATE, ("p1", 100.0))
+        queue.enqueue(INSERT, ("o3", "NEW"))
+
+        await queue.flush()
+
+        assert [(kind, len(rows)) for kind, _, rows in pool.calls] == [
+            ("executemany", 2), ("execute", 1), ("execute", 1)
+        ]
+        assert [row for _, row in pool.rows()] == [("o1", "NEW"), ("o2", "NEW"), ("p1", 100.0), ("o3", "NEW")]
+        assert queue.get_stats()["written"] == 4
+        assert queue.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_no_pool_keeps_writes(self):
+        queue = WriteBehindQueue(lambda: None)
+        queue.enqueue(INSERT, ("o1", "NEW"))
+
+        await queue.flush()
+
+        assert queue.pending == 1
+
+
+class TestCoalescing:
+    """Only an entity's latest write may absorb a newer one"""
+
+    @pytest.mark.asyncio
+    async def test_latest_update_replaces_pending(self, pool):
+        queue = make_queue(pool)
+        for price in (100.0, 101.0, 102.0):
+            queue.enqueue(UPDATE, ("p1", price), entity=("position", "p1"), coalesce=True)
+        queue.enqueue(UPDATE, ("p2", 50.0), entity=("position", "p2"), coalesce=True)
+
+        await queue.flush()
+
+        assert [row for _, row in pool.rows()] == [("p1", 102.0), ("p2", 50.0)]
+        assert queue.get_stats()["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_update_not_moved_ahead_of_later_write(self, pool):
+        queue = make_queue(pool)
+        queue.enqueue(UPDATE, ("p1", 100.0), entity=("position", "p1"), coalesce=True)
+        queue.enqueue(INSERT, ("p1", "CLOSED"), entity=("position", "p1"))
+        queue.enqueue(UPDATE, ("p1", 101.0), entity=("position", "p1"), coalesce=True)
+
+        await queue.flush()
+
+        assert [row for _, row in pool.rows()] == [("p1", 100.0), ("p1", "CLOSED"), ("p1", 101.0)]
+
+    @pytest.mark.asyncio
+    async def test_no_coalescing_across_flushes(self, pool):
+        queue = make_queue(pool)
+        queue.enqueue(UPDATE, ("p1", 100.0), entity=("position", "p1"), coalesce=True)
+        await queue.flush()
+        queue.enqueue(UPDATE, ("p1", 101.0), entity=("position", "p1"), coalesce=True)
+        await queue.flush()
+
+        assert [row for _, row in pool.rows()] == [("p1", 100.0), ("p1", 101.0)]
+
+
+class TestFailures:
+    """Connection errors defer writes; statement errors drop only bad rows"""
+
+    @pytest.mark.asyncio
+    async def test_connection_error_requeues_in_order(self, pool):
+        queue = make_queue(pool)
+        queue.enqueue(INSERT, ("o1", "NEW"))
+        queue.enqueue(UPDATE, ("p1", 100.0))
+        queue.enqueue(INSERT, ("o2", "NEW"))
+        pool.fail_next = ConnectionRefusedError("questdb down")
+
+        await queue.flush()
+
+        assert queue.pending == 3
+        assert queue.get_stats()["failed_flushes"] == 1
+        queue.logger.warning.assert_called_once()
+        assert queue.logger.warning.call_args[0][0] == "test.flush_deferred"
+
+        queue.enqueue(INSERT, ("o3", "NEW"))
+        await queue.flush()
+
+        assert [row for _, row in pool.rows()] == [("o1", "NEW"), ("p1", 100.0), ("o2", "NEW"), ("o3", "NEW")]
+
+    @pytest.mark.asyncio
+    async def test_statement_error_drops_only_failing_batch(self, pool):
+        queue = make_queue(pool)
+        queue.enqueue(INSERT, ("o1", "NEW"))
+        queue.enqueue(UPDATE, ("p1", 100.0))
+        pool.fail_next = ValueError("invalid input syntax")
+
+        await queue.flush()
+
+        assert [row for _, row in pool.rows()] == [("p1", 100.0)]
+        assert queue.get_stats()["dropped"] == 1
+        assert queue.logger.error.call_args[0][0] == "test.batch_write_failed"
+
+    @pytest.mark.asyncio
+    async def test_statement_error_in_batch_drops_only_bad_row(self, pool):
+        queue = make_queue(pool)
+        for i in range(5):
+            queue.enqueue(INSERT, (f"o{i}", "NEW"))
+        pool.bad_rows.add(("o2", "NEW"))
+
+        await queue.flush()
+
+        assert [row for _, row in pool.rows()] == [("o0", "NEW"), ("o1", "NEW"), ("o3", "NEW"), ("o4", "NEW")]
+        assert queue.get_stats()["written"] == 4
+        assert queue.get_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_error_during_row_retry_requeues_rest(self, pool):
+        queue = make_queue(pool)
+        for i in range(3):
+            queue.enqueue(INSERT, (f"o{i}", "NEW"))
+        pool.bad_rows.add(("o2", "NEW"))
+        original = pool.conn.execute.side_effect
+
+        async def execute(query, *args):
+            if args[0] == "o1":
+                raise ConnectionResetError("connection lost")
+            await original(query, *args)
+
+        pool.conn.execute.side_effect = execute
+
+        await queue.flush()
+
+        assert [row for _, row in pool.rows()] == [("o0", "NEW")]
+        assert [w.args for w in queue._pending] == [("o1", "NEW"), ("o2", "NEW")]
+
+    def test_overflow_drops_oldest(self, pool):
+        queue = make_queue(pool, max_batch=2, max_pending=2)
+        for i in range(3):
+            queue.enqueue(INSERT, (f"o{i}", "NEW"))
+
+        assert [w.args for w in queue._pending] == [("o1", "NEW"), ("o2", "NEW")]
+        assert queue.get_stats()["dropped"] == 1
+
+
+class TestBackgroundFlush:
+    """The flush loop runs on size or time and drains on stop"""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_full(self, pool):
+        queue = make_queue(pool, max_batch=2, flush_interval=60.0)
+        await queue.start()
+        queue.enqueue(INSERT, ("o1", "NEW"))
+        queue.enqueue(INSERT, ("o2", "NEW"))
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert len(pool.rows()) == 2
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_interval_and_drains_on_stop(self, pool):
+        queue = make_queue(pool, flush_interval=0.01)
+        await queue.start()
+        queue.enqueue(INSERT, ("o1", "NEW"))
+        await asyncio.sleep(0.05)
+        assert len(pool.rows()) == 1
+
+        queue.enqueue(INSERT, ("o2", "NEW"))
+        await queue.stop()
+
+        assert len(pool.rows()) == 2
+        assert queue.pending == 0
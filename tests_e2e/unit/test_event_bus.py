@@ -512,3 +512,226 @@ class TestEventBusHealthCheck:
         assert health["healthy"] is True
         assert health["active_subscribers"] == 0
         assert health["total_topics"] == 0
+
+
+class TestEventBusQueuedDelivery:
+    """Test per-subscriber queues (queued delivery mode)."""
+
+    @staticmethod
+    def gated_handler(received, gate):
+        async def handler(data):
+            received.append(data)
+            await gate.wait()
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_does_not_block_publisher(self):
+        """Retry backoff runs on the subscriber's worker, not in publish()."""
+        bus = EventBus()
+        attempts = []
+        fast_received = []
+
+        async def flaky_handler(data):
+            attempts.append(data)
+            if len(attempts) == 1:
+                raise ValueError("Simulated failure")
+
+        async def fast_handler(data):
+            fast_received.append(data)
+
+        await bus.subscribe("test", flaky_handler, queue_size=10)
+        await bus.subscribe("test", fast_handler)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await bus.publish("test", {"value": 1})
+        await asyncio.sleep(0.05)
+
+        assert loop.time() - started < 0.5  # Inline delivery would wait out the 1s backoff
+        assert fast_received == [{"value": 1}]
+        assert len(attempts) == 1
+
+        await asyncio.sleep(1.2)
+        assert len(attempts) == 2
+        await bus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self):
+        bus = EventBus()
+        received, gate = [], asyncio.Event()
+        await bus.subscribe("test", self.gated_handler(received, gate), queue_size=3)
+
+        await bus.publish("test", {"value": 0})
+        await asyncio.sleep(0.01)  # Worker takes event 0 and blocks on the gate
+        for i in range(1, 10):
+            await bus.publish("test", {"value": i})
+
+        stats = bus.get_subscriber_stats()[0]
+        assert stats["depth"] == 3
+        assert stats["dropped"] == 6
+
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert [d["value"] for d in received] == [0, 7, 8, 9]
+        await bus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy_keeps_latest_per_key(self):
+        bus = EventBus()
+        received, gate = [], asyncio.Event()
+        await bus.subscribe(
+            "prices", self.gated_handler(received, gate),
+            queue_size=10, overflow="coalesce", coalesce_key="symbol"
+        )
+
+        await bus.publish("prices", {"symbol": "BTC", "price": 0})
+        await asyncio.sleep(0.01)
+        for i, symbol in enumerate(["BTC", "ETH", "BTC", "ETH", "BTC"], start=1):
+            await bus.publish("prices", {"symbol": symbol, "price": i})
+
+        assert bus.get_subscriber_stats()[0]["coalesced"] == 3
+
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert [(d["symbol"], d["price"]) for d in received] == [("BTC", 0), ("BTC", 5), ("ETH", 4)]
+        await bus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_applies_backpressure(self):
+        bus = EventBus()
+        received, gate = [], asyncio.Event()
+        await bus.subscribe("test", self.gated_handler(received, gate), queue_size=1, overflow="block")
+
+        await bus.publish("test", {"value": 0})
+        await asyncio.sleep(0.01)
+        await bus.publish("test", {"value": 1})  # Fills the queue
+
+        blocked = asyncio.create_task(bus.publish("test", {"value": 2}))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        gate.set()
+        await asyncio.wait_for(blocked, timeout=1.0)
+        await asyncio.sleep(0.05)
+        assert [d["value"] for d in received] == [0, 1, 2]
+        assert bus.get_subscriber_stats()[0]["dropped"] == 0
+        await bus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_lag_metrics_in_health_check(self):
+        bus = EventBus()
+        received, gate = [], asyncio.Event()
+        await bus.subscribe("test", self.gated_handler(received, gate), queue_size=5)
+
+        for i in range(3):
+            await bus.publish("test", {"value": i})
+        await asyncio.sleep(0.05)
+
+        health = await bus.health_check()
+        assert health["total_queue_size"] == 2
+        queue = health["subscriber_queues"][0]
+        assert queue["topic"] == "test"
+        assert queue["lag_ms"] >= 40
+
+        gate.set()
+        await asyncio.sleep(0.05)
+        stats = bus.get_subscriber_stats()[0]
+        assert stats["delivered"] == 3
+        assert stats["max_lag_ms"] >= 40
+        await bus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_worker(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(data):
+            received.append(data)
+
+        await bus.subscribe("test", handler, queue_size=5)
+        queue = bus._subscribers["test"][0].queue
+        await bus.unsubscribe("test", handler)
+
+        assert "test" not in bus._subscribers
+        assert queue._task.done()
+
+    @pytest.mark.asyncio
+    async def test_invalid_queue_options(self):
+        bus = EventBus()
+
+        async def handler(data):
+            pass
+
+        with pytest.raises(ValueError):
+            await bus.subscribe("test", handler, queue_size=0)
+        with pytest.raises(ValueError):
+            await bus.subscribe("test", handler, queue_size=5, overflow="spill")
+        with pytest.raises(ValueError):
+            await bus.subscribe("test", handler, queue_size=5, overflow="coalesce")
+
+
+class TestEventBusBatchPublish:
+    """Test publish_many() and batch subscriptions."""
+
+    @pytest.mark.asyncio
+    async def test_batch_subscriber_receives_one_list(self):
+        bus = EventBus()
+        batches = []
+
+        async def handler(items):
+            batches.append(items)
+
+        await bus.subscribe("test", handler, batch=True)
+        await bus.publish_many("test", [{"value": i} for i in range(5)])
+        await bus.publish("test", {"value": 5})
+
+        assert [[d["value"] for d in batch] for batch in batches] == [[0, 1, 2, 3, 4], [5]]
+        assert bus.get_metrics().published_by_topic["test"] == 6
+        await bus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_single_event_subscriber_adapter(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(data):
+            received.append(data["value"])
+
+        await bus.subscribe("test", handler)
+        await bus.publish_many("test", [{"value": i} for i in range(4)])
+
+        assert received == [0, 1, 2, 3]
+        await bus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queued_batch_subscriber_drains_pending(self):
+        bus = EventBus()
+        batches, gate = [], asyncio.Event()
+
+        async def handler(items):
+            await gate.wait()
+            batches.append([d["value"] for d in items])
+
+        await bus.subscribe("test", handler, queue_size=10, batch=True)
+        await bus.publish("test", {"value": 0})
+        await asyncio.sleep(0.01)  # Worker picks up the first event and blocks
+        await bus.publish_many("test", [{"value": i} for i in range(1, 4)])
+
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert batches == [[0], [1, 2, 3]]
+        assert bus.get_subscriber_stats()[0]["delivered"] == 4
+        await bus.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_publish_many_validation(self):
+        bus = EventBus()
+
+        with pytest.raises(ValueError):
+            await bus.publish_many("", [{"value": 1}])
+        with pytest.raises(ValueError):
+            await bus.publish_many("test", {"value": 1})
+        with pytest.raises(ValueError):
+            await bus.publish_many("test", [{"value": 1}, "bad"])
+
+        await bus.publish_many("no_subscribers", [{"value": 1}])  # No-op
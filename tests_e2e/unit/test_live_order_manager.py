@@ -469,6 +469,177 @@ async def test_get_metrics(order_manager):
     assert metrics["failed"] == 1
 
 
+# ===== TEST: Status Polling =====
+
+def _open_order(index: int, symbol: str = "BTC_USDT") -> Order:
+    return Order(
+        order_id=f"order_{index}",
+        symbol=symbol,
+        side="buy",
+        quantity=1.0,
+        price=None,
+        order_type="market",
+        status=OrderStatus.SUBMITTED,
+        created_at=time.time(),
+        updated_at=time.time(),
+        exchange_order_id=f"MEXC_{index}"
+    )
+
+
+def _status(value: str, filled: float = 1.0, price: float = 100.0):
+    response = MagicMock()
+    response.status.value = value
+    response.filled_quantity = filled
+    response.average_fill_price = price
+    return response
+
+
+class BatchStatusAdapter:
+    """Adapter stub exposing the batched status query"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.requests = []
+
+    async def get_order_statuses(self, symbol, exchange_order_ids):
+        self.requests.append((symbol, list(exchange_order_ids)))
+        return {oid: self.statuses[oid] for oid in exchange_order_ids if oid in self.statuses}
+
+
+@pytest.mark.asyncio
+async def test_poll_concurrency_bounded(event_bus, mexc_adapter, risk_manager):
+    """Single-order status queries run concurrently, at most status_concurrency at a time."""
+    manager = LiveOrderManager(event_bus, mexc_adapter, risk_manager, status_concurrency=3)
+    orders = [_open_order(i) for i in range(10)]
+    in_flight = 0
+    peak = 0
+
+    async def get_order_status(symbol, exchange_order_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _status("FILLED")
+
+    mexc_adapter.get_order_status = AsyncMock(side_effect=get_order_status)
+    await manager._poll_statuses_concurrently(orders)
+
+    assert peak == 3
+    assert mexc_adapter.get_order_status.call_count == 10
+    assert all(order.status == OrderStatus.FILLED for order in orders)
+
+
+@pytest.mark.asyncio
+async def test_poll_concurrently_stops_on_circuit_breaker(event_bus, mexc_adapter, risk_manager):
+    """An open circuit breaker skips the remaining orders of the cycle."""
+    manager = LiveOrderManager(event_bus, mexc_adapter, risk_manager, status_concurrency=1)
+    mexc_adapter.get_order_status = AsyncMock(side_effect=CircuitBreakerOpenException("open"))
+
+    await manager._poll_statuses_concurrently([_open_order(i) for i in range(5)])
+
+    assert mexc_adapter.get_order_status.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_poll_uses_batched_status_queries(event_bus, risk_manager):
+    """Adapters with get_order_statuses() are queried per symbol in batches."""
+    orders = [_open_order(i) for i in range(7)] + [_open_order(100, symbol="ETH_USDT")]
+    adapter = BatchStatusAdapter({"MEXC_0": _status("FILLED"), "MEXC_6": _status("PARTIALLY_FILLED", filled=0.5)})
+    manager = LiveOrderManager(event_bus, adapter, risk_manager, status_batch_size=3)
+    rate_limiter = MagicMock()
+    rate_limiter.acquire_wait = AsyncMock(return_value=True)
+    manager.status_rate_limiter = rate_limiter
+
+    assert manager._batch_status_supported
+    await manager._poll_statuses_batched(orders)
+
+    assert [(symbol, len(ids)) for symbol, ids in adapter.requests] == [
+        ("BTC_USDT", 3), ("BTC_USDT", 3), ("BTC_USDT", 1), ("ETH_USDT", 1)
+    ]
+    assert rate_limiter.acquire_wait.await_count == 4
+    assert orders[0].status == OrderStatus.FILLED
+    assert orders[6].status == OrderStatus.PARTIALLY_FILLED
+    assert orders[1].status == OrderStatus.SUBMITTED
+
+
+def test_poll_interval_adapts(order_manager):
+    """Interval depends on open orders, recent fills and the rate limiter budget."""
+    assert order_manager._next_poll_interval(0) == order_manager.max_poll_interval_seconds
+    assert order_manager._next_poll_interval(5) == order_manager.poll_interval_seconds
+
+    order_manager._last_fill_at = time.monotonic()
+    assert order_manager._next_poll_interval(5) == order_manager.min_poll_interval_seconds
+
+    order_manager.status_rate_limiter = MagicMock(refill_rate=10.0)
+    assert order_manager._next_poll_interval(50) == pytest.approx(5.0)  # 50 requests at 10/s
+    assert order_manager._next_poll_interval(500) == order_manager.max_poll_interval_seconds
+
+
+@pytest.mark.asyncio
+async def test_submit_after_idle_wakes_poller(event_bus, mexc_adapter, risk_manager):
+    """An order submitted while the poller idles at the max interval is polled within the base interval."""
+    manager = LiveOrderManager(
+        event_bus, mexc_adapter, risk_manager,
+        poll_interval_seconds=0.05, max_poll_interval_seconds=30.0
+    )
+    mexc_adapter.get_order_status = AsyncMock(return_value=_status("FILLED"))
+
+    await manager.start()
+    try:
+        await asyncio.sleep(0.1)  # Idle cycle: no open orders, interval grows to the max
+        assert manager._poll_interval == manager.max_poll_interval_seconds
+
+        order = Order(
+            order_id="order_idle", symbol="BTC_USDT", side="buy", quantity=1.0, price=None,
+            order_type="market", status=OrderStatus.PENDING, created_at=time.time(), updated_at=time.time()
+        )
+        assert await manager.submit_order(order)
+
+        for _ in range(50):
+            if order.status == OrderStatus.FILLED:
+                break
+            await asyncio.sleep(0.01)
+
+        assert order.status == OrderStatus.FILLED
+        mexc_adapter.get_order_status.assert_awaited()
+    finally:
+        await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_fill_channel_applies_pushed_fills(event_bus, mexc_adapter, risk_manager):
+    """Fills pushed through the fill channel update orders without polling."""
+    pushed = asyncio.Queue()
+
+    async def fill_channel():
+        while True:
+            yield await pushed.get()
+
+    manager = LiveOrderManager(event_bus, mexc_adapter, risk_manager, fill_channel=fill_channel())
+    order = _open_order(1)
+    manager.orders[order.order_id] = order
+
+    await manager.start()
+    try:
+        await pushed.put(("MEXC_unknown", _status("FILLED")))
+        await pushed.put(("MEXC_1", _status("FILLED", filled=1.0, price=101.0)))
+        for _ in range(100):
+            if order.status == OrderStatus.FILLED:
+                break
+            await asyncio.sleep(0.01)
+
+        assert order.status == OrderStatus.FILLED
+        assert manager._fill_channel_connected
+        assert manager._next_poll_interval(5) == manager.max_poll_interval_seconds
+        mexc_adapter.get_order_status.assert_not_called()
+    finally:
+        await manager.stop()
+
+    assert not manager._fill_channel_connected
+    assert await manager.apply_status_update("MEXC_1", _status("FILLED")) is False
+
+
 # ===== TEST: Lifecycle =====
 
 @pytest.mark.asyncio
@@ -0,0 +1,175 @@
+"""
+Unit Tests - StrategyManager Compiled Conditions
+================================================
+Tests for strategies compiled into slot-indexed condition plans.
+
+Test Coverage:
+- Compiled conditions match Condition.evaluate() for every operator and edge case
+- IndicatorValues mirrors dict writes into slots (copy, pop, late slots)
+- create_strategy_from_config / add_strategy compile strategies once
+- Evaluation with the manager's indicator cache uses the compiled plan
+- Plain dicts and replaced condition lists still evaluate correctly
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from src.core.event_bus import EventBus
+from src.core.logger import StructuredLogger
+from src.domain.services.strategy_manager import (
+    Condition,
+    ConditionGroup,
+    ConditionResult,
+    IndicatorSlotTable,
+    IndicatorValues,
+    Strategy,
+    StrategyManager,
+    compile_condition,
+)
+
+
+@pytest.fixture
+def manager():
+    event_bus = Mock(spec=EventBus)
+    event_bus.subscribe = AsyncMock()
+    event_bus.publish = AsyncMock()
+    return StrategyManager(event_bus=event_bus, logger=Mock(spec=StructuredLogger))
+
+
+CONDITIONS = [
+    Condition("a", "rsi", "gte", 50),
+    Condition("b", "rsi", ">", 50),
+    Condition("c", "RSI", "<=", 50),
+    Condition("d", "rsi", "lt", 50),
+    Condition("e", "rsi", " EQ ", 50),
+    Condition("f", "rsi", "=", 50),
+    Condition("g", "rsi", "between", (40, 60)),
+    Condition("h", "rsi", "between", 40),          # Malformed bounds
+    Condition("i", "regime", "allowed", ["pump", "range"]),
+    Condition("j", "rsi", "crosses", 50),          # Unknown operator
+    Condition("k", "rsi", "gte", 50, enabled=False),
+    Condition("l", "volume_surge", "gte", 2.0),    # Often missing
+    Condition("m", "rsi", 5, 50),                  # Non-string operator
+]
+
+VALUE_SETS = [
+    {"rsi": 50, "regime": "pump", "volume_surge": 3.0},
+    {"RSI": 61.5, "regime": "dump"},
+    {"rsi": None, "regime": None},
+    {"rsi": "high"},
+    {},
+]
+
+
+class TestCompiledConditions:
+    """Compiled plans agree with the interpreted evaluator"""
+
+    @pytest.mark.parametrize("values", VALUE_SETS)
+    def test_conditions_match_interpreted(self, values):
+        table = IndicatorSlotTable()
+        compiled = [compile_condition(c, table) for c in CONDITIONS]
+        store = IndicatorValues(table, values)
+
+        for condition, evaluate in zip(CONDITIONS, compiled):
+            assert evaluate(store.slot_view()) is condition.evaluate(values), condition.name
+
+    @pytest.mark.parametrize("require_all", [True, False])
+    @pytest.mark.parametrize("values", VALUE_SETS)
+    def test_groups_match_interpreted(self, values, require_all):
+        groups = [
+            ConditionGroup("g1", CONDITIONS[:2], require_all),
+            ConditionGroup("g2", [CONDITIONS[0], CONDITIONS[9]], require_all),  # ERROR wins
+            ConditionGroup("g3", [CONDITIONS[11], CONDITIONS[6]], require_all),
+            ConditionGroup("empty", [], require_all),
+        ]
+        for group in groups:
+            strategy = Strategy("s", signal_detection=group)
+            interpreted = strategy.evaluate_signal_detection(dict(values))
+            table = IndicatorSlotTable()
+            strategy.compile(table)
+            assert strategy.evaluate_signal_detection(IndicatorValues(table, values)) is interpreted, group.name
+
+
+class TestIndicatorValues:
+    """Slot mirroring of the per-symbol indicator cache"""
+
+    def test_writes_copies_and_removals(self):
+        table = IndicatorSlotTable()
+        store = IndicatorValues(table, {"Price": 1.0})
+        store["rsi"] = 40.0
+        slot = compile_condition(Condition("c", "price", "gte", 1.0), table)
+
+        clone = store.copy()
+        clone["signal_age_seconds"] = 12.0
+        assert isinstance(clone, IndicatorValues) and "signal_age_seconds" not in store
+        assert slot(clone.slot_view()) is ConditionResult.TRUE
+
+        store.pop("Price")
+        assert slot(store.slot_view()) is ConditionResult.PENDING
+        assert slot(clone.slot_view()) is ConditionResult.TRUE
+        assert dict(store) == {"rsi": 40.0}
+
+    def test_slots_assigned_after_store_creation(self):
+        table = IndicatorSlotTable()
+        store = IndicatorValues(table, {"rsi": 40.0})
+        late = compile_condition(Condition("c", "new_indicator", "gte", 1.0), table)  # Grows the table
+
+        assert late(store.slot_view()) is ConditionResult.PENDING
+        store["NEW_INDICATOR"] = 2.0
+        assert late(store.slot_view()) is ConditionResult.TRUE
+
+
+class TestStrategyManagerCompilation:
+    """Strategies are compiled once and evaluated against slot arrays"""
+
+    CONFIG = {
+        "strategy_name": "pump",
+        "s1_signal": {"conditions": [
+            {"id": "c1", "indicatorId": "price_velocity", "operator": ">=", "value": 2.0},
+            {"id": "c2", "indicatorId": "volume_surge_ratio", "operator": "gte", "value": 3.0},
+        ]},
+        "o1_cancel": {"conditions": [
+            {"id": "c3", "indicatorId": "signal_age_seconds", "operator": "gte", "value": 60},
+        ]},
+    }
+
+    def test_config_compiled_and_evaluated_without_interpreter(self, manager):
+        strategy = manager.create_strategy_from_config(self.CONFIG)
+        assert strategy.compiled_plan is not None
+        manager.add_strategy(strategy)
+        plan = strategy.compiled_plan
+
+        values = IndicatorValues(manager._indicator_slots, {"PRICE_VELOCITY": 2.5, "volume_surge_ratio": 3.0})
+        with patch.object(Condition, "evaluate", side_effect=AssertionError("interpreted path used")):
+            assert strategy.evaluate_signal_detection(values) is ConditionResult.TRUE
+            values["volume_surge_ratio"] = 1.0
+            assert strategy.evaluate_signal_detection(values) is ConditionResult.FALSE
+
+            extended = values.copy()
+            extended["signal_age_seconds"] = 90.0
+            assert strategy.evaluate_signal_cancellation(extended) is ConditionResult.TRUE
+        assert strategy.compiled_plan is plan  # add_strategy kept the existing plan
+
+    def test_plain_dict_and_replaced_conditions(self, manager):
+        strategy = manager.create_strategy_from_config(self.CONFIG)
+        assert strategy.evaluate_signal_detection({"price_velocity": 5.0, "volume_surge_ratio": 5.0}) is ConditionResult.TRUE
+
+        strategy.signal_detection.conditions = [Condition("x", "price_velocity", "lt", 0.0)]
+        values = IndicatorValues(manager._indicator_slots, {"price_velocity": 5.0})
+        assert strategy.evaluate_signal_detection(values) is ConditionResult.FALSE
+
+    @pytest.mark.asyncio
+    async def test_indicator_updates_populate_slot_cache(self, manager):
+        manager.add_strategy(Strategy("manual", signal_detection=ConditionGroup(
+            "signal_detection", [Condition("c", "price_velocity", "gte", 1.0)])))
+        assert manager.strategies["manual"].compiled_plan.table is manager._indicator_slots
+
+        await manager._on_indicator_update({
+            "symbol": "BTC_USDT", "indicator": "PRICE_VELOCITY_default_BTC_USDT", "indicator_type": "PRICE_VELOCITY", "value": 1.5
+        })
+        await manager._on_price_update({"symbol": "BTC_USDT", "price": 100.0})
+
+        values = manager.indicator_values["BTC_USDT"]
+        assert isinstance(values, IndicatorValues)
+        assert values == {"price_velocity": 1.5, "price": 100.0, "last_price": 100.0}
+        assert manager.strategies["manual"].evaluate_signal_detection(values) is ConditionResult.TRUE
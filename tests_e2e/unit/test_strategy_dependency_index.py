@@ -0,0 +1,181 @@
+"""
+Unit Tests - StrategyManager Dependency-Indexed Triggering
+==========================================================
+Tests for re-evaluating only the strategies an indicator update affects.
+
+Test Coverage:
+- Index maps (symbol, indicator_type) to strategies and condition sections
+- Only strategies whose current-state sections use an updated key are evaluated
+- Updates for a symbol in the same loop turn are coalesced into one pass
+- Updates arriving during a pass are evaluated, never dropped
+- Index is rebuilt when active strategies or condition lists change
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from src.core.event_bus import EventBus
+from src.core.logger import StructuredLogger
+from src.domain.services.strategy_manager import (
+    Condition,
+    ConditionGroup,
+    Strategy,
+    StrategyManager,
+    StrategyState,
+)
+
+
+SYMBOL = "BTC_USDT"
+
+
+@pytest.fixture
+def manager():
+    event_bus = Mock(spec=EventBus)
+    event_bus.subscribe = AsyncMock()
+    event_bus.publish = AsyncMock()
+    manager = StrategyManager(event_bus=event_bus, logger=Mock(spec=StructuredLogger))
+    manager.evaluated = []
+
+    async def record(strategy, indicator_values):
+        manager.evaluated.append((strategy.strategy_name, dict(indicator_values)))
+
+    manager._evaluate_strategy = record
+    return manager
+
+
+def make_strategy(name, s1=(), z1=(), e1=()):
+    def group(section, keys):
+        return ConditionGroup(section, [Condition(f"{section}_{key}", key, "gte", 1.0) for key in keys])
+
+    return Strategy(
+        name,
+        signal_detection=group("signal_detection", s1),
+        entry_conditions=group("entry_conditions", z1),
+        emergency_exit=group("emergency_exit", e1),
+    )
+
+
+def update(indicator_type, value=1.0, symbol=SYMBOL):
+    return {"symbol": symbol, "indicator": f"{indicator_type}_default", "indicator_type": indicator_type, "value": value}
+
+
+def activate(manager, *strategies):
+    for strategy in strategies:
+        manager.add_strategy(strategy)
+        manager.activate_strategy_for_symbol(strategy.strategy_name, SYMBOL)
+
+
+class TestDependencyIndex:
+    """Index from indicator types to referencing strategies and sections"""
+
+    def test_dependents_by_indicator_type(self, manager):
+        activate(manager,
+                 make_strategy("a", s1=["rsi"], z1=["RSI", "volume"]),
+                 make_strategy("b", e1=["volume"]))
+
+        assert manager.get_indicator_dependents(SYMBOL, "RSI") == {"a": ["entry_conditions", "signal_detection"]}
+        assert manager.get_indicator_dependents(SYMBOL, "volume") == {"a": ["entry_conditions"], "b": ["emergency_exit"]}
+        assert manager.get_indicator_dependents(SYMBOL, "macd") == {}
+        assert manager.get_indicator_dependents("ETH_USDT", "rsi") == {}
+
+    def test_rebuilt_on_activation_and_condition_changes(self, manager):
+        activate(manager, make_strategy("a", s1=["rsi"]))
+        assert manager.get_indicator_dependents(SYMBOL, "macd") == {}
+
+        manager.strategies["a"].signal_detection.conditions.append(Condition("m", "macd", "gt", 0))
+        assert manager.get_indicator_dependents(SYMBOL, "macd") == {"a": ["signal_detection"]}
+
+        activate(manager, make_strategy("b", s1=["macd"]))
+        assert set(manager.get_indicator_dependents(SYMBOL, "macd")) == {"a", "b"}
+
+        manager.deactivate_strategy_for_symbol("a", SYMBOL)
+        assert manager.get_indicator_dependents(SYMBOL, "macd") == {"b": ["signal_detection"]}
+
+
+class TestIndexedTriggering:
+    """Indicator updates only re-evaluate affected strategies"""
+
+    @pytest.mark.asyncio
+    async def test_only_affected_strategies_evaluated(self, manager):
+        activate(manager, make_strategy("rsi_only", s1=["rsi"]), make_strategy("volume_only", s1=["volume"]))
+
+        await manager._on_indicator_update(update("RSI"))
+        assert [name for name, _ in manager.evaluated] == ["rsi_only"]
+
+        await manager._on_indicator_update(update("macd"))
+        assert len(manager.evaluated) == 1
+
+    @pytest.mark.asyncio
+    async def test_current_state_sections_decide(self, manager):
+        strategy = make_strategy("s", s1=["rsi"], z1=["volume"])
+        activate(manager, strategy)
+
+        await manager._on_indicator_update(update("volume"))
+        assert manager.evaluated == []  # Z1 is not checked while MONITORING
+
+        strategy.current_state = StrategyState.SIGNAL_DETECTED
+        await manager._on_indicator_update(update("volume"))
+        assert len(manager.evaluated) == 1
+
+        strategy.current_state = StrategyState.EXITED  # Cooldown transitions run on any update
+        await manager._on_indicator_update(update("macd"))
+        assert len(manager.evaluated) == 2
+
+    @pytest.mark.asyncio
+    async def test_price_conditions_checked_on_every_update(self, manager):
+        strategy = make_strategy("s", z1=["price"])
+        activate(manager, strategy)
+        strategy.current_state = StrategyState.SIGNAL_DETECTED
+
+        await manager._on_indicator_update(update("macd"))
+        assert len(manager.evaluated) == 1
+
+    @pytest.mark.asyncio
+    async def test_no_strategy_cap_or_rate_budget(self, manager):
+        activate(manager, *[make_strategy(f"s{i}", s1=["rsi"]) for i in range(8)])
+
+        for value in range(20):
+            await manager._on_indicator_update(update("rsi", value))
+
+        assert len(manager.evaluated) == 8 * 20
+
+
+class TestCoalescing:
+    """Per-symbol coalescing of updates within one event-loop turn"""
+
+    @pytest.mark.asyncio
+    async def test_same_turn_updates_share_one_pass(self, manager):
+        activate(manager, make_strategy("s", s1=["rsi", "volume"]))
+
+        await asyncio.gather(
+            manager._on_indicator_update(update("rsi", 1.0)),
+            manager._on_indicator_update(update("volume", 2.0)),
+            manager._on_indicator_update(update("rsi", 3.0)),
+        )
+
+        assert manager.evaluated == [("s", {"rsi": 3.0, "volume": 2.0})]
+
+    @pytest.mark.asyncio
+    async def test_updates_during_pass_are_evaluated(self, manager):
+        activate(manager, make_strategy("s", s1=["rsi"]))
+        release = asyncio.Event()
+        seen = []
+
+        async def slow(strategy, indicator_values):
+            seen.append(indicator_values["rsi"])
+            if len(seen) == 1:
+                await release.wait()
+
+        manager._evaluate_strategy = slow
+        first = asyncio.create_task(manager._on_indicator_update(update("rsi", 1.0)))
+        while not seen:
+            await asyncio.sleep(0)
+
+        await manager._on_indicator_update(update("rsi", 2.0))  # Joins the running pass
+        release.set()
+        await first
+
+        assert seen == [1.0, 2.0]
+        assert manager._pending_indicator_keys == {}
@@ -0,0 +1,176 @@
+"""
+Unit Tests - StructuredLogger Asynchronous Pipeline
+===================================================
+Tests for queue-based logging with throttling and lazy payloads.
+
+Test Coverage:
+- Records are formatted and written by the background writer thread
+- Lazy (callable) payloads are only built for emitted events
+- Per-event-type rate limiting and sampling with suppression counters
+- Warnings and errors bypass throttles
+- async_enabled=False keeps handlers on the logger itself
+- Dict payloads are snapshotted (at any depth) when enqueued
+- Throttle and suppression counters are consistent across threads
+"""
+
+import json
+import logging
+import threading
+import uuid
+from logging.handlers import QueueHandler
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.logger import (
+    StructuredLogger,
+    configure_event_throttle,
+    flush_logs,
+    get_log_pipeline_stats,
+)
+
+
+def make_config(tmp_path, **overrides):
+    config = dict(level="DEBUG", console_enabled=False, file_enabled=True, log_dir=str(tmp_path))
+    config.update(overrides)
+    return SimpleNamespace(**config)
+
+
+def read_records(path):
+    flush_logs()
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture
+def event_type():
+    name = f"test_pipeline.event_{uuid.uuid4().hex[:8]}"
+    yield name
+    configure_event_throttle(name)
+
+
+@pytest.fixture
+def logger(tmp_path):
+    return StructuredLogger(f"pipeline_{uuid.uuid4().hex[:8]}", make_config(tmp_path), filename="pipeline.jsonl")
+
+
+class TestAsyncWriter:
+    """Records reach their handlers through the writer thread"""
+
+    def test_records_written_by_writer(self, logger, tmp_path, event_type):
+        assert not any(isinstance(h, logging.FileHandler) for h in logger.logger.handlers)
+
+        logger.info(event_type, {"value": 1})
+        logger.error(event_type, {"value": 2})
+
+        records = read_records(tmp_path / "pipeline.jsonl")
+        assert [(r["level"], r["data"]) for r in records] == [("INFO", {"value": 1}), ("ERROR", {"value": 2})]
+        assert get_log_pipeline_stats()["running"] is True
+
+    def test_duplicate_instances_share_handlers(self, logger, tmp_path, event_type):
+        again = StructuredLogger(logger.logger.name, make_config(tmp_path), filename="pipeline.jsonl")
+        again.info(event_type)
+
+        assert len(read_records(tmp_path / "pipeline.jsonl")) == 1
+
+    def test_payload_snapshotted_when_enqueued(self, logger, tmp_path, event_type):
+        queue_handler = next(h for h in logger.logger.handlers if isinstance(h, QueueHandler))
+        metrics = {"sessions": 1, "by_symbol": {"BTC_USDT": [1]}}
+        record = logger.logger.makeRecord(
+            logger.logger.name, logging.INFO, __file__, 0, {"event_type": event_type, "data": metrics}, None, None
+        )
+
+        prepared = queue_handler.prepare(record)
+        metrics["sessions"] = 2  # Caller keeps updating its live dict, nested containers too
+        metrics["by_symbol"]["ETH_USDT"] = [2]
+        metrics["by_symbol"]["BTC_USDT"].append(3)
+
+        assert prepared.msg["data"] == {"sessions": 1, "by_symbol": {"BTC_USDT": [1]}}
+        metrics = {"sessions": 2}
+
+        logger.info(event_type, metrics)
+        metrics["sessions"] = 3
+        assert read_records(tmp_path / "pipeline.jsonl")[0]["data"] == {"sessions": 2}
+
+    def test_sync_mode_keeps_handlers_on_logger(self, tmp_path, event_type):
+        sync = StructuredLogger(f"sync_{uuid.uuid4().hex[:8]}", make_config(tmp_path, async_enabled=False),
+                                filename="sync.jsonl")
+        assert any(isinstance(h, logging.FileHandler) for h in sync.logger.handlers)
+
+        sync.info(event_type, {"value": 1})
+        assert json.loads((tmp_path / "sync.jsonl").read_text(encoding="utf-8"))["data"] == {"value": 1}
+
+
+class TestLazyPayloads:
+    """Callable payloads are only built when the event is emitted"""
+
+    def test_not_built_below_level(self, tmp_path, event_type):
+        quiet = StructuredLogger(f"quiet_{uuid.uuid4().hex[:8]}", make_config(tmp_path, level="INFO"))
+        build = Mock(return_value={})
+
+        quiet.debug(event_type, build)
+        build.assert_not_called()
+
+    def test_built_once_when_emitted(self, logger, tmp_path, event_type):
+        logger.info(event_type, lambda: {"keys": list("abc")})
+
+        assert read_records(tmp_path / "pipeline.jsonl")[0]["data"] == {"keys": ["a", "b", "c"]}
+
+
+class TestThrottling:
+    """Per-event-type rate limits and sampling"""
+
+    def test_rate_limit_counts_suppressed(self, logger, tmp_path, event_type):
+        configure_event_throttle(event_type, per_second=2)
+        build = Mock(return_value={})
+
+        for _ in range(5):
+            logger.info(event_type, build)
+
+        assert build.call_count == 2
+        assert get_log_pipeline_stats()["suppressed"][event_type] == 3
+        assert len(read_records(tmp_path / "pipeline.jsonl")) == 2
+
+    def test_next_emitted_event_reports_suppressed(self, logger, tmp_path, event_type):
+        configure_event_throttle(event_type, sample_rate=0.25)
+
+        for index in range(8):
+            logger.info(event_type, {"index": index})
+
+        records = read_records(tmp_path / "pipeline.jsonl")
+        assert [r["data"]["index"] for r in records] == [3, 7]
+        assert [r["suppressed"] for r in records] == [3, 3]
+
+    def test_warnings_and_errors_bypass_throttle(self, logger, tmp_path, event_type):
+        configure_event_throttle(event_type, per_second=0)
+
+        logger.info(event_type)
+        logger.warning(event_type)
+        logger.error(event_type)
+
+        assert [r["level"] for r in read_records(tmp_path / "pipeline.jsonl")] == ["WARNING", "ERROR"]
+
+    def test_throttle_removed(self, logger, tmp_path, event_type):
+        logger.throttle(event_type, per_second=0)
+        logger.info(event_type)
+        logger.throttle(event_type)
+        logger.info(event_type)
+
+        assert len(read_records(tmp_path / "pipeline.jsonl")) == 1
+
+    def test_counters_consistent_across_threads(self, logger, tmp_path, event_type):
+        configure_event_throttle(event_type, sample_rate=0.5)
+        before = get_log_pipeline_stats()["suppressed"].get(event_type, 0)
+
+        def log_many():
+            for _ in range(2000):
+                logger.debug(event_type)
+
+        threads = [threading.Thread(target=log_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert get_log_pipeline_stats()["suppressed"][event_type] - before == 4000
+        assert len(read_records(tmp_path / "pipeline.jsonl")) == 4000